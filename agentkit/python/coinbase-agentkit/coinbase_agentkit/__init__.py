@@ -1,57 +1,91 @@
 """Coinbase AgentKit - Framework for enabling AI agents to take actions onchain."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .__version__ import __version__
-from .action_providers import (
-    Action,
-    ActionProvider,
-    allora_action_provider,
-    basename_action_provider,
-    cdp_api_action_provider,
-    cdp_wallet_action_provider,
-    compound_action_provider,
-    create_action,
-    erc20_action_provider,
-    hyperbolic_action_provider,
-    morpho_action_provider,
-    pyth_action_provider,
-    ssh_action_provider,
-    superfluid_action_provider,
-    twitter_action_provider,
-    wallet_action_provider,
-    weth_action_provider,
-    wow_action_provider,
-)
+from .action_providers import Action, ActionProvider, create_action
 from .agentkit import AgentKit, AgentKitConfig
-from .wallet_providers import (
-    CdpWalletProvider,
-    CdpWalletProviderConfig,
-    EthAccountWalletProvider,
-    EthAccountWalletProviderConfig,
-    EvmWalletProvider,
-    SmartWalletProvider,
-    SmartWalletProviderConfig,
-    WalletProvider,
-)
+from .wallet_providers import WalletProvider
+
+if TYPE_CHECKING:
+    from .action_providers import (
+        allora_action_provider,
+        basename_action_provider,
+        cdp_api_action_provider,
+        cdp_wallet_action_provider,
+        compound_action_provider,
+        erc20_action_provider,
+        hyperbolic_action_provider,
+        morpho_action_provider,
+        pyth_action_provider,
+        ssh_action_provider,
+        superfluid_action_provider,
+        twitter_action_provider,
+        wallet_action_provider,
+        weth_action_provider,
+        wow_action_provider,
+    )
+    from .wallet_providers import (
+        CdpWalletProvider,
+        CdpWalletProviderConfig,
+        EthAccountWalletProvider,
+        EthAccountWalletProviderConfig,
+        EvmWalletProvider,
+        MultiChainWalletProvider,
+        SmartWalletProvider,
+        SmartWalletProviderConfig,
+    )
+
+# Maps each lazily imported name to the package exporting it. Providers are only imported
+# when they are used, which keeps `import coinbase_agentkit` fast.
+_LAZY_IMPORTS = {
+    "allora_action_provider": ".action_providers",
+    "basename_action_provider": ".action_providers",
+    "cdp_api_action_provider": ".action_providers",
+    "cdp_wallet_action_provider": ".action_providers",
+    "compound_action_provider": ".action_providers",
+    "erc20_action_provider": ".action_providers",
+    "hyperbolic_action_provider": ".action_providers",
+    "morpho_action_provider": ".action_providers",
+    "pyth_action_provider": ".action_providers",
+    "ssh_action_provider": ".action_providers",
+    "superfluid_action_provider": ".action_providers",
+    "twitter_action_provider": ".action_providers",
+    "wallet_action_provider": ".action_providers",
+    "weth_action_provider": ".action_providers",
+    "wow_action_provider": ".action_providers",
+    "CdpWalletProvider": ".wallet_providers",
+    "CdpWalletProviderConfig": ".wallet_providers",
+    "EthAccountWalletProvider": ".wallet_providers",
+    "EthAccountWalletProviderConfig": ".wallet_providers",
+    "EvmWalletProvider": ".wallet_providers",
+    "MultiChainWalletProvider": ".wallet_providers",
+    "SmartWalletProvider": ".wallet_providers",
+    "SmartWalletProviderConfig": ".wallet_providers",
+}
 
 __all__ = [
-    "AgentKit",
-    "AgentKitConfig",
     "Action",
     "ActionProvider",
-    "create_action",
-    "basename_action_provider",
-    "WalletProvider",
+    "AgentKit",
+    "AgentKitConfig",
     "CdpWalletProvider",
     "CdpWalletProviderConfig",
-    "EvmWalletProvider",
     "EthAccountWalletProvider",
     "EthAccountWalletProviderConfig",
+    "EvmWalletProvider",
+    "MultiChainWalletProvider",
     "SmartWalletProvider",
     "SmartWalletProviderConfig",
+    "WalletProvider",
+    "__version__",
     "allora_action_provider",
+    "basename_action_provider",
     "cdp_api_action_provider",
     "cdp_wallet_action_provider",
     "compound_action_provider",
+    "create_action",
     "erc20_action_provider",
     "hyperbolic_action_provider",
     "morpho_action_provider",
@@ -62,5 +96,18 @@ __all__ = [
     "wallet_action_provider",
     "weth_action_provider",
     "wow_action_provider",
-    "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a provider on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the module, including the providers not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
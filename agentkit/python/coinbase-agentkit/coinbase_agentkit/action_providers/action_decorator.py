@@ -8,6 +8,7 @@ from typing import Any, TypedDict
 from pydantic import BaseModel
 
 from ..analytics import RequiredEventData, send_analytics_event
+from ..instrumentation import action_trace
 
 
 class WalletMetadata(TypedDict):
@@ -70,7 +71,8 @@ def create_action(name: str, description: str, schema: type[BaseModel] | None =
             except Exception as e:
                 print(f"Warning: Failed to track action invocation: {e}")
 
-            return func(*args, **kwargs)
+            with action_trace(prefixed_name):
+                return func(*args, **kwargs)
 
         wrapper._action_metadata = ActionMetadata(
             name=prefixed_name,
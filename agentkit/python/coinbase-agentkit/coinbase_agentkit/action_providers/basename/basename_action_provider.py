@@ -1,11 +1,14 @@
 """Basename action provider for Base domain name registration."""
 
+import threading
+import time
 from typing import Any
 
 from web3 import Web3
 
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
+from ...wallet_providers.multicall import ContractCall, multicall
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 from .constants import (
@@ -14,10 +17,11 @@ from .constants import (
     L2_RESOLVER_ABI,
     L2_RESOLVER_ADDRESS_MAINNET,
     L2_RESOLVER_ADDRESS_TESTNET,
+    PRICE_CACHE_TTL,
     REGISTRAR_ABI,
     REGISTRATION_DURATION,
 )
-from .schemas import RegisterBasenameSchema
+from .schemas import CheckBasenamesSchema, RegisterBasenameSchema
 
 
 class BasenameActionProvider(ActionProvider[EvmWalletProvider]):
@@ -26,6 +30,69 @@ class BasenameActionProvider(ActionProvider[EvmWalletProvider]):
     def __init__(self) -> None:
         """Initialize the Basename action provider."""
         super().__init__("basename", [])
+        # (network_id, name) -> (registration price in wei, time it was read)
+        self._prices: dict[tuple[str | None, str], tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    @create_action(
+        name="check_basenames",
+        description="""
+This tool will check whether candidate Basenames are available and how much they cost to register for one year.
+Use it before register_basename to find a free name in one step instead of trying registrations one at a time.
+Names can be given with or without the .base.eth (base-mainnet) or .basetest.eth (base-sepolia) suffix.
+""",
+        schema=CheckBasenamesSchema,
+    )
+    def check_basenames(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Check the availability and registration price of several Basenames in one multicall.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = CheckBasenamesSchema(**args)
+            network_id = wallet_provider.get_network().network_id
+            suffix, contract_address = _get_registrar(network_id)
+
+            names = list(
+                dict.fromkeys(name.removesuffix(suffix) for name in validated_args.basenames)
+            )
+            calls = []
+            for name in names:
+                calls += [
+                    ContractCall(contract_address, REGISTRAR_ABI, "available", (name,)),
+                    ContractCall(
+                        contract_address,
+                        REGISTRAR_ABI,
+                        "registerPrice",
+                        (name, int(REGISTRATION_DURATION)),
+                    ),
+                ]
+            results = multicall(wallet_provider, calls)
+
+            lines = ["Basename availability for one year of registration:"]
+            checked_at = time.monotonic()
+            for index, name in enumerate(names):
+                available, price = results[2 * index : 2 * index + 2]
+                if not available.success:
+                    lines.append(f"- {name}{suffix}: error: {available.error}")
+                elif not available.value:
+                    lines.append(f"- {name}{suffix}: taken")
+                elif not price.success:
+                    lines.append(f"- {name}{suffix}: available, price unknown: {price.error}")
+                else:
+                    with self._lock:
+                        self._prices[(network_id, name)] = (price.value, checked_at)
+                    amount = Web3.from_wei(price.value, "ether")
+                    lines.append(f"- {name}{suffix}: available for {amount} ETH")
+            return "\n".join(lines)
+        except Exception as e:
+            return f"Error checking basenames: {e!s}"
 
     @create_action(
         name="register_basename",
@@ -34,6 +101,7 @@ This tool will register a Basename for the agent. The agent should have a wallet
 When your network ID is 'base-mainnet' (also sometimes known simply as 'base'), the name must end with .base.eth, and when your network ID is 'base-sepolia', it must ends with .basetest.eth.
 Do not suggest any alternatives and never try to register a Basename with another postfix. The prefix of the name must be unique so if the registration of the
 Basename fails, you should prompt to try again with a more unique name.
+Use check_basenames first to find an available name. Leave the amount empty to pay the price it returned.
 """,
         schema=RegisterBasenameSchema,
     )
@@ -50,19 +118,16 @@ Basename fails, you should prompt to try again with a more unique name.
         """
         try:
             address = Web3.to_checksum_address(wallet_provider.get_address())
-            is_mainnet = wallet_provider.get_network().network_id == "base-mainnet"
+            network_id = wallet_provider.get_network().network_id
 
-            suffix = ".base.eth" if is_mainnet else ".basetest.eth"
+            suffix, contract_address = _get_registrar(network_id)
             if not args["basename"].endswith(suffix):
                 args["basename"] += suffix
 
             l2_resolver_address = Web3.to_checksum_address(
-                L2_RESOLVER_ADDRESS_MAINNET if is_mainnet else L2_RESOLVER_ADDRESS_TESTNET
-            )
-            contract_address = Web3.to_checksum_address(
-                BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET
-                if is_mainnet
-                else BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET
+                L2_RESOLVER_ADDRESS_MAINNET
+                if network_id == "base-mainnet"
+                else L2_RESOLVER_ADDRESS_TESTNET
             )
 
             w3 = Web3()
@@ -85,11 +150,16 @@ Basename fails, you should prompt to try again with a more unique name.
 
             data = registrar_contract.encode_abi("register", args=[register_request])
 
+            if args.get("amount") is not None:
+                value = Web3.to_wei(args["amount"], "ether")
+            else:
+                value = self._get_price(wallet_provider, contract_address, register_request["name"])
+
             tx_hash = wallet_provider.send_transaction(
                 {
                     "to": contract_address,
                     "data": data,
-                    "value": Web3.to_wei(args["amount"], "ether"),
+                    "value": value,
                 }
             )
 
@@ -99,6 +169,33 @@ Basename fails, you should prompt to try again with a more unique name.
         except Exception as e:
             return f"Error registering basename: {e!s}"
 
+    def _get_price(
+        self, wallet_provider: EvmWalletProvider, contract_address: str, name: str
+    ) -> int:
+        """Get the registration price of a name, reusing the one read by check_basenames.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            contract_address (str): The address of the registrar controller.
+            name (str): The name, without suffix.
+
+        Returns:
+            int: The price of a one year registration, in wei.
+
+        """
+        key = (wallet_provider.get_network().network_id, name)
+        with self._lock:
+            cached = self._prices.pop(key, None)
+        if cached is not None and time.monotonic() - cached[1] < PRICE_CACHE_TTL:
+            return cached[0]
+
+        return wallet_provider.read_contract(
+            contract_address=contract_address,
+            abi=REGISTRAR_ABI,
+            function_name="registerPrice",
+            args=[name, int(REGISTRATION_DURATION)],
+        )
+
     def supports_network(self, network: Network) -> bool:
         """Check if the network is supported by the Basename action provider.
 
@@ -115,6 +212,21 @@ Basename fails, you should prompt to try again with a more unique name.
         ]
 
 
+def _get_registrar(network_id: str | None) -> tuple[str, str]:
+    """Get the name suffix and registrar controller address of a network.
+
+    Args:
+        network_id (str | None): The network ID.
+
+    Returns:
+        tuple[str, str]: The suffix and the checksummed registrar controller address.
+
+    """
+    if network_id == "base-mainnet":
+        return ".base.eth", Web3.to_checksum_address(BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET)
+    return ".basetest.eth", Web3.to_checksum_address(BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET)
+
+
 def basename_action_provider() -> BasenameActionProvider:
     """Create a new Basename action provider.
 
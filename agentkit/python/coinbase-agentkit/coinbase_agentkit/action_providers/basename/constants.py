@@ -54,5 +54,29 @@ REGISTRAR_ABI = [
         "outputs": [],
         "stateMutability": "payable",
         "type": "function",
-    }
+    },
+    {
+        "inputs": [{"internalType": "string", "name": "name", "type": "string"}],
+        "name": "available",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "string", "name": "name", "type": "string"},
+            {"internalType": "uint256", "name": "duration", "type": "uint256"},
+        ],
+        "name": "registerPrice",
+        "outputs": [{"internalType": "uint256", "name": "price", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
 ]
+
+# Maximum number of names checked at once
+MAX_CHECKED_BASENAMES = 50
+
+# How long a price read by check_basenames is reused for registration, in seconds.
+# The registrar refunds any excess payment.
+PRICE_CACHE_TTL = 600
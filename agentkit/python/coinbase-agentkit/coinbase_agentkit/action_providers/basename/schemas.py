@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, Field
 
+from .constants import MAX_CHECKED_BASENAMES
+
 
 class RegisterBasenameSchema(BaseModel):
     """Input argument schema for registering a Basename."""
@@ -10,6 +12,18 @@ class RegisterBasenameSchema(BaseModel):
         ...,
         description="The Basename to assign to the agent (e.g., `example.base.eth` or `example.basetest.eth`)",
     )
-    amount: str = Field(
-        ..., description="The amount of Eth to pay for registration. The default is set to 0.002."
+    amount: str | None = Field(
+        None,
+        description="The amount of Eth to pay for registration. If not provided, pays the price returned by check_basenames, or reads it from the registrar",
+    )
+
+
+class CheckBasenamesSchema(BaseModel):
+    """Input argument schema for checking the availability of Basenames."""
+
+    basenames: list[str] = Field(
+        ...,
+        description="The candidate Basenames to check (e.g., `example` or `example.base.eth`)",
+        min_length=1,
+        max_length=MAX_CHECKED_BASENAMES,
     )
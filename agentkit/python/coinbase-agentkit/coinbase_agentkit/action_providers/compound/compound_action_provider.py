@@ -16,6 +16,7 @@ from .constants import (
     COMET_ADDRESSES,
     SUPPORTED_NETWORKS,
 )
+from .market import MarketConfig, MarketConfigCache, MarketPosition, get_market_position
 from .schemas import (
     CompoundBorrowSchema,
     CompoundPortfolioSchema,
@@ -26,15 +27,11 @@ from .schemas import (
 from .utils import (
     format_amount_from_decimals,
     format_amount_with_decimals,
-    get_base_token_address,
-    get_collateral_balance,
     get_health_ratio,
     get_health_ratio_after_borrow,
     get_health_ratio_after_withdraw,
     get_portfolio_details_markdown,
     get_token_balance,
-    get_token_decimals,
-    get_token_symbol,
 )
 
 
@@ -43,6 +40,7 @@ class CompoundActionProvider(ActionProvider[EvmWalletProvider]):
 
     def __init__(self):
         super().__init__("compound", [])
+        self.market_configs = MarketConfigCache()
 
     def _get_comet_address(self, network: Network) -> str:
         """Get the appropriate Comet address based on network."""
@@ -52,6 +50,20 @@ class CompoundActionProvider(ActionProvider[EvmWalletProvider]):
         """Get the asset address based on network and asset ID."""
         return ASSET_ADDRESSES[network.network_id][asset_id]
 
+    def _get_market_config(
+        self, wallet_provider: EvmWalletProvider, comet_address: str
+    ) -> MarketConfig:
+        """Get the cached configuration of a Comet market."""
+        return self.market_configs.get(wallet_provider, comet_address)
+
+    def _get_position(
+        self, wallet_provider: EvmWalletProvider, config: MarketConfig
+    ) -> MarketPosition:
+        """Read the position of the wallet, dropping the market configuration once outdated."""
+        position = get_market_position(wallet_provider, config)
+        self.market_configs.observe(wallet_provider, config, position.block_number)
+        return position
+
     @create_action(
         name="supply",
         description="""
@@ -87,7 +99,9 @@ Important notes:
                 wallet_provider.get_network(), validated_args.asset_id
             )
 
-            decimals = get_token_decimals(wallet_provider, token_address)
+            config = self._get_market_config(wallet_provider, comet_address)
+            asset = config.get_asset(token_address)
+            decimals = asset.decimals
             amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
 
             # Check wallet balance before proceeding
@@ -97,7 +111,7 @@ Important notes:
                 return f"Error: Insufficient balance. You have {human_balance}, but trying to supply {validated_args.amount}"
 
             # Get current health ratio for reference
-            current_health = get_health_ratio(wallet_provider, comet_address)
+            current_health = get_health_ratio(config, self._get_position(wallet_provider, config))
 
             # Approve Compound to spend tokens
             token_contract = Web3().eth.contract(address=token_address, abi=ERC20_ABI)
@@ -131,8 +145,8 @@ Important notes:
                 return f"Error executing transaction: {e!s}"
 
             # Get new health ratio
-            new_health = get_health_ratio(wallet_provider, comet_address)
-            token_symbol = get_token_symbol(wallet_provider, token_address)
+            new_health = get_health_ratio(config, self._get_position(wallet_provider, config))
+            token_symbol = asset.symbol
 
             # Format health ratio strings and compose the final message
             if current_health == Decimal("Infinity") and new_health == Decimal("Infinity"):
@@ -185,20 +199,21 @@ Important notes:
                 wallet_provider.get_network(), validated_args.asset_id
             )
 
-            decimals = get_token_decimals(wallet_provider, token_address)
+            config = self._get_market_config(wallet_provider, comet_address)
+            asset = config.get_asset(token_address)
+            decimals = asset.decimals
             amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
 
             # Check that there is enough balance supplied to withdraw amount
-            collateral_balance = get_collateral_balance(
-                wallet_provider, comet_address, token_address
-            )
+            position = self._get_position(wallet_provider, config)
+            collateral_balance = position.collateral_balances.get(asset.address, 0)
             if amount_atomic > collateral_balance:
                 human_balance = format_amount_from_decimals(collateral_balance, decimals)
                 return f"Error: Insufficient balance. Trying to withdraw {validated_args.amount}, but only have {human_balance} supplied"
 
             # Check if position would be healthy after withdrawal
             projected_health_ratio = get_health_ratio_after_withdraw(
-                wallet_provider, comet_address, token_address, amount_atomic
+                config, position, token_address, amount_atomic
             )
 
             if projected_health_ratio < 1:
@@ -223,11 +238,11 @@ Important notes:
                 return f"Error executing transaction: {e!s}"
 
             # Get current health ratio for reference
-            current_health = get_health_ratio(wallet_provider, comet_address)
+            current_health = get_health_ratio(config, position)
 
             # Get new health ratio
-            new_health = get_health_ratio(wallet_provider, comet_address)
-            token_symbol = get_token_symbol(wallet_provider, token_address)
+            new_health = get_health_ratio(config, self._get_position(wallet_provider, config))
+            token_symbol = asset.symbol
 
             # Format health ratio strings and compose the final message
             if current_health == Decimal("Infinity") and new_health == Decimal("Infinity"):
@@ -275,25 +290,25 @@ Important notes:
         try:
             validated_args = CompoundBorrowSchema(**args)
             comet_address = self._get_comet_address(wallet_provider.get_network())
-            base_token_address = get_base_token_address(wallet_provider, comet_address)
-            base_token_decimals = get_token_decimals(wallet_provider, base_token_address)
+            config = self._get_market_config(wallet_provider, comet_address)
+            base_token_address = config.base_token.address
+            base_token_decimals = config.base_token.decimals
 
             # Convert human-readable amount to atomic amount
             amount_atomic = format_amount_with_decimals(validated_args.amount, base_token_decimals)
 
             # Get current health ratio for reference
-            current_health = get_health_ratio(wallet_provider, comet_address)
+            position = self._get_position(wallet_provider, config)
+            current_health = get_health_ratio(config, position)
             current_health_str = (
                 "Infinity" if current_health == Decimal("Infinity") else f"{current_health:.2f}"
             )
 
             # Check if position would be healthy after borrow
-            projected_health_ratio = get_health_ratio_after_borrow(
-                wallet_provider, comet_address, amount_atomic
-            )
+            projected_health_ratio = get_health_ratio_after_borrow(config, position, amount_atomic)
 
             if projected_health_ratio < 1:
-                return f"Error: Borrowing {validated_args.amount} USDC would result in an unhealthy position. Health ratio would be {projected_health_ratio:.2f}"
+                return f"Error: Borrowing {validated_args.amount} {config.base_token.symbol} would result in an unhealthy position. Health ratio would be {projected_health_ratio:.2f}"
 
             # Use withdraw method to borrow from Compound
             contract = Web3().eth.contract(address=comet_address, abi=COMET_ABI)
@@ -311,11 +326,11 @@ Important notes:
                 return f"Error executing transaction: {e!s}"
 
             # Get new health ratio
-            new_health = get_health_ratio(wallet_provider, comet_address)
+            new_health = get_health_ratio(config, self._get_position(wallet_provider, config))
             new_health_str = "Inf.%" if new_health == Decimal("Infinity") else f"{new_health:.2f}"
 
             return (
-                f"Borrowed {validated_args.amount} USDC from Compound.\n"
+                f"Borrowed {validated_args.amount} {config.base_token.symbol} from Compound.\n"
                 f"Transaction hash: {tx_hash}\n"
                 f"Health ratio changed from {current_health_str} to {new_health_str}"
             )
@@ -356,9 +371,12 @@ Important notes:
                 wallet_provider.get_network(), validated_args.asset_id
             )
 
+            config = self._get_market_config(wallet_provider, comet_address)
+            asset = config.get_asset(token_address)
+
             # Check wallet balance before proceeding
             token_balance = get_token_balance(wallet_provider, token_address)
-            token_decimals = get_token_decimals(wallet_provider, token_address)
+            token_decimals = asset.decimals
             amount_atomic = format_amount_with_decimals(validated_args.amount, token_decimals)
 
             if token_balance < int(amount_atomic):
@@ -366,7 +384,7 @@ Important notes:
                 return f"Error: Insufficient balance. You have {human_balance}, but trying to repay {validated_args.amount}"
 
             # Get current health ratio for reference
-            current_health = get_health_ratio(wallet_provider, comet_address)
+            current_health = get_health_ratio(config, self._get_position(wallet_provider, config))
 
             # Approve Compound to spend tokens
             token_contract = Web3().eth.contract(address=token_address, abi=ERC20_ABI)
@@ -399,8 +417,8 @@ Important notes:
                 return f"Error executing transaction: {e!s}"
 
             # Get new health ratio
-            new_health = get_health_ratio(wallet_provider, comet_address)
-            token_symbol = get_token_symbol(wallet_provider, token_address)
+            new_health = get_health_ratio(config, self._get_position(wallet_provider, config))
+            token_symbol = asset.symbol
 
             return (
                 f"Repaid {validated_args.amount} {token_symbol} to Compound.\n"
@@ -438,7 +456,10 @@ Formatted in Markdown for readability.
         """
         try:
             comet_address = self._get_comet_address(wallet_provider.get_network())
-            return get_portfolio_details_markdown(wallet_provider, comet_address)
+            config = self._get_market_config(wallet_provider, comet_address)
+            return get_portfolio_details_markdown(
+                config, self._get_position(wallet_provider, config)
+            )
         except Exception as e:
             return f"Error getting portfolio details: {e!s}"
 
@@ -2,6 +2,9 @@
 
 SUPPORTED_NETWORKS = ["base-mainnet", "base-sepolia"]
 
+# Blocks a cached market configuration is used for, about a day of Base blocks
+MARKET_CONFIG_MAX_AGE_BLOCKS = 43_200
+
 # Compound Comet ABI for interacting with the protocol
 COMET_ABI = [
     {
@@ -0,0 +1,252 @@
+"""Cached configuration of Compound Comet markets, and batched reads of positions in them."""
+
+import threading
+from dataclasses import dataclass
+
+from web3 import Web3
+
+from ...wallet_providers.evm_wallet_provider import EvmWalletProvider
+from ...wallet_providers.multicall import (
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+    CallResult,
+    ContractCall,
+    multicall,
+)
+from ..erc20.constants import ERC20_ABI
+from .constants import COMET_ABI, MARKET_CONFIG_MAX_AGE_BLOCKS, PRICE_FEED_ABI
+
+
+@dataclass(frozen=True)
+class AssetConfig:
+    """A token of a Comet market, with its price feed and borrow collateral factor."""
+
+    address: str
+    symbol: str
+    decimals: int
+    price_feed: str
+    borrow_collateral_factor: int = 0
+
+
+@dataclass(frozen=True)
+class MarketConfig:
+    """The configuration of a Comet market, which only changes with governance upgrades."""
+
+    comet_address: str
+    base_token: AssetConfig
+    collateral_assets: tuple[AssetConfig, ...]
+    block_number: int
+
+    def get_asset(self, address: str) -> AssetConfig:
+        """Get the base token or a collateral asset of the market by address.
+
+        Args:
+            address: The token address.
+
+        Returns:
+            AssetConfig: The configuration of the token.
+
+        Raises:
+            ValueError: If the token is not an asset of the market.
+
+        """
+        for asset in (self.base_token, *self.collateral_assets):
+            if asset.address.lower() == address.lower():
+                return asset
+        raise ValueError(f"{address} is not an asset of the Compound market {self.comet_address}")
+
+
+@dataclass(frozen=True)
+class MarketPosition:
+    """The balances of a wallet in a Comet market and the prices of the market assets.
+
+    Collateral balances and prices are keyed by asset address, and prices have 8 decimals.
+    """
+
+    block_number: int
+    borrow_balance: int
+    collateral_balances: dict[str, int]
+    prices: dict[str, int]
+
+
+def _value(result: CallResult, description: str):
+    """Get the value of a call, raising if it failed."""
+    if not result.success:
+        raise ValueError(f"Could not read {description}: {result.error}")
+    return result.value
+
+
+def load_market_config(wallet: EvmWalletProvider, comet_address: str) -> MarketConfig:
+    """Read the configuration of a Comet market in three multicalls.
+
+    Args:
+        wallet: The wallet provider of the network of the market.
+        comet_address: The address of the Compound Comet contract.
+
+    Returns:
+        MarketConfig: The configuration of the market.
+
+    """
+    block, base_token, base_price_feed, num_assets = multicall(
+        wallet,
+        [
+            ContractCall(MULTICALL3_ADDRESS, MULTICALL3_ABI, "getBlockNumber"),
+            ContractCall(comet_address, COMET_ABI, "baseToken"),
+            ContractCall(comet_address, COMET_ABI, "baseTokenPriceFeed"),
+            ContractCall(comet_address, COMET_ABI, "numAssets"),
+        ],
+    )
+    block_number = _value(block, "the block number")
+    base_token = _value(base_token, "the base token")
+    base_price_feed = _value(base_price_feed, "the base token price feed")
+    num_assets = _value(num_assets, "the number of assets")
+
+    results = multicall(
+        wallet,
+        [
+            ContractCall(base_token, ERC20_ABI, "decimals"),
+            ContractCall(base_token, ERC20_ABI, "symbol"),
+            *(
+                ContractCall(comet_address, COMET_ABI, "getAssetInfo", (i,))
+                for i in range(num_assets)
+            ),
+        ],
+    )
+    base_decimals = _value(results[0], "the base token decimals")
+    base_symbol = _value(results[1], "the base token symbol")
+    asset_infos = [_value(result, "the asset info") for result in results[2:]]
+    asset_addresses = [Web3.to_checksum_address(info[1]) for info in asset_infos]
+
+    # Decimals follow from the asset scale, so only symbols are read from the tokens.
+    symbols = multicall(
+        wallet, [ContractCall(address, ERC20_ABI, "symbol") for address in asset_addresses]
+    )
+    collateral_assets = tuple(
+        AssetConfig(
+            address=address,
+            symbol=_value(symbol, f"the symbol of {address}"),
+            decimals=len(str(info[3])) - 1,
+            price_feed=Web3.to_checksum_address(info[2]),
+            borrow_collateral_factor=info[4],
+        )
+        for address, info, symbol in zip(asset_addresses, asset_infos, symbols, strict=True)
+    )
+
+    return MarketConfig(
+        comet_address=comet_address,
+        base_token=AssetConfig(base_token, base_symbol, base_decimals, base_price_feed),
+        collateral_assets=collateral_assets,
+        block_number=block_number,
+    )
+
+
+def get_market_position(wallet: EvmWalletProvider, config: MarketConfig) -> MarketPosition:
+    """Read the balances of the wallet in a market and the asset prices in one multicall.
+
+    Args:
+        wallet: The wallet to read the position of.
+        config: The configuration of the market.
+
+    Returns:
+        MarketPosition: The position of the wallet.
+
+    """
+    account = wallet.get_address()
+    comet = config.comet_address
+    assets = config.collateral_assets
+    calls = [
+        ContractCall(MULTICALL3_ADDRESS, MULTICALL3_ABI, "getBlockNumber"),
+        ContractCall(comet, COMET_ABI, "borrowBalanceOf", (account,)),
+        ContractCall(config.base_token.price_feed, PRICE_FEED_ABI, "latestRoundData"),
+    ]
+    for asset in assets:
+        calls += [
+            ContractCall(comet, COMET_ABI, "collateralBalanceOf", (account, asset.address)),
+            ContractCall(asset.price_feed, PRICE_FEED_ABI, "latestRoundData"),
+        ]
+    block, borrow_balance, base_price, *results = multicall(wallet, calls)
+
+    collateral_balances = {}
+    prices = {config.base_token.address: _value(base_price, "the base token price")[1]}
+    for index, asset in enumerate(assets):
+        balance, price = results[2 * index : 2 * index + 2]
+        collateral_balances[asset.address] = _value(balance, f"the {asset.symbol} balance")
+        prices[asset.address] = _value(price, f"the {asset.symbol} price")[1]
+
+    return MarketPosition(
+        block_number=_value(block, "the block number"),
+        borrow_balance=_value(borrow_balance, "the borrow balance"),
+        collateral_balances=collateral_balances,
+        prices=prices,
+    )
+
+
+class MarketConfigCache:
+    """Caches the configuration of Comet markets per network.
+
+    A configuration is loaded on first use and kept until a position read more than
+    `max_age_blocks` blocks after it is observed, or until it is refreshed explicitly.
+    """
+
+    def __init__(self, max_age_blocks: int = MARKET_CONFIG_MAX_AGE_BLOCKS):
+        """Initialize the cache.
+
+        Args:
+            max_age_blocks: How many blocks a configuration is used for.
+
+        """
+        self.max_age_blocks = max_age_blocks
+        self._configs: dict[tuple[str | None, str], MarketConfig] = {}
+        self._lock = threading.Lock()
+
+    def get(self, wallet: EvmWalletProvider, comet_address: str) -> MarketConfig:
+        """Get the configuration of a market, loading it if it is not cached.
+
+        Args:
+            wallet: The wallet provider of the network of the market.
+            comet_address: The address of the Compound Comet contract.
+
+        Returns:
+            MarketConfig: The configuration of the market.
+
+        """
+        with self._lock:
+            config = self._configs.get(self._key(wallet, comet_address))
+        return config if config is not None else self.refresh(wallet, comet_address)
+
+    def refresh(self, wallet: EvmWalletProvider, comet_address: str) -> MarketConfig:
+        """Reload the configuration of a market, e.g. after a governance upgrade.
+
+        Args:
+            wallet: The wallet provider of the network of the market.
+            comet_address: The address of the Compound Comet contract.
+
+        Returns:
+            MarketConfig: The configuration of the market.
+
+        """
+        config = load_market_config(wallet, comet_address)
+        with self._lock:
+            self._configs[self._key(wallet, comet_address)] = config
+        return config
+
+    def observe(self, wallet: EvmWalletProvider, config: MarketConfig, block_number: int) -> None:
+        """Drop a configuration once a read shows it is more than `max_age_blocks` old.
+
+        Args:
+            wallet: The wallet provider of the network of the market.
+            config: The configuration used for the read.
+            block_number: The block the read was made at.
+
+        """
+        if block_number - config.block_number <= self.max_age_blocks:
+            return
+        key = self._key(wallet, config.comet_address)
+        with self._lock:
+            if self._configs.get(key) is config:
+                del self._configs[key]
+
+    @staticmethod
+    def _key(wallet: EvmWalletProvider, comet_address: str) -> tuple[str | None, str]:
+        """Get the cache key of a market."""
+        return wallet.get_network().network_id, comet_address.lower()
@@ -1,5 +1,8 @@
 """Constants for ERC20 action provider."""
 
+# The maximum number of transfers in a single batch transfer.
+MAX_BATCH_TRANSFERS = 200
+
 ERC20_ABI = [
     {
         "type": "function",
@@ -1,15 +1,23 @@
 """ERC20 action provider."""
 
+from decimal import Decimal
 from typing import Any
 
 from web3 import Web3
 
-from ...network import Network
+from ...network import KNOWN_TOKENS, Network
 from ...wallet_providers import EvmWalletProvider
+from ...wallet_providers.multicall import ContractCall, multicall
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 from .constants import ERC20_ABI
-from .schemas import GetBalanceSchema, TransferSchema
+from .schemas import (
+    BatchTransferSchema,
+    GetBalanceSchema,
+    GetBalancesSchema,
+    TransferItemSchema,
+    TransferSchema,
+)
 
 
 class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
@@ -58,6 +66,66 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
         except Exception as e:
             return f"Error getting balance: {e!s}"
 
+    @create_action(
+        name="get_balances",
+        description="""
+        This tool will get the balances of several ERC20 assets in the wallet at once.
+
+        It takes an optional list of token contract addresses as input. Without it, the balances
+        of the well-known tokens of the network (e.g. USDC, WETH) are returned.
+        Prefer this tool over calling get_balance once per token.
+        """,
+        schema=GetBalancesSchema,
+    )
+    def get_balances(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Get the balances of several ERC20 tokens for the wallet's address.
+
+        The balance, decimals and symbol of every token are read in a single multicall.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A table of the token balances, or error details.
+
+        """
+        try:
+            validated_args = GetBalancesSchema(**args)
+            network_id = wallet_provider.get_network().network_id
+            tokens = validated_args.contract_addresses
+            if tokens is None:
+                tokens = list(KNOWN_TOKENS.get(network_id, {}).values())
+            if not tokens:
+                return f"No contract addresses given and no known tokens on {network_id}"
+
+            address = wallet_provider.get_address()
+            tokens = [Web3.to_checksum_address(token) for token in tokens]
+            calls = [
+                ContractCall(token, ERC20_ABI, function_name, call_args)
+                for token in tokens
+                for function_name, call_args in (
+                    ("balanceOf", (address,)),
+                    ("decimals", ()),
+                    ("symbol", ()),
+                )
+            ]
+            results = multicall(wallet_provider, calls)
+
+            rows = ["| Token | Balance | Contract address |", "| --- | --- | --- |"]
+            for index, token in enumerate(tokens):
+                balance, decimals, symbol = results[3 * index : 3 * index + 3]
+                if balance.success and decimals.success:
+                    amount = Decimal(balance.value) / Decimal(10) ** decimals.value
+                    value = f"{amount.normalize():f}"
+                else:
+                    value = f"error: {balance.error or decimals.error}"
+                rows.append(f"| {symbol.value if symbol.success else '?'} | {value} | {token} |")
+
+            return f"Balances of {address} on {network_id}:\n" + "\n".join(rows)
+        except Exception as e:
+            return f"Error getting balances: {e!s}"
+
     @create_action(
         name="transfer",
         description="""
@@ -110,6 +178,146 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
         except Exception as e:
             return f"Error transferring the asset: {e!s}"
 
+    @create_action(
+        name="batch_transfer",
+        description="""
+        This tool will transfer an ERC20 token from the wallet to many onchain addresses at once,
+        e.g. for payouts or airdrops.
+
+        It takes the following inputs:
+        - contract_address: The contract address of the token to transfer
+        - transfers: A list of transfers, each with a destination and an amount in wei
+
+        All transfers are submitted before any confirmation is awaited, and the status of each
+        transfer is reported. Prefer this tool over calling transfer once per destination.
+
+        Important notes:
+        - Ensure sufficient balance of the token for the sum of all transfers
+        - Ensure there is sufficient native balance for the gas cost of every transfer
+        """,
+        schema=BatchTransferSchema,
+    )
+    def batch_transfer(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Transfer ERC20 tokens to many destination addresses.
+
+        Smart wallets send every transfer in a single user operation. Other wallets submit
+        the transfers back to back with consecutive nonces and then wait for all receipts,
+        so the confirmation waits overlap instead of adding up.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: The status of each transfer, or error details.
+
+        """
+        try:
+            validated_args = BatchTransferSchema(**args)
+            contract_address = Web3.to_checksum_address(validated_args.contract_address)
+            contract = Web3().eth.contract(address=contract_address, abi=ERC20_ABI)
+            transfers = [
+                (
+                    transfer,
+                    contract.encode_abi(
+                        "transfer",
+                        [Web3.to_checksum_address(transfer.destination), int(transfer.amount)],
+                    ),
+                )
+                for transfer in validated_args.transfers
+            ]
+
+            if getattr(wallet_provider, "send_user_operation", None) is not None:
+                statuses = self._transfer_in_user_operation(
+                    wallet_provider, contract_address, transfers
+                )
+            else:
+                statuses = self._transfer_with_nonces(wallet_provider, contract_address, transfers)
+
+            confirmed = sum(status == "confirmed" for status, _ in statuses)
+            lines = [
+                f"Batch transfer of {contract_address}: "
+                f"{confirmed} of {len(transfers)} transfers confirmed."
+            ]
+            for (transfer, _), (status, detail) in zip(transfers, statuses, strict=True):
+                line = f"- {transfer.amount} to {transfer.destination}: {status}"
+                lines.append(f"{line} ({detail})" if detail else line)
+            return "\n".join(lines)
+        except Exception as e:
+            return f"Error transferring the asset: {e!s}"
+
+    def _transfer_in_user_operation(
+        self,
+        wallet_provider: EvmWalletProvider,
+        contract_address: str,
+        transfers: list[tuple[TransferItemSchema, str]],
+    ) -> list[tuple[str, str]]:
+        """Send every transfer as a call of a single user operation."""
+        from cdp import EncodedCall
+
+        calls = [EncodedCall(to=contract_address, data=data, value=0) for _, data in transfers]
+        try:
+            tx_hash = wallet_provider.send_user_operation(calls)
+        except Exception as e:
+            return [("failed", str(e))] * len(transfers)
+        return [("confirmed", f"tx {tx_hash}")] * len(transfers)
+
+    def _transfer_with_nonces(
+        self,
+        wallet_provider: EvmWalletProvider,
+        contract_address: str,
+        transfers: list[tuple[TransferItemSchema, str]],
+    ) -> list[tuple[str, str]]:
+        """Submit the transfers with consecutive nonces, then wait for their receipts.
+
+        Once a transfer cannot be submitted, the later transfers are not sent, since their
+        nonces could not be mined. Wallet providers that do not accept nonces send each
+        transfer after the previous one is confirmed.
+        """
+        try:
+            nonce = wallet_provider.get_transaction_count("pending")
+        except NotImplementedError:
+            nonce = None
+
+        statuses: list[tuple[str, str] | None] = [None] * len(transfers)
+        pending: list[tuple[int, str]] = []
+        stopped = False
+        for index, (_, data) in enumerate(transfers):
+            if stopped:
+                statuses[index] = ("not sent", "")
+                continue
+
+            transaction: dict[str, Any] = {"to": contract_address, "data": data}
+            if nonce is not None:
+                transaction["nonce"] = nonce + index
+            try:
+                tx_hash = wallet_provider.send_transaction(transaction)
+            except Exception as e:
+                statuses[index] = ("failed", str(e))
+                stopped = nonce is not None
+                continue
+
+            if nonce is None:
+                statuses[index] = self._wait_for_transfer(wallet_provider, tx_hash)
+            else:
+                pending.append((index, tx_hash))
+
+        for index, tx_hash in pending:
+            statuses[index] = self._wait_for_transfer(wallet_provider, tx_hash)
+        return statuses
+
+    def _wait_for_transfer(
+        self, wallet_provider: EvmWalletProvider, tx_hash: str
+    ) -> tuple[str, str]:
+        """Wait for the receipt of a transfer and get its status."""
+        try:
+            receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
+        except Exception as e:
+            return ("unconfirmed", f"tx {tx_hash}: {e!s}")
+        if receipt.get("status", 1) == 0:
+            return ("reverted", f"tx {tx_hash}")
+        return ("confirmed", f"tx {tx_hash}")
+
     def supports_network(self, network: Network) -> bool:
         """Check if the network is supported by this action provider.
 
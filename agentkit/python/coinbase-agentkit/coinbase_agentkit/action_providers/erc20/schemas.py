@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, Field, field_validator
 
+from .constants import MAX_BATCH_TRANSFERS
 from .validators import wei_amount_validator
 
 
@@ -14,6 +15,16 @@ class GetBalanceSchema(BaseModel):
     )
 
 
+class GetBalancesSchema(BaseModel):
+    """Schema for getting the balances of several ERC20 tokens."""
+
+    contract_addresses: list[str] | None = Field(
+        None,
+        description="The contract addresses of the tokens to get the balances for. "
+        "Defaults to the well-known tokens of the network (e.g. USDC, WETH)",
+    )
+
+
 class TransferSchema(BaseModel):
     """Schema for transferring ERC20 tokens."""
 
@@ -26,3 +37,27 @@ class TransferSchema(BaseModel):
     def validate_wei_amount(cls, v: str) -> str:
         """Validate wei amount."""
         return wei_amount_validator(v)
+
+
+class TransferItemSchema(BaseModel):
+    """Schema for a single transfer of a batch transfer."""
+
+    destination: str = Field(description="The destination to transfer the funds")
+    amount: str = Field(description="The amount of the asset to transfer in wei")
+
+    @field_validator("amount")
+    @classmethod
+    def validate_wei_amount(cls, v: str) -> str:
+        """Validate wei amount."""
+        return wei_amount_validator(v)
+
+
+class BatchTransferSchema(BaseModel):
+    """Schema for transferring an ERC20 token to many destinations."""
+
+    contract_address: str = Field(description="The contract address of the token to transfer")
+    transfers: list[TransferItemSchema] = Field(
+        description="The destinations and amounts in wei of the transfers",
+        min_length=1,
+        max_length=MAX_BATCH_TRANSFERS,
+    )
@@ -219,3 +219,31 @@ ERC721_ABI = [
         "type": "function",
     },
 ]
+
+ERC721_ENUMERABLE_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "owner", "type": "address"},
+            {"internalType": "uint256", "name": "index", "type": "uint256"},
+        ],
+        "name": "tokenOfOwnerByIndex",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+# The ERC165 interface ID of ERC721Enumerable.
+ERC721_ENUMERABLE_INTERFACE_ID = bytes.fromhex("780e9d63")
+
+# The topic of `Transfer(address,address,uint256)` events.
+TRANSFER_EVENT_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+# The number of token IDs enumerated per collection.
+MAX_TOKENS_PER_CONTRACT = 100
+
+# The number of blocks read per `eth_getLogs` call when scanning Transfer logs.
+LOG_CHUNK_SIZE = 10_000
+
+# The number of recent blocks scanned for Transfer logs of non-enumerable collections.
+MAX_LOG_SCAN_BLOCKS = 500_000
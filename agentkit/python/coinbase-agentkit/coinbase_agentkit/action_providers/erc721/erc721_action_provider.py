@@ -9,16 +9,29 @@ from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
-from .constants import ERC721_ABI
-from .schemas import GetBalanceSchema, MintSchema, TransferSchema
+from .constants import ERC721_ABI, LOG_CHUNK_SIZE, MAX_LOG_SCAN_BLOCKS
+from .holdings import HoldingsReader
+from .schemas import GetBalanceSchema, GetNftHoldingsSchema, MintSchema, TransferSchema
 
 
 class Erc721ActionProvider(ActionProvider[EvmWalletProvider]):
     """Action provider for ERC721 contract interactions."""
 
-    def __init__(self) -> None:
-        """Initialize the ERC721 action provider."""
+    def __init__(
+        self,
+        log_chunk_size: int = LOG_CHUNK_SIZE,
+        max_log_blocks: int = MAX_LOG_SCAN_BLOCKS,
+    ) -> None:
+        """Initialize the ERC721 action provider.
+
+        Args:
+            log_chunk_size: The number of blocks read per `eth_getLogs` call when listing the
+                tokens of collections that are not enumerable.
+            max_log_blocks: The number of recent blocks scanned for their Transfer logs.
+
+        """
         super().__init__("erc721", [])
+        self.holdings = HoldingsReader(log_chunk_size=log_chunk_size, max_log_blocks=max_log_blocks)
 
     @create_action(
         name="mint",
@@ -166,6 +179,48 @@ It takes the following inputs:
         except Exception as e:
             return f"Error getting NFT balance for contract {args['contract_address']}: {e}"
 
+    @create_action(
+        name="get_nft_holdings",
+        description="""
+This tool will list the NFTs (ERC721 tokens) held by an address across several collections.
+
+It takes the following inputs:
+- contract_addresses: The NFT contract addresses to check
+- address: (Optional) The address to list holdings for. If not provided, uses the wallet's address
+
+It returns, per collection, the number of tokens held and their token IDs. Prefer this tool
+over calling get_balance once per collection.
+""",
+        schema=GetNftHoldingsSchema,
+    )
+    def get_nft_holdings(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """List the NFTs held by an address across several collections.
+
+        Balances and token IDs are read with multicalls. Collections that do not implement
+        ERC721Enumerable are listed from their Transfer logs.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider to use for the reads.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the holdings of each collection, or error details.
+
+        """
+        try:
+            validated_args = GetNftHoldingsSchema(**args)
+            address = validated_args.address or wallet_provider.get_address()
+
+            block_number, holdings = self.holdings.read(
+                wallet_provider, address, validated_args.contract_addresses
+            )
+
+            lines = [f"NFT holdings of {address} at block {block_number}:"]
+            lines += [collection.format() for collection in holdings]
+            return "\n".join(lines)
+        except Exception as e:
+            return f"Error getting NFT holdings: {e}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if the ERC721 action provider supports the given network.
 
@@ -179,11 +234,18 @@ It takes the following inputs:
         return network.protocol_family == "evm"
 
 
-def erc721_action_provider() -> Erc721ActionProvider:
+def erc721_action_provider(
+    log_chunk_size: int = LOG_CHUNK_SIZE,
+    max_log_blocks: int = MAX_LOG_SCAN_BLOCKS,
+) -> Erc721ActionProvider:
     """Create an instance of the ERC721 action provider.
 
+    Args:
+        log_chunk_size: The number of blocks read per `eth_getLogs` call when scanning logs.
+        max_log_blocks: The number of recent blocks scanned for Transfer logs.
+
     Returns:
         An instance of the ERC721 action provider.
 
     """
-    return Erc721ActionProvider()
+    return Erc721ActionProvider(log_chunk_size=log_chunk_size, max_log_blocks=max_log_blocks)
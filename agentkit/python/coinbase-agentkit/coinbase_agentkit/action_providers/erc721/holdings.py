@@ -0,0 +1,252 @@
+"""Batched enumeration of the NFTs held by an address."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from web3 import Web3
+
+from ...wallet_providers.evm_wallet_provider import EvmWalletProvider
+from ...wallet_providers.multicall import (
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+    ContractCall,
+    multicall,
+)
+from .constants import (
+    ERC721_ABI,
+    ERC721_ENUMERABLE_ABI,
+    ERC721_ENUMERABLE_INTERFACE_ID,
+    LOG_CHUNK_SIZE,
+    MAX_LOG_SCAN_BLOCKS,
+    MAX_TOKENS_PER_CONTRACT,
+    TRANSFER_EVENT_TOPIC,
+)
+
+ENUMERABLE_ABI = ERC721_ABI + ERC721_ENUMERABLE_ABI
+
+
+@dataclass
+class CollectionHoldings:
+    """The tokens of a collection held by an address at a block."""
+
+    contract_address: str
+    balance: int | None = None
+    token_ids: list[int] = field(default_factory=list)
+    enumerable: bool = False
+    scanned_blocks: int | None = None
+    error: str | None = None
+
+    def format(self) -> str:
+        """Format the holdings as a single line."""
+        if self.error is not None:
+            return f"- {self.contract_address}: error: {self.error}"
+
+        line = f"- {self.contract_address}: {self.balance} tokens"
+        if self.scanned_blocks is not None and len(self.token_ids) < self.balance:
+            line += (
+                f", {len(self.token_ids)} found in Transfer logs of the last "
+                f"{self.scanned_blocks} blocks"
+            )
+        elif len(self.token_ids) < self.balance:
+            line += f", first {len(self.token_ids)} listed"
+        if self.token_ids:
+            line += f": {', '.join(str(token_id) for token_id in self.token_ids)}"
+        return line
+
+
+class HoldingsReader:
+    """Reads the NFTs an address holds across collections with as few RPC calls as possible.
+
+    Balances and ERC721Enumerable support of every collection are read in one multicall,
+    together with the block number. The token IDs of enumerable collections are then read
+    with `tokenOfOwnerByIndex` in a second multicall at that block. For other collections,
+    `Transfer` logs to the owner are scanned backwards in chunks, and the tokens they name
+    are kept if `ownerOf` still returns the owner. Results are cached per block.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = MAX_TOKENS_PER_CONTRACT,
+        log_chunk_size: int = LOG_CHUNK_SIZE,
+        max_log_blocks: int = MAX_LOG_SCAN_BLOCKS,
+        max_cached: int = 256,
+    ):
+        """Initialize the reader.
+
+        Args:
+            max_tokens: The number of token IDs listed per collection.
+            log_chunk_size: The number of blocks read per `eth_getLogs` call.
+            max_log_blocks: The number of recent blocks scanned for Transfer logs.
+            max_cached: The number of collection holdings cached.
+
+        """
+        self.max_tokens = max_tokens
+        self.log_chunk_size = log_chunk_size
+        self.max_log_blocks = max_log_blocks
+        self.max_cached = max_cached
+        self._cache: OrderedDict[tuple, CollectionHoldings] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(
+        self, wallet_provider: EvmWalletProvider, owner: str, contract_addresses: list[str]
+    ) -> tuple[int, list[CollectionHoldings]]:
+        """Read the tokens of several collections held by an address.
+
+        Args:
+            wallet_provider: The wallet provider of the network to read.
+            owner: The address holding the tokens.
+            contract_addresses: The collections.
+
+        Returns:
+            tuple[int, list[CollectionHoldings]]: The block the holdings were read at, and the
+                holdings of each collection.
+
+        """
+        owner = Web3.to_checksum_address(owner)
+        contracts = [Web3.to_checksum_address(address) for address in contract_addresses]
+        network_id = wallet_provider.get_network().network_id
+
+        calls = [ContractCall(MULTICALL3_ADDRESS, MULTICALL3_ABI, "getBlockNumber")]
+        for contract in contracts:
+            calls += [
+                ContractCall(contract, ERC721_ABI, "balanceOf", (owner,)),
+                ContractCall(
+                    contract, ERC721_ABI, "supportsInterface", (ERC721_ENUMERABLE_INTERFACE_ID,)
+                ),
+            ]
+        block, *results = multicall(wallet_provider, calls)
+        if not block.success:
+            raise ValueError(f"Could not read the block number: {block.error}")
+        block_number = block.value
+
+        holdings: list[CollectionHoldings] = []
+        to_enumerate: list[CollectionHoldings] = []
+        for index, contract in enumerate(contracts):
+            cached = self._get((network_id, contract, owner, block_number))
+            if cached is not None:
+                holdings.append(cached)
+                continue
+
+            balance, enumerable = results[2 * index : 2 * index + 2]
+            collection = CollectionHoldings(contract)
+            holdings.append(collection)
+            if not balance.success:
+                collection.error = balance.error
+                continue
+            collection.balance = balance.value
+            collection.enumerable = enumerable.success and enumerable.value is True
+            if collection.balance and collection.enumerable:
+                to_enumerate.append(collection)
+            elif collection.balance:
+                self._scan_logs(wallet_provider, owner, collection, block_number)
+
+        self._enumerate(wallet_provider, owner, to_enumerate, block_number)
+        for collection in holdings:
+            self._put((network_id, collection.contract_address, owner, block_number), collection)
+        return block_number, holdings
+
+    def _enumerate(
+        self,
+        wallet_provider: EvmWalletProvider,
+        owner: str,
+        collections: list[CollectionHoldings],
+        block_number: int,
+    ) -> None:
+        """List the tokens of enumerable collections with a single multicall."""
+        calls = [
+            ContractCall(c.contract_address, ENUMERABLE_ABI, "tokenOfOwnerByIndex", (owner, i))
+            for c in collections
+            for i in range(min(c.balance, self.max_tokens))
+        ]
+        results = iter(multicall(wallet_provider, calls, block_identifier=block_number))
+        for collection in collections:
+            for _ in range(min(collection.balance, self.max_tokens)):
+                result = next(results)
+                if result.success:
+                    collection.token_ids.append(result.value)
+
+    def _scan_logs(
+        self,
+        wallet_provider: EvmWalletProvider,
+        owner: str,
+        collection: CollectionHoldings,
+        block_number: int,
+    ) -> None:
+        """Find the tokens of a non-enumerable collection from its Transfer logs.
+
+        Logs are read backwards from the block until every token of the balance is found,
+        `max_tokens` are found, or `max_log_blocks` were scanned.
+        """
+        owner_topic = "0x" + owner[2:].lower().rjust(64, "0")
+        wanted = min(collection.balance, self.max_tokens)
+        checked: set[int] = set()
+        found: list[int] = []
+        to_block = block_number
+        scanned = 0
+        try:
+            while len(found) < wanted and scanned < self.max_log_blocks and to_block >= 0:
+                from_block = max(
+                    0, to_block - min(self.log_chunk_size, self.max_log_blocks - scanned) + 1
+                )
+                logs = wallet_provider.get_logs(
+                    {
+                        "address": collection.contract_address,
+                        "topics": [TRANSFER_EVENT_TOPIC, None, owner_topic],
+                        "fromBlock": from_block,
+                        "toBlock": to_block,
+                    }
+                )
+                scanned += to_block - from_block + 1
+                to_block = from_block - 1
+
+                candidates = [
+                    token_id
+                    for token_id in dict.fromkeys(_token_id(log) for log in logs)
+                    if token_id is not None and token_id not in checked
+                ]
+                checked.update(candidates)
+                owners = multicall(
+                    wallet_provider,
+                    [
+                        ContractCall(collection.contract_address, ERC721_ABI, "ownerOf", (t,))
+                        for t in candidates
+                    ],
+                    block_identifier=block_number,
+                )
+                found += [
+                    token_id
+                    for token_id, result in zip(candidates, owners, strict=True)
+                    if result.success and result.value == owner
+                ]
+        except Exception as e:
+            if not found:
+                collection.error = f"Could not scan Transfer logs: {e!s}"
+                return
+
+        collection.token_ids = sorted(found)[:wanted]
+        collection.scanned_blocks = scanned
+
+    def _get(self, key: tuple) -> CollectionHoldings | None:
+        """Get cached holdings."""
+        with self._lock:
+            return self._cache.get(key)
+
+    def _put(self, key: tuple, collection: CollectionHoldings) -> None:
+        """Cache holdings, evicting the oldest beyond `max_cached`."""
+        if collection.error is not None:
+            return
+        with self._lock:
+            self._cache[key] = collection
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+
+
+def _token_id(log: dict) -> int | None:
+    """Get the token ID of an ERC721 Transfer log, or None for ERC20 Transfer logs."""
+    topics = log.get("topics") or []
+    if len(topics) != 4:
+        return None
+    topic = topics[3]
+    return int(topic if isinstance(topic, str) else topic.hex(), 16)
@@ -37,3 +37,17 @@ class TransferSchema(BaseModel):
         None,
         description="The address to transfer from. If not provided, defaults to the wallet's default address",
     )
+
+
+class GetNftHoldingsSchema(BaseModel):
+    """Input schema for get NFT (ERC721) holdings action."""
+
+    contract_addresses: list[str] = Field(
+        description="The NFT contract addresses to list the held tokens of",
+        min_length=1,
+        max_length=50,
+    )
+    address: str | None = Field(
+        None,
+        description="The address to list NFT holdings for. If not provided, uses the wallet's default address",
+    )
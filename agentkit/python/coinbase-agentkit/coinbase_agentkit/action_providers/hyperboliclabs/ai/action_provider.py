@@ -5,14 +5,20 @@ It includes functionality for text, image and audio generation.
 """
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ...action_decorator import create_action
 from ..action_provider import ActionProvider
+from ..service import create_session
+from .batch import run_batch
+from .cache import ResponseCache
 from .schemas import (
     GenerateAudioSchema,
     GenerateImageSchema,
+    GenerateImagesSchema,
     GenerateTextSchema,
+    GenerateTextsSchema,
 )
 from .service import AIService
 from .types import (
@@ -23,6 +29,12 @@ from .types import (
 )
 from .utils import save_base64_data, save_text
 
+# Number of prompts of a batch action generated concurrently
+MAX_BATCH_WORKERS = 4
+
+# Number of images of a single response decoded and written concurrently
+MAX_IMAGE_WRITERS = 4
+
 
 class AIActionProvider(ActionProvider):
     """Action provider for generating text, images and audio via AI."""
@@ -32,15 +44,22 @@ class AIActionProvider(ActionProvider):
     def __init__(
         self,
         api_key: str | None = None,
+        response_cache: ResponseCache | None = None,
     ):
         """Initialize the AI action provider.
 
         Args:
             api_key: The API key for authentication.
+            response_cache: Optional cache of deterministic responses, used by actions
+                called with `cache_ttl`.
 
         """
         super().__init__("hyperbolic_ai", [], api_key=api_key)
-        self.ai_service = AIService(api_key=self.api_key)
+        self.ai_service = AIService(
+            api_key=self.api_key,
+            session=create_session(pool_size=MAX_BATCH_WORKERS),
+            cache=response_cache,
+        )
 
     @create_action(
         name="generate_text",
@@ -51,6 +70,9 @@ Required inputs:
 - prompt: Text prompt for generation.
 - model: (Optional) Model to use for text generation.
     Default: "meta-llama/Meta-Llama-3-70B-Instruct"
+- temperature: (Optional) Sampling temperature, 0 for deterministic output
+- seed: (Optional) Random seed for reproducible output
+- cache_ttl: (Optional) Seconds to reuse the output of an identical deterministic request
 
 Example successful response:
     Text generation successful:
@@ -82,25 +104,11 @@ Important notes:
         try:
             validated_args = GenerateTextSchema(**args)
 
-            messages = []
-            if validated_args.system_prompt:
-                messages.append(ChatMessage(role="system", content=validated_args.system_prompt))
-            messages.append(ChatMessage(role="user", content=validated_args.prompt))
-
-            request = ChatCompletionRequest(
-                messages=messages,
-                model=validated_args.model,
-            )
-
-            response = self.ai_service.generate_text(request)
-
-            if not response.choices or len(response.choices) == 0:
+            result = self._generate_text_file(validated_args.prompt, validated_args)
+            if result is None:
                 return "Error: Generation failed: No text was generated by the model."
 
-            generated_text = response.choices[0].message.content
-
-            filename = f"./tmp/generated_text_{uuid.uuid4()}.txt"
-            file_path = save_text(generated_text, filename)
+            file_path, generated_text = result
 
             preview = generated_text[:500] + "..." if len(generated_text) > 500 else generated_text
 
@@ -129,6 +137,8 @@ Required inputs:
 - steps: (Optional) Number of inference steps (default: 30)
 - num_images: (Optional) Number of images to generate (default: 1)
 - negative_prompt: (Optional) What to avoid in the image
+- seed: (Optional) Random seed for reproducible images
+- cache_ttl: (Optional) Seconds to reuse the images of an identical request with a seed
 
 Example successful response:
     Image generation successful:
@@ -166,15 +176,11 @@ Important notes:
                 steps=validated_args.steps,
                 num_images=validated_args.num_images,
                 negative_prompt=validated_args.negative_prompt,
+                seed=validated_args.seed,
+                cache_ttl=validated_args.cache_ttl,
             )
 
-            response = self.ai_service.generate_image(request)
-
-            file_paths = []
-            for img in response.images:
-                filename = f"./tmp/generated_image_{uuid.uuid4()}.png"
-                file_path = save_base64_data(img.image, filename)
-                file_paths.append(file_path)
+            file_paths = self._generate_image_files(request)
 
             if not file_paths:
                 return "Error: Generation failed: No images were generated."
@@ -252,15 +258,225 @@ Important notes:
         except Exception as e:
             return f"Error: Audio generation: {e!s}"
 
+    @create_action(
+        name="generate_texts",
+        description="""
+This tool generates text for several prompts at once using specified language model.
+
+Required inputs:
+- prompts: List of text prompts (1-8), one completion per prompt
+- model: (Optional) Model to use (default: "meta-llama/Meta-Llama-3-70B-Instruct")
+- system_prompt: (Optional) System prompt applied to every prompt
+- temperature: (Optional) Sampling temperature, 0 for deterministic output
+- seed: (Optional) Random seed for reproducible output
+- cache_ttl: (Optional) Seconds to reuse identical deterministic output
+
+Example response:
+    Batch text generation: 2/2 succeeded
+    Latency: total 3.10s, per item min 2.50s, median 2.80s, max 3.10s
+
+    1. Saved to: /path/to/generated_text_{uuid}.txt
+       Preview: ...
+    2. Error: API request failed
+
+Important notes:
+- Prompts are generated concurrently and results are listed in the order of the prompts
+- A failing prompt does not affect the others
+- Use this instead of several generate_text calls to produce variations or batches
+""",
+        schema=GenerateTextsSchema,
+    )
+    def generate_texts(self, args: dict[str, Any]) -> str:
+        """Generate text for several prompts concurrently.
+
+        With `cache_ttl` set and a deterministic request (`temperature` 0 or a `seed`), each
+        prompt is served from the response cache when an identical request was made within
+        the TTL.
+
+        Args:
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = GenerateTextsSchema(**args)
+
+            def generate(prompt: str) -> tuple[str, str]:
+                result = self._generate_text_file(prompt, validated_args)
+                if result is None:
+                    raise ValueError("Generation failed: No text was generated by the model.")
+                return result
+
+            batch = run_batch(generate, validated_args.prompts, MAX_BATCH_WORKERS)
+
+            output = [*batch.format_summary("text"), ""]
+            for index, item in enumerate(batch.items, start=1):
+                if item.error is not None:
+                    output.append(f"{index}. Error: {item.error!s}")
+                    continue
+
+                file_path, generated_text = item.value
+                preview = (
+                    generated_text[:200] + "..." if len(generated_text) > 200 else generated_text
+                )
+                output.append(f"{index}. Saved to: {file_path}")
+                output.append(f"   Preview: {preview}")
+
+            return "\n".join(output)
+        except Exception as e:
+            return f"Error: Batch text generation: {e!s}"
+
+    @create_action(
+        name="generate_images",
+        description="""
+This tool generates images for several prompts at once using specified model.
+
+Required inputs:
+- prompts: List of image prompts (1-8)
+- model_name: (Optional) The model to use (default: "SDXL1.0-base")
+- height, width: (Optional) Image size in pixels (default: 1024)
+- steps: (Optional) Number of inference steps (default: 30)
+- num_images: (Optional) Number of images per prompt (default: 1)
+- negative_prompt: (Optional) What to avoid in every image
+- seed: (Optional) Random seed for reproducible images
+- cache_ttl: (Optional) Seconds to reuse identical output when a seed is set
+
+Example response:
+    Batch image generation: 2/2 succeeded
+    Latency: total 8.10s, per item min 7.50s, median 7.80s, max 8.10s
+
+    1. Saved to: /path/to/generated_image_{uuid}.png
+    2. Error: API request failed
+
+Important notes:
+- Prompts are generated concurrently and results are listed in the order of the prompts
+- A failing prompt does not affect the others
+- Images are saved as PNG files with a UUID in the filename
+""",
+        schema=GenerateImagesSchema,
+    )
+    def generate_images(self, args: dict[str, Any]) -> str:
+        """Generate images for several prompts concurrently.
+
+        With `cache_ttl` and a `seed` set, each prompt is served from the response cache when
+        an identical request was made within the TTL.
+
+        Args:
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = GenerateImagesSchema(**args)
+
+            def generate(prompt: str) -> list[str]:
+                file_paths = self._generate_image_files(
+                    ImageGenerationRequest(
+                        prompt=prompt,
+                        model_name=validated_args.model_name,
+                        height=validated_args.height,
+                        width=validated_args.width,
+                        steps=validated_args.steps,
+                        num_images=validated_args.num_images,
+                        negative_prompt=validated_args.negative_prompt,
+                        seed=validated_args.seed,
+                        cache_ttl=validated_args.cache_ttl,
+                    )
+                )
+                if not file_paths:
+                    raise ValueError("Generation failed: No images were generated.")
+                return file_paths
+
+            batch = run_batch(generate, validated_args.prompts, MAX_BATCH_WORKERS)
+
+            output = [*batch.format_summary("image"), ""]
+            for index, item in enumerate(batch.items, start=1):
+                if item.error is not None:
+                    output.append(f"{index}. Error: {item.error!s}")
+                    continue
+
+                output.append(f"{index}. Saved to: {', '.join(item.value)}")
+
+            return "\n".join(output)
+        except Exception as e:
+            return f"Error: Batch image generation: {e!s}"
+
+    def _generate_text_file(
+        self, prompt: str, options: GenerateTextSchema | GenerateTextsSchema
+    ) -> tuple[str, str] | None:
+        """Generate text for a prompt and save it to a file.
+
+        Args:
+            prompt: The text prompt.
+            options: The validated action arguments, giving the model, system prompt,
+                sampling and caching options.
+
+        Returns:
+            tuple[str, str] | None: The file path and the generated text, or None if the model
+                returned no choices.
+
+        """
+        messages = []
+        if options.system_prompt:
+            messages.append(ChatMessage(role="system", content=options.system_prompt))
+        messages.append(ChatMessage(role="user", content=prompt))
+
+        response = self.ai_service.generate_text(
+            ChatCompletionRequest(
+                messages=messages,
+                model=options.model,
+                temperature=options.temperature,
+                seed=options.seed,
+                cache_ttl=options.cache_ttl,
+            )
+        )
+
+        if not response.choices:
+            return None
+
+        generated_text = response.choices[0].message.content
+
+        filename = f"./tmp/generated_text_{uuid.uuid4()}.txt"
+        return save_text(generated_text, filename), generated_text
+
+    def _generate_image_files(self, request: ImageGenerationRequest) -> list[str]:
+        """Generate images and save them to files.
+
+        Args:
+            request: The image generation request.
+
+        Returns:
+            list[str]: The paths of the saved images, in response order.
+
+        """
+        response = self.ai_service.generate_image(request)
+
+        images = [img.image for img in response.images]
+        filenames = [f"./tmp/generated_image_{uuid.uuid4()}.png" for _ in images]
+        if len(images) <= 1:
+            return list(map(save_base64_data, images, filenames))
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(images), MAX_IMAGE_WRITERS), thread_name_prefix="hyperbolic-writer"
+        ) as writer:
+            return list(writer.map(save_base64_data, images, filenames))
+
 
 def ai_action_provider(
     api_key: str | None = None,
+    response_cache: ResponseCache | None = None,
 ) -> AIActionProvider:
     """Create a new instance of the AIActionProvider.
 
     Args:
         api_key: Optional API key for authentication. If not provided,
                 will attempt to read from HYPERBOLIC_API_KEY environment variable.
+        response_cache: Optional cache of deterministic responses, used by actions
+                called with `cache_ttl`.
 
     Returns:
         A new AI action provider instance.
@@ -269,4 +485,4 @@ def ai_action_provider(
         ValueError: If API key is not provided and not found in environment.
 
     """
-    return AIActionProvider(api_key=api_key)
+    return AIActionProvider(api_key=api_key, response_cache=response_cache)
@@ -0,0 +1,81 @@
+"""Concurrent execution of batches of Hyperbolic AI requests."""
+
+import statistics
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class BatchItemResult:
+    """The outcome of a single item of a batch."""
+
+    value: Any = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+
+@dataclass
+class BatchResult:
+    """The outcomes of every item of a batch, in input order."""
+
+    items: list[BatchItemResult]
+    elapsed: float
+
+    @property
+    def succeeded(self) -> int:
+        """Get the number of items that completed without an error."""
+        return sum(item.error is None for item in self.items)
+
+    def format_summary(self, label: str) -> list[str]:
+        """Format the success count and latency summary of the batch.
+
+        Args:
+            label: What the batch generated, for example "text".
+
+        Returns:
+            list[str]: The summary lines.
+
+        """
+        latencies = [item.elapsed for item in self.items]
+        return [
+            f"Batch {label} generation: {self.succeeded}/{len(self.items)} succeeded",
+            f"Latency: total {self.elapsed:.2f}s, per item min {min(latencies):.2f}s, "
+            f"median {statistics.median(latencies):.2f}s, max {max(latencies):.2f}s",
+        ]
+
+
+def _timed(fn: Callable[[Any], Any], item: Any) -> BatchItemResult:
+    """Run a single item, capturing its result or error and its latency."""
+    start = time.perf_counter()
+    try:
+        return BatchItemResult(value=fn(item), elapsed=time.perf_counter() - start)
+    except Exception as e:
+        return BatchItemResult(error=e, elapsed=time.perf_counter() - start)
+
+
+def run_batch(fn: Callable[[Any], Any], items: list[Any], max_workers: int) -> BatchResult:
+    """Run a function over every item on a thread pool scoped to the batch.
+
+    Each item runs in a copy of the caller's context, so the calls it makes are attributed
+    to the calling action. An error in one item does not affect the others.
+
+    Args:
+        fn: The function to run for each item.
+        items: The items.
+        max_workers: The maximum number of items run concurrently.
+
+    Returns:
+        BatchResult: The outcome of every item, in input order.
+
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=max(min(len(items), max_workers), 1), thread_name_prefix="hyperbolic-batch"
+    ) as executor:
+        futures = [executor.submit(copy_context().run, _timed, fn, item) for item in items]
+        results = [future.result() for future in futures]
+    return BatchResult(items=results, elapsed=time.perf_counter() - start)
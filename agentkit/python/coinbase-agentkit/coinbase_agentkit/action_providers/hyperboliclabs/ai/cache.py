@@ -0,0 +1,174 @@
+"""Content-addressed cache of deterministic Hyperbolic AI responses."""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from pydantic import BaseModel
+
+from ....instrumentation import record_cache_lookup
+
+
+def request_cache_key(kind: str, request: BaseModel) -> str:
+    """Get the content address of a request.
+
+    The address is the SHA-256 of the canonical JSON of everything sent to the API, so
+    requests that differ only in fields excluded from serialization, such as `cache_ttl`,
+    share an address.
+
+    Args:
+        kind: The kind of request, for example "chat".
+        request: The request.
+
+    Returns:
+        str: The hex digest.
+
+    """
+    canonical = json.dumps(
+        {"kind": kind, "request": request.model_dump(exclude_none=True)},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """A two-tier cache of API responses with a per-entry time to live.
+
+    The memory tier keeps the most recently used entries up to `max_entries`. The optional
+    disk tier keeps every entry as a JSON file under `directory`, so entries survive
+    restarts and memory evictions. Expired entries are dropped when they are read.
+    """
+
+    def __init__(self, max_entries: int = 128, directory: str | None = None):
+        """Initialize the cache.
+
+        Args:
+            max_entries: The number of entries kept in memory.
+            directory: Optional directory of the disk tier.
+
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self._memory: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get a cached response.
+
+        Args:
+            key: The content address of the request.
+
+        Returns:
+            dict[str, Any] | None: The response, or None if it is not cached or has expired.
+
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+
+        entry = self._read(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            self._remove(key)
+            return None
+
+        self._remember(key, entry)
+        return entry[1]
+
+    def set(self, key: str, value: dict[str, Any], ttl: float) -> None:
+        """Cache a response.
+
+        Args:
+            key: The content address of the request.
+            value: The JSON-serializable response.
+            ttl: Seconds the response is served from the cache.
+
+        """
+        entry = (time.time() + ttl, value)
+        self._remember(key, entry)
+        self._write(key, entry)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self.directory and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _remember(self, key: str, entry: tuple[float, dict[str, Any]]) -> None:
+        """Put an entry in the memory tier, evicting the least recently used entries."""
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        """Get the file of an entry in the disk tier."""
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read(self, key: str) -> tuple[float, dict[str, Any]] | None:
+        """Read an entry from the disk tier."""
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+            return data["expires_at"], data["value"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write(self, key: str, entry: tuple[float, dict[str, Any]]) -> None:
+        """Write an entry to the disk tier atomically."""
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"expires_at": entry[0], "value": entry[1]}, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry from the disk tier."""
+        with contextlib.suppress(OSError):
+            os.remove(self._path(key))
+
+
+def lookup(
+    cache: ResponseCache, kind: str, request: BaseModel
+) -> tuple[str, dict[str, Any] | None]:
+    """Look up a request in a cache and report the lookup.
+
+    Args:
+        cache: The cache.
+        kind: The kind of request, for example "chat".
+        request: The request.
+
+    Returns:
+        tuple[str, dict[str, Any] | None]: The content address of the request and the cached
+            response, if any.
+
+    """
+    key = request_cache_key(kind, request)
+    value = cache.get(key)
+    record_cache_lookup("hyperbolic_ai_responses", hit=value is not None)
+    return key, value
@@ -18,6 +18,22 @@ class GenerateTextSchema(BaseModel):
         default=None,
         description="Optional system prompt to guide the model's behavior",
     )
+    temperature: float | None = Field(
+        default=None,
+        description="Sampling temperature. Use 0 for deterministic, cacheable completions",
+        ge=0.0,
+        le=2.0,
+    )
+    seed: int | None = Field(
+        default=None,
+        description="Random seed, making completions reproducible and cacheable",
+    )
+    cache_ttl: float | None = Field(
+        default=None,
+        description="Seconds to reuse the response of an identical deterministic request "
+        "(temperature 0 or a seed), if the provider has a response cache",
+        gt=0,
+    )
 
 
 class GenerateImageSchema(BaseModel):
@@ -56,6 +72,16 @@ class GenerateImageSchema(BaseModel):
         None,
         description="Text specifying what the model should not generate",
     )
+    seed: int | None = Field(
+        None,
+        description="Random seed, making images reproducible and cacheable",
+    )
+    cache_ttl: float | None = Field(
+        None,
+        description="Seconds to reuse the response of an identical request with a seed, "
+        "if the provider has a response cache",
+        gt=0,
+    )
 
 
 class GenerateAudioSchema(BaseModel):
@@ -76,3 +102,89 @@ class GenerateAudioSchema(BaseModel):
         ge=0.1,
         le=5.0,
     )
+
+
+class GenerateTextsSchema(BaseModel):
+    """Schema for generate_texts action."""
+
+    prompts: list[str] = Field(
+        description="The text prompts to generate from, one completion per prompt",
+        min_length=1,
+        max_length=8,
+    )
+    model: str = Field(
+        default="meta-llama/Meta-Llama-3-70B-Instruct",
+        description="The model to use for text generation",
+    )
+    system_prompt: str | None = Field(
+        default=None,
+        description="Optional system prompt to guide the model's behavior for every prompt",
+    )
+    temperature: float | None = Field(
+        default=None,
+        description="Sampling temperature. Use 0 for deterministic, cacheable completions",
+        ge=0.0,
+        le=2.0,
+    )
+    seed: int | None = Field(
+        default=None,
+        description="Random seed, making completions reproducible and cacheable",
+    )
+    cache_ttl: float | None = Field(
+        default=None,
+        description="Seconds to reuse the response of an identical deterministic request "
+        "(temperature 0 or a seed), if the provider has a response cache",
+        gt=0,
+    )
+
+
+class GenerateImagesSchema(BaseModel):
+    """Schema for generate_images action."""
+
+    prompts: list[str] = Field(
+        description="The image prompts to generate from",
+        min_length=1,
+        max_length=8,
+    )
+    model_name: str = Field(
+        default="SDXL1.0-base",
+        description="The model to use for image generation",
+    )
+    height: int = Field(
+        default=1024,
+        description="Image height in pixels",
+        ge=64,
+        le=2048,
+    )
+    width: int = Field(
+        default=1024,
+        description="Image width in pixels",
+        ge=64,
+        le=2048,
+    )
+    steps: int = Field(
+        default=30,
+        description="Number of inference steps",
+        ge=1,
+        le=100,
+    )
+    num_images: int = Field(
+        default=1,
+        description="Number of images to generate per prompt",
+        ge=1,
+        le=4,
+    )
+    negative_prompt: str | None = Field(
+        None,
+        description="Text specifying what the model should not generate for any prompt",
+    )
+    seed: int | None = Field(
+        None,
+        description="Random seed, making images reproducible and cacheable",
+    )
+    cache_ttl: float | None = Field(
+        None,
+        description="Seconds to reuse the response of an identical request with a seed, "
+        "if the provider has a response cache",
+        gt=0,
+    )
@@ -1,7 +1,16 @@
 """Service for AI-related operations."""
 
+import time
+from collections.abc import Callable
+from typing import Any
+
+import requests
+from pydantic import BaseModel
+
 from ..constants import AI_SERVICES_BASE_URL, AI_SERVICES_ENDPOINTS, SUPPORTED_IMAGE_MODELS
 from ..service import Base
+from .cache import ResponseCache, lookup
+from .streaming import ChatCompletionStream
 from .types import (
     AudioGenerationRequest,
     AudioGenerationResponse,
@@ -15,14 +24,23 @@ from .types import (
 class AIService(Base):
     """AI service for Hyperbolic platform."""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        session: requests.Session | None = None,
+        cache: ResponseCache | None = None,
+    ):
         """Initialize AI service.
 
         Args:
             api_key: API key for authentication.
+            session: Optional HTTP session whose connections are reused across requests.
+            cache: Optional cache of deterministic responses. Requests opt in by setting
+                `cache_ttl`.
 
         """
-        super().__init__(api_key, AI_SERVICES_BASE_URL)
+        super().__init__(api_key, AI_SERVICES_BASE_URL, session=session)
+        self.cache = cache
 
     def generate_text(
         self,
@@ -30,6 +48,10 @@ class AIService(Base):
     ) -> ChatCompletionResponse:
         """Generate text using specified model.
 
+        If the request has `stream` set, the completion is streamed and aggregated, which
+        records the time to first token but still returns once generation has finished.
+        Otherwise, deterministic requests with a `cache_ttl` are served from the cache.
+
         Args:
             request: The ChatCompletionRequest object containing the request parameters.
 
@@ -37,12 +59,44 @@ class AIService(Base):
             ChatCompletionResponse: The chat completion response.
 
         """
+        if request.stream:
+            with self.stream_text(request) as stream:
+                return stream.response
+
+        response = self._cached(
+            "chat",
+            request,
+            request.temperature == 0 or request.seed is not None,
+            lambda: self.make_request(
+                endpoint=AI_SERVICES_ENDPOINTS["TEXT_GENERATION"],
+                data=request.model_dump(exclude_none=True),
+            ).json(),
+        )
+
+        return ChatCompletionResponse(**response)
+
+    def stream_text(
+        self,
+        request: ChatCompletionRequest,
+    ) -> ChatCompletionStream:
+        """Generate text using specified model, receiving tokens as they are generated.
+
+        Args:
+            request: The ChatCompletionRequest object containing the request parameters.
+                The request is sent with `stream` set regardless of its value.
+
+        Returns:
+            ChatCompletionStream: The stream yielding token deltas and the aggregated response.
+
+        """
+        started_at = time.perf_counter()
         response = self.make_request(
             endpoint=AI_SERVICES_ENDPOINTS["TEXT_GENERATION"],
-            data=request.model_dump(exclude_none=True),
+            data=request.model_copy(update={"stream": True}).model_dump(exclude_none=True),
+            stream=True,
         )
 
-        return ChatCompletionResponse(**response.json())
+        return ChatCompletionStream(response, started_at=started_at)
 
     def generate_image(
         self,
@@ -50,6 +104,8 @@ class AIService(Base):
     ) -> ImageGenerationResponse:
         """Generate images using specified model.
 
+        Requests with a fixed seed and a `cache_ttl` are served from the cache.
+
         Args:
             request: The ImageGenerationRequest object containing the request parameters.
 
@@ -62,12 +118,17 @@ class AIService(Base):
                 f"Model {request.model_name} not supported. Use one of: {SUPPORTED_IMAGE_MODELS}"
             )
 
-        response = self.make_request(
-            endpoint=AI_SERVICES_ENDPOINTS["IMAGE_GENERATION"],
-            data=request.model_dump(exclude_none=True),
+        response = self._cached(
+            "image",
+            request,
+            request.seed is not None,
+            lambda: self.make_request(
+                endpoint=AI_SERVICES_ENDPOINTS["IMAGE_GENERATION"],
+                data=request.model_dump(exclude_none=True),
+            ).json(),
         )
 
-        return ImageGenerationResponse(**response.json())
+        return ImageGenerationResponse(**response)
 
     def generate_audio(
         self,
@@ -88,3 +149,32 @@ class AIService(Base):
         )
 
         return AudioGenerationResponse(**response.json())
+
+    def _cached(
+        self,
+        kind: str,
+        request: BaseModel,
+        deterministic: bool,
+        fetch: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Get a response from the cache, or fetch and cache it.
+
+        Args:
+            kind: The kind of request, part of the cache key.
+            request: The request, whose canonical serialization addresses the response.
+            deterministic: Whether the request always produces the same response.
+            fetch: Function fetching the response from the API.
+
+        Returns:
+            dict[str, Any]: The JSON response.
+
+        """
+        ttl = getattr(request, "cache_ttl", None)
+        if self.cache is None or not ttl or not deterministic:
+            return fetch()
+
+        key, response = lookup(self.cache, kind, request)
+        if response is None:
+            response = fetch()
+            self.cache.set(key, response, ttl)
+        return response
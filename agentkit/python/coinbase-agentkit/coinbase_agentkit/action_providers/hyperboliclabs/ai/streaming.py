@@ -0,0 +1,196 @@
+"""Incremental consumption of streamed Hyperbolic chat completions."""
+
+import json
+import time
+from collections.abc import Iterable, Iterator
+
+import requests
+
+from ....instrumentation import record_call
+from ....instrumentation.tracing import TIME_TO_FIRST_TOKEN
+from .types import (
+    ChatCompletionChunk,
+    ChatCompletionResponse,
+    ChatCompletionResponseChoice,
+    ChatCompletionResponseMessage,
+    ChatCompletionResponseUsage,
+)
+
+STREAM_DONE = "[DONE]"
+
+
+def iter_sse_data(lines: Iterable[str | bytes]) -> Iterator[str]:
+    """Get the data of every server-sent event in a stream of lines.
+
+    Multi-line data fields are joined with newlines. Comments and other fields are ignored.
+
+    Args:
+        lines: The lines of the event stream, without line terminators.
+
+    Yields:
+        str: The data of each event.
+
+    """
+    data: list[str] = []
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line:
+            if data:
+                yield "\n".join(data)
+                data = []
+            continue
+        if line.startswith(":"):
+            continue
+
+        field, _, value = line.partition(":")
+        if field == "data":
+            data.append(value[1:] if value.startswith(" ") else value)
+
+    if data:
+        yield "\n".join(data)
+
+
+class ChatCompletionStream:
+    """A streamed chat completion that yields token deltas as they arrive.
+
+    Iterating the stream yields the text added to the first choice by each chunk. Once the
+    stream is exhausted, `response` holds the aggregated completion of every choice.
+    """
+
+    def __init__(self, response: requests.Response, started_at: float | None = None):
+        """Initialize the stream.
+
+        Args:
+            response: The HTTP response of a `stream=true` chat completion request.
+            started_at: `time.perf_counter()` when the request was sent, used to measure the
+                time to first token.
+
+        """
+        self._http_response = response
+        self._started_at = time.perf_counter() if started_at is None else started_at
+        self._events = iter_sse_data(response.iter_lines())
+        self._first_chunk: ChatCompletionChunk | None = None
+        self._roles: dict[int, str] = {}
+        self._contents: dict[int, list[str]] = {}
+        self._finish_reasons: dict[int, str | None] = {}
+        self._usage: ChatCompletionResponseUsage | None = None
+        self._done = False
+        self._closed = False
+        self.time_to_first_token: float | None = None
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the text added to the first choice by each chunk."""
+        return self.iter_chunks_text()
+
+    def __enter__(self) -> "ChatCompletionStream":
+        """Enter the stream context."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the underlying connection."""
+        self.close()
+
+    def iter_chunks(self) -> Iterator[ChatCompletionChunk]:
+        """Yield every chunk of the completion as it arrives.
+
+        Yields:
+            ChatCompletionChunk: The next chunk.
+
+        Raises:
+            ValueError: If the server reports an error in the stream.
+
+        """
+        try:
+            for data in self._events:
+                if data == STREAM_DONE:
+                    break
+
+                payload = json.loads(data)
+                if "error" in payload:
+                    error = payload["error"]
+                    message = error.get("message", error) if isinstance(error, dict) else error
+                    raise ValueError(f"Stream error: {message}")
+
+                chunk = ChatCompletionChunk(**payload)
+                self._aggregate(chunk)
+                yield chunk
+            self._done = True
+        finally:
+            self.close()
+
+    def iter_chunks_text(self) -> Iterator[str]:
+        """Yield the text added to the first choice by each chunk.
+
+        Yields:
+            str: The next token delta.
+
+        """
+        for chunk in self.iter_chunks():
+            for choice in chunk.choices:
+                if choice.index == 0 and choice.delta.content:
+                    yield choice.delta.content
+
+    @property
+    def response(self) -> ChatCompletionResponse:
+        """Get the aggregated completion, reading the rest of the stream if necessary.
+
+        If the stream was closed early, the completion holds the chunks received until then.
+
+        Returns:
+            ChatCompletionResponse: The completion, as if it had not been streamed.
+
+        Raises:
+            ValueError: If the stream ended before any chunk was received.
+
+        """
+        if not self._done and not self._closed:
+            for _ in self.iter_chunks():
+                pass
+
+        if self._first_chunk is None:
+            raise ValueError("Stream ended without any completion chunks")
+
+        return ChatCompletionResponse(
+            id=self._first_chunk.id,
+            object="chat.completion",
+            created=self._first_chunk.created,
+            model=self._first_chunk.model,
+            choices=[
+                ChatCompletionResponseChoice(
+                    index=index,
+                    message=ChatCompletionResponseMessage(
+                        role=self._roles.get(index, "assistant"),
+                        content="".join(self._contents.get(index, [])),
+                    ),
+                    finish_reason=self._finish_reasons.get(index),
+                )
+                for index in sorted(self._contents.keys() | self._finish_reasons.keys())
+            ],
+            usage=self._usage,
+        )
+
+    def close(self) -> None:
+        """Release the underlying connection, ending the stream where it is."""
+        self._closed = True
+        self._http_response.close()
+
+    def _aggregate(self, chunk: ChatCompletionChunk) -> None:
+        """Fold a chunk into the aggregated completion."""
+        if self._first_chunk is None:
+            self._first_chunk = chunk
+        if chunk.usage is not None:
+            self._usage = chunk.usage
+
+        for choice in chunk.choices:
+            if choice.delta.role:
+                self._roles[choice.index] = choice.delta.role
+            if choice.delta.content:
+                if self.time_to_first_token is None:
+                    self.time_to_first_token = time.perf_counter() - self._started_at
+                    record_call(TIME_TO_FIRST_TOKEN, chunk.model, self.time_to_first_token)
+                self._contents.setdefault(choice.index, []).append(choice.delta.content)
+            else:
+                self._contents.setdefault(choice.index, [])
+            if choice.finish_reason is not None:
+                self._finish_reasons[choice.index] = choice.finish_reason
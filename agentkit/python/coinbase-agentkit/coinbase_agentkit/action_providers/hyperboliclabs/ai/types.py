@@ -58,6 +58,13 @@ class ChatCompletionRequest(BaseModel):
     repetition_penalty: float | None = Field(
         None, description="Penalty for token repetition", ge=0.0
     )
+    cache_ttl: float | None = Field(
+        None,
+        exclude=True,
+        description="Seconds to serve the response from the AI service cache, if it has one. "
+        "Only applies when the completion is deterministic (temperature 0 or a fixed seed)",
+        gt=0,
+    )
 
 
 class ChatCompletionResponseMessage(BaseModel):
@@ -104,6 +111,34 @@ class ChatCompletionResponse(BaseModel):
     usage: ChatCompletionResponseUsage | None = Field(None, description="Token usage information")
 
 
+class ChatCompletionChunkDelta(BaseModel):
+    """The part of a message added by a streamed chunk."""
+
+    role: str | None = Field(None, description="The role of the message sender")
+    content: str | None = Field(None, description="The content added to the message")
+
+
+class ChatCompletionChunkChoice(BaseModel):
+    """A single choice in a streamed chat completion chunk."""
+
+    index: int = Field(..., description="Index of this choice")
+    delta: ChatCompletionChunkDelta = Field(..., description="The message content added")
+    finish_reason: str | None = Field(None, description="Reason for finishing")
+
+
+class ChatCompletionChunk(BaseModel):
+    """A single server-sent event of a streamed chat completion."""
+
+    id: str = Field(..., description="Unique identifier for this completion")
+    object: str = Field(..., description="Object type")
+    created: int = Field(..., description="Unix timestamp of creation")
+    model: str = Field(..., description="Model used for completion")
+    choices: list[ChatCompletionChunkChoice] = Field(
+        default_factory=list, description="List of completion choice deltas"
+    )
+    usage: ChatCompletionResponseUsage | None = Field(None, description="Token usage information")
+
+
 class ImageGenerationRequest(BaseModel):
     """Request model for image generation API."""
 
@@ -130,6 +165,13 @@ class ImageGenerationRequest(BaseModel):
         None, description="Base64 encoded image for ControlNet input"
     )
     loras: dict[str, float] | None = Field(None, description="Pairs of lora name and weight")
+    cache_ttl: float | None = Field(
+        None,
+        exclude=True,
+        description="Seconds to serve the response from the AI service cache, if it has one. "
+        "Only applies when the generation is deterministic (a fixed seed)",
+        gt=0,
+    )
 
 
 class ImageMetadata(BaseModel):
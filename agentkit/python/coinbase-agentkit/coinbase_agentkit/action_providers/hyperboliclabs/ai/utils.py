@@ -5,12 +5,57 @@ such as saving generated data.
 """
 
 import base64
+import binascii
 import os
+from collections.abc import Iterator
+
+# Number of base64 characters decoded at a time. A multiple of 4, so that every chunk of a
+# payload without whitespace decodes on its own.
+BASE64_CHUNK_SIZE = 256 * 1024
+
+
+def iter_base64_decode(base64_data: str, chunk_size: int = BASE64_CHUNK_SIZE) -> Iterator[bytes]:
+    """Decode base64 data in fixed-size chunks.
+
+    A data URI prefix such as `data:image/png;base64,` is skipped and whitespace is ignored.
+    Only one chunk of the encoded and decoded data is held in memory at a time.
+
+    Args:
+        base64_data: The base64 encoded data string
+        chunk_size: Number of base64 characters decoded at a time
+
+    Yields:
+        bytes: The next decoded chunk
+
+    Raises:
+        ValueError: If the base64 data is invalid
+
+    """
+    start = base64_data.find(",") + 1
+    carry = ""
+    try:
+        for offset in range(start, len(base64_data), chunk_size):
+            chunk = carry + base64_data[offset : offset + chunk_size]
+            if any(c.isspace() for c in chunk):
+                chunk = "".join(chunk.split())
+
+            aligned = len(chunk) - len(chunk) % 4
+            carry = chunk[aligned:]
+            if aligned:
+                yield base64.b64decode(chunk[:aligned])
+
+        if carry:
+            yield base64.b64decode(carry)
+    except binascii.Error as e:
+        raise ValueError(f"Invalid base64 data: {e!s}") from e
 
 
 def save_base64_data(base64_data: str, output_path: str) -> str:
     """Save base64 encoded data to a file.
 
+    The data is decoded in chunks straight into the file, so memory use does not grow with
+    the size of the decoded media. The file is removed if the data turns out to be invalid.
+
     Args:
         base64_data: The base64 encoded data string
         output_path: Path where to save the file
@@ -24,18 +69,17 @@ def save_base64_data(base64_data: str, output_path: str) -> str:
 
     """
     try:
-        if "," in base64_data:
-            base64_data = base64_data.split(",")[1]
-
-        decoded_data = base64.b64decode(base64_data)
         os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
 
-        with open(output_path, "wb") as f:
-            f.write(decoded_data)
+        try:
+            with open(output_path, "wb") as f:
+                for decoded_chunk in iter_base64_decode(base64_data):
+                    f.write(decoded_chunk)
+        except ValueError:
+            os.remove(output_path)
+            raise
 
         return os.path.abspath(output_path)
-    except base64.binascii.Error as e:
-        raise ValueError(f"Invalid base64 data: {e!s}") from e
     except OSError as e:
         raise OSError(f"Error saving file: {e!s}") from e
 
@@ -65,6 +109,7 @@ def save_text(text: str, output_path: str) -> str:
 
 
 __all__ = [
+    "iter_base64_decode",
     "save_base64_data",
     "save_text",
 ]
@@ -4,20 +4,25 @@ This module provides actions for interacting with Hyperbolic billing services.
 It includes functionality for checking balance and spend history.
 """
 
+import threading
 from typing import Any
 
 from ...action_decorator import create_action
 from ..action_provider import ActionProvider
 from ..marketplace.service import MarketplaceService
+from ..marketplace.types import InstanceHistoryEntry
+from .rollup import SpendRollup, get_account_fingerprint, load_rollup, save_rollup
 from .schemas import (
     GetCurrentBalanceSchema,
     GetPurchaseHistorySchema,
+    GetSpendBreakdownSchema,
     GetSpendHistorySchema,
 )
 from .service import BillingService
 from .utils import (
     format_purchase_history,
-    format_spend_history,
+    format_spend_breakdown,
+    format_spend_rollup,
 )
 
 
@@ -32,12 +37,15 @@ class BillingActionProvider(ActionProvider):
     def __init__(
         self,
         api_key: str | None = None,
+        spend_rollup_path: str | None = None,
     ):
         """Initialize the Hyperbolic billing action provider.
 
         Args:
             api_key: Optional API key for authentication. If not provided,
                     will attempt to read from HYPERBOLIC_API_KEY environment variable.
+            spend_rollup_path: Optional file the aggregated spend is persisted to, so that
+                    only rentals completed since the last run are aggregated after a restart.
 
         Raises:
             ValueError: If API key is not provided and not found in environment.
@@ -46,6 +54,9 @@ class BillingActionProvider(ActionProvider):
         super().__init__("hyperbolic_billing", [], api_key=api_key)
         self.billing = BillingService(self.api_key)
         self.marketplace = MarketplaceService(self.api_key)
+        self.spend_rollup_path = spend_rollup_path
+        self._rollup = load_rollup(spend_rollup_path, get_account_fingerprint(self.api_key))
+        self._rollup_lock = threading.Lock()
 
     @create_action(
         name="get_current_balance",
@@ -128,12 +139,16 @@ Important notes:
 - All costs are in USD
 - Duration is in seconds
 - History includes instance names with animal-based identifiers
+- Totals cover every completed rental
 """,
         schema=GetSpendHistorySchema,
     )
     def get_spend_history(self, args: dict[str, Any]) -> str:
         """Retrieve GPU rental spending history from the platform.
 
+        Totals come from the spend rollup, which only folds in the rentals completed since
+        its watermark on each call.
+
         Args:
             args (dict[str, Any]): Input arguments for the action.
 
@@ -151,10 +166,59 @@ Important notes:
             if not response.instance_history:
                 return "No rental history found."
 
-            return format_spend_history(response)
+            with self._rollup_lock:
+                rollup = self._update_rollup(response.instance_history)
+                return format_spend_rollup(response.instance_history, rollup)
         except Exception as e:
             return f"Error: Spend history retrieval: {e!s}"
 
+    @create_action(
+        name="get_spend_breakdown",
+        description="""
+This tool breaks down your GPU rental spending on Hyperbolic platform by GPU model or period.
+
+Optional inputs:
+- group_by: "model", "day", "month" or "year" (default: "month")
+
+Example successful response:
+    Spend by month:
+    - 2025-02: $1.20
+    - 2025-03: $5.76
+
+    Total Spending: $6.96 over 24 rentals
+
+Example error response:
+    Error: API request failed
+
+Important notes:
+- All costs are in USD
+- Only completed rentals are included, attributed to the day they were terminated
+""",
+        schema=GetSpendBreakdownSchema,
+    )
+    def get_spend_breakdown(self, args: dict[str, Any]) -> str:
+        """Break down GPU rental spending by GPU model or calendar period.
+
+        Args:
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = GetSpendBreakdownSchema(**args)
+
+            response = self.marketplace.get_instance_history()
+            if not response:
+                return "Could not retrieve instance history. Please try again later."
+
+            with self._rollup_lock:
+                rollup = self._update_rollup(response.instance_history)
+                return format_spend_breakdown(rollup, validated_args.group_by)
+        except Exception as e:
+            return f"Error: Spend breakdown retrieval: {e!s}"
+
     @create_action(
         name="get_purchase_history",
         description="""
@@ -197,6 +261,22 @@ Important notes:
         except Exception as e:
             return f"Error: Purchase history retrieval: {e!s}"
 
+    def _update_rollup(self, entries: list[InstanceHistoryEntry]) -> SpendRollup:
+        """Fold newly completed rentals into the spend rollup and persist it.
+
+        Must be called with the rollup lock held, which also guards reading the result.
+
+        Args:
+            entries: Rental history entries.
+
+        Returns:
+            SpendRollup: The updated rollup.
+
+        """
+        if self._rollup.update(entries) and self.spend_rollup_path:
+            save_rollup(self._rollup, self.spend_rollup_path)
+        return self._rollup
+
 
 def hyperbolic_billing_action_provider(
     api_key: str | None = None,
@@ -0,0 +1,243 @@
+"""Incremental rollup of Hyperbolic GPU rental spend.
+
+Completed rentals never change, so each one is folded into the rollup once. Rentals
+terminated after the watermark are new; everything else has already been counted.
+"""
+
+import hashlib
+import os
+import tempfile
+from collections.abc import Iterable
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from ..marketplace.types import InstanceHistoryEntry
+
+UNKNOWN_GPU = "Unknown GPU"
+
+
+def parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO format timestamp as returned by the API.
+
+    Args:
+        timestamp: ISO format timestamp string.
+
+    Returns:
+        datetime: The parsed timestamp.
+
+    """
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+def get_gpu_models(entry: InstanceHistoryEntry) -> list[str]:
+    """Get the GPU models of a rental.
+
+    Args:
+        entry: The rental.
+
+    Returns:
+        list[str]: The GPU models, empty if unknown.
+
+    """
+    if not entry.hardware or not entry.hardware.gpus:
+        return []
+    return [gpu.model for gpu in entry.hardware.gpus if gpu.model]
+
+
+def get_rental_cost(entry: InstanceHistoryEntry) -> tuple[float, float] | None:
+    """Get the duration and cost of a completed rental.
+
+    Args:
+        entry: The rental.
+
+    Returns:
+        tuple[float, float] | None: The duration in seconds and the cost in USD, or None if
+            the rental has no start or termination time.
+
+    """
+    if not entry.started_at or not entry.terminated_at:
+        return None
+
+    duration_seconds = (
+        parse_timestamp(entry.terminated_at) - parse_timestamp(entry.started_at)
+    ).total_seconds()
+    return duration_seconds, (duration_seconds / 3600.0 * entry.price.amount) / 100.0
+
+
+class ModelSpend(BaseModel):
+    """The accumulated spend on a GPU model."""
+
+    count: float = Field(0, description="Number of GPUs rented")
+    total_cost: float = Field(0.0, description="Total cost in USD")
+    total_seconds: float = Field(0.0, description="Total rental time in seconds")
+    last_terminated_at: str | None = Field(None, description="Latest termination time")
+
+
+class SpendRollup(BaseModel):
+    """Spend aggregated over every completed rental up to the watermark."""
+
+    account: str = Field("", description="Fingerprint of the API key the rollup belongs to")
+    watermark: str | None = Field(None, description="Latest termination time folded in")
+    watermark_keys: list[str] = Field(
+        default_factory=list, description="Rentals terminated exactly at the watermark"
+    )
+    rental_count: int = Field(0, description="Number of completed rentals folded in")
+    by_model: dict[str, ModelSpend] = Field(default_factory=dict, description="Spend per GPU model")
+    by_day: dict[str, float] = Field(
+        default_factory=dict, description="Cost in USD per termination day (YYYY-MM-DD)"
+    )
+    total_cost: float = Field(0.0, description="Total cost in USD")
+
+    def update(self, entries: Iterable[InstanceHistoryEntry]) -> int:
+        """Fold the rentals completed after the watermark into the rollup.
+
+        Args:
+            entries: Rental history entries, in any order.
+
+        Returns:
+            int: The number of rentals folded in.
+
+        """
+        watermark = parse_timestamp(self.watermark) if self.watermark else None
+        seen_at_watermark = set(self.watermark_keys)
+
+        new: list[tuple[datetime, str, InstanceHistoryEntry]] = []
+        for entry in entries:
+            if not entry.started_at or not entry.terminated_at:
+                continue
+
+            terminated_at = parse_timestamp(entry.terminated_at)
+            key = f"{entry.instance_name}|{entry.started_at}|{entry.terminated_at}"
+            if watermark is not None and (
+                terminated_at < watermark
+                or (terminated_at == watermark and key in seen_at_watermark)
+            ):
+                continue
+            new.append((terminated_at, key, entry))
+
+        if not new:
+            return 0
+
+        new.sort(key=lambda item: item[0])
+        for _, _, entry in new:
+            self._fold(entry)
+
+        latest = new[-1][0]
+        if watermark is None or latest > watermark:
+            self.watermark = latest.isoformat()
+            seen_at_watermark = set()
+        seen_at_watermark.update(key for terminated_at, key, _ in new if terminated_at == latest)
+        self.watermark_keys = sorted(seen_at_watermark)
+        return len(new)
+
+    def spend_by_model(self) -> list[tuple[str, ModelSpend]]:
+        """Get the spend per GPU model.
+
+        Returns:
+            list[tuple[str, ModelSpend]]: The spend per model, most recently rented first.
+
+        """
+        return sorted(
+            self.by_model.items(),
+            key=lambda item: parse_timestamp(item[1].last_terminated_at or "1970-01-01T00:00:00Z"),
+            reverse=True,
+        )
+
+    def spend_by_period(self, period: str = "month") -> dict[str, float]:
+        """Get the cost per calendar period.
+
+        Args:
+            period: "day", "month" or "year".
+
+        Returns:
+            dict[str, float]: The cost in USD per period, oldest first.
+
+        Raises:
+            ValueError: If the period is not supported.
+
+        """
+        lengths = {"day": 10, "month": 7, "year": 4}
+        if period not in lengths:
+            raise ValueError(f"Period must be one of {list(lengths)}")
+
+        totals: dict[str, float] = {}
+        for day, cost in sorted(self.by_day.items()):
+            bucket = day[: lengths[period]]
+            totals[bucket] = totals.get(bucket, 0.0) + cost
+        return totals
+
+    def _fold(self, entry: InstanceHistoryEntry) -> None:
+        """Add a completed rental to every aggregate."""
+        duration_seconds, cost = get_rental_cost(entry)
+        gpu_models = get_gpu_models(entry)
+        gpu_count = entry.gpu_count or 0
+
+        self.rental_count += 1
+
+        shares = gpu_models or [UNKNOWN_GPU]
+        for model in shares:
+            stats = self.by_model.setdefault(model, ModelSpend())
+            stats.count += gpu_count / len(shares)
+            stats.total_cost += cost / len(shares)
+            stats.total_seconds += duration_seconds
+            stats.last_terminated_at = entry.terminated_at
+
+        day = parse_timestamp(entry.terminated_at).date().isoformat()
+        self.by_day[day] = self.by_day.get(day, 0.0) + cost
+        self.total_cost += cost
+
+
+def get_account_fingerprint(api_key: str) -> str:
+    """Get a fingerprint identifying the account of an API key without storing the key.
+
+    Args:
+        api_key: The API key.
+
+    Returns:
+        str: The fingerprint.
+
+    """
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def load_rollup(path: str | None, account: str) -> SpendRollup:
+    """Load the rollup of an account, starting a new one if there is none.
+
+    Args:
+        path: Optional file the rollup is persisted to.
+        account: Fingerprint of the account.
+
+    Returns:
+        SpendRollup: The rollup.
+
+    """
+    if path and os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                rollup = SpendRollup.model_validate_json(f.read())
+            if rollup.account == account:
+                return rollup
+        except (OSError, ValueError):
+            pass
+    return SpendRollup(account=account)
+
+
+def save_rollup(rollup: SpendRollup, path: str) -> None:
+    """Persist a rollup atomically.
+
+    Args:
+        rollup: The rollup.
+        path: The file to persist it to.
+
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(rollup.model_dump_json())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
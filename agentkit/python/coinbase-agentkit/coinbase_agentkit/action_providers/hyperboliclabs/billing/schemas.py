@@ -3,7 +3,9 @@
 This module provides simplified schemas for billing action inputs.
 """
 
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 
 
 class GetCurrentBalanceSchema(BaseModel):
@@ -22,3 +24,12 @@ class GetSpendHistorySchema(BaseModel):
     """Schema for get_spend_history action."""
 
     pass
+
+
+class GetSpendBreakdownSchema(BaseModel):
+    """Schema for get_spend_breakdown action."""
+
+    group_by: Literal["model", "day", "month", "year"] = Field(
+        default="month",
+        description="Group spend by GPU model or by calendar day, month or year",
+    )
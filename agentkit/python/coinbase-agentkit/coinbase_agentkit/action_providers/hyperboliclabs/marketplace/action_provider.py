@@ -4,15 +4,21 @@ This module provides actions for interacting with Hyperbolic marketplace service
 It includes functionality for managing GPU instances and SSH access.
 """
 
+import time
 from typing import Any
 
 from ...action_decorator import create_action
+from ...ssh.connection import SSHConnectionParams, UnknownHostKeyError
+from ...ssh.connection_pool import SSHConnectionPool
 from ..action_provider import ActionProvider
+from .inventory import GpuInventoryCache
+from .readiness import connect_with_retries, wait_until_ready
 from .schemas import (
     GetAvailableGpusByTypeSchema,
     GetAvailableGpusSchema,
     GetAvailableGpusTypesSchema,
     GetGpuStatusSchema,
+    RentAndConnectSchema,
     RentComputeSchema,
     TerminateComputeSchema,
 )
@@ -20,8 +26,9 @@ from .service import MarketplaceService
 from .utils import (
     format_all_gpu_instances,
     format_gpu_instances_by_type,
+    format_gpu_models,
     format_gpu_status,
-    format_gpu_types,
+    format_rent_and_connect_response,
     format_rent_compute_response,
     format_terminate_compute_response,
 )
@@ -38,12 +45,18 @@ class MarketplaceActionProvider(ActionProvider):
     def __init__(
         self,
         api_key: str | None = None,
+        inventory_ttl: float = 10.0,
+        ssh_pool: SSHConnectionPool | None = None,
     ):
         """Initialize the Hyperbolic marketplace action provider.
 
         Args:
             api_key: Optional API key for authentication. If not provided,
                     will attempt to read from HYPERBOLIC_API_KEY environment variable.
+            inventory_ttl: Seconds a fetched GPU inventory is reused across actions.
+            ssh_pool: Optional pool that rent_and_connect adds its connections to. Pass the
+                `connection_pool` of an SSH action provider to run commands on rented nodes
+                with its actions.
 
         Raises:
             ValueError: If API key is not provided and not found in environment.
@@ -51,6 +64,10 @@ class MarketplaceActionProvider(ActionProvider):
         """
         super().__init__("hyperbolic_marketplace", [], api_key=api_key)
         self.marketplace = MarketplaceService(self.api_key)
+        self.inventory = GpuInventoryCache(
+            lambda: self.marketplace.get_available_instances().instances, ttl=inventory_ttl
+        )
+        self.ssh_pool = ssh_pool or SSHConnectionPool(name="hyperbolic")
 
     @create_action(
         name="get_available_gpus",
@@ -74,7 +91,7 @@ Example error response:
 Important notes:
 - The GPU prices are shown in dollars per hour
 - Only non-reserved and available GPU instances are returned
-- GPU availability is real-time and may change between queries
+- GPU availability is refreshed every few seconds and may change between queries
 """,
         schema=GetAvailableGpusSchema,
     )
@@ -91,12 +108,12 @@ Important notes:
         GetAvailableGpusSchema(**args)
 
         try:
-            response = self.marketplace.get_available_instances()
+            inventory = self.inventory.get()
 
-            if not response.instances:
+            if not inventory.instances:
                 return "No available GPU instances found."
 
-            return format_all_gpu_instances(response.instances)
+            return format_all_gpu_instances(inventory.instances)
 
         except Exception as e:
             return f"Error: GPU retrieval: {e!s}"
@@ -120,7 +137,7 @@ Example error response:
 
 Important notes:
 - Only models with available GPUs are listed
-- GPU availability is real-time and may change between queries
+- GPU availability is refreshed every few seconds and may change between queries
 - The GPU model names include manufacturer and specific model details
 """,
         schema=GetAvailableGpusTypesSchema,
@@ -138,12 +155,12 @@ Important notes:
         GetAvailableGpusTypesSchema(**args)
 
         try:
-            response = self.marketplace.get_available_instances()
+            inventory = self.inventory.get()
 
-            if not response.instances:
+            if not inventory.instances:
                 return "No available GPU instances found."
 
-            return format_gpu_types(response.instances)
+            return format_gpu_models(inventory.models)
 
         except Exception as e:
             return f"Error: GPU types retrieval: {e!s}"
@@ -156,6 +173,8 @@ This tool retrieves all available GPU machines of a specific model on the Hyperb
 Required inputs:
 - gpu_model: The GPU model to filter by (e.g., "NVIDIA-GeForce-RTX-4090")
 
+Optional inputs: min_gpus (minimum available GPUs per node) and max_price ($ per GPU per hour)
+
 Example successful response:
     Available NVIDIA-GeForce-RTX-4090 GPU Options:
 
@@ -166,13 +185,6 @@ Example successful response:
     Price: $0.35/hour per GPU
     ----------------------------------------
 
-    Cluster: webbed-peperomia-magpie
-    Node ID: las1-prd-acl-msi-07.fen.intra
-    GPU Model: NVIDIA-GeForce-RTX-4090
-    Available GPUs: 1/4
-    Price: $0.30/hour per GPU
-    ----------------------------------------
-
 Example error response:
     Error: API request failed
     Error: No available GPU instances with the model 'NVIDIA-GeForce-RTX-4090' found
@@ -198,12 +210,17 @@ Important notes:
         gpu_model = validated_args.gpu_model
 
         try:
-            response = self.marketplace.get_available_instances()
+            inventory = self.inventory.get()
 
-            if not response.instances:
+            if not inventory.instances:
                 return "No available GPU instances found."
 
-            return format_gpu_instances_by_type(response.instances, gpu_model)
+            offers = inventory.find(
+                gpu_model=gpu_model,
+                min_gpus=validated_args.min_gpus,
+                max_price=validated_args.max_price,
+            )
+            return format_gpu_instances_by_type([offer.instance for offer in offers], gpu_model)
 
         except Exception as e:
             return f"Error: GPU retrieval: {e!s}"
@@ -327,12 +344,111 @@ Important notes:
 
         try:
             response = self.marketplace.rent_instance(validated_args)
+            self.inventory.invalidate()
 
             return format_rent_compute_response(response)
 
         except Exception as e:
             return f"Error: Compute rental: {e!s}"
 
+    @create_action(
+        name="rent_and_connect",
+        description="""
+This tool rents a GPU machine on Hyperbolic platform and opens an SSH connection to it once
+it is ready, all in one step. It polls the instance status until it accepts SSH connections.
+
+Required inputs:
+- cluster_name: Which cluster the node is on
+- node_name: Which node to rent
+- gpu_count: How many GPUs to rent
+
+Optional inputs:
+- private_key_path: Path to the SSH private key (default: the platform's key path or ~/.ssh/id_rsa)
+- connection_id: Identifier for the SSH connection (default: the instance name)
+- timeout: Seconds to wait for the instance to accept SSH connections (default: 600)
+
+Important notes:
+- Use this instead of rent_compute followed by repeated get_gpu_status checks
+- The instance stays rented if it does not become ready in time; terminate it with terminate_compute
+- If the host key is unknown, add it with ssh_add_host_key and connect with ssh_connect
+- Do not ask for a duration, it is not needed
+""",
+        schema=RentAndConnectSchema,
+    )
+    def rent_and_connect(self, args: dict[str, Any]) -> str:
+        """Rents a GPU machine and connects to it once it accepts SSH connections.
+
+        The instance status is polled with jittered exponential backoff until it is running,
+        then the SSH connection is retried while the node is still starting. The response
+        reports the time spent renting, provisioning and connecting.
+
+        Args:
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        validated_args = RentAndConnectSchema(**args)
+        start = time.monotonic()
+
+        try:
+            response = self.marketplace.rent_instance(
+                RentComputeSchema(
+                    cluster_name=validated_args.cluster_name,
+                    node_name=validated_args.node_name,
+                    gpu_count=validated_args.gpu_count,
+                )
+            )
+            self.inventory.invalidate()
+        except Exception as e:
+            return f"Error: Compute rental: {e!s}"
+
+        instance_name = response.instance_name
+        if not instance_name:
+            return f"Error: Compute rental: No instance name in response ({response.status})"
+        timings = {"rent": time.monotonic() - start}
+
+        try:
+            stage = time.monotonic()
+            rental, target, polls = wait_until_ready(
+                lambda: self.marketplace.get_rented_instances().instances,
+                instance_name,
+                timeout=validated_args.timeout,
+            )
+            timings["provisioning"] = time.monotonic() - stage
+        except Exception as e:
+            return (
+                f"Error: Instance readiness: {e!s}. The instance is still rented; check it with "
+                f"get_gpu_status or release it with terminate_compute (id: {instance_name})."
+            )
+
+        params = SSHConnectionParams(
+            connection_id=validated_args.connection_id or instance_name,
+            host=target.host,
+            username=target.username,
+            port=target.port,
+            private_key_path=validated_args.private_key_path or target.key_path,
+        )
+        stage = time.monotonic()
+        remaining = max(validated_args.timeout - (stage - start), 0.0)
+        try:
+            _, attempts = connect_with_retries(self.ssh_pool, params, timeout=remaining)
+            error = None
+        except UnknownHostKeyError as e:
+            attempts, error = None, str(e)
+        except Exception as e:
+            return (
+                f"Error: SSH connection: {e!s}. Instance {instance_name} is running; "
+                f"connect manually with: {target.command}"
+            )
+        timings["connect"] = time.monotonic() - stage
+        timings["total"] = time.monotonic() - start
+
+        return format_rent_and_connect_response(
+            rental, target, params.connection_id, timings, polls, attempts, error
+        )
+
     @create_action(
         name="terminate_compute",
         description="""
@@ -382,6 +498,7 @@ Important notes:
 
         try:
             response = self.marketplace.terminate_instance(validated_args)
+            self.inventory.invalidate()
 
             return format_terminate_compute_response(response)
 
@@ -0,0 +1,240 @@
+"""Indexed, TTL-cached snapshot of the Hyperbolic GPU marketplace inventory."""
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+
+from ....instrumentation import record_cache_lookup
+from .types import AvailableInstance, GpuOffer
+
+# Upper bounds in dollars per GPU per hour of the price bands offers are indexed by.
+PRICE_BANDS = (0.5, 1.0, 2.0, 4.0, 8.0)
+
+# GPU model of offers on nodes that list no GPU hardware.
+UNKNOWN_MODEL = "Unknown Model"
+
+
+def get_price_band(price: float) -> int:
+    """Get the index of the price band a price falls in.
+
+    Args:
+        price: Price in dollars per GPU per hour.
+
+    Returns:
+        int: The index of the band, where `len(PRICE_BANDS)` is the open-ended top band.
+
+    """
+    return bisect_left(PRICE_BANDS, price)
+
+
+def to_gpu_offer(instance: AvailableInstance) -> GpuOffer | None:
+    """Derive the offer of a marketplace node.
+
+    Args:
+        instance: The marketplace node.
+
+    Returns:
+        GpuOffer | None: The offer, or None if the node is reserved or has no free GPUs.
+
+    """
+    if instance.reserved:
+        return None
+
+    gpus_total = instance.gpus_total or 0
+    gpus_available = gpus_total - (instance.gpus_reserved or 0)
+    if gpus_available <= 0:
+        return None
+
+    gpus = instance.hardware.gpus
+    return GpuOffer(
+        cluster_name=instance.cluster_name or "Unknown Cluster",
+        node_id=instance.id,
+        gpu_model=gpus[0].model if gpus else UNKNOWN_MODEL,
+        gpus_available=gpus_available,
+        gpus_total=gpus_total,
+        price=instance.pricing.price.amount / 100 if instance.pricing else 0,
+        instance=instance,
+    )
+
+
+class GpuInventory:
+    """An immutable snapshot of the marketplace, indexed by GPU model, cluster and price band.
+
+    Every index lists offers from cheapest to most expensive.
+    """
+
+    def __init__(self, instances: list[AvailableInstance], fetched_at: float | None = None):
+        """Build the snapshot.
+
+        Args:
+            instances: Every node returned by the marketplace.
+            fetched_at: Monotonic time the nodes were fetched at.
+
+        """
+        self.instances = instances
+        self.fetched_at = time.monotonic() if fetched_at is None else fetched_at
+
+        offers = [offer for offer in map(to_gpu_offer, instances) if offer is not None]
+        self.offers = sorted(offers, key=lambda offer: offer.price)
+
+        self.by_model: dict[str, list[GpuOffer]] = {}
+        self.by_cluster: dict[str, list[GpuOffer]] = {}
+        self.by_price_band: dict[int, list[GpuOffer]] = {}
+        for offer in self.offers:
+            self.by_model.setdefault(offer.gpu_model, []).append(offer)
+            self.by_cluster.setdefault(offer.cluster_name, []).append(offer)
+            self.by_price_band.setdefault(get_price_band(offer.price), []).append(offer)
+
+        self.models = sorted(model for model in self.by_model if model != UNKNOWN_MODEL)
+
+    def find(
+        self,
+        gpu_model: str | None = None,
+        cluster_name: str | None = None,
+        min_gpus: int = 1,
+        max_price: float | None = None,
+    ) -> list[GpuOffer]:
+        """Find offers matching every given filter.
+
+        The smallest matching index is looked up and only its entries are filtered further.
+
+        Args:
+            gpu_model: Only offers of this GPU model.
+            cluster_name: Only offers on this cluster.
+            min_gpus: Only offers with at least this many available GPUs.
+            max_price: Only offers at or below this price in dollars per GPU per hour.
+
+        Returns:
+            list[GpuOffer]: The matching offers, cheapest first.
+
+        """
+        candidates = [self.offers]
+        if gpu_model is not None:
+            candidates.append(self.by_model.get(gpu_model, []))
+        if cluster_name is not None:
+            candidates.append(self.by_cluster.get(cluster_name, []))
+        if max_price is not None:
+            candidates.append(
+                [
+                    offer
+                    for band in range(get_price_band(max_price) + 1)
+                    for offer in self.by_price_band.get(band, [])
+                ]
+            )
+
+        return [
+            offer
+            for offer in min(candidates, key=len)
+            if (gpu_model is None or offer.gpu_model == gpu_model)
+            and (cluster_name is None or offer.cluster_name == cluster_name)
+            and offer.gpus_available >= min_gpus
+            and (max_price is None or offer.price <= max_price)
+        ]
+
+    def cheapest(self, gpu_model: str, min_gpus: int = 1) -> GpuOffer | None:
+        """Get the cheapest offer of a GPU model with enough available GPUs.
+
+        Args:
+            gpu_model: The GPU model.
+            min_gpus: The number of GPUs needed on a single node.
+
+        Returns:
+            GpuOffer | None: The cheapest offer, or None if there is none.
+
+        """
+        return next(iter(self.find(gpu_model=gpu_model, min_gpus=min_gpus)), None)
+
+
+class GpuInventoryCache:
+    """Serves marketplace snapshots that are refreshed at most once per TTL.
+
+    A fresh snapshot is served as is. A stale snapshot younger than `max_stale` is served
+    while a background refresh fetches the next one. Older snapshots, or the very first one,
+    are fetched synchronously, and concurrent callers wait for a single fetch. A fetch that
+    was started before the cache was invalidated is not stored.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], list[AvailableInstance]],
+        ttl: float = 10.0,
+        max_stale: float = 60.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            fetch: Function fetching every node from the marketplace.
+            ttl: Seconds a snapshot is served without refreshing it.
+            max_stale: Seconds after which a snapshot is no longer served while refreshing.
+
+        """
+        self.fetch = fetch
+        self.ttl = ttl
+        self.max_stale = max(max_stale, ttl)
+        self._snapshot: GpuInventory | None = None
+        self._fetch_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+        self._generation = 0
+
+    def get(self) -> GpuInventory:
+        """Get a marketplace snapshot.
+
+        Returns:
+            GpuInventory: The snapshot.
+
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            age = time.monotonic() - snapshot.fetched_at
+            if age <= self.ttl:
+                record_cache_lookup("hyperbolic_gpu_inventory", hit=True)
+                return snapshot
+            if age <= self.max_stale:
+                record_cache_lookup("hyperbolic_gpu_inventory", hit=True)
+                self._refresh_in_background()
+                return snapshot
+
+        record_cache_lookup("hyperbolic_gpu_inventory", hit=False)
+        with self._fetch_lock:
+            current = self._snapshot
+            if current is not None and current is not snapshot:
+                return current
+            return self._refresh()
+
+    def invalidate(self) -> None:
+        """Drop the current snapshot, for example after renting or terminating a node."""
+        with self._refresh_lock:
+            self._generation += 1
+            self._snapshot = None
+
+    def _refresh(self) -> GpuInventory:
+        """Fetch and index a new snapshot, storing it unless the cache was invalidated meanwhile."""
+        generation = self._generation
+        snapshot = GpuInventory(self.fetch())
+        with self._refresh_lock:
+            if generation == self._generation:
+                self._snapshot = snapshot
+        return snapshot
+
+    def _refresh_in_background(self) -> None:
+        """Start a background refresh unless one is already running."""
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def refresh() -> None:
+            try:
+                with self._fetch_lock:
+                    self._refresh()
+            except Exception:
+                # The stale snapshot keeps being served until it expires, after which the
+                # synchronous fetch surfaces the error to the caller.
+                pass
+            finally:
+                with self._refresh_lock:
+                    self._refreshing = False
+
+        threading.Thread(target=refresh, name="hyperbolic-inventory", daemon=True).start()
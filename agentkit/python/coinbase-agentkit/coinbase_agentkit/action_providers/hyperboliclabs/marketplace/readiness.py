@@ -0,0 +1,250 @@
+"""Polling a rented Hyperbolic node until it accepts SSH connections."""
+
+import logging
+import random
+import shlex
+import time
+from collections.abc import Callable, Iterator
+
+import requests
+from pydantic import BaseModel, Field
+
+from ...ssh.connection import (
+    SSHConnection,
+    SSHConnectionError,
+    SSHConnectionParams,
+    UnknownHostKeyError,
+)
+from ...ssh.connection_pool import SSHConnectionPool
+from .types import NodeRental
+
+READY_STATUSES = ("running", "online")
+FAILED_STATUSES = ("terminated", "failed")
+
+logger = logging.getLogger(__name__)
+
+
+class SSHTarget(BaseModel):
+    """Where and as whom to connect to a rented node."""
+
+    host: str = Field(..., description="SSH host address")
+    username: str = Field(..., description="SSH username")
+    port: int = Field(22, description="SSH port")
+    key_path: str | None = Field(None, description="Path to the SSH key file, if given")
+
+    @property
+    def command(self) -> str:
+        """Get the equivalent ssh command."""
+        port = f" -p {self.port}" if self.port != 22 else ""
+        return f"ssh {self.username}@{self.host}{port}"
+
+
+def backoff_delays(
+    initial: float = 1.0,
+    maximum: float = 15.0,
+    factor: float = 2.0,
+    jitter: float = 0.5,
+) -> Iterator[float]:
+    """Yield exponentially growing delays with random jitter.
+
+    Each delay is drawn uniformly from `[d * (1 - jitter), d]`, where `d` doubles from
+    `initial` up to `maximum`, so concurrent pollers spread out instead of polling in step.
+
+    Args:
+        initial: The base of the first delay in seconds.
+        maximum: The largest base delay in seconds.
+        factor: The growth of the base delay per attempt.
+        jitter: The fraction of each delay that is randomized.
+
+    Yields:
+        float: The next delay in seconds.
+
+    """
+    delay = initial
+    while True:
+        yield delay * (1 - jitter * random.random())
+        delay = min(delay * factor, maximum)
+
+
+def parse_ssh_command(command: str) -> SSHTarget | None:
+    """Parse the host, username, port and key of an ssh command.
+
+    Args:
+        command: The command, for example "ssh ubuntu@1.2.3.4 -p 31234 -i ~/.ssh/key".
+
+    Returns:
+        SSHTarget | None: The target, or None if the command names no user and host.
+
+    """
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        return None
+
+    host = username = key_path = None
+    port = 22
+    index = 1 if tokens and tokens[0] == "ssh" else 0
+    while index < len(tokens):
+        token = tokens[index]
+        if token in ("-p", "-i", "-l") and index + 1 < len(tokens):
+            value = tokens[index + 1]
+            if token == "-p" and value.isdigit():
+                port = int(value)
+            elif token == "-i":
+                key_path = value
+            elif token == "-l":
+                username = value
+            index += 2
+            continue
+        if token.startswith("-"):
+            index += 1
+            continue
+        if "@" in token:
+            username, _, host = token.rpartition("@")
+        elif host is None:
+            host = token
+        index += 1
+
+    if not host or not username:
+        return None
+    return SSHTarget(host=host, username=username, port=port, key_path=key_path)
+
+
+def get_ssh_target(rental: NodeRental) -> SSHTarget | None:
+    """Get the SSH target of a rented node once it is known.
+
+    Args:
+        rental: The rented node.
+
+    Returns:
+        SSHTarget | None: The target, or None if the node has no SSH details yet.
+
+    """
+    if rental.ssh_command:
+        return parse_ssh_command(rental.ssh_command)
+    if rental.ssh_access:
+        if rental.ssh_access.ssh_command:
+            target = parse_ssh_command(rental.ssh_access.ssh_command)
+            if target:
+                return target
+        return SSHTarget(
+            host=rental.ssh_access.host,
+            username=rental.ssh_access.username,
+            key_path=rental.ssh_access.key_path,
+        )
+    return None
+
+
+def wait_until_ready(
+    fetch: Callable[[], list[NodeRental]],
+    instance_name: str,
+    timeout: float,
+    delays: Iterator[float] | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> tuple[NodeRental, SSHTarget, int]:
+    """Poll the rented nodes until a node is running and has SSH details.
+
+    Request errors while fetching the nodes are logged and polled through, so a transient
+    API failure does not end the wait before the timeout.
+
+    Args:
+        fetch: Function fetching the currently rented nodes.
+        instance_name: The name of the node to wait for.
+        timeout: Seconds to wait before giving up.
+        delays: Delays between polls. Defaults to `backoff_delays()`.
+        sleep: Function sleeping for a number of seconds.
+
+    Returns:
+        tuple[NodeRental, SSHTarget, int]: The node, its SSH target and the number of polls.
+
+    Raises:
+        TimeoutError: If the node is not ready within the timeout.
+        RuntimeError: If the node failed or was terminated while starting.
+
+    """
+    delays = delays or backoff_delays()
+    deadline = time.monotonic() + timeout
+    polls = 0
+    status = "not listed"
+
+    while True:
+        polls += 1
+        try:
+            rental = next((r for r in fetch() if r.id == instance_name), None)
+        except requests.RequestException as e:
+            logger.warning("Polling instance %s failed: %s", instance_name, e)
+            rental = None
+            status = f"request failed: {e!s}"
+        if rental is not None:
+            status = rental.status
+            if status.lower() in FAILED_STATUSES:
+                raise RuntimeError(f"Instance {instance_name} stopped while starting ({status})")
+            if status.lower() in READY_STATUSES:
+                target = get_ssh_target(rental)
+                if target is not None:
+                    return rental, target, polls
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(
+                f"Instance {instance_name} was not ready after {timeout:.0f} seconds "
+                f"(last status: {status})"
+            )
+        sleep(min(next(delays), remaining))
+
+
+def connect_with_retries(
+    pool: SSHConnectionPool,
+    params: SSHConnectionParams,
+    timeout: float,
+    delays: Iterator[float] | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> tuple[SSHConnection, int]:
+    """Connect to a node, retrying while its SSH daemon is still starting.
+
+    A node can be reported running before it accepts connections, so connection errors
+    are retried until the timeout. Unknown host keys are not retried since they need the
+    host key to be added first. The connection is removed from the pool if it fails.
+
+    Args:
+        pool: The pool the connection is added to.
+        params: The connection parameters.
+        timeout: Seconds to keep retrying.
+        delays: Delays between attempts. Defaults to `backoff_delays()`.
+        sleep: Function sleeping for a number of seconds.
+
+    Returns:
+        tuple[SSHConnection, int]: The connection and the number of attempts.
+
+    Raises:
+        UnknownHostKeyError: If the host key of the node is not known.
+        SSHConnectionError: If the node does not accept a connection within the timeout.
+
+    """
+    delays = delays or backoff_delays()
+    deadline = time.monotonic() + timeout
+    attempts = 0
+
+    if pool.has_connection(params.connection_id):
+        pool.close_and_remove_connection(params.connection_id)
+    connection = pool.create_connection(params)
+
+    try:
+        while True:
+            attempts += 1
+            try:
+                connection.connect()
+                return connection, attempts
+            except UnknownHostKeyError:
+                raise
+            except SSHConnectionError as e:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise SSHConnectionError(
+                        f"{params.host} did not accept a connection after {attempts} attempts: "
+                        f"{e!s}"
+                    ) from e
+                sleep(min(next(delays), remaining))
+    except Exception:
+        pool.close_and_remove_connection(params.connection_id)
+        raise
@@ -13,6 +13,12 @@ class GetAvailableGpusByTypeSchema(BaseModel):
     """Schema for get_available_gpus_by_type action."""
 
     gpu_model: str = Field(description="The GPU model to filter by (e.g., 'NVIDIA A100')")
+    min_gpus: int = Field(
+        1, description="Only include nodes with at least this many available GPUs"
+    )
+    max_price: float | None = Field(
+        None, description="Only include nodes at or below this price in dollars per GPU per hour"
+    )
 
 
 class GetAvailableGpusTypesSchema(BaseModel):
@@ -35,6 +41,25 @@ class RentComputeSchema(BaseModel):
     gpu_count: str = Field(description="Number of GPUs to rent")
 
 
+class RentAndConnectSchema(RentComputeSchema):
+    """Schema for rent_and_connect action."""
+
+    private_key_path: str | None = Field(
+        None,
+        description="Path to the private key for SSH authentication. Defaults to the key path "
+        "reported by the platform, or ~/.ssh/id_rsa",
+    )
+    connection_id: str | None = Field(
+        None, description="Identifier for the SSH connection. Defaults to the instance name"
+    )
+    timeout: float = Field(
+        600,
+        description="Seconds to wait for the instance to accept SSH connections",
+        ge=30,
+        le=1800,
+    )
+
+
 class TerminateComputeSchema(BaseModel):
     """Schema for terminate_compute action."""
 
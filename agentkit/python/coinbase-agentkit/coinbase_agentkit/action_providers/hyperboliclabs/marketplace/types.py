@@ -133,6 +133,18 @@ class AvailableInstance(NodeInstance):
     pass
 
 
+class GpuOffer(BaseModel):
+    """Available GPUs on a single marketplace node."""
+
+    cluster_name: str = Field(..., description="Cluster the node is on")
+    node_id: str = Field(..., description="Node identifier")
+    gpu_model: str = Field(..., description="GPU model name")
+    gpus_available: int = Field(..., description="Number of GPUs that can be rented")
+    gpus_total: int = Field(..., description="Total number of GPUs on the node")
+    price: float = Field(..., description="Price in dollars per GPU per hour")
+    instance: AvailableInstance = Field(..., description="The node the offer was derived from")
+
+
 class AvailableInstancesResponse(BaseModel):
     """Response for available instances."""
 
@@ -2,6 +2,7 @@
 
 import os
 
+from .readiness import SSHTarget
 from .types import (
     AvailableInstance,
     NodeRental,
@@ -91,11 +92,23 @@ def format_gpu_types(instances: list[AvailableInstance]) -> str:
         if gpus:
             gpu_models.add(gpus[0].model)
 
+    return format_gpu_models(sorted(gpu_models))
+
+
+def format_gpu_models(gpu_models: list[str]) -> str:
+    """Format a list of GPU model names.
+
+    Args:
+        gpu_models: The GPU model names, in display order.
+
+    Returns:
+        str: Formatted string with available GPU types.
+
+    """
     if not gpu_models:
         return "No available GPU types found."
 
-    gpu_models_list = sorted(gpu_models)
-    formatted_models = "\n".join([f"- {model}" for model in gpu_models_list])
+    formatted_models = "\n".join([f"- {model}" for model in gpu_models])
     return f"Available GPU Types:\n{formatted_models}"
 
 
@@ -276,6 +289,57 @@ def format_rent_compute_response(response_data: RentInstanceResponse) -> str:
     return f"{formatted_response}\n{next_steps}"
 
 
+def format_rent_and_connect_response(
+    rental: NodeRental,
+    target: SSHTarget,
+    connection_id: str,
+    timings: dict[str, float],
+    polls: int,
+    attempts: int | None,
+    error: str | None = None,
+) -> str:
+    """Format the outcome of renting and connecting to an instance.
+
+    Args:
+        rental: The rented node.
+        target: Its SSH target.
+        connection_id: The identifier of the SSH connection.
+        timings: Seconds spent on "rent", "provisioning", "connect" and "total".
+        polls: The number of status checks while provisioning.
+        attempts: The number of connection attempts, if the connection was established.
+        error: Optional error that prevented the connection.
+
+    Returns:
+        str: Formatted response string with the timing breakdown.
+
+    """
+    if error:
+        output = [
+            f"Instance {rental.id} is ready, but the SSH connection was not established.",
+            error,
+        ]
+    else:
+        output = [
+            f"Instance {rental.id} is ready and connected.",
+            f"Connection ID: {connection_id}",
+        ]
+    output.extend(
+        [
+            f"SSH command: {target.command}",
+            "",
+            "Timing:",
+            f"- Rent request: {timings['rent']:.2f}s",
+            f"- Provisioning: {timings['provisioning']:.2f}s ({polls} status checks)",
+            f"- SSH connect: {timings['connect']:.2f}s"
+            + (f" ({attempts} attempts)" if attempts else ""),
+            f"- Total: {timings['total']:.2f}s",
+        ]
+    )
+    if not error:
+        output.extend(["", "Use remote_shell with this connection ID to run commands."])
+    return "\n".join(output)
+
+
 def format_terminate_compute_response(response_data: TerminateInstanceResponse) -> str:
     """Format compute termination response into a readable string.
 
@@ -3,24 +3,51 @@
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from ...rate_limiting import rate_limiter
 from .constants import API_BASE_URL
 
 
+def create_session(pool_size: int) -> requests.Session:
+    """Create an HTTP session that keeps connections alive for concurrent requests.
+
+    Args:
+        pool_size: The number of connections kept open per host.
+
+    Returns:
+        requests.Session: The session.
+
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class Base:
     """Base class with common functionality."""
 
-    def __init__(self, api_key: str, base_url: str | None = None):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str | None = None,
+        session: requests.Session | None = None,
+    ):
         """Initialize the service.
 
         Args:
             api_key: The API key for authentication.
             base_url: Optional base URL for the service. If not provided,
                      will use API_BASE_URL from constants.
+            session: Optional HTTP session whose connections are reused across requests.
+                     If not provided, every request opens a new connection.
 
         """
         self.api_key = api_key
         self.base_url = base_url or API_BASE_URL
+        self.session = session
 
     def make_request(
         self,
@@ -29,15 +56,20 @@ class Base:
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        stream: bool = False,
     ) -> requests.Response:
         """Make an API request to the service endpoint.
 
+        Requests are subject to the shared rate limit of the endpoint. A 429 response pauses
+        the endpoint for its `Retry-After` and the request is queued again.
+
         Args:
             endpoint: The endpoint path to call.
             method: The HTTP method to use (default: "POST").
             data: Optional JSON body for the request.
             params: Optional query parameters.
             headers: Optional additional headers.
+            stream: Whether to return as soon as the headers arrive and read the body lazily.
 
         Returns:
             requests.Response: The raw HTTP response object.
@@ -55,9 +87,18 @@ class Base:
         )
 
         url = f"{self.base_url}{endpoint}"
-        response = requests.request(
-            method=method, url=url, headers=headers, json=data, params=params
-        )
+        request_kwargs: dict[str, Any] = {
+            "method": method,
+            "url": url,
+            "headers": headers,
+            "json": data,
+            "params": params,
+        }
+        if stream:
+            request_kwargs["stream"] = True
+
+        send = self.session.request if self.session else requests.request
+        response = rate_limiter.call(url, lambda: send(**request_kwargs))
 
         try:
             response.raise_for_status()
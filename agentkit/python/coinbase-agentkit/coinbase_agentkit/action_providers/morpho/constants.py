@@ -22,4 +22,152 @@ METAMORPHO_ABI = [
         "stateMutability": "nonpayable",
         "type": "function",
     },
+    {
+        "inputs": [],
+        "name": "asset",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "totalAssets",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "totalSupply",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "lastTotalAssets",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "fee",
+        "outputs": [{"internalType": "uint96", "name": "", "type": "uint96"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "MORPHO",
+        "outputs": [{"internalType": "contract IMorpho", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "withdrawQueueLength",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "name": "withdrawQueue",
+        "outputs": [{"internalType": "Id", "name": "", "type": "bytes32"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+MARKET_PARAMS_COMPONENTS = [
+    {"internalType": "address", "name": "loanToken", "type": "address"},
+    {"internalType": "address", "name": "collateralToken", "type": "address"},
+    {"internalType": "address", "name": "oracle", "type": "address"},
+    {"internalType": "address", "name": "irm", "type": "address"},
+    {"internalType": "uint256", "name": "lltv", "type": "uint256"},
+]
+
+MARKET_COMPONENTS = [
+    {"internalType": "uint128", "name": "totalSupplyAssets", "type": "uint128"},
+    {"internalType": "uint128", "name": "totalSupplyShares", "type": "uint128"},
+    {"internalType": "uint128", "name": "totalBorrowAssets", "type": "uint128"},
+    {"internalType": "uint128", "name": "totalBorrowShares", "type": "uint128"},
+    {"internalType": "uint128", "name": "lastUpdate", "type": "uint128"},
+    {"internalType": "uint128", "name": "fee", "type": "uint128"},
+]
+
+MORPHO_BLUE_ABI = [
+    {
+        "inputs": [{"internalType": "Id", "name": "", "type": "bytes32"}],
+        "name": "market",
+        "outputs": MARKET_COMPONENTS,
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "Id", "name": "", "type": "bytes32"}],
+        "name": "idToMarketParams",
+        "outputs": MARKET_PARAMS_COMPONENTS,
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "Id", "name": "", "type": "bytes32"},
+            {"internalType": "address", "name": "", "type": "address"},
+        ],
+        "name": "position",
+        "outputs": [
+            {"internalType": "uint256", "name": "supplyShares", "type": "uint256"},
+            {"internalType": "uint128", "name": "borrowShares", "type": "uint128"},
+            {"internalType": "uint128", "name": "collateral", "type": "uint128"},
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+IRM_ABI = [
+    {
+        "inputs": [
+            {
+                "components": MARKET_PARAMS_COMPONENTS,
+                "internalType": "struct MarketParams",
+                "name": "marketParams",
+                "type": "tuple",
+            },
+            {
+                "components": MARKET_COMPONENTS,
+                "internalType": "struct Market",
+                "name": "market",
+                "type": "tuple",
+            },
+        ],
+        "name": "borrowRateView",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    }
 ]
+
+# Fixed point scale of Morpho fees and rates
+WAD = 10**18
+
+# Virtual shares and assets of Morpho Blue markets
+VIRTUAL_SHARES = 10**6
+VIRTUAL_ASSETS = 1
+
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+# How long vault totals and rates are reused by get_vault_state, in seconds
+VAULT_STATE_TTL = 60
+
+MAX_VAULTS = 20
@@ -7,13 +7,14 @@ from web3 import Web3
 
 from coinbase_agentkit.action_providers.action_decorator import create_action
 from coinbase_agentkit.action_providers.action_provider import ActionProvider
-from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
 from coinbase_agentkit.action_providers.morpho.constants import METAMORPHO_ABI
 from coinbase_agentkit.action_providers.morpho.schemas import (
     MorphoDepositSchema,
+    MorphoGetVaultStateSchema,
     MorphoWithdrawSchema,
 )
 from coinbase_agentkit.action_providers.morpho.utils import approve
+from coinbase_agentkit.action_providers.morpho.vaults import VaultStateReader
 from coinbase_agentkit.network import Network
 from coinbase_agentkit.wallet_providers import EvmWalletProvider
 
@@ -25,6 +26,7 @@ class MorphoActionProvider(ActionProvider[EvmWalletProvider]):
 
     def __init__(self):
         super().__init__("morpho", [])
+        self.vaults = VaultStateReader()
 
     @create_action(
         name="deposit",
@@ -61,14 +63,13 @@ Important notes:
             return "Error: Assets amount must be greater than 0"
 
         try:
-            decimals = wallet_provider.read_contract(
-                contract_address=args["token_address"],
-                abi=ERC20_ABI,
-                function_name="decimals",
-                args=[],
-            )
+            asset, asset_decimals = self.vaults.get_asset(wallet_provider, args["vault_address"])
+            if asset.lower() != args["token_address"].lower():
+                raise ValueError(
+                    f"Token {args['token_address']} is not the asset of the vault, {asset}"
+                )
 
-            atomic_assets = int(assets * (10**decimals))
+            atomic_assets = int(assets * (10**asset_decimals))
 
             try:
                 approve(
@@ -89,7 +90,12 @@ Important notes:
             }
 
             tx_hash = wallet_provider.send_transaction(params)
-            wallet_provider.wait_for_transaction_receipt(tx_hash)
+            try:
+                wallet_provider.wait_for_transaction_receipt(tx_hash)
+            finally:
+                self.vaults.invalidate(
+                    wallet_provider.get_network().network_id, args["vault_address"]
+                )
 
             return f"Deposited {args['assets']} to Morpho Vault {args['vault_address']} with transaction hash: {tx_hash}"
 
@@ -101,8 +107,13 @@ Important notes:
         description="""
 This tool allows withdrawing assets from a Morpho Vault. It takes:
 - vault_address: The address of the Morpho Vault to withdraw from
-- assets: The amount of assets to withdraw in atomic units
+- assets: The amount of assets to withdraw in whole units
+    Examples for WETH:
+    - 1 WETH
+    - 0.1 WETH
 - receiver: The address to receive the shares
+Important notes:
+- Make sure to use the exact amount provided. Do not convert units for assets for this action.
 """,
         schema=MorphoWithdrawSchema,
     )
@@ -122,27 +133,70 @@ This tool allows withdrawing assets from a Morpho Vault. It takes:
         if assets <= Decimal("0.0"):
             return "Error: Assets amount must be greater than 0"
 
-        atomic_assets = Web3.to_wei(assets, "ether")
+        try:
+            _, asset_decimals = self.vaults.get_asset(wallet_provider, args["vault_address"])
+            atomic_assets = int(assets * (10**asset_decimals))
 
-        contract = Web3().eth.contract(address=args["vault_address"], abi=METAMORPHO_ABI)
-        encoded_data = contract.encode_abi(
-            "withdraw", args=[atomic_assets, args["receiver"], args["receiver"]]
-        )
+            contract = Web3().eth.contract(address=args["vault_address"], abi=METAMORPHO_ABI)
+            encoded_data = contract.encode_abi(
+                "withdraw", args=[atomic_assets, args["receiver"], args["receiver"]]
+            )
 
-        try:
             params = {
                 "to": args["vault_address"],
                 "data": encoded_data,
             }
 
             tx_hash = wallet_provider.send_transaction(params)
-            wallet_provider.wait_for_transaction_receipt(tx_hash)
+            try:
+                wallet_provider.wait_for_transaction_receipt(tx_hash)
+            finally:
+                self.vaults.invalidate(
+                    wallet_provider.get_network().network_id, args["vault_address"]
+                )
 
             return f"Withdrawn {args['assets']} from Morpho Vault {args['vault_address']} with transaction hash: {tx_hash}"
 
         except Exception as e:
             return f"Error withdrawing from Morpho Vault: {e!s}"
 
+    @create_action(
+        name="get_vault_state",
+        description="""
+This tool gets the state of one or more Morpho Vaults, to compare them before depositing. It takes:
+- vault_addresses: The addresses of the Morpho Vaults
+- assets: (Optional) An amount of assets in whole units to preview the deposit of
+It returns, for each vault, its total assets, the value of one share, the performance fee, the estimated supply APY
+and, when assets are given, the shares a deposit would mint.
+Important notes:
+- Prefer a single call with all the vaults to compare over one call per vault.
+""",
+        schema=MorphoGetVaultStateSchema,
+    )
+    def get_vault_state(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Get the state of Morpho Vaults, with deposit previews computed locally.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = MorphoGetVaultStateSchema(**args)
+            assets = Decimal(validated_args.assets) if validated_args.assets is not None else None
+
+            states = self.vaults.get(wallet_provider, validated_args.vault_addresses)
+
+            lines = ["Morpho Vault state:"]
+            lines += [state.format(assets) for state in states]
+            return "\n".join(lines)
+
+        except Exception as e:
+            return f"Error getting Morpho Vault state: {e!s}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if the network is supported by this action provider.
 
@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, Field
 
+from .constants import MAX_VAULTS
+
 
 class MorphoDepositSchema(BaseModel):
     """Input schema for Morpho Vault deposit action."""
@@ -21,5 +23,20 @@ class MorphoWithdrawSchema(BaseModel):
     """Input schema for Morpho Vault withdraw action."""
 
     vault_address: str = Field(..., description="The address of the Morpho Vault to withdraw from")
-    assets: str = Field(..., description="The amount of assets to withdraw in atomic units")
+    assets: str = Field(..., description="The amount of assets to withdraw, in whole units")
     receiver: str = Field(..., description="The address to receive the withdrawn assets")
+
+
+class MorphoGetVaultStateSchema(BaseModel):
+    """Input schema for Morpho Vault state action."""
+
+    vault_addresses: list[str] = Field(
+        ...,
+        description="The addresses of the Morpho Vaults to compare",
+        min_length=1,
+        max_length=MAX_VAULTS,
+    )
+    assets: str | None = Field(
+        None,
+        description="An amount of assets, in whole units, to preview the shares minted by depositing it",
+    )
@@ -0,0 +1,436 @@
+"""Cached state of MetaMorpho vaults, with share and asset previews computed locally."""
+
+import math
+import threading
+import time
+from dataclasses import dataclass, replace
+from decimal import Decimal
+
+from web3 import Web3
+
+from ...wallet_providers.evm_wallet_provider import EvmWalletProvider
+from ...wallet_providers.multicall import ContractCall, multicall
+from ..erc20.constants import ERC20_ABI
+from .constants import (
+    IRM_ABI,
+    METAMORPHO_ABI,
+    MORPHO_BLUE_ABI,
+    SECONDS_PER_YEAR,
+    VAULT_STATE_TTL,
+    VIRTUAL_ASSETS,
+    VIRTUAL_SHARES,
+    WAD,
+)
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+VAULT_FIELDS = [
+    "asset",
+    "decimals",
+    "totalAssets",
+    "totalSupply",
+    "lastTotalAssets",
+    "fee",
+    "MORPHO",
+    "withdrawQueueLength",
+]
+
+
+def _mul_div(x: int, y: int, denominator: int, round_up: bool = False) -> int:
+    """Compute x * y / denominator with the rounding of the vault contracts."""
+    return -(-x * y // denominator) if round_up else x * y // denominator
+
+
+@dataclass(frozen=True)
+class VaultState:
+    """The state of an ERC4626 vault, from which conversions are computed like on-chain.
+
+    Conversions follow MetaMorpho: performance fee shares not minted yet are added to the
+    total supply, and the vault decimals offset adds virtual shares.
+    """
+
+    address: str
+    asset: str = ZERO_ADDRESS
+    asset_decimals: int = 0
+    asset_symbol: str | None = None
+    decimals: int = 0
+    total_assets: int = 0
+    total_supply: int = 0
+    last_total_assets: int = 0
+    fee: int = 0
+    supply_apy: float | None = None
+    loaded_at: float = 0.0
+    error: str | None = None
+
+    def _total_shares(self) -> int:
+        """Get the total supply, including the fee shares accrued since the last interaction."""
+        interest = max(self.total_assets - self.last_total_assets, 0)
+        if interest == 0 or self.fee == 0:
+            return self.total_supply
+        fee_assets = _mul_div(interest, self.fee, WAD)
+        fee_shares = _mul_div(
+            fee_assets,
+            self.total_supply + 10 ** (self.decimals - self.asset_decimals),
+            self.total_assets - fee_assets + 1,
+        )
+        return self.total_supply + fee_shares
+
+    def to_shares(self, assets: int, round_up: bool = False) -> int:
+        """Convert assets to shares.
+
+        Args:
+            assets: The amount of assets, in atomic units.
+            round_up: Whether to round up, as for withdrawals, instead of down.
+
+        Returns:
+            int: The amount of shares, in atomic units.
+
+        """
+        offset = 10 ** (self.decimals - self.asset_decimals)
+        return _mul_div(assets, self._total_shares() + offset, self.total_assets + 1, round_up)
+
+    def to_assets(self, shares: int, round_up: bool = False) -> int:
+        """Convert shares to assets.
+
+        Args:
+            shares: The amount of shares, in atomic units.
+            round_up: Whether to round up, as for mints, instead of down.
+
+        Returns:
+            int: The amount of assets, in atomic units.
+
+        """
+        offset = 10 ** (self.decimals - self.asset_decimals)
+        return _mul_div(shares, self.total_assets + 1, self._total_shares() + offset, round_up)
+
+    @property
+    def net_apy(self) -> float | None:
+        """The supply APY earned by depositors, after the vault performance fee."""
+        if self.supply_apy is None:
+            return None
+        return self.supply_apy * (1 - self.fee / WAD)
+
+    def format(self, assets: Decimal | None = None) -> str:
+        """Format the state as a single line.
+
+        Args:
+            assets: An amount of assets, in whole units, to preview the deposit of.
+
+        Returns:
+            str: The formatted state.
+
+        """
+        if self.error is not None:
+            return f"- {self.address}: error: {self.error}"
+
+        symbol = self.asset_symbol or self.asset
+        one_share = 10**self.decimals
+        parts = [
+            f"{_whole(self.total_assets, self.asset_decimals)} {symbol} total",
+            f"1 share = {_whole(self.to_assets(one_share), self.asset_decimals)} {symbol}",
+            f"fee {self.fee / WAD:.2%}",
+        ]
+        if self.net_apy is not None:
+            parts.append(f"APY {self.net_apy:.2%} (before fee {self.supply_apy:.2%})")
+        if assets is not None:
+            shares = self.to_shares(int(assets * 10**self.asset_decimals))
+            parts.append(
+                f"depositing {assets.normalize():f} {symbol} mints "
+                f"{_whole(shares, self.decimals)} shares"
+            )
+        return f"- {self.address}: {', '.join(parts)}"
+
+
+class VaultStateReader:
+    """Loads the state of many vaults in a few multicalls and caches it.
+
+    Vault totals, fee and withdraw queue length are read in one multicall, the asset
+    decimals and withdraw queues in a second one, and the supply APY of the Morpho Blue
+    markets the vaults are allocated to in two more, whatever the number of vaults. States
+    are reused for `ttl` seconds. The asset of a vault and its decimals, which never change,
+    are read on their own where nothing else is needed and kept indefinitely.
+    """
+
+    def __init__(self, ttl: float = VAULT_STATE_TTL):
+        """Initialize the reader.
+
+        Args:
+            ttl: How long loaded states are reused, in seconds.
+
+        """
+        self.ttl = ttl
+        self._states: dict[tuple[str | None, str], VaultState] = {}
+        self._assets: dict[tuple[str | None, str], tuple[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        wallet_provider: EvmWalletProvider,
+        vault_addresses: list[str],
+        max_age: float | None = None,
+    ) -> list[VaultState]:
+        """Get the state of vaults, loading the missing or outdated ones together.
+
+        Args:
+            wallet_provider: The wallet provider of the network of the vaults.
+            vault_addresses: The vault addresses.
+            max_age: How old a cached state may be, in seconds. Defaults to `ttl`.
+
+        Returns:
+            list[VaultState]: The state of each vault.
+
+        """
+        network_id = wallet_provider.get_network().network_id
+        max_age = self.ttl if max_age is None else max_age
+        vaults = [Web3.to_checksum_address(address) for address in vault_addresses]
+
+        now = time.monotonic()
+        with self._lock:
+            states = {vault: self._states.get((network_id, vault)) for vault in vaults}
+        outdated = [
+            vault
+            for vault, state in states.items()
+            if state is None or now - state.loaded_at > max_age
+        ]
+
+        if outdated:
+            for state in _load(wallet_provider, outdated):
+                states[state.address] = state
+                if state.error is None:
+                    with self._lock:
+                        self._states[(network_id, state.address)] = state
+        return [states[vault] for vault in vaults]
+
+    def get_asset(self, wallet_provider: EvmWalletProvider, vault_address: str) -> tuple[str, int]:
+        """Get the asset of a vault and its decimals, without reading the rest of its state.
+
+        Args:
+            wallet_provider: The wallet provider of the network of the vault.
+            vault_address: The vault address.
+
+        Returns:
+            tuple[str, int]: The asset address and its decimals.
+
+        Raises:
+            ValueError: If the vault or its asset could not be read.
+
+        """
+        key = (wallet_provider.get_network().network_id, Web3.to_checksum_address(vault_address))
+        with self._lock:
+            asset = self._assets.get(key)
+            state = self._states.get(key)
+        if asset is not None:
+            return asset
+        if state is not None:
+            return state.asset, state.asset_decimals
+
+        (result,) = multicall(wallet_provider, [ContractCall(key[1], METAMORPHO_ABI, "asset")])
+        if not result.success:
+            raise ValueError(f"Not an ERC4626 vault: {result.error}")
+        (decimals,) = multicall(
+            wallet_provider, [ContractCall(result.value, ERC20_ABI, "decimals")]
+        )
+        if not decimals.success:
+            raise ValueError(f"Could not read the asset: {decimals.error}")
+
+        asset = (result.value, decimals.value)
+        with self._lock:
+            self._assets[key] = asset
+        return asset
+
+    def invalidate(self, network_id: str | None, vault_address: str) -> None:
+        """Mark the totals of a vault as outdated, keeping its asset and decimals.
+
+        Args:
+            network_id: The network of the vault.
+            vault_address: The vault address.
+
+        """
+        key = (network_id, Web3.to_checksum_address(vault_address))
+        with self._lock:
+            if key in self._states:
+                self._states[key] = replace(self._states[key], loaded_at=-math.inf)
+
+
+def _load(wallet_provider: EvmWalletProvider, vaults: list[str]) -> list[VaultState]:
+    """Read the state of vaults.
+
+    Args:
+        wallet_provider: The wallet provider of the network of the vaults.
+        vaults: The checksummed vault addresses.
+
+    Returns:
+        list[VaultState]: The state of each vault.
+
+    """
+    loaded_at = time.monotonic()
+    results = multicall(
+        wallet_provider,
+        [ContractCall(vault, METAMORPHO_ABI, name) for vault in vaults for name in VAULT_FIELDS],
+    )
+
+    states: dict[str, VaultState] = {}
+    queues: dict[str, tuple[str, int]] = {}
+    for index, vault in enumerate(vaults):
+        fields = dict(
+            zip(
+                VAULT_FIELDS,
+                results[len(VAULT_FIELDS) * index : len(VAULT_FIELDS) * (index + 1)],
+                strict=True,
+            )
+        )
+        required = [fields[name] for name in ("asset", "decimals", "totalAssets", "totalSupply")]
+        failed = [result for result in required if not result.success]
+        if failed:
+            states[vault] = VaultState(vault, error=f"Not an ERC4626 vault: {failed[0].error}")
+            continue
+
+        # Other ERC4626 vaults have no performance fee and no Morpho Blue markets.
+        total_assets = fields["totalAssets"].value
+        states[vault] = VaultState(
+            vault,
+            asset=fields["asset"].value,
+            decimals=fields["decimals"].value,
+            total_assets=total_assets,
+            total_supply=fields["totalSupply"].value,
+            last_total_assets=(
+                fields["lastTotalAssets"].value
+                if fields["lastTotalAssets"].success
+                else total_assets
+            ),
+            fee=fields["fee"].value if fields["fee"].success else 0,
+            loaded_at=loaded_at,
+        )
+        if fields["MORPHO"].success and fields["withdrawQueueLength"].success:
+            queues[vault] = (fields["MORPHO"].value, fields["withdrawQueueLength"].value)
+
+    loaded = [vault for vault, state in states.items() if state.error is None]
+    calls = []
+    for vault in loaded:
+        calls += [
+            ContractCall(states[vault].asset, ERC20_ABI, "decimals"),
+            ContractCall(states[vault].asset, ERC20_ABI, "symbol"),
+        ]
+        _, length = queues.get(vault, (None, 0))
+        calls += [ContractCall(vault, METAMORPHO_ABI, "withdrawQueue", (i,)) for i in range(length)]
+    results = iter(multicall(wallet_provider, calls))
+
+    markets: dict[str, list[bytes]] = {}
+    for vault in loaded:
+        decimals, symbol = next(results), next(results)
+        _, length = queues.get(vault, (None, 0))
+        ids = [next(results) for _ in range(length)]
+        if not decimals.success:
+            states[vault] = VaultState(vault, error=f"Could not read the asset: {decimals.error}")
+            continue
+        states[vault] = replace(
+            states[vault],
+            asset_decimals=decimals.value,
+            asset_symbol=symbol.value if symbol.success else None,
+        )
+        if vault in queues and all(result.success for result in ids):
+            markets[vault] = [result.value for result in ids]
+
+    apys = _supply_apys(
+        wallet_provider, {vault: (queues[vault][0], ids) for vault, ids in markets.items()}
+    )
+    for vault, apy in apys.items():
+        states[vault] = replace(states[vault], supply_apy=apy)
+    return [states[vault] for vault in vaults]
+
+
+def _supply_apys(
+    wallet_provider: EvmWalletProvider, queues: dict[str, tuple[str, list[bytes]]]
+) -> dict[str, float]:
+    """Compute the supply APY of vaults from the Morpho Blue markets they supply.
+
+    Args:
+        wallet_provider: The wallet provider of the network of the vaults.
+        queues: The Morpho Blue address and withdraw queue market IDs of each vault. The
+            withdraw queue lists every market the vault can hold assets in.
+
+    Returns:
+        dict[str, float]: The APY of each vault it could be computed for, before the vault fee.
+
+    """
+    market_keys = list(
+        dict.fromkeys((morpho, id_) for morpho, ids in queues.values() for id_ in ids)
+    )
+    positions = [(vault, morpho, id_) for vault, (morpho, ids) in queues.items() for id_ in ids]
+    calls = [
+        ContractCall(morpho, MORPHO_BLUE_ABI, name, (id_,))
+        for morpho, id_ in market_keys
+        for name in ("market", "idToMarketParams")
+    ]
+    calls += [
+        ContractCall(morpho, MORPHO_BLUE_ABI, "position", (id_, vault))
+        for vault, morpho, id_ in positions
+    ]
+    results = multicall(wallet_provider, calls)
+
+    market_states = {}
+    for index, key in enumerate(market_keys):
+        market, params = results[2 * index : 2 * index + 2]
+        if market.success and params.success:
+            market_states[key] = (market.value, params.value)
+    supply_shares = {
+        (vault, morpho, id_): result.value[0]
+        for (vault, morpho, id_), result in zip(
+            positions, results[2 * len(market_keys) :], strict=True
+        )
+        if result.success
+    }
+
+    # Idle markets, without interest rate model or borrows, earn nothing.
+    rated = [
+        key
+        for key, (market, params) in market_states.items()
+        if params[3] != ZERO_ADDRESS and market[2] > 0
+    ]
+    rates = multicall(
+        wallet_provider,
+        [
+            ContractCall(
+                market_states[key][1][3],
+                IRM_ABI,
+                "borrowRateView",
+                (tuple(market_states[key][1]), tuple(market_states[key][0])),
+            )
+            for key in rated
+        ],
+    )
+    supply_apys = dict.fromkeys(market_states, 0.0)
+    for key, rate in zip(rated, rates, strict=True):
+        if not rate.success:
+            del supply_apys[key]
+            continue
+        market = market_states[key][0]
+        utilization = market[2] / market[0]
+        supply_rate = rate.value / WAD * utilization * (1 - market[5] / WAD)
+        supply_apys[key] = math.expm1(supply_rate * SECONDS_PER_YEAR)
+
+    apys = {}
+    for vault, (morpho, ids) in queues.items():
+        keys = [(morpho, id_) for id_ in ids]
+        if any(key not in supply_apys or (vault, *key) not in supply_shares for key in keys):
+            continue
+        supplied = {
+            key: _mul_div(
+                supply_shares[(vault, *key)],
+                market_states[key][0][0] + VIRTUAL_ASSETS,
+                market_states[key][0][1] + VIRTUAL_SHARES,
+            )
+            for key in keys
+        }
+        total = sum(supplied.values())
+        apys[vault] = (
+            sum(assets * supply_apys[key] for key, assets in supplied.items()) / total
+            if total
+            else 0.0
+        )
+    return apys
+
+
+def _whole(amount: int, decimals: int) -> str:
+    """Format an atomic amount in whole units."""
+    return f"{(Decimal(amount) / Decimal(10) ** decimals).normalize():f}"
@@ -6,6 +6,7 @@ import requests
 from pydantic import BaseModel, Field
 
 from ...network import Network
+from ...rate_limiting import rate_limiter
 from ...wallet_providers import WalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
@@ -46,7 +47,7 @@ class PythActionProvider(ActionProvider[WalletProvider]):
         """
         token_symbol = args["token_symbol"]
         url = f"https://hermes.pyth.network/v2/price_feeds?query={token_symbol}&asset_type=crypto"
-        response = requests.get(url)
+        response = rate_limiter.call(url, lambda: requests.get(url))
         response.raise_for_status()
         data = response.json()
 
@@ -86,7 +87,7 @@ Important notes:
         try:
             price_feed_id = args["price_feed_id"]
             url = f"https://hermes.pyth.network/v2/updates/price/latest?ids[]={price_feed_id}"
-            response = requests.get(url)
+            response = rate_limiter.call(url, lambda: requests.get(url))
             response.raise_for_status()
             data = response.json()
             parsed_data = data["parsed"]
@@ -6,8 +6,14 @@ and provides methods to create, retrieve, and close connections.
 @module ssh/pool
 """
 
+import itertools
+import weakref
+
+from ...metrics import remove_ssh_pool, set_ssh_pool_occupancy
 from .connection import SSHConnection, SSHConnectionError, SSHConnectionParams
 
+_pool_ids = itertools.count(1)
+
 
 class SSHConnectionPool:
     """Manages multiple SSH connections.
@@ -16,16 +22,22 @@ class SSHConnectionPool:
     of connections, and provides methods to create, retrieve, and close connections.
     """
 
-    def __init__(self, max_connections: int = 5):
+    def __init__(self, max_connections: int = 5, name: str = "ssh"):
         """Initialize connection pool.
 
         Args:
             max_connections: Maximum number of concurrent connections
+            name: Name the pool occupancy is reported under. Occupancy of pools
+                sharing a name is summed.
 
         """
         self.connections = {}
         self.max_connections = max_connections
         self.connection_params = {}
+        self.name = name
+        self._metrics_id = next(_pool_ids)
+        weakref.finalize(self, remove_ssh_pool, self.name, self._metrics_id)
+        self._report_occupancy()
 
     def has_connection(self, connection_id: str) -> bool:
         """Check if a connection exists in the pool.
@@ -102,6 +114,7 @@ class SSHConnectionPool:
             connection = SSHConnection(stored_params)
 
             self.connections[params.connection_id] = connection
+            self._report_occupancy()
 
             return connection
         except ValueError as e:
@@ -124,6 +137,7 @@ class SSHConnectionPool:
         connection.disconnect()
 
         del self.connections[connection_id]
+        self._report_occupancy()
 
         return connection
 
@@ -146,6 +160,7 @@ class SSHConnectionPool:
         """Close all connections and clear all stored parameters."""
         self.close_all_connections()
         self.connection_params.clear()
+        remove_ssh_pool(self.name, self._metrics_id)
 
     def get_connections(self):
         """Get all connections in the pool.
@@ -213,3 +228,9 @@ class SSHConnectionPool:
         """
         if connection_id in self.connection_params:
             del self.connection_params[connection_id]
+
+    def _report_occupancy(self) -> None:
+        """Report the number of open connections to the metrics registry."""
+        set_ssh_pool_occupancy(
+            self.name, len(self.connections), self.max_connections, self._metrics_id
+        )
@@ -60,3 +60,116 @@ DELETE_ABI = [
         "type": "function",
     }
 ]
+
+# Batching flow operations through the Superfluid host. The host and the Constant Flow
+# Agreement (CFA) are read from the Super Token, so no per-network addresses are needed.
+SUPER_TOKEN_ABI = [
+    {
+        "inputs": [],
+        "name": "getHost",
+        "outputs": [{"internalType": "address", "name": "host", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
+        "name": "realtimeBalanceOfNow",
+        "outputs": [
+            {"internalType": "int256", "name": "availableBalance", "type": "int256"},
+            {"internalType": "uint256", "name": "deposit", "type": "uint256"},
+            {"internalType": "uint256", "name": "owedDeposit", "type": "uint256"},
+            {"internalType": "uint256", "name": "timestamp", "type": "uint256"},
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+HOST_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "uint32", "name": "operationType", "type": "uint32"},
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bytes", "name": "data", "type": "bytes"},
+                ],
+                "internalType": "struct ISuperfluid.Operation[]",
+                "name": "operations",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "batchCall",
+        "outputs": [],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "bytes32", "name": "agreementType", "type": "bytes32"}],
+        "name": "getAgreementClass",
+        "outputs": [
+            {
+                "internalType": "contract ISuperAgreement",
+                "name": "agreementClass",
+                "type": "address",
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+CFA_ABI = [
+    {
+        "inputs": [
+            {"internalType": "contract ISuperfluidToken", "name": "token", "type": "address"},
+            {"internalType": "address", "name": "receiver", "type": "address"},
+            {"internalType": "int96", "name": "flowRate", "type": "int96"},
+            {"internalType": "bytes", "name": "ctx", "type": "bytes"},
+        ],
+        "name": "createFlow",
+        "outputs": [{"internalType": "bytes", "name": "newCtx", "type": "bytes"}],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "contract ISuperfluidToken", "name": "token", "type": "address"},
+            {"internalType": "address", "name": "receiver", "type": "address"},
+            {"internalType": "int96", "name": "flowRate", "type": "int96"},
+            {"internalType": "bytes", "name": "ctx", "type": "bytes"},
+        ],
+        "name": "updateFlow",
+        "outputs": [{"internalType": "bytes", "name": "newCtx", "type": "bytes"}],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "contract ISuperfluidToken", "name": "token", "type": "address"},
+            {"internalType": "address", "name": "sender", "type": "address"},
+            {"internalType": "address", "name": "receiver", "type": "address"},
+            {"internalType": "bytes", "name": "ctx", "type": "bytes"},
+        ],
+        "name": "deleteFlow",
+        "outputs": [{"internalType": "bytes", "name": "newCtx", "type": "bytes"}],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "contract ISuperfluidToken", "name": "token", "type": "address"},
+            {"internalType": "address", "name": "account", "type": "address"},
+        ],
+        "name": "getNetFlow",
+        "outputs": [{"internalType": "int96", "name": "flowRate", "type": "int96"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+CFA_AGREEMENT_TYPE = "0xa9214cc96615e0085d3bb077758db69497dc2dce3b2b1e97bc93c3d18d83efd3"
+
+OPERATION_TYPE_SUPERFLUID_CALL_AGREEMENT = 201
+
+MAX_BATCH_FLOWS = 50
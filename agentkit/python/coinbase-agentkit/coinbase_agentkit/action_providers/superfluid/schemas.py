@@ -1,6 +1,10 @@
 """Schemas for Superfluid action provider."""
 
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+from .constants import MAX_BATCH_FLOWS
 
 
 class CreateFlowSchema(BaseModel):
@@ -24,3 +28,50 @@ class UpdateFlowSchema(BaseModel):
     recipient: str = Field(..., description="The wallet address of the recipient")
     token_address: str = Field(..., description="The address of the token that is being streamed")
     new_flow_rate: str = Field(..., description="The new flow rate of tokens in wei per second")
+
+
+class FlowOperationSchema(BaseModel):
+    """A single flow operation of a batch."""
+
+    operation: Literal["create", "update", "delete"] = Field(
+        ..., description="Whether to create, update or delete the flow"
+    )
+    recipient: str = Field(..., description="The wallet address of the recipient")
+    token_address: str = Field(..., description="The address of the Super token being streamed")
+    flow_rate: str | None = Field(
+        None,
+        description="The flow rate of tokens in wei per second. Required to create or update a flow",
+    )
+
+    @model_validator(mode="after")
+    def validate_flow_rate(self) -> "FlowOperationSchema":
+        """Validate that flows being created or updated have a flow rate."""
+        if self.operation != "delete" and self.flow_rate is None:
+            raise ValueError(f"A flow rate is required to {self.operation} a flow")
+        return self
+
+
+class BatchFlowsSchema(BaseModel):
+    """Input argument schema for running several flow operations in one transaction."""
+
+    operations: list[FlowOperationSchema] = Field(
+        ...,
+        description="The flow operations to run, in order",
+        min_length=1,
+        max_length=MAX_BATCH_FLOWS,
+    )
+
+
+class GetStreamBalanceSchema(BaseModel):
+    """Input argument schema for getting a streaming balance."""
+
+    token_address: str = Field(..., description="The address of the Super token")
+    address: str | None = Field(
+        None,
+        description="The address to get the balance of. If not provided, uses the wallet's address",
+    )
+    timestamp: int | None = Field(
+        None,
+        description="The unix timestamp, in seconds, to compute the balance at. Defaults to now",
+        ge=0,
+    )
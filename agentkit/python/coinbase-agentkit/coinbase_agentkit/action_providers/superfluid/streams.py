@@ -0,0 +1,175 @@
+"""Client-side computation of Superfluid streaming balances."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from web3 import Web3
+
+from ...wallet_providers.evm_wallet_provider import EvmWalletProvider
+from ...wallet_providers.multicall import ContractCall, multicall
+from .constants import CFA_ABI, CFA_AGREEMENT_TYPE, HOST_ABI, SUPER_TOKEN_ABI
+
+
+@dataclass(frozen=True)
+class StreamSnapshot:
+    """The Super token balance and net flow rate of an account at a block timestamp.
+
+    Between flow changes the balance moves linearly with time, so a single snapshot is
+    enough to compute the balance at any later timestamp.
+    """
+
+    token: str
+    account: str
+    timestamp: int
+    available_balance: int
+    deposit: int
+    net_flow_rate: int
+
+    def balance_at(self, timestamp: int) -> int:
+        """Compute the available balance at a timestamp.
+
+        Args:
+            timestamp: The unix timestamp, in seconds.
+
+        Returns:
+            int: The available balance, in wei. Negative once the account is critical.
+
+        """
+        return self.available_balance + self.net_flow_rate * (timestamp - self.timestamp)
+
+    def depleted_at(self) -> int | None:
+        """Compute when the available balance runs out.
+
+        Returns:
+            int | None: The unix timestamp the balance reaches zero, or None if the net flow
+                rate is not negative.
+
+        """
+        if self.net_flow_rate >= 0:
+            return None
+        seconds = max(self.available_balance, 0) // -self.net_flow_rate
+        return self.timestamp + seconds
+
+
+class StreamStateReader:
+    """Reads Superfluid stream state once and serves balances from local computation.
+
+    Snapshots are cached per network, token and account until `invalidate` is called for a
+    flow changing transaction of the account, keeping the most recently used `max_cached`.
+    Changes made outside of the action provider, such as incoming plain transfers, are not
+    observed.
+    """
+
+    def __init__(self, max_cached: int = 256):
+        """Initialize the reader.
+
+        Args:
+            max_cached: The number of account snapshots cached.
+
+        """
+        self.max_cached = max_cached
+        # (network_id, token) -> (host, constant flow agreement)
+        self._flow_agreements: dict[tuple[str | None, str], tuple[str, str]] = {}
+        # (network_id, token, account) -> snapshot
+        self._snapshots: OrderedDict[tuple[str | None, str, str], StreamSnapshot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def flow_agreement(
+        self, wallet_provider: EvmWalletProvider, token_address: str
+    ) -> tuple[str, str]:
+        """Get the Superfluid host and constant flow agreement of a Super token.
+
+        Args:
+            wallet_provider: The wallet provider to read with.
+            token_address: The address of the Super token.
+
+        Returns:
+            tuple[str, str]: The host and constant flow agreement addresses.
+
+        """
+        token = Web3.to_checksum_address(token_address)
+        key = (wallet_provider.get_network().network_id, token.lower())
+        with self._lock:
+            cached = self._flow_agreements.get(key)
+        if cached is not None:
+            return cached
+
+        host = wallet_provider.read_contract(
+            contract_address=token, abi=SUPER_TOKEN_ABI, function_name="getHost"
+        )
+        cfa = wallet_provider.read_contract(
+            contract_address=host,
+            abi=HOST_ABI,
+            function_name="getAgreementClass",
+            args=[CFA_AGREEMENT_TYPE],
+        )
+        agreement = (Web3.to_checksum_address(host), Web3.to_checksum_address(cfa))
+        with self._lock:
+            self._flow_agreements[key] = agreement
+        return agreement
+
+    def snapshot(
+        self, wallet_provider: EvmWalletProvider, token_address: str, account: str
+    ) -> StreamSnapshot:
+        """Get the stream state of an account, reading it only if it is not cached.
+
+        Args:
+            wallet_provider: The wallet provider to read with.
+            token_address: The address of the Super token.
+            account: The address of the account.
+
+        Returns:
+            StreamSnapshot: The balance and net flow rate of the account.
+
+        """
+        token = Web3.to_checksum_address(token_address)
+        account = Web3.to_checksum_address(account)
+        key = (wallet_provider.get_network().network_id, token.lower(), account.lower())
+        with self._lock:
+            cached = self._snapshots.get(key)
+            if cached is not None:
+                self._snapshots.move_to_end(key)
+        if cached is not None:
+            return cached
+
+        _, cfa = self.flow_agreement(wallet_provider, token)
+        balance, net_flow = multicall(
+            wallet_provider,
+            [
+                ContractCall(token, SUPER_TOKEN_ABI, "realtimeBalanceOfNow", (account,)),
+                ContractCall(cfa, CFA_ABI, "getNetFlow", (token, account)),
+            ],
+        )
+        for result in (balance, net_flow):
+            if not result.success:
+                raise ValueError(f"Could not read the stream state: {result.error}")
+
+        available_balance, deposit, _, timestamp = balance.value
+        snapshot = StreamSnapshot(
+            token=token,
+            account=account,
+            timestamp=timestamp,
+            available_balance=available_balance,
+            deposit=deposit,
+            net_flow_rate=net_flow.value,
+        )
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self.max_cached:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, network_id: str | None, token_address: str, accounts: list[str]) -> None:
+        """Drop the cached snapshots of accounts whose flows of a token changed.
+
+        Args:
+            network_id: The network of the flows.
+            token_address: The address of the Super token.
+            accounts: The senders and receivers of the changed flows.
+
+        """
+        with self._lock:
+            for account in accounts:
+                self._snapshots.pop((network_id, token_address.lower(), account.lower()), None)
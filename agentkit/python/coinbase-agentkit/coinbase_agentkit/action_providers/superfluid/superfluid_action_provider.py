@@ -1,15 +1,34 @@
 """Superfluid action provider."""
 
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import eth_abi
 from web3 import Web3
 
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
-from .constants import CREATE_ABI, DELETE_ABI, SUPERFLUID_HOST_ADDRESS, UPDATE_ABI
-from .schemas import CreateFlowSchema, DeleteFlowSchema, UpdateFlowSchema
+from .constants import (
+    CFA_ABI,
+    CREATE_ABI,
+    DELETE_ABI,
+    HOST_ABI,
+    OPERATION_TYPE_SUPERFLUID_CALL_AGREEMENT,
+    SUPERFLUID_HOST_ADDRESS,
+    UPDATE_ABI,
+)
+from .schemas import (
+    BatchFlowsSchema,
+    CreateFlowSchema,
+    DeleteFlowSchema,
+    FlowOperationSchema,
+    GetStreamBalanceSchema,
+    UpdateFlowSchema,
+)
+from .streams import StreamStateReader
 
 
 class SuperfluidActionProvider(ActionProvider[EvmWalletProvider]):
@@ -17,6 +36,7 @@ class SuperfluidActionProvider(ActionProvider[EvmWalletProvider]):
 
     def __init__(self):
         super().__init__("superfluid", [])
+        self.streams = StreamStateReader()
 
     @create_action(
         name="create_flow",
@@ -63,8 +83,10 @@ Important notes:
             params = {"to": SUPERFLUID_HOST_ADDRESS, "data": encoded_data}
 
             tx_hash = wallet_provider.send_transaction(params)
-
-            wallet_provider.wait_for_transaction_receipt(tx_hash)
+            try:
+                wallet_provider.wait_for_transaction_receipt(tx_hash)
+            finally:
+                self._flows_changed(wallet_provider, args["token_address"], [args["recipient"]])
 
             return f"Flow created successfully. Transaction hash: {tx_hash}"
 
@@ -115,8 +137,10 @@ Important notes:
             params = {"to": SUPERFLUID_HOST_ADDRESS, "data": encoded_data}
 
             tx_hash = wallet_provider.send_transaction(params)
-
-            wallet_provider.wait_for_transaction_receipt(tx_hash)
+            try:
+                wallet_provider.wait_for_transaction_receipt(tx_hash)
+            finally:
+                self._flows_changed(wallet_provider, args["token_address"], [args["recipient"]])
 
             return f"Flow updated successfully. Transaction hash: {tx_hash}"
 
@@ -161,14 +185,153 @@ Inputs:
             params = {"to": SUPERFLUID_HOST_ADDRESS, "data": encoded_data}
 
             tx_hash = wallet_provider.send_transaction(params)
-
-            wallet_provider.wait_for_transaction_receipt(tx_hash)
+            try:
+                wallet_provider.wait_for_transaction_receipt(tx_hash)
+            finally:
+                self._flows_changed(wallet_provider, args["token_address"], [args["recipient"]])
 
             return f"Flow deleted successfully. Transaction hash: {tx_hash}"
 
         except Exception as e:
             return f"Error deleting flow: {e!s}"
 
+    @create_action(
+        name="batch_flows",
+        description="""
+This tool will create, update and delete several Superfluid money flows in a single transaction. Do not use this tool for any other purpose, or trading other assets.
+Inputs:
+- A list of operations, each with:
+  - operation: "create", "update" or "delete"
+  - Wallet address of the flow recipient
+  - Super token contract address
+  - The flowrate of flow in wei per second (not needed to delete a flow)
+Important notes:
+- The operations run atomically, in order: if one fails, none of them is applied.
+- Prefer this tool over several create_flow, update_flow or delete_flow calls when changing more than one flow.
+- The flowrate cannot have any decimal points, since the unit of measurement is wei per second.""",
+        schema=BatchFlowsSchema,
+    )
+    def batch_flows(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Run several flow operations in one Superfluid host `batchCall` transaction.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = BatchFlowsSchema(**args)
+            sender = Web3.to_checksum_address(wallet_provider.get_address())
+
+            hosts = set()
+            operations = []
+            for operation in validated_args.operations:
+                host, cfa = self.streams.flow_agreement(wallet_provider, operation.token_address)
+                hosts.add(host)
+                operations.append(
+                    (
+                        OPERATION_TYPE_SUPERFLUID_CALL_AGREEMENT,
+                        cfa,
+                        _encode_flow_operation(cfa, sender, operation),
+                    )
+                )
+            if len(hosts) > 1:
+                raise ValueError("The tokens are not managed by the same Superfluid host")
+
+            host = hosts.pop()
+            superfluid_host_contract = Web3().eth.contract(address=host, abi=HOST_ABI)
+            encoded_data = superfluid_host_contract.encode_abi("batchCall", args=[operations])
+
+            params = {"to": host, "data": encoded_data}
+
+            tx_hash = wallet_provider.send_transaction(params)
+            try:
+                wallet_provider.wait_for_transaction_receipt(tx_hash)
+            finally:
+                for operation in validated_args.operations:
+                    self._flows_changed(
+                        wallet_provider, operation.token_address, [operation.recipient]
+                    )
+
+            return (
+                f"{len(operations)} flow operations completed in one transaction. "
+                f"Transaction hash: {tx_hash}"
+            )
+
+        except Exception as e:
+            return f"Error running batch flow operations: {e!s}"
+
+    @create_action(
+        name="get_stream_balance",
+        description="""
+This tool will get the real-time Superfluid Super token balance of an address, its net flow rate, and when the balance runs dry. Use it to answer questions about streaming balances at any time, including in the future.
+Inputs:
+- Super token contract address
+- (Optional) The address to check. If not provided, uses the wallet's address
+- (Optional) The unix timestamp, in seconds, to compute the balance at. Defaults to now""",
+        schema=GetStreamBalanceSchema,
+    )
+    def get_stream_balance(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Get the streaming balance of an address from a locally extrapolated snapshot.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = GetStreamBalanceSchema(**args)
+            account = validated_args.address or wallet_provider.get_address()
+            timestamp = validated_args.timestamp or int(time.time())
+
+            snapshot = self.streams.snapshot(wallet_provider, validated_args.token_address, account)
+
+            lines = [
+                f"Balance of {snapshot.account} in {snapshot.token} at {_format_time(timestamp)}: "
+                f"{snapshot.balance_at(timestamp)} wei",
+                f"Net flow rate: {snapshot.net_flow_rate} wei per second",
+            ]
+            depleted_at = snapshot.depleted_at()
+            if depleted_at is None:
+                lines.append("The balance is not decreasing.")
+            elif depleted_at <= timestamp:
+                lines.append(f"The balance ran dry at {_format_time(depleted_at)}.")
+            else:
+                lines.append(
+                    f"The balance runs dry at {_format_time(depleted_at)}, "
+                    f"in {timedelta(seconds=depleted_at - timestamp)}."
+                )
+            return "\n".join(lines)
+
+        except Exception as e:
+            return f"Error getting stream balance: {e!s}"
+
+    def _flows_changed(
+        self, wallet_provider: EvmWalletProvider, token_address: str, recipients: list[str]
+    ) -> None:
+        """Drop the stream snapshots made stale by a flow changing transaction.
+
+        Called once the transaction is mined, so snapshots read while it was pending are
+        dropped too.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider that sent the transaction.
+            token_address (str): The address of the Super token of the flows.
+            recipients (list[str]): The receivers of the flows.
+
+        """
+        self.streams.invalidate(
+            wallet_provider.get_network().network_id,
+            token_address,
+            [wallet_provider.get_address(), *recipients],
+        )
+
     def supports_network(self, network: Network) -> bool:
         """Check if network is supported by Superfluid actions.
 
@@ -182,6 +345,35 @@ Inputs:
         return network.protocol_family == "evm"
 
 
+def _format_time(timestamp: int) -> str:
+    """Format a unix timestamp as a UTC ISO 8601 date."""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+def _encode_flow_operation(cfa: str, sender: str, operation: FlowOperationSchema) -> bytes:
+    """Encode a flow operation as the data of a host `batchCall` agreement call.
+
+    Args:
+        cfa (str): The address of the constant flow agreement.
+        sender (str): The address sending the flow.
+        operation (FlowOperationSchema): The flow operation.
+
+    Returns:
+        bytes: The agreement call data and empty user data, ABI encoded.
+
+    """
+    cfa_contract = Web3().eth.contract(address=cfa, abi=CFA_ABI)
+    token = Web3.to_checksum_address(operation.token_address)
+    recipient = Web3.to_checksum_address(operation.recipient)
+    if operation.operation == "delete":
+        call_data = cfa_contract.encode_abi("deleteFlow", args=[token, sender, recipient, b""])
+    else:
+        call_data = cfa_contract.encode_abi(
+            f"{operation.operation}Flow", args=[token, recipient, int(operation.flow_rate), b""]
+        )
+    return eth_abi.encode(["bytes", "bytes"], [Web3.to_bytes(hexstr=call_data), b""])
+
+
 def superfluid_action_provider() -> SuperfluidActionProvider:
     """Create a new Superfluid action provider.
 
@@ -0,0 +1,179 @@
+"""Incremental fetching of Twitter (X) mentions."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+# The largest page the mentions endpoint returns.
+MAX_PAGE_SIZE = 100
+
+
+class MentionsCursor:
+    """Tracks the newest mention seen per user so that polls only fetch new mentions.
+
+    The first fetch for a user returns the most recent page of mentions. Later fetches pass
+    the newest mention id seen as `since_id` and follow `pagination_token` through a backlog
+    of up to `max_pages` pages. A longer backlog is resumed from its next page on the following
+    fetch, and `since_id` only advances once the whole backlog was fetched. Every fetched
+    mention is kept in a bounded per-user cache.
+    """
+
+    def __init__(self, max_cached: int = 100, max_pages: int = 5):
+        """Initialize the cursor.
+
+        Args:
+            max_cached: The number of recent mentions cached per user.
+            max_pages: The number of pages followed when catching up on a backlog.
+
+        """
+        self.max_cached = max_cached
+        self.max_pages = max_pages
+        self._since_ids: dict[str, str] = {}
+        # The next page and newest mention id of a backlog longer than `max_pages`, per user.
+        self._backlogs: dict[str, tuple[str, str]] = {}
+        self._cache: dict[str, OrderedDict[str, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def since_id(self, user_id: str) -> str | None:
+        """Get the id of the newest mention seen for a user.
+
+        Args:
+            user_id: The Twitter user ID.
+
+        Returns:
+            str | None: The mention id, or None if no mention was fetched yet.
+
+        """
+        with self._lock:
+            return self._since_ids.get(user_id)
+
+    def recent(self, user_id: str) -> list[dict[str, Any]]:
+        """Get the cached mentions of a user.
+
+        Args:
+            user_id: The Twitter user ID.
+
+        Returns:
+            list[dict[str, Any]]: The mentions, newest first.
+
+        """
+        with self._lock:
+            cache = self._cache.get(user_id, {})
+            return sorted(cache.values(), key=lambda mention: int(mention["id"]), reverse=True)
+
+    def fetch(self, user_id: str, fetch_page: Callable[..., dict[str, Any]]) -> dict[str, Any]:
+        """Fetch the mentions of a user that are newer than the cursor.
+
+        The cursor only advances once every page was fetched, so a failed fetch is retried
+        from the same position. A backlog truncated at `max_pages` is resumed by the next
+        fetch from where this one stopped, before newer mentions are fetched.
+
+        Args:
+            user_id: The Twitter user ID.
+            fetch_page: Function calling the mentions endpoint with the user ID and any of
+                `since_id`, `pagination_token` and `max_results` as keyword arguments.
+
+        Returns:
+            dict[str, Any]: The API response. Responses spanning several pages are merged,
+                with `meta.truncated` set if the backlog had more pages than were followed.
+
+        """
+        with self._lock:
+            since_id = self._since_ids.get(user_id)
+            next_token, backlog_newest_id = self._backlogs.get(user_id, (None, None))
+        if since_id is None:
+            pages = [fetch_page(user_id)]
+            next_token = None
+        else:
+            pages, next_token = self._fetch_since(user_id, since_id, fetch_page, next_token)
+
+        response = pages[0] if len(pages) == 1 else merge_pages(pages)
+        if next_token:
+            response.setdefault("meta", {})["truncated"] = True
+        self._remember(user_id, response.get("data") or [], next_token, backlog_newest_id)
+        return response
+
+    def _fetch_since(
+        self,
+        user_id: str,
+        since_id: str,
+        fetch_page: Callable[..., dict[str, Any]],
+        token: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Fetch the pages of mentions newer than `since_id` from a page, up to `max_pages`.
+
+        Returns the pages and the token of the next page if the backlog was truncated.
+        """
+        pages = []
+        while len(pages) < self.max_pages:
+            kwargs: dict[str, Any] = {"since_id": since_id, "max_results": MAX_PAGE_SIZE}
+            if token:
+                kwargs["pagination_token"] = token
+            page = fetch_page(user_id, **kwargs)
+            pages.append(page)
+
+            token = (page.get("meta") or {}).get("next_token")
+            if not token:
+                return pages, None
+        return pages, token
+
+    def _remember(
+        self,
+        user_id: str,
+        mentions: list[dict[str, Any]],
+        next_token: str | None = None,
+        backlog_newest_id: str | None = None,
+    ) -> None:
+        """Cache fetched mentions and advance the cursor past them.
+
+        While a backlog has a next page, the newest mention id is kept with its token
+        instead, so the mentions between `since_id` and the fetched pages are not skipped.
+        """
+        ids = [mention["id"] for mention in mentions]
+        if backlog_newest_id is not None:
+            ids.append(backlog_newest_id)
+        newest = max(ids, key=int) if ids else None
+
+        with self._lock:
+            cache = self._cache.setdefault(user_id, OrderedDict())
+            for mention in sorted(mentions, key=lambda m: int(m["id"])):
+                cache[mention["id"]] = mention
+                cache.move_to_end(mention["id"])
+            while len(cache) > self.max_cached:
+                cache.popitem(last=False)
+
+            if next_token:
+                self._backlogs[user_id] = (next_token, newest)
+                return
+            self._backlogs.pop(user_id, None)
+            current = self._since_ids.get(user_id)
+            if newest is not None and (current is None or int(newest) > int(current)):
+                self._since_ids[user_id] = newest
+
+
+def merge_pages(pages: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge pages of a paginated response into a single response.
+
+    Args:
+        pages: The pages, newest first.
+
+    Returns:
+        dict[str, Any]: The response with the data and includes of every page.
+
+    """
+    data = [mention for page in pages for mention in page.get("data") or []]
+    includes: dict[str, list[Any]] = {}
+    for page in pages:
+        for key, values in (page.get("includes") or {}).items():
+            includes.setdefault(key, []).extend(values)
+
+    response: dict[str, Any] = {"data": data} if data else {}
+    if includes:
+        response["includes"] = includes
+    meta: dict[str, Any] = {"result_count": len(data)}
+    if data:
+        meta["newest_id"] = data[0]["id"]
+        meta["oldest_id"] = data[-1]["id"]
+    response["meta"] = meta
+    return response
@@ -13,6 +13,10 @@ class AccountMentionsSchema(BaseModel):
     """Input argument schema for Twitter account mentions action."""
 
     user_id: str = Field(..., description="The Twitter user ID to fetch mentions for")
+    include_cached: bool = Field(
+        False,
+        description="Whether to also return the recent mentions returned by earlier calls",
+    )
 
 
 class PostTweetSchema(BaseModel):
@@ -28,3 +32,9 @@ class PostTweetReplySchema(BaseModel):
         ..., description="The text content of the reply tweet (max 280 characters)"
     )
     tweet_id: str = Field(..., description="The ID of the tweet to reply to")
+
+
+class GetQueuedTweetSchema(BaseModel):
+    """Input argument schema for getting the status of a queued tweet."""
+
+    handle: str = Field(..., description="The handle returned when the tweet was queued")
@@ -0,0 +1,275 @@
+"""Rate-limit-aware queue of outbound tweets."""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from contextvars import Context, copy_context
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+from ...rate_limiting import RateLimitTimeoutError, rate_limiter
+
+QUEUED = "queued"
+POSTING = "posting"
+POSTED = "posted"
+FAILED = "failed"
+
+
+@dataclass
+class QueuedTweet:
+    """A handle on a tweet waiting to be posted."""
+
+    handle: str
+    text: str
+    in_reply_to_tweet_id: str | None = None
+    status: str = QUEUED
+    response: dict[str, Any] | None = None
+    error: Exception | None = None
+    queued_at: float = field(default_factory=time.time)
+    posted_at: float | None = None
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+    _context: Context | None = field(default=None, repr=False)
+
+    @property
+    def key(self) -> tuple[str, str | None]:
+        """Get the key under which duplicate posts are coalesced."""
+        return self.text.strip(), self.in_reply_to_tweet_id
+
+    @property
+    def tweet_id(self) -> str | None:
+        """Get the ID of the posted tweet, if it was posted."""
+        if not self.response:
+            return None
+        return (self.response.get("data") or {}).get("id")
+
+    @property
+    def done(self) -> bool:
+        """Check whether the tweet was posted or failed."""
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the tweet to be posted or fail.
+
+        Args:
+            timeout: Maximum number of seconds to wait. Waits indefinitely when unset.
+
+        Returns:
+            bool: Whether the tweet is done.
+
+        """
+        return self._done.wait(timeout)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get a JSON-serializable summary of the handle."""
+        summary: dict[str, Any] = {"handle": self.handle, "status": self.status}
+        if self.in_reply_to_tweet_id:
+            summary["in_reply_to_tweet_id"] = self.in_reply_to_tweet_id
+        if self.tweet_id:
+            summary["tweet_id"] = self.tweet_id
+        if self.error is not None:
+            summary["error"] = str(self.error)
+        return summary
+
+
+class TweetQueue:
+    """Posts tweets one at a time on a background thread, inside the allowed rate window.
+
+    Posts go through the rate limiter bucket of the tweets route. The `x-rate-limit-*`
+    headers of every tweets response are recorded, and once the window is exhausted the
+    bucket is paused until it resets, so queued posts wait instead of getting a 429. A post
+    that is rate limited anyway is kept at the front of the queue and retried after the
+    reset. Posting the same text to the same conversation while an earlier post is queued
+    or posting, or within `coalesce_window` seconds after it was posted, returns the earlier
+    handle.
+    """
+
+    def __init__(
+        self,
+        post: Callable[[QueuedTweet], dict[str, Any]],
+        rate_limit_key: str,
+        is_rate_limited: Callable[[Exception], bool] = lambda e: False,
+        max_handles: int = 256,
+        coalesce_window: float = 0.0,
+    ):
+        """Initialize the queue.
+
+        Args:
+            post: Function posting a tweet and returning the API response.
+            rate_limit_key: The rate limiting key of the tweets route.
+            is_rate_limited: Function checking whether an error is a 429 response.
+            max_handles: The number of finished handles kept for status checks.
+            coalesce_window: Seconds after a tweet is posted during which posting the same
+                text again returns its handle. By default only unfinished tweets are coalesced.
+
+        """
+        self.post = post
+        self.rate_limit_key = rate_limit_key
+        self.is_rate_limited = is_rate_limited
+        self.max_handles = max_handles
+        self.coalesce_window = coalesce_window
+        self.remaining: int | None = None
+        self.reset_at: float | None = None
+        self._pending: deque[QueuedTweet] = deque()
+        self._handles: OrderedDict[str, QueuedTweet] = OrderedDict()
+        self._cond = threading.Condition()
+        self._worker: threading.Thread | None = None
+
+    def submit(self, text: str, in_reply_to_tweet_id: str | None = None) -> QueuedTweet:
+        """Queue a tweet for posting.
+
+        Args:
+            text: The text of the tweet.
+            in_reply_to_tweet_id: Optional ID of the tweet to reply to.
+
+        Returns:
+            QueuedTweet: The handle of the tweet, or of an identical earlier tweet that is
+                queued, posting, or was posted within `coalesce_window` seconds.
+
+        """
+        tweet = QueuedTweet(
+            handle=uuid.uuid4().hex[:12],
+            text=text,
+            in_reply_to_tweet_id=in_reply_to_tweet_id,
+            _context=copy_context(),
+        )
+        with self._cond:
+            for existing in reversed(self._handles.values()):
+                if existing.key == tweet.key and self._coalesces(existing):
+                    return existing
+
+            self._handles[tweet.handle] = tweet
+            self._pending.append(tweet)
+            self._evict()
+            self._ensure_worker()
+            self._cond.notify_all()
+        return tweet
+
+    def get(self, handle: str) -> QueuedTweet | None:
+        """Get a tweet by its handle.
+
+        Args:
+            handle: The handle returned when the tweet was queued.
+
+        Returns:
+            QueuedTweet | None: The tweet, or None if the handle is unknown or was evicted.
+
+        """
+        with self._cond:
+            return self._handles.get(handle)
+
+    def pending(self) -> int:
+        """Get the number of tweets waiting to be posted."""
+        with self._cond:
+            return len(self._pending)
+
+    def record_response(self, response: Any, *args: Any, **kwargs: Any) -> None:
+        """Record the rate limit headers of a response to the tweets route.
+
+        This is a `requests` response hook, so it sees every response of the client's session
+        and ignores those of other routes.
+
+        Args:
+            response: The HTTP response.
+            *args: Ignored hook arguments.
+            **kwargs: Ignored hook arguments.
+
+        """
+        request = getattr(response, "request", None)
+        if request is None or request.method != "POST":
+            return
+        if urlsplit(response.url).path.rstrip("/") != "/2/tweets":
+            return
+        self.update_rate_limit(response.headers)
+
+    def update_rate_limit(self, headers: Any) -> None:
+        """Update the rate window from `x-rate-limit-*` headers.
+
+        Args:
+            headers: The response headers.
+
+        """
+        try:
+            remaining = int(headers["x-rate-limit-remaining"])
+            reset_at = float(headers["x-rate-limit-reset"])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        self.remaining = remaining
+        self.reset_at = reset_at
+        if remaining <= 0:
+            rate_limiter.pause(self.rate_limit_key, max(reset_at - time.time(), 0.0))
+
+    def _coalesces(self, tweet: QueuedTweet) -> bool:
+        """Check whether an identical new tweet should return the handle of this one."""
+        if tweet.status in (QUEUED, POSTING):
+            return True
+        return (
+            tweet.status == POSTED
+            and tweet.posted_at is not None
+            and time.time() - tweet.posted_at < self.coalesce_window
+        )
+
+    def _evict(self) -> None:
+        """Drop the oldest finished handles beyond `max_handles`."""
+        excess = len(self._handles) - self.max_handles
+        for handle in list(self._handles):
+            if excess <= 0:
+                break
+            if self._handles[handle].done:
+                del self._handles[handle]
+                excess -= 1
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread if it is not running."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="twitter-outbound", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Post queued tweets until the queue is empty."""
+        while True:
+            with self._cond:
+                if not self._pending:
+                    self._worker = None
+                    return
+                tweet = self._pending[0]
+                tweet.status = POSTING
+
+            delay = self._post(tweet)
+            if delay is not None:
+                with self._cond:
+                    tweet.status = QUEUED
+                time.sleep(delay)
+                continue
+
+            with self._cond:
+                self._pending.popleft()
+                self._evict()
+            tweet._done.set()
+
+    def _post(self, tweet: QueuedTweet) -> float | None:
+        """Post a tweet.
+
+        Returns:
+            float | None: Seconds to wait before retrying if the post was rate limited,
+                None once the tweet is posted or failed.
+
+        """
+        try:
+            tweet.response = tweet._context.run(self.post, tweet)
+            tweet.status = POSTED
+            tweet.posted_at = time.time()
+        except RateLimitTimeoutError as e:
+            return e.wait
+        except Exception as e:
+            if self.is_rate_limited(e):
+                self.update_rate_limit(getattr(getattr(e, "response", None), "headers", None))
+                if self.reset_at is not None:
+                    return max(self.reset_at - time.time(), 1.0)
+                return 1.0
+            tweet.error = e
+            tweet.status = FAILED
+        return None
@@ -1,18 +1,30 @@
 """Twitter action provider."""
 
 import os
+from collections.abc import Callable
 from json import dumps
-from typing import Any
+from typing import Any, TypeVar
 
 from ...network import Network
+from ...rate_limiting import RateLimitTimeoutError, rate_limiter
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
+from .mentions import MentionsCursor
 from .schemas import (
     AccountDetailsSchema,
     AccountMentionsSchema,
+    GetQueuedTweetSchema,
     PostTweetReplySchema,
     PostTweetSchema,
 )
+from .tweet_queue import FAILED, QueuedTweet, TweetQueue
+
+T = TypeVar("T")
+
+# X applies its rate limits per route, so every route gets its own bucket.
+MENTIONS_RATE_LIMIT_KEY = "x-api:GET /2/users/:id/mentions"
+ME_RATE_LIMIT_KEY = "x-api:GET /2/users/me"
+TWEETS_RATE_LIMIT_KEY = "x-api:POST /2/tweets"
 
 
 class TwitterActionProvider(ActionProvider):
@@ -25,8 +37,12 @@ class TwitterActionProvider(ActionProvider):
         access_token: str | None = None,
         access_token_secret: str | None = None,
         bearer_token: str | None = None,
+        mentions_cache_size: int = 100,
+        post_wait: float = 10.0,
     ):
         super().__init__("twitter", [])
+        self.mentions = MentionsCursor(max_cached=mentions_cache_size)
+        self.post_wait = post_wait
 
         api_key = api_key or os.getenv("TWITTER_API_KEY")
         api_secret = api_secret or os.getenv("TWITTER_API_SECRET")
@@ -56,6 +72,12 @@ class TwitterActionProvider(ActionProvider):
                 bearer_token=bearer_token,
                 return_type=dict,
             )
+            self.outbound = TweetQueue(
+                self._create_tweet,
+                TWEETS_RATE_LIMIT_KEY,
+                is_rate_limited=lambda e: isinstance(e, tweepy.errors.TooManyRequests),
+            )
+            self.client.session.hooks["response"].append(self.outbound.record_response)
         except ImportError as e:
             raise ImportError(
                 "Failed to import tweepy. Please install it with 'pip install tweepy'."
@@ -90,12 +112,12 @@ A failure response will return a message with a Twitter API request error:
         import tweepy
 
         try:
-            response = self.client.get_me()
+            response = self._request(ME_RATE_LIMIT_KEY, self.client.get_me)
             data = response["data"]
             data["url"] = f"https://x.com/{data['username']}"
 
             return f"Successfully retrieved authenticated user account details:\n{dumps(response)}"
-        except tweepy.errors.TweepyException as e:
+        except (tweepy.errors.TweepyException, RateLimitTimeoutError) as e:
             return f"Error retrieving authenticated user account details:\n{e}"
 
     @create_action(
@@ -103,6 +125,12 @@ A failure response will return a message with a Twitter API request error:
         description="""
 This tool will return mentions for the specified Twitter (X) user id.
 
+The first call returns the most recent mentions. Later calls for the same user only return
+mentions posted since the previous call, so an empty result means there is nothing new to reply to.
+If meta.truncated is set, the backlog was too long for one call and the next call returns the
+older mentions that were left out.
+Set include_cached to also get the recent mentions returned by earlier calls.
+
 A successful response will return a message with the API response as a JSON payload:
     {"data": [{"id": "1857479287504584856", "text": "@CDPAgentKit reply"}]}
 
@@ -114,7 +142,8 @@ A failure response will return a message with the Twitter API request error:
         """Get mentions for a specified Twitter user.
 
         Args:
-            args (dict[str, Any]): Arguments containing user_id to get mentions for.
+            args (dict[str, Any]): Arguments containing user_id to get mentions for and whether
+                to include cached mentions.
 
         Returns:
             str: A message containing the action response or error details.
@@ -125,9 +154,17 @@ A failure response will return a message with the Twitter API request error:
         import tweepy
 
         try:
-            response = self.client.get_users_mentions(validated_args.user_id)
+            response = self.mentions.fetch(
+                validated_args.user_id,
+                lambda user_id, **kwargs: self._request(
+                    MENTIONS_RATE_LIMIT_KEY,
+                    lambda: self.client.get_users_mentions(user_id, **kwargs),
+                ),
+            )
+            if validated_args.include_cached:
+                response = {**response, "cached": self.mentions.recent(validated_args.user_id)}
             return f"Successfully retrieved account mentions:\n{dumps(response)}"
-        except tweepy.errors.TweepyException as e:
+        except (tweepy.errors.TweepyException, RateLimitTimeoutError) as e:
             return f"Error retrieving authenticated account mentions:\n{e}"
 
     @create_action(
@@ -138,6 +175,11 @@ This tool will post a tweet on Twitter. The tool takes the text of the tweet as
 A successful response will return a message with the API response as a JSON payload:
     {"data": {"text": "hello, world!", "id": "0123456789012345678", "edit_history_tweet_ids": ["0123456789012345678"]}}
 
+If the rate limit window is exhausted, the tweet is queued and posted once the window resets:
+    Queued tweet for posting:
+    {"handle": "3f2a9c1b7d4e", "status": "queued"}
+Use get_queued_tweet with the handle to get the final tweet ID. Posting the same text again while it is still queued returns the same handle.
+
 A failure response will return a message with the Twitter API request error:
     You are not allowed to create a Tweet with duplicate content.""",
         schema=PostTweetSchema,
@@ -154,13 +196,12 @@ A failure response will return a message with the Twitter API request error:
         """
         validated_args = PostTweetSchema(**args)
 
-        import tweepy
-
-        try:
-            response = self.client.create_tweet(text=validated_args.tweet)
-            return f"Successfully posted to Twitter:\n{dumps(response)}"
-        except tweepy.errors.TweepyException as e:
-            return f"Error posting to Twitter:\n{e}"
+        tweet = self.outbound.submit(validated_args.tweet)
+        if not tweet.wait(self.post_wait):
+            return f"Queued tweet for posting:\n{dumps(tweet.to_dict())}"
+        if tweet.status == FAILED:
+            return f"Error posting to Twitter:\n{tweet.error}"
+        return f"Successfully posted to Twitter:\n{dumps(tweet.response)}"
 
     @create_action(
         name="post_tweet_reply",
@@ -170,6 +211,11 @@ This tool will post a tweet on Twitter. The tool takes the text of the tweet as
 A successful response will return a message with the API response as a JSON payload:
     {"data": {"text": "hello, world!", "id": "0123456789012345678", "edit_history_tweet_ids": ["0123456789012345678"]}}
 
+If the rate limit window is exhausted, the reply is queued and posted once the window resets:
+    Queued tweet for posting:
+    {"handle": "3f2a9c1b7d4e", "status": "queued", "in_reply_to_tweet_id": "0123456789012345678"}
+Use get_queued_tweet with the handle to get the final tweet ID. Posting the same reply again returns the same handle.
+
 A failure response will return a message with the Twitter API request error:
     You are not allowed to create a Tweet with duplicate content.""",
         schema=PostTweetReplySchema,
@@ -186,15 +232,76 @@ A failure response will return a message with the Twitter API request error:
         """
         validated_args = PostTweetReplySchema(**args)
 
-        import tweepy
+        tweet = self.outbound.submit(validated_args.tweet_reply, validated_args.tweet_id)
+        if not tweet.wait(self.post_wait):
+            return f"Queued tweet for posting:\n{dumps(tweet.to_dict())}"
+        if tweet.status == FAILED:
+            return f"Error posting reply to Twitter:\n{tweet.error}"
+        return f"Successfully posted reply to Twitter:\n{dumps(tweet.response)}"
 
-        try:
-            response = self.client.create_tweet(
-                text=validated_args.tweet_reply, in_reply_to_tweet_id=validated_args.tweet_id
-            )
-            return f"Successfully posted reply to Twitter:\n{dumps(response)}"
-        except tweepy.errors.TweepyException as e:
-            return f"Error posting reply to Twitter:\n{e}"
+    @create_action(
+        name="get_queued_tweet",
+        description="""
+This tool will return the status of a tweet or reply queued by post_tweet or post_tweet_reply.
+
+It takes the handle returned when the tweet was queued as input.
+
+A successful response will return a message with the status as a JSON payload:
+    {"handle": "3f2a9c1b7d4e", "status": "posted", "tweet_id": "0123456789012345678"}
+
+The status is one of "queued", "posting", "posted" or "failed". Failed tweets include the error.
+
+A failure response will return a message with the error:
+    Error retrieving queued tweet: Unknown handle 3f2a9c1b7d4e""",
+        schema=GetQueuedTweetSchema,
+    )
+    def get_queued_tweet(self, args: dict[str, Any]) -> str:
+        """Get the status of a queued tweet.
+
+        Args:
+            args (dict[str, Any]): Arguments containing the handle of the queued tweet.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        validated_args = GetQueuedTweetSchema(**args)
+
+        tweet = self.outbound.get(validated_args.handle)
+        if tweet is None:
+            return f"Error retrieving queued tweet: Unknown handle {validated_args.handle}"
+        return f"Successfully retrieved queued tweet:\n{dumps(tweet.to_dict())}"
+
+    def _create_tweet(self, tweet: QueuedTweet) -> dict[str, Any]:
+        """Post a queued tweet under the rate limit of the tweets route.
+
+        Args:
+            tweet (QueuedTweet): The tweet to post.
+
+        Returns:
+            dict[str, Any]: The API response.
+
+        """
+        kwargs: dict[str, Any] = {"text": tweet.text}
+        if tweet.in_reply_to_tweet_id:
+            kwargs["in_reply_to_tweet_id"] = tweet.in_reply_to_tweet_id
+        return self._request(TWEETS_RATE_LIMIT_KEY, lambda: self.client.create_tweet(**kwargs))
+
+    def _request(self, key: str, fn: Callable[[], T]) -> T:
+        """Call the Twitter API under the rate limit of a route.
+
+        A 429 pauses the route until its window resets instead of being retried in place, so
+        later calls queue for the reset or fail fast when it is too far away.
+
+        Args:
+            key (str): The rate limiting key of the route.
+            fn (Callable[[], T]): The function performing the API call.
+
+        Returns:
+            T: The API response.
+
+        """
+        return rate_limiter.call(key, fn, max_retries=0)
 
     def supports_network(self, network: Network) -> bool:
         """Check if network is supported by Twitter actions.
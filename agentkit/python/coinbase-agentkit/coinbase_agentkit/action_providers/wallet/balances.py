@@ -0,0 +1,104 @@
+"""Reading the native and token balances of a wallet on a chain."""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from ...network import NETWORK_ID_TO_CHAIN
+from ...wallet_providers.evm_wallet_provider import EvmWalletProvider
+from ...wallet_providers.multicall import (
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+    ContractCall,
+    multicall,
+    native_balance_call,
+)
+from .constants import ERC20_BALANCE_ABI
+
+
+@dataclass
+class TokenBalance:
+    """The balance of an ERC20 token."""
+
+    address: str
+    symbol: str | None = None
+    amount: Decimal | None = None
+    error: str | None = None
+
+
+@dataclass
+class ChainBalances:
+    """The balances of a wallet on a chain, read at a single block."""
+
+    network_id: str
+    address: str
+    native_amount: Decimal
+    native_symbol: str
+    block_number: int | None = None
+    tokens: list[TokenBalance] = field(default_factory=list)
+
+    def format(self) -> str:
+        """Format the balances as a single line, leaving out empty token balances."""
+        chain = NETWORK_ID_TO_CHAIN.get(self.network_id)
+        location = f"chain {chain.id}" if chain else "chain"
+        if self.block_number is not None:
+            location += f", block {self.block_number}"
+
+        amounts = [f"{self.native_amount.normalize():f} {self.native_symbol}"]
+        for token in self.tokens:
+            name = token.symbol or token.address
+            if token.error is not None:
+                amounts.append(f"{name}: {token.error}")
+            elif token.amount:
+                amounts.append(f"{token.amount.normalize():f} {name}")
+        return f"- {self.network_id} ({location}): {', '.join(amounts)}"
+
+
+def read_chain_balances(
+    wallet_provider: EvmWalletProvider, tokens: list[str] | None = None
+) -> ChainBalances:
+    """Read the native and token balances of the wallet in a single multicall.
+
+    Args:
+        wallet_provider (EvmWalletProvider): The wallet provider of the chain.
+        tokens (list[str] | None): The addresses of the ERC20 tokens to read.
+
+    Returns:
+        ChainBalances: The balances.
+
+    """
+    network_id = wallet_provider.get_network().network_id
+    address = wallet_provider.get_address()
+    tokens = tokens or []
+
+    calls = [
+        native_balance_call(address),
+        ContractCall(MULTICALL3_ADDRESS, MULTICALL3_ABI, "getBlockNumber"),
+    ]
+    for token in tokens:
+        calls += [
+            ContractCall(token, ERC20_BALANCE_ABI, "balanceOf", (address,)),
+            ContractCall(token, ERC20_BALANCE_ABI, "decimals"),
+            ContractCall(token, ERC20_BALANCE_ABI, "symbol"),
+        ]
+    native, block_number, *token_results = multicall(wallet_provider, calls)
+
+    chain = NETWORK_ID_TO_CHAIN.get(network_id)
+    native_decimals = chain.native_currency.decimals if chain else 18
+    native_wei = native.value if native.success else wallet_provider.get_balance()
+    balances = ChainBalances(
+        network_id=network_id,
+        address=address,
+        native_amount=Decimal(native_wei) / Decimal(10) ** native_decimals,
+        native_symbol=chain.native_currency.symbol if chain else "native",
+        block_number=block_number.value if block_number.success else None,
+    )
+
+    for index, token in enumerate(tokens):
+        balance, decimals, symbol = token_results[3 * index : 3 * index + 3]
+        token_balance = TokenBalance(address=token, symbol=symbol.value if symbol.success else None)
+        if balance.success and decimals.success:
+            token_balance.amount = Decimal(balance.value) / Decimal(10) ** decimals.value
+        else:
+            token_balance.error = balance.error or decimals.error
+        balances.tokens.append(token_balance)
+    return balances
@@ -0,0 +1,28 @@
+"""Constants for the wallet action provider."""
+
+# The seconds a cross-chain balance query waits for each chain.
+DEFAULT_CHAIN_TIMEOUT = 10.0
+
+ERC20_BALANCE_ABI = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "stateMutability": "view",
+        "inputs": [{"name": "account", "type": "address"}],
+        "outputs": [{"type": "uint256"}],
+    },
+    {
+        "type": "function",
+        "name": "decimals",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"type": "uint8"}],
+    },
+    {
+        "type": "function",
+        "name": "symbol",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"type": "string"}],
+    },
+]
@@ -33,3 +33,13 @@ class NativeTransferSchema(BaseModel):
     def validate_value(cls, v: str) -> str:
         """Validate the transfer value."""
         return positive_decimal_validator(v)
+
+
+class GetBalancesAllChainsSchema(BaseModel):
+    """Input schema for getting balances across chains."""
+
+    network_ids: list[str] | None = Field(
+        None,
+        description="The chains to query, as network IDs (e.g. 'base-mainnet') or chain IDs "
+        "(e.g. '8453'). Defaults to every chain the wallet is available on",
+    )
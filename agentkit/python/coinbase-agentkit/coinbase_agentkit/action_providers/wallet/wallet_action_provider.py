@@ -1,19 +1,47 @@
 """Wallet action provider for basic wallet operations."""
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextvars import copy_context
 from typing import Any
 
-from ...network import Network
+from ...network import KNOWN_TOKENS, Network
 from ...wallet_providers.wallet_provider import WalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
-from .schemas import GetBalanceSchema, GetWalletDetailsSchema, NativeTransferSchema
+from .constants import DEFAULT_CHAIN_TIMEOUT
+from .schemas import (
+    GetBalancesAllChainsSchema,
+    GetBalanceSchema,
+    GetWalletDetailsSchema,
+    NativeTransferSchema,
+)
 
 
 class WalletActionProvider(ActionProvider[WalletProvider]):
     """Provides actions for interacting with wallet functionality."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        tokens: dict[str, list[str]] | None = None,
+        chain_timeout: float = DEFAULT_CHAIN_TIMEOUT,
+    ):
+        """Initialize the wallet action provider.
+
+        Args:
+            tokens (dict[str, list[str]] | None): The ERC20 token addresses whose balances are
+                read by `get_balances_all_chains`, per network ID. Defaults to the well-known
+                tokens of each network.
+            chain_timeout (float): The seconds `get_balances_all_chains` waits for each chain.
+
+        """
         super().__init__("wallet", [])
+        self.tokens = (
+            tokens
+            if tokens is not None
+            else {network_id: list(known.values()) for network_id, known in KNOWN_TOKENS.items()}
+        )
+        self.chain_timeout = chain_timeout
 
     @create_action(
         name="get_wallet_details",
@@ -78,6 +106,71 @@ class WalletActionProvider(ActionProvider[WalletProvider]):
         except Exception as e:
             return f"Error getting balance: {e}"
 
+    @create_action(
+        name="get_balances_all_chains",
+        description="""
+This tool will get the balances of the wallet on every chain it is available on, in a single step.
+
+It returns, per chain, the native balance and the non-zero balances of well-known ERC20 tokens
+(e.g. USDC, WETH). All chains are queried at the same time. A chain that does not answer in time
+is reported as timed out, and the balances of the other chains are still returned.
+
+It takes the following optional input:
+- network_ids: The chains to query (e.g. ['base-mainnet', '8453']). Defaults to every chain.
+""",
+        schema=GetBalancesAllChainsSchema,
+    )
+    def get_balances_all_chains(self, wallet_provider: WalletProvider, args: dict[str, Any]) -> str:
+        """Get the native and token balances of the wallet on every chain concurrently.
+
+        Each chain is read with a single multicall. Chains that take longer than
+        `chain_timeout` are reported as timed out, so the action takes as long as the slowest
+        chain rather than the sum of all chains.
+
+        Args:
+            wallet_provider (WalletProvider): The wallet provider. With a
+                `MultiChainWalletProvider` every chain it allows is queried, otherwise only
+                its network is.
+            args (dict[str, Any]): Arguments containing the optional chains to query.
+
+        Returns:
+            str: A message containing the balances of each chain.
+
+        """
+        try:
+            validated_args = GetBalancesAllChainsSchema(**args)
+            chains = self._get_balance_chains(wallet_provider, validated_args.network_ids)
+
+            # A chain that hangs past the timeout keeps its thread, so each query gets its own
+            # executor rather than queueing behind the hung reads of earlier queries.
+            executor = ThreadPoolExecutor(
+                max_workers=max(len(chains), 1), thread_name_prefix="wallet-balances"
+            )
+            try:
+                futures = {
+                    network_id: executor.submit(
+                        copy_context().run, self._read_chain_balances, network_id, get_provider
+                    )
+                    for network_id, get_provider in chains.items()
+                }
+                done, _ = wait(futures.values(), timeout=self.chain_timeout)
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+            lines = []
+            for network_id, future in futures.items():
+                if future not in done:
+                    lines.append(f"- {network_id}: timed out after {self.chain_timeout:g}s")
+                elif future.exception() is not None:
+                    lines.append(f"- {network_id}: error: {future.exception()!s}")
+                else:
+                    lines.append(future.result().format())
+
+            header = f"Balances of {wallet_provider.get_address()} across {len(chains)} chains:"
+            return "\n".join([header, *lines])
+        except Exception as e:
+            return f"Error getting balances across chains: {e!s}"
+
     @create_action(
         name="native_transfer",
         description="""
@@ -111,6 +204,42 @@ Important notes:
         except Exception as e:
             return f"Error transferring native tokens: {e}"
 
+    def _read_chain_balances(self, network_id: str, get_provider: Callable[[], Any]) -> Any:
+        """Read the balances of the wallet on a chain."""
+        from .balances import read_chain_balances
+
+        return read_chain_balances(get_provider(), self.tokens.get(network_id))
+
+    def _get_balance_chains(
+        self, wallet_provider: WalletProvider, network_ids: list[str] | None
+    ) -> dict[str, Callable[[], Any]]:
+        """Get the chains of a cross-chain balance query and how to get their wallet providers.
+
+        Raises:
+            ValueError: If a chain other than the network of a single-chain provider is asked.
+
+        """
+        from ...wallet_providers.multi_chain_wallet_provider import (
+            MultiChainWalletProvider,
+            resolve_network_id,
+        )
+
+        if isinstance(wallet_provider, MultiChainWalletProvider):
+            requested = network_ids or wallet_provider.network_ids
+            return {
+                resolve_network_id(chain): lambda chain=chain: wallet_provider.get_provider(chain)
+                for chain in requested
+            }
+
+        network_id = wallet_provider.get_network().network_id
+        for chain in network_ids or []:
+            if resolve_network_id(chain) != network_id:
+                raise ValueError(
+                    f"The wallet is only available on {network_id}. "
+                    "Use a MultiChainWalletProvider to query other chains"
+                )
+        return {network_id: lambda: wallet_provider}
+
     def supports_network(self, network: Network) -> bool:
         """Check if network is supported by wallet actions.
 
@@ -124,11 +253,19 @@ Important notes:
         return True
 
 
-def wallet_action_provider() -> WalletActionProvider:
+def wallet_action_provider(
+    tokens: dict[str, list[str]] | None = None,
+    chain_timeout: float = DEFAULT_CHAIN_TIMEOUT,
+) -> WalletActionProvider:
     """Create a new WalletActionProvider instance.
 
+    Args:
+        tokens (dict[str, list[str]] | None): The ERC20 token addresses whose balances are read
+            across chains, per network ID. Defaults to the well-known tokens of each network.
+        chain_timeout (float): The seconds a cross-chain balance query waits for each chain.
+
     Returns:
         WalletActionProvider: A new wallet action provider instance.
 
     """
-    return WalletActionProvider()
+    return WalletActionProvider(tokens=tokens, chain_timeout=chain_timeout)
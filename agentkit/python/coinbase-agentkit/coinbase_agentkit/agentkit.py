@@ -3,7 +3,7 @@
 from pydantic import BaseModel, ConfigDict
 
 from .action_providers import Action, ActionProvider, wallet_action_provider
-from .wallet_providers import CdpWalletProvider, CdpWalletProviderConfig, WalletProvider
+from .wallet_providers import WalletProvider
 
 
 class AgentKitConfig(BaseModel):
@@ -35,12 +35,17 @@ class AgentKit:
         if not config:
             config = AgentKitConfig()
 
-        self.wallet_provider = config.wallet_provider or CdpWalletProvider(
-            CdpWalletProviderConfig(
-                api_key_name=config.cdp_api_key_name,
-                api_key_private_key=config.cdp_api_key_private_key,
+        if config.wallet_provider:
+            self.wallet_provider = config.wallet_provider
+        else:
+            from .wallet_providers import CdpWalletProvider, CdpWalletProviderConfig
+
+            self.wallet_provider = CdpWalletProvider(
+                CdpWalletProviderConfig(
+                    api_key_name=config.cdp_api_key_name,
+                    api_key_private_key=config.cdp_api_key_private_key,
+                )
             )
-        )
         self.action_providers = config.action_providers or [wallet_action_provider()]
 
     def get_actions(self) -> list[Action]:
@@ -0,0 +1,43 @@
+"""Per-action instrumentation of RPC calls, HTTP requests, signing and receipt waits."""
+
+from typing import TYPE_CHECKING, Any
+
+from .sinks import InMemoryMetricsSink, MetricsSink, add_metrics_sink, remove_metrics_sink
+from .tracing import (
+    ActionTrace,
+    CallStats,
+    action_trace,
+    current_trace,
+    record_cache_lookup,
+    record_call,
+    track,
+    tracked,
+)
+
+if TYPE_CHECKING:
+    from .middleware import InstrumentationMiddleware
+
+__all__ = [
+    "ActionTrace",
+    "CallStats",
+    "InMemoryMetricsSink",
+    "InstrumentationMiddleware",
+    "MetricsSink",
+    "action_trace",
+    "add_metrics_sink",
+    "current_trace",
+    "record_cache_lookup",
+    "record_call",
+    "remove_metrics_sink",
+    "track",
+    "tracked",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the web3 middleware on first access, so tracing does not load web3."""
+    if name == "InstrumentationMiddleware":
+        from .middleware import InstrumentationMiddleware
+
+        return InstrumentationMiddleware
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,28 @@
+"""Web3 middleware that records every JSON-RPC request."""
+
+from collections.abc import Callable
+from typing import Any
+
+from web3.middleware import Web3Middleware
+from web3.types import RPCEndpoint, RPCResponse
+
+from .tracing import RPC, track
+
+
+class InstrumentationMiddleware(Web3Middleware):
+    """Records the count and wall time of JSON-RPC requests per method.
+
+    Inject it as the innermost layer so that it sees the requests that actually reach the
+    provider, after signing middleware has rewritten them.
+    """
+
+    def wrap_make_request(
+        self, make_request: Callable[[RPCEndpoint, Any], RPCResponse]
+    ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+        """Wrap the provider's request function."""
+
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            with track(RPC, method):
+                return make_request(method, params)
+
+        return middleware
@@ -0,0 +1,150 @@
+"""Pluggable sinks that receive instrumentation data."""
+
+import logging
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .tracing import ActionTrace
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsSink:
+    """Base class for sinks that receive instrumentation data.
+
+    Override the hooks of interest. They are called synchronously on the thread that made the
+    call, so implementations should be cheap and thread-safe.
+    """
+
+    def record_call(
+        self,
+        kind: str,
+        name: str,
+        elapsed: float,
+        error: bool,
+        action_name: str | None,
+        endpoint: str | None = None,
+    ) -> None:
+        """Receive a completed call.
+
+        Args:
+            kind (str): The kind of call, for example `rpc` or `sign`.
+            name (str): The name of the call, for example the JSON-RPC method.
+            elapsed (float): The wall time of the call in seconds.
+            error (bool): Whether the call failed.
+            action_name (str | None): The action the call was made for, if any.
+            endpoint (str | None): The endpoint the call was sent to, if any.
+
+        """
+
+    def record_cache_lookup(self, cache: str, hit: bool) -> None:
+        """Receive a cache lookup.
+
+        Args:
+            cache (str): The name of the cache.
+            hit (bool): Whether the lookup was served from the cache.
+
+        """
+
+    def record_action(self, trace: "ActionTrace") -> None:
+        """Receive the trace of a completed action invocation.
+
+        Args:
+            trace (ActionTrace): The trace of the invocation.
+
+        """
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """A sink that keeps the traces of the most recent action invocations."""
+
+    def __init__(self, max_traces: int = 100):
+        """Initialize the sink.
+
+        Args:
+            max_traces (int): The number of traces to keep.
+
+        """
+        self._traces: deque[ActionTrace] = deque(maxlen=max_traces)
+        self._lock = threading.Lock()
+
+    @property
+    def traces(self) -> list["ActionTrace"]:
+        """Get the kept traces, oldest first."""
+        with self._lock:
+            return list(self._traces)
+
+    def record_action(self, trace: "ActionTrace") -> None:
+        """Keep the trace of a completed action invocation."""
+        with self._lock:
+            self._traces.append(trace)
+
+    def clear(self) -> None:
+        """Drop every kept trace."""
+        with self._lock:
+            self._traces.clear()
+
+
+_sinks: tuple[MetricsSink, ...] = ()
+_sinks_lock = threading.Lock()
+
+
+def add_metrics_sink(sink: MetricsSink) -> None:
+    """Register a sink to receive instrumentation data.
+
+    Args:
+        sink (MetricsSink): The sink.
+
+    """
+    global _sinks
+    with _sinks_lock:
+        if sink not in _sinks:
+            _sinks = (*_sinks, sink)
+
+
+def remove_metrics_sink(sink: MetricsSink) -> None:
+    """Unregister a sink.
+
+    Args:
+        sink (MetricsSink): The sink.
+
+    """
+    global _sinks
+    with _sinks_lock:
+        _sinks = tuple(s for s in _sinks if s is not sink)
+
+
+def emit_call(
+    kind: str,
+    name: str,
+    elapsed: float,
+    error: bool,
+    action_name: str | None,
+    endpoint: str | None = None,
+) -> None:
+    """Hand a completed call to every registered sink."""
+    for sink in _sinks:
+        try:
+            sink.record_call(kind, name, elapsed, error, action_name, endpoint)
+        except Exception:
+            logger.exception("Metrics sink %r failed to record a call", sink)
+
+
+def emit_cache_lookup(cache: str, hit: bool) -> None:
+    """Hand a cache lookup to every registered sink."""
+    for sink in _sinks:
+        try:
+            sink.record_cache_lookup(cache, hit)
+        except Exception:
+            logger.exception("Metrics sink %r failed to record a cache lookup", sink)
+
+
+def emit_action(trace: "ActionTrace") -> None:
+    """Hand the trace of a completed action invocation to every registered sink."""
+    for sink in _sinks:
+        try:
+            sink.record_action(trace)
+        except Exception:
+            logger.exception("Metrics sink %r failed to record an action", sink)
@@ -0,0 +1,206 @@
+"""Attribution of RPC calls, HTTP requests, signing and receipt waits to action invocations."""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any
+
+from .sinks import emit_action, emit_cache_lookup, emit_call
+
+# Kinds of calls attributed to an action invocation.
+RPC = "rpc"
+HTTP = "http"
+SIGN = "sign"
+SEND = "send"
+RECEIPT_WAIT = "receipt_wait"
+RATE_LIMIT_WAIT = "rate_limit_wait"
+TIME_TO_FIRST_TOKEN = "time_to_first_token"
+
+
+@dataclass
+class CallStats:
+    """The number and total wall time of calls of a single kind and name."""
+
+    count: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+
+
+@dataclass
+class ActionTrace:
+    """The breakdown of the calls made by a single action invocation."""
+
+    action_name: str
+    started_at: float = field(default_factory=time.time)
+    duration: float = 0.0
+    error: bool = False
+    calls: dict[tuple[str, str], CallStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, kind: str, name: str, elapsed: float, error: bool = False) -> None:
+        """Record a call made on behalf of the action.
+
+        Args:
+            kind (str): The kind of call, for example `rpc` or `sign`.
+            name (str): The name of the call, for example the JSON-RPC method.
+            elapsed (float): The wall time of the call in seconds.
+            error (bool): Whether the call failed.
+
+        """
+        with self._lock:
+            stats = self.calls.setdefault((kind, name), CallStats())
+            stats.count += 1
+            stats.errors += int(error)
+            stats.total_time += elapsed
+
+    def count(self, kind: str | None = None) -> int:
+        """Get the number of calls made by the action.
+
+        Args:
+            kind (str | None): Only count calls of this kind.
+
+        Returns:
+            int: The number of calls.
+
+        """
+        with self._lock:
+            return sum(s.count for (k, _), s in self.calls.items() if kind in (None, k))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the breakdown as a JSON-serializable dictionary.
+
+        Returns:
+            dict[str, Any]: The action name, duration and the calls grouped by kind and name.
+
+        """
+        breakdown: dict[str, dict[str, dict[str, float]]] = {}
+        with self._lock:
+            for (kind, name), stats in sorted(self.calls.items()):
+                breakdown.setdefault(kind, {})[name] = {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "total_time": stats.total_time,
+                }
+        return {
+            "action_name": self.action_name,
+            "started_at": self.started_at,
+            "duration": self.duration,
+            "error": self.error,
+            "calls": breakdown,
+        }
+
+
+_current_trace: ContextVar[ActionTrace | None] = ContextVar("current_action_trace", default=None)
+
+
+def current_trace() -> ActionTrace | None:
+    """Get the trace of the action invocation running in the current context, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def action_trace(action_name: str) -> Iterator[ActionTrace]:
+    """Attribute every call made in the block to a new action invocation.
+
+    The finished trace is handed to the registered metrics sinks.
+
+    Args:
+        action_name (str): The name of the action.
+
+    Yields:
+        ActionTrace: The trace of the invocation.
+
+    """
+    trace = ActionTrace(action_name)
+    token = _current_trace.set(trace)
+    start = time.perf_counter()
+    try:
+        yield trace
+    except BaseException:
+        trace.error = True
+        raise
+    finally:
+        trace.duration = time.perf_counter() - start
+        _current_trace.reset(token)
+        emit_action(trace)
+
+
+def record_call(
+    kind: str, name: str, elapsed: float, error: bool = False, endpoint: str | None = None
+) -> None:
+    """Record a call that has completed.
+
+    The call is attributed to the current action invocation, if any, and reported to the
+    registered metrics sinks.
+
+    Args:
+        kind (str): The kind of call, for example `rpc` or `sign`.
+        name (str): The name of the call, for example the JSON-RPC method.
+        elapsed (float): The wall time of the call in seconds.
+        error (bool): Whether the call failed.
+        endpoint (str | None): The endpoint the call was sent to, if any.
+
+    """
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.record(kind, name, elapsed, error)
+    emit_call(kind, name, elapsed, error, trace.action_name if trace else None, endpoint)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Report a cache lookup to the registered metrics sinks.
+
+    Args:
+        cache (str): The name of the cache.
+        hit (bool): Whether the lookup was served from the cache.
+
+    """
+    emit_cache_lookup(cache, hit)
+
+
+@contextmanager
+def track(kind: str, name: str, endpoint: str | None = None) -> Iterator[None]:
+    """Time the block and record it as a call.
+
+    Args:
+        kind (str): The kind of call, for example `rpc` or `sign`.
+        name (str): The name of the call, for example the JSON-RPC method.
+        endpoint (str | None): The endpoint the call is sent to, if any.
+
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        record_call(kind, name, time.perf_counter() - start, error=True, endpoint=endpoint)
+        raise
+    record_call(kind, name, time.perf_counter() - start, endpoint=endpoint)
+
+
+def tracked(kind: str, name: str | None = None) -> Callable[[Callable], Callable]:
+    """Decorate a function so that every call to it is recorded.
+
+    Args:
+        kind (str): The kind of call, for example `rpc` or `sign`.
+        name (str | None): The name of the call. Defaults to the function name.
+
+    Returns:
+        Callable[[Callable], Callable]: The decorator.
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        call_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with track(kind, call_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
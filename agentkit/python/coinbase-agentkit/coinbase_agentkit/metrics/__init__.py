@@ -0,0 +1,30 @@
+"""Prometheus/OpenMetrics exporter for AgentKit runtime metrics."""
+
+from .exporter import (
+    REGISTRY,
+    PrometheusSink,
+    disable_metrics,
+    enable_metrics,
+    remove_ssh_pool,
+    set_ssh_pool_occupancy,
+)
+from .registry import CONTENT_TYPE, Counter, Gauge, Histogram, MetricsRegistry
+from .server import generate_latest, make_metrics_handler, make_wsgi_app, start_http_server
+
+__all__ = [
+    "CONTENT_TYPE",
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "PrometheusSink",
+    "disable_metrics",
+    "enable_metrics",
+    "generate_latest",
+    "make_metrics_handler",
+    "make_wsgi_app",
+    "remove_ssh_pool",
+    "set_ssh_pool_occupancy",
+    "start_http_server",
+]
@@ -0,0 +1,206 @@
+"""AgentKit runtime metrics collected from the instrumentation sinks."""
+
+import threading
+
+from ..instrumentation import ActionTrace, MetricsSink, add_metrics_sink, remove_metrics_sink
+from ..instrumentation.tracing import (
+    HTTP,
+    RATE_LIMIT_WAIT,
+    RECEIPT_WAIT,
+    RPC,
+    SEND,
+    SIGN,
+    TIME_TO_FIRST_TOKEN,
+)
+from .registry import Counter, Gauge, Histogram, MetricsRegistry
+
+REGISTRY = MetricsRegistry()
+
+ACTION_DURATION = REGISTRY.register(
+    Histogram(
+        "agentkit_action_duration_seconds",
+        "Wall time of action invocations.",
+        ("action",),
+    )
+)
+ACTION_ERRORS = REGISTRY.register(
+    Counter("agentkit_action_errors", "Action invocations that raised an error.", ("action",))
+)
+RPC_DURATION = REGISTRY.register(
+    Histogram(
+        "agentkit_rpc_duration_seconds",
+        "Wall time of JSON-RPC calls as issued by web3, including failover and retries.",
+        ("method",),
+    )
+)
+HTTP_DURATION = REGISTRY.register(
+    Histogram(
+        "agentkit_http_request_duration_seconds",
+        "Wall time of HTTP requests on the wire. For RPC endpoints the operation is the "
+        "JSON-RPC method.",
+        ("endpoint", "operation"),
+    )
+)
+HTTP_ERRORS = REGISTRY.register(
+    Counter(
+        "agentkit_http_request_errors",
+        "HTTP requests that failed.",
+        ("endpoint", "operation"),
+    )
+)
+RATE_LIMIT_WAIT_DURATION = REGISTRY.register(
+    Histogram(
+        "agentkit_rate_limit_wait_seconds",
+        "Time requests spent queued behind client-side rate limits.",
+        ("endpoint",),
+    )
+)
+WALLET_DURATION = REGISTRY.register(
+    Histogram(
+        "agentkit_wallet_operation_duration_seconds",
+        "Wall time of wallet signing and sending operations.",
+        ("kind", "operation"),
+    )
+)
+RECEIPT_WAIT_DURATION = REGISTRY.register(
+    Histogram(
+        "agentkit_receipt_wait_seconds",
+        "Time spent waiting for transaction receipts.",
+        buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300),
+    )
+)
+TIME_TO_FIRST_TOKEN_DURATION = REGISTRY.register(
+    Histogram(
+        "agentkit_time_to_first_token_seconds",
+        "Time from sending a streamed completion request to receiving its first token.",
+        ("model",),
+    )
+)
+CACHE_LOOKUPS = REGISTRY.register(
+    Counter("agentkit_cache_lookups", "Cache lookups by cache and result.", ("cache", "result"))
+)
+SSH_POOL_CONNECTIONS = REGISTRY.register(
+    Gauge(
+        "agentkit_ssh_pool_connections",
+        "Open SSH connections per pool.",
+        ("pool",),
+    )
+)
+SSH_POOL_CAPACITY = REGISTRY.register(
+    Gauge(
+        "agentkit_ssh_pool_capacity",
+        "Maximum SSH connections per pool.",
+        ("pool",),
+    )
+)
+
+
+class PrometheusSink(MetricsSink):
+    """A metrics sink that feeds the AgentKit metrics registry."""
+
+    def record_call(
+        self,
+        kind: str,
+        name: str,
+        elapsed: float,
+        error: bool,
+        action_name: str | None,
+        endpoint: str | None = None,
+    ) -> None:
+        """Observe a completed call."""
+        if kind == RPC:
+            RPC_DURATION.observe(elapsed, method=name)
+        elif kind == HTTP:
+            HTTP_DURATION.observe(elapsed, endpoint=endpoint or "", operation=name)
+            if error:
+                HTTP_ERRORS.inc(endpoint=endpoint or "", operation=name)
+        elif kind == RATE_LIMIT_WAIT:
+            RATE_LIMIT_WAIT_DURATION.observe(elapsed, endpoint=endpoint or name)
+        elif kind in (SIGN, SEND):
+            WALLET_DURATION.observe(elapsed, kind=kind, operation=name)
+        elif kind == RECEIPT_WAIT:
+            RECEIPT_WAIT_DURATION.observe(elapsed)
+        elif kind == TIME_TO_FIRST_TOKEN:
+            TIME_TO_FIRST_TOKEN_DURATION.observe(elapsed, model=name)
+
+    def record_action(self, trace: ActionTrace) -> None:
+        """Observe a completed action invocation."""
+        ACTION_DURATION.observe(trace.duration, action=trace.action_name)
+        if trace.error:
+            ACTION_ERRORS.inc(action=trace.action_name)
+
+    def record_cache_lookup(self, cache: str, hit: bool) -> None:
+        """Count a cache lookup."""
+        CACHE_LOOKUPS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+_sink = PrometheusSink()
+_enabled = False
+
+# pool name -> pool instance -> (open connections, capacity)
+_ssh_pools: dict[str, dict[int, tuple[int, int]]] = {}
+_ssh_pools_lock = threading.Lock()
+
+
+def enable_metrics() -> None:
+    """Start collecting AgentKit metrics into the registry."""
+    global _enabled
+    _enabled = True
+    add_metrics_sink(_sink)
+
+
+def disable_metrics() -> None:
+    """Stop collecting AgentKit metrics."""
+    global _enabled
+    _enabled = False
+    remove_metrics_sink(_sink)
+
+
+def set_ssh_pool_occupancy(pool: str, connections: int, capacity: int, instance: int = 0) -> None:
+    """Report the occupancy of an SSH connection pool.
+
+    Pools sharing a name are reported as one series, summed over the pools. Nothing is
+    recorded while metrics are disabled.
+
+    Args:
+        pool (str): The name of the pool.
+        connections (int): The number of open connections.
+        capacity (int): The maximum number of connections.
+        instance (int): Identifies the pool among the pools sharing its name.
+
+    """
+    if not _enabled:
+        return
+    with _ssh_pools_lock:
+        _ssh_pools.setdefault(pool, {})[instance] = (connections, capacity)
+        _publish_ssh_pool(pool)
+
+
+def remove_ssh_pool(pool: str, instance: int = 0) -> None:
+    """Stop reporting a closed SSH connection pool.
+
+    The series of the name is removed once no pool of that name is left.
+
+    Args:
+        pool (str): The name of the pool.
+        instance (int): Identifies the pool among the pools sharing its name.
+
+    """
+    with _ssh_pools_lock:
+        instances = _ssh_pools.get(pool)
+        if instances is None:
+            return
+        instances.pop(instance, None)
+        if instances:
+            _publish_ssh_pool(pool)
+            return
+        del _ssh_pools[pool]
+        SSH_POOL_CONNECTIONS.remove(pool=pool)
+        SSH_POOL_CAPACITY.remove(pool=pool)
+
+
+def _publish_ssh_pool(pool: str) -> None:
+    """Set the occupancy gauges of a pool name from its pools."""
+    occupancy = _ssh_pools[pool].values()
+    SSH_POOL_CONNECTIONS.set(sum(connections for connections, _ in occupancy), pool=pool)
+    SSH_POOL_CAPACITY.set(sum(capacity for _, capacity in occupancy), pool=pool)
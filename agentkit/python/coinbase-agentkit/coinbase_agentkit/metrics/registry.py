@@ -0,0 +1,250 @@
+"""Minimal metric types and registry rendered in the OpenMetrics text format."""
+
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Iterator
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+Sample = tuple[str, dict[str, str], float]
+
+
+class Metric:
+    """Base class for a metric family with a fixed set of label names."""
+
+    type = "unknown"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        """Initialize the metric.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text of the metric.
+            labelnames (tuple[str, ...]): The names of the labels of the metric.
+
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        """Get the label values of a sample in label name order."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple[str, ...]) -> dict[str, str]:
+        """Get the labels of a sample from its label values."""
+        return dict(zip(self.labelnames, key, strict=True))
+
+    def samples(self) -> Iterator[Sample]:
+        """Get the current samples of the metric."""
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """A monotonically increasing count."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        """Initialize the counter."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increment the counter.
+
+        Args:
+            amount (float): The amount to increment by.
+            **labels: The label values.
+
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> Iterator[Sample]:
+        """Get the current samples of the counter."""
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield f"{self.name}_total", self._labels(key), value
+
+
+class Gauge(Metric):
+    """A value that can go up and down."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        """Initialize the gauge."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge.
+
+        Args:
+            value (float): The new value.
+            **labels: The label values.
+
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def remove(self, **labels: str) -> None:
+        """Remove the sample of a label set, if any.
+
+        Args:
+            **labels: The label values.
+
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values.pop(key, None)
+
+    def samples(self) -> Iterator[Sample]:
+        """Get the current samples of the gauge."""
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield self.name, self._labels(key), value
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        """Initialize the histogram.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text of the metric.
+            labelnames (tuple[str, ...]): The names of the labels of the metric.
+            buckets (tuple[float, ...]): The upper bounds of the buckets.
+
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation.
+
+        Args:
+            value (float): The observed value.
+            **labels: The label values.
+
+        """
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def samples(self) -> Iterator[Sample]:
+        """Get the current samples of the histogram."""
+        with self._lock:
+            values = [
+                (key, list(counts), total[0]) for key, (counts, total) in self._values.items()
+            ]
+        for key, counts, total in values:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_count", labels, cumulative
+            yield f"{self.name}_sum", labels, total
+
+
+class MetricsRegistry:
+    """A collection of metrics that can be rendered for scraping."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric to the registry.
+
+        Args:
+            metric (Metric): The metric.
+
+        Returns:
+            Metric: The registered metric.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, name: str) -> None:
+        """Remove a metric from the registry.
+
+        Args:
+            name (str): The metric name.
+
+        """
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        """Render every metric in the OpenMetrics text format.
+
+        Returns:
+            str: The exposition.
+
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value or help text."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    """Format a label set."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return f"{float(value):.1f}"
+    return repr(float(value))
@@ -0,0 +1,91 @@
+"""HTTP handlers exposing the AgentKit metrics for scraping."""
+
+import threading
+from collections.abc import Callable, Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from .exporter import REGISTRY
+from .registry import CONTENT_TYPE, MetricsRegistry
+
+
+def generate_latest(registry: MetricsRegistry = REGISTRY) -> bytes:
+    """Render the metrics of a registry for an HTTP response body.
+
+    Args:
+        registry (MetricsRegistry): The registry to render.
+
+    Returns:
+        bytes: The OpenMetrics exposition, served with `CONTENT_TYPE`.
+
+    """
+    return registry.render().encode("utf-8")
+
+
+def make_metrics_handler(
+    registry: MetricsRegistry = REGISTRY,
+) -> type[BaseHTTPRequestHandler]:
+    """Create a `http.server` request handler that serves the metrics on every GET.
+
+    Args:
+        registry (MetricsRegistry): The registry to serve.
+
+    Returns:
+        type[BaseHTTPRequestHandler]: The request handler class.
+
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            body = generate_latest(registry)
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return MetricsHandler
+
+
+def make_wsgi_app(registry: MetricsRegistry = REGISTRY) -> Callable[..., Iterable[bytes]]:
+    """Create a WSGI app that serves the metrics, for mounting in an existing web app.
+
+    Args:
+        registry (MetricsRegistry): The registry to serve.
+
+    Returns:
+        Callable[..., Iterable[bytes]]: The WSGI app.
+
+    """
+
+    def app(environ: dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        body = generate_latest(registry)
+        start_response(
+            "200 OK", [("Content-Type", CONTENT_TYPE), ("Content-Length", str(len(body)))]
+        )
+        return [body]
+
+    return app
+
+
+def start_http_server(
+    port: int, addr: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY
+) -> ThreadingHTTPServer:
+    """Serve the metrics from a background thread.
+
+    Args:
+        port (int): The port to listen on. Use 0 to pick a free port.
+        addr (str): The address to bind to.
+        registry (MetricsRegistry): The registry to serve.
+
+    Returns:
+        ThreadingHTTPServer: The running server. Call `shutdown()` to stop it.
+
+    """
+    server = ThreadingHTTPServer((addr, port), make_metrics_handler(registry))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="agentkit-metrics", daemon=True).start()
+    return server
@@ -16,12 +16,14 @@ from .network import (
     NETWORK_ID_TO_CHAIN_ID,
     Network,
 )
+from .tokens import KNOWN_TOKENS
 
 __all__ = [
     "Network",
     "CHAIN_ID_TO_NETWORK_ID",
     "NETWORK_ID_TO_CHAIN_ID",
     "NETWORK_ID_TO_CHAIN",
+    "KNOWN_TOKENS",
     "mainnet",
     "sepolia",
     "base_sepolia",
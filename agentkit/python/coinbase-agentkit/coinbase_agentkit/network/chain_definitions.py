@@ -42,6 +42,16 @@ class Chain(BaseModel):
     contracts: dict[str, Contract]
     testnet: bool | None = False
 
+    def get_rpc_urls(self) -> list[str]:
+        """Get every HTTP RPC URL of the chain, with the default endpoints first.
+
+        Returns:
+            list[str]: The de-duplicated RPC URLs.
+
+        """
+        ordered = sorted(self.rpc_urls.items(), key=lambda item: item[0] != "default")
+        return list(dict.fromkeys(url for _, rpc_urls in ordered for url in rpc_urls.http))
+
 
 # Convert existing dictionaries to Chain instances
 mainnet = Chain(
@@ -0,0 +1,41 @@
+"""Well-known ERC20 tokens of the supported networks."""
+
+# Maps Coinbase network IDs to the symbols and addresses of widely held tokens
+KNOWN_TOKENS: dict[str, dict[str, str]] = {
+    "ethereum-mainnet": {
+        "USDC": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+        "USDT": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+        "WETH": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+    },
+    "ethereum-sepolia": {
+        "USDC": "0x1c7D4B196Cb0C7B01d743Fbc6116a902379C7238",
+    },
+    "polygon-mainnet": {
+        "USDC": "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359",
+        "WETH": "0x7ceB23fD6bC0adD59E62ac25578270cFf1b9f619",
+    },
+    "base-mainnet": {
+        "USDC": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+        "WETH": "0x4200000000000000000000000000000000000006",
+        "cbETH": "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22",
+        "cbBTC": "0xcbB7C0000aB88B473b1f5aFd9ef808440eed33Bf",
+    },
+    "base-sepolia": {
+        "USDC": "0x036CbD53842c5426634e7929541eC2318f3dCF7e",
+        "WETH": "0x4200000000000000000000000000000000000006",
+    },
+    "arbitrum-mainnet": {
+        "USDC": "0xaf88d065e77c8cC2239327C5EDb3A432268e5831",
+        "WETH": "0x82aF49447D8a07e3bd95BD0d56f35241523fBab1",
+    },
+    "arbitrum-sepolia": {
+        "USDC": "0x75faf114eafb1BDbe2F0316DF893fd58CE46AA4d",
+    },
+    "optimism-mainnet": {
+        "USDC": "0x0b2C639c533813f4Aa9D7837CAf62653d097Ff85",
+        "WETH": "0x4200000000000000000000000000000000000006",
+    },
+    "optimism-sepolia": {
+        "USDC": "0x5fd84259d66Cd46123540766Be93DFE6D43130D7",
+    },
+}
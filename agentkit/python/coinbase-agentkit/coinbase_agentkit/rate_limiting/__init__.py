@@ -0,0 +1,19 @@
+"""Client-side rate limiting for RPC and REST endpoints used by AgentKit."""
+
+from .rate_limiter import (
+    RateLimiter,
+    RateLimitTimeoutError,
+    TokenBucket,
+    endpoint_key,
+    get_retry_after,
+    rate_limiter,
+)
+
+__all__ = [
+    "RateLimitTimeoutError",
+    "RateLimiter",
+    "TokenBucket",
+    "endpoint_key",
+    "get_retry_after",
+    "rate_limiter",
+]
@@ -0,0 +1,307 @@
+"""Client-side token-bucket rate limiting keyed on endpoint."""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
+
+from ..instrumentation.tracing import HTTP, RATE_LIMIT_WAIT, record_call, track
+
+T = TypeVar("T")
+
+# Documented public rate limits of endpoints used by AgentKit, as (tokens per second, burst).
+DEFAULT_RATE_LIMITS: dict[str, tuple[float, int]] = {
+    # Hermes allows 30 requests per 10 seconds per IP.
+    "https://hermes.pyth.network": (3, 30),
+}
+
+# Fallback pause in seconds after a 429 response that carries no retry hint.
+DEFAULT_RETRY_AFTER = 1.0
+
+
+class RateLimitTimeoutError(TimeoutError):
+    """Raised when a rate limit token cannot be acquired in time."""
+
+    def __init__(self, endpoint: str, wait: float):
+        self.endpoint = endpoint
+        self.wait = wait
+        super().__init__(f"Rate limit for {endpoint} exceeded, retry in {wait:.1f}s")
+
+
+class TokenBucket:
+    """A token bucket that serves waiting callers in arrival order.
+
+    Tokens refill continuously at `rate` per second up to `burst`. A bucket without a rate
+    never runs dry but still honors pauses, for example from `Retry-After` headers.
+    """
+
+    def __init__(self, endpoint: str, rate: float | None = None, burst: int = 1):
+        self.endpoint = endpoint
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._queue: deque[object] = deque()
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout: float | None = None) -> float:
+        """Take a token, waiting behind earlier callers if necessary.
+
+        Args:
+            timeout (float | None): Maximum number of seconds to wait. Waits indefinitely
+                when unset.
+
+        Returns:
+            float: The number of seconds spent waiting.
+
+        Raises:
+            RateLimitTimeoutError: If no token can be acquired within the timeout.
+
+        """
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        ticket = object()
+
+        with self._cond:
+            self._queue.append(ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = self._wait_time(now) if self._queue[0] is ticket else None
+
+                    if wait == 0:
+                        if self.rate is not None:
+                            self._tokens -= 1
+                        return now - start
+
+                    if deadline is not None and (
+                        now >= deadline or (wait is not None and now + wait > deadline)
+                    ):
+                        raise RateLimitTimeoutError(self.endpoint, wait or deadline - now)
+
+                    remaining = None if deadline is None else deadline - now
+                    if wait is None:
+                        self._cond.wait(timeout=remaining)
+                    else:
+                        self._cond.wait(timeout=wait)
+            finally:
+                self._queue.remove(ticket)
+                self._cond.notify_all()
+
+    def is_paused(self) -> bool:
+        """Check whether the bucket is paused, for example after a 429 response."""
+        return time.monotonic() < self._paused_until
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for a number of seconds.
+
+        Args:
+            seconds (float): How long to pause for.
+
+        """
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            if self.rate is not None:
+                self._tokens = 0.0
+            self._cond.notify_all()
+
+    def _wait_time(self, now: float) -> float:
+        """Get the time until the next token is available."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.rate is None:
+            return 0
+
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            return 0
+        return (1 - self._tokens) / self.rate
+
+
+class RateLimiter:
+    """A registry of token buckets keyed on endpoint origin."""
+
+    def __init__(
+        self,
+        limits: Mapping[str, tuple[float, int]] | None = None,
+        max_wait: float | None = 60,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            limits (Mapping[str, tuple[float, int]] | None): Rate limits keyed on endpoint,
+                as (tokens per second, burst).
+            max_wait (float | None): Maximum number of seconds a caller waits for a token
+                before a RateLimitTimeoutError is raised. Waits indefinitely when unset.
+
+        """
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._buckets: dict[str, TokenBucket] = {}
+        for endpoint, (rate, burst) in (limits or {}).items():
+            self.configure(endpoint, rate, burst)
+
+    def configure(self, endpoint: str, rate: float | None, burst: int = 1) -> None:
+        """Set the rate limit of an endpoint.
+
+        Args:
+            endpoint (str): A URL on the endpoint. Only its origin is used as the key.
+            rate (float | None): Tokens per second, or None for no limit.
+            burst (int): Maximum number of tokens that can accumulate.
+
+        """
+        key = endpoint_key(endpoint)
+        with self._lock:
+            self._buckets[key] = TokenBucket(key, rate, burst)
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """Get the token bucket of an endpoint, creating an unlimited one if needed.
+
+        Args:
+            endpoint (str): A URL on the endpoint.
+
+        Returns:
+            TokenBucket: The token bucket.
+
+        """
+        key = endpoint_key(endpoint)
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = TokenBucket(key)
+            return self._buckets[key]
+
+    def acquire(self, endpoint: str) -> float:
+        """Take a token for an endpoint.
+
+        Args:
+            endpoint (str): A URL on the endpoint.
+
+        Returns:
+            float: The number of seconds spent waiting.
+
+        """
+        return self.bucket(endpoint).acquire(timeout=self.max_wait)
+
+    def pause(self, endpoint: str, seconds: float) -> None:
+        """Pause an endpoint, for example after a 429 response.
+
+        Args:
+            endpoint (str): A URL on the endpoint.
+            seconds (float): How long to pause for.
+
+        """
+        self.bucket(endpoint).pause(seconds)
+
+    def call(
+        self,
+        endpoint: str,
+        fn: Callable[[], T],
+        max_retries: int = 2,
+        operation: str | None = None,
+    ) -> T:
+        """Run a request under the rate limit of an endpoint.
+
+        When the request is rejected with a 429, either as a raised error or as a returned
+        response, the endpoint is paused for the advertised retry delay and the request is
+        queued again.
+
+        Args:
+            endpoint (str): A URL on the endpoint.
+            fn (Callable[[], T]): The function performing the request.
+            max_retries (int): How many times a rate limited request is retried.
+            operation (str | None): The name the request is instrumented under, for example
+                a JSON-RPC method. Defaults to the endpoint.
+
+        Returns:
+            T: The result of the function.
+
+        """
+        key = endpoint_key(endpoint)
+        for attempt in range(max_retries + 1):
+            waited = self.acquire(endpoint)
+            if waited:
+                record_call(RATE_LIMIT_WAIT, key, waited, endpoint=key)
+            try:
+                with track(HTTP, operation or key, endpoint=key):
+                    result = fn()
+            except Exception as e:
+                retry_after = get_retry_after(getattr(e, "response", None))
+                if retry_after is None:
+                    raise
+                self.pause(endpoint, retry_after)
+                if attempt == max_retries:
+                    raise
+                continue
+
+            retry_after = get_retry_after(result)
+            if retry_after is None or attempt == max_retries:
+                if retry_after is not None:
+                    self.pause(endpoint, retry_after)
+                return result
+            self.pause(endpoint, retry_after)
+
+        raise AssertionError("unreachable")
+
+
+def endpoint_key(url: str) -> str:
+    """Get the rate limiting key of a URL, which is its origin.
+
+    Keys that are not URLs are used verbatim, which allows finer-grained buckets such as
+    per-route limits.
+
+    Args:
+        url (str): The URL, or a verbatim key.
+
+    Returns:
+        str: The scheme and network location of the URL.
+
+    """
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return url
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def get_retry_after(response: Any) -> float | None:
+    """Get the retry delay advertised by a rate limited response.
+
+    Args:
+        response (Any): An HTTP response, or None.
+
+    Returns:
+        float | None: The delay in seconds if the response is a 429, None otherwise.
+
+    """
+    if response is None or getattr(response, "status_code", None) != 429:
+        return None
+
+    headers = getattr(response, "headers", None) or {}
+
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                pass
+
+    # X (Twitter) advertises the epoch second at which the window resets instead.
+    reset = headers.get("x-rate-limit-reset")
+    if reset:
+        try:
+            return max(float(reset) - time.time(), 0.0)
+        except ValueError:
+            pass
+
+    return DEFAULT_RETRY_AFTER
+
+
+# Shared by every wallet provider and action provider in the process.
+rate_limiter = RateLimiter(DEFAULT_RATE_LIMITS)
@@ -1,19 +1,65 @@
-"""Wallet providers for AgentKit."""
+"""Wallet providers for AgentKit.
+
+Wallet providers are imported on first access, so the base `WalletProvider` can be used
+without loading web3 or the CDP SDK.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .cdp_wallet_provider import CdpProviderConfig, CdpWalletProvider, CdpWalletProviderConfig
-from .eth_account_wallet_provider import EthAccountWalletProvider, EthAccountWalletProviderConfig
-from .evm_wallet_provider import EvmWalletProvider
-from .smart_wallet_provider import SmartWalletProvider, SmartWalletProviderConfig
 from .wallet_provider import WalletProvider
 
+if TYPE_CHECKING:
+    from .cdp_wallet_provider import CdpProviderConfig, CdpWalletProvider, CdpWalletProviderConfig
+    from .eth_account_wallet_provider import (
+        EthAccountWalletProvider,
+        EthAccountWalletProviderConfig,
+    )
+    from .evm_wallet_provider import EvmWalletProvider
+    from .multi_chain_wallet_provider import MultiChainWalletProvider
+    from .rpc_pool import RpcPool, RpcPoolConfig
+    from .smart_wallet_provider import SmartWalletProvider, SmartWalletProviderConfig
+
+# Maps each lazily imported name to the module defining it.
+_LAZY_IMPORTS = {
+    "CdpProviderConfig": ".cdp_wallet_provider",
+    "CdpWalletProvider": ".cdp_wallet_provider",
+    "CdpWalletProviderConfig": ".cdp_wallet_provider",
+    "EthAccountWalletProvider": ".eth_account_wallet_provider",
+    "EthAccountWalletProviderConfig": ".eth_account_wallet_provider",
+    "EvmWalletProvider": ".evm_wallet_provider",
+    "MultiChainWalletProvider": ".multi_chain_wallet_provider",
+    "RpcPool": ".rpc_pool",
+    "RpcPoolConfig": ".rpc_pool",
+    "SmartWalletProvider": ".smart_wallet_provider",
+    "SmartWalletProviderConfig": ".smart_wallet_provider",
+}
+
 __all__ = [
-    "WalletProvider",
-    "EvmWalletProvider",
     "CdpProviderConfig",
     "CdpWalletProvider",
     "CdpWalletProviderConfig",
     "EthAccountWalletProvider",
     "EthAccountWalletProviderConfig",
+    "EvmWalletProvider",
+    "MultiChainWalletProvider",
+    "RpcPool",
+    "RpcPoolConfig",
     "SmartWalletProvider",
     "SmartWalletProviderConfig",
+    "WalletProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a wallet provider on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the module, including the providers not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
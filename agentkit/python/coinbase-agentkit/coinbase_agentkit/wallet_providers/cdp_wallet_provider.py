@@ -17,11 +17,21 @@ from cdp import (
 from eth_account.typed_transactions import DynamicFeeTransaction
 from pydantic import BaseModel, Field
 from web3 import Web3
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
 
 from ..__version__ import __version__
+from ..instrumentation import InstrumentationMiddleware
 from ..network import NETWORK_ID_TO_CHAIN, Network
 from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .rpc_pool import RpcPoolConfig, create_rpc_provider
+from .single_flight import coalesced_read
 
 
 class CdpProviderConfig(BaseModel):
@@ -38,6 +48,10 @@ class CdpWalletProviderConfig(CdpProviderConfig):
     mnemonic_phrase: str | None = Field(None, description="The mnemonic phrase of the wallet")
     wallet_data: str | None = Field(None, description="The data of the CDP Wallet as a JSON string")
     gas: EvmGasConfig | None = Field(None, description="Gas configuration settings")
+    rpc_urls: list[str] | None = Field(
+        None, description="Optional RPC URLs to override the default chain RPC endpoints"
+    )
+    rpc_pool: RpcPoolConfig | None = Field(None, description="RPC pool configuration settings")
 
 
 class CdpWalletProvider(EvmWalletProvider):
@@ -87,7 +101,7 @@ class CdpWalletProvider(EvmWalletProvider):
                 self._wallet = Wallet.create(network_id=network_id)
 
             chain = NETWORK_ID_TO_CHAIN[network_id]
-            rpc_url = chain.rpc_urls["default"].http[0]
+            rpc_urls = config.rpc_urls or chain.get_rpc_urls()
 
             self._address = self._wallet.default_address.address_id
             self._network = Network(
@@ -95,7 +109,10 @@ class CdpWalletProvider(EvmWalletProvider):
                 network_id=network_id,
                 chain_id=chain.id,
             )
-            self._web3 = Web3(Web3.HTTPProvider(rpc_url))
+            self._web3 = Web3(create_rpc_provider(rpc_urls, config.rpc_pool))
+            self._web3.middleware_onion.inject(
+                InstrumentationMiddleware, name="instrumentation", layer=0
+            )
 
             self._gas_limit_multiplier = (
                 max(config.gas.gas_limit_multiplier, 1)
@@ -194,6 +211,18 @@ class CdpWalletProvider(EvmWalletProvider):
         except Exception as e:
             raise Exception(f"Failed to transfer native tokens: {e!s}") from e
 
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The `eth_getLogs` filter.
+
+        Returns:
+            list[LogReceipt]: The logs.
+
+        """
+        return self._web3.eth.get_logs(filter_params)
+
     def read_contract(
         self,
         contract_address: ChecksumAddress,
@@ -219,10 +248,9 @@ class CdpWalletProvider(EvmWalletProvider):
 
         """
         contract = self._web3.eth.contract(address=contract_address, abi=abi)
-        func = contract.functions[function_name]
-        if args is None:
-            args = []
-        return func(*args).call(block_identifier=block_identifier)
+        return coalesced_read(
+            contract, function_name, args or [], self._network.chain_id, block_identifier
+        )
 
     def sign_message(self, message: str | bytes) -> HexStr:
         """Sign a message using the wallet's private key.
@@ -325,6 +353,18 @@ class CdpWalletProvider(EvmWalletProvider):
 
         return broadcasted_transaction.transaction_hash
 
+    def get_transaction_count(self, block_identifier: BlockIdentifier = "pending") -> int:
+        """Get the number of transactions sent from the wallet, which is its next nonce.
+
+        Args:
+            block_identifier (BlockIdentifier): The block to count at, defaults to 'pending'.
+
+        Returns:
+            int: The transaction count.
+
+        """
+        return self._web3.eth.get_transaction_count(self._address, block_identifier)
+
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
     ) -> dict[str, Any]:
@@ -369,8 +409,8 @@ class CdpWalletProvider(EvmWalletProvider):
         transaction["type"] = 2
         transaction["chainId"] = int(self._network.chain_id)
 
-        nonce = self._web3.eth.get_transaction_count(self._address)
-        transaction["nonce"] = nonce
+        if "nonce" not in transaction:
+            transaction["nonce"] = self._web3.eth.get_transaction_count(self._address)
 
         data_field = transaction.get("data", b"")
         if isinstance(data_field, str) and data_field.startswith("0x"):
@@ -9,10 +9,20 @@ from eth_account.messages import encode_defunct
 from pydantic import BaseModel, Field
 from web3 import Web3
 from web3.middleware import SignAndSendRawMiddlewareBuilder
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
-
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
+
+from ..instrumentation import InstrumentationMiddleware
 from ..network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN, Network
 from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .rpc_pool import RpcPoolConfig, create_rpc_provider
+from .single_flight import coalesced_read
 
 
 class EthAccountWalletProviderConfig(BaseModel):
@@ -22,6 +32,10 @@ class EthAccountWalletProviderConfig(BaseModel):
     chain_id: str
     gas: EvmGasConfig | None = Field(None, description="Gas configuration settings")
     rpc_url: str | None = Field(None, description="Optional RPC URL to override default chain RPC")
+    rpc_urls: list[str] | None = Field(
+        None, description="Optional RPC URLs to override the default chain RPC endpoints"
+    )
+    rpc_pool: RpcPoolConfig | None = Field(None, description="RPC pool configuration settings")
 
     class Config:
         """Configuration for EthAccountWalletProvider."""
@@ -43,17 +57,20 @@ class EthAccountWalletProvider(EvmWalletProvider):
         self.account = config.account
 
         network_id = ""
-        rpc_url = config.rpc_url
+        rpc_urls = config.rpc_urls or ([config.rpc_url] if config.rpc_url else None)
 
-        if rpc_url is None:
+        if rpc_urls is None:
             chain = NETWORK_ID_TO_CHAIN[CHAIN_ID_TO_NETWORK_ID[config.chain_id]]
             network_id = CHAIN_ID_TO_NETWORK_ID[config.chain_id]
-            rpc_url = chain.rpc_urls["default"].http[0]
+            rpc_urls = chain.get_rpc_urls()
 
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+        self.web3 = Web3(create_rpc_provider(rpc_urls, config.rpc_pool))
         self.web3.middleware_onion.inject(
             SignAndSendRawMiddlewareBuilder.build(self.account), layer=0
         )
+        self.web3.middleware_onion.inject(
+            InstrumentationMiddleware, name="instrumentation", layer=0
+        )
 
         self._network = Network(
             protocol_family="evm",
@@ -203,8 +220,8 @@ class EthAccountWalletProvider(EvmWalletProvider):
         transaction["from"] = self.account.address
         transaction["chainId"] = int(self._network.chain_id)
 
-        nonce = self.web3.eth.get_transaction_count(self.account.address)
-        transaction["nonce"] = nonce
+        if "nonce" not in transaction:
+            transaction["nonce"] = self.web3.eth.get_transaction_count(self.account.address)
 
         max_priority_fee_per_gas, max_fee_per_gas = self.estimate_fees()
         transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
@@ -216,6 +233,18 @@ class EthAccountWalletProvider(EvmWalletProvider):
         hash = self.web3.eth.send_transaction(transaction)
         return Web3.to_hex(hash)
 
+    def get_transaction_count(self, block_identifier: BlockIdentifier = "pending") -> int:
+        """Get the number of transactions sent from the wallet, which is its next nonce.
+
+        Args:
+            block_identifier (BlockIdentifier): The block to count at, defaults to 'pending'.
+
+        Returns:
+            int: The transaction count.
+
+        """
+        return self.web3.eth.get_transaction_count(self.account.address, block_identifier)
+
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
     ) -> dict[str, Any]:
@@ -237,6 +266,18 @@ class EthAccountWalletProvider(EvmWalletProvider):
             tx_hash, timeout=timeout, poll_latency=poll_latency
         )
 
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The `eth_getLogs` filter.
+
+        Returns:
+            list[LogReceipt]: The logs.
+
+        """
+        return self.web3.eth.get_logs(filter_params)
+
     def read_contract(
         self,
         contract_address: ChecksumAddress,
@@ -259,10 +300,9 @@ class EthAccountWalletProvider(EvmWalletProvider):
 
         """
         contract = self.web3.eth.contract(address=contract_address, abi=abi)
-        func = contract.functions[function_name]
-        if args is None:
-            args = []
-        return func(*args).call(block_identifier=block_identifier)
+        return coalesced_read(
+            contract, function_name, args or [], self._network.chain_id, block_identifier
+        )
 
     def native_transfer(self, to: str, value: Decimal) -> str:
         """Transfer the native asset of the network.
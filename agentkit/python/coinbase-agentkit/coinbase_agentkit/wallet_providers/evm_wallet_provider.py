@@ -5,8 +5,9 @@ from typing import Any
 
 from eth_account.datastructures import SignedTransaction
 from pydantic import BaseModel, Field
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.types import BlockIdentifier, ChecksumAddress, FilterParams, HexStr, LogReceipt, TxParams
 
+from ..instrumentation.tracing import RECEIPT_WAIT, SEND, SIGN, tracked
 from .wallet_provider import WalletProvider
 
 
@@ -21,9 +22,37 @@ class EvmGasConfig(BaseModel):
     )
 
 
+# Wallet provider methods that are timed and attributed to the running action, by kind.
+TRACKED_METHODS = {
+    "sign_message": SIGN,
+    "sign_typed_data": SIGN,
+    "sign_transaction": SIGN,
+    "send_transaction": SEND,
+    "send_user_operation": SEND,
+    "wait_for_transaction_receipt": RECEIPT_WAIT,
+}
+
+
 class EvmWalletProvider(WalletProvider, ABC):
     """Abstract base class for all EVM wallet providers."""
 
+    def __init_subclass__(cls, track_methods: bool = True, **kwargs: Any):
+        """Instrument the signing, sending and receipt waiting methods of a wallet provider.
+
+        Args:
+            track_methods: Whether to instrument the methods. Providers that delegate to
+                other wallet providers pass False so that calls are not recorded twice.
+            **kwargs: Keyword arguments passed to the parent class.
+
+        """
+        super().__init_subclass__(**kwargs)
+        if not track_methods:
+            return
+        for method_name, kind in TRACKED_METHODS.items():
+            method = cls.__dict__.get(method_name)
+            if callable(method) and not getattr(method, "__isabstractmethod__", False):
+                setattr(cls, method_name, tracked(kind)(method))
+
     @abstractmethod
     def sign_message(self, message: str | bytes) -> HexStr:
         """Sign a message using the wallet's private key."""
@@ -51,6 +80,39 @@ class EvmWalletProvider(WalletProvider, ABC):
         """Wait for transaction confirmation and return receipt."""
         pass
 
+    def get_transaction_count(self, block_identifier: BlockIdentifier = "pending") -> int:
+        """Get the number of transactions sent from the wallet, which is its next nonce.
+
+        Providers that accept a `nonce` in `send_transaction` implement this, so that several
+        transactions can be submitted with consecutive nonces before the first one is mined.
+
+        Args:
+            block_identifier (BlockIdentifier): The block to count at, defaults to 'pending'.
+
+        Returns:
+            int: The transaction count.
+
+        Raises:
+            NotImplementedError: If the provider does not accept caller-managed nonces.
+
+        """
+        raise NotImplementedError(f"{self.get_name()} does not support caller-managed nonces")
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The `eth_getLogs` filter.
+
+        Returns:
+            list[LogReceipt]: The logs.
+
+        Raises:
+            NotImplementedError: If the provider cannot read logs.
+
+        """
+        raise NotImplementedError(f"{self.get_name()} does not support reading logs")
+
     @abstractmethod
     def read_contract(
         self,
@@ -0,0 +1,370 @@
+"""Multi-chain wallet provider."""
+
+import json
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from web3.types import BlockIdentifier, ChecksumAddress, FilterParams, HexStr, LogReceipt, TxParams
+
+from ..network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN, Network
+from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .rpc_pool import RpcPoolConfig
+
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
+
+    from .cdp_wallet_provider import CdpWalletProviderConfig
+
+
+def resolve_network_id(chain: str) -> str:
+    """Get the network ID of a chain given by chain ID or network ID.
+
+    Args:
+        chain (str): A chain ID such as "8453", or a network ID such as "base-mainnet".
+
+    Returns:
+        str: The network ID.
+
+    Raises:
+        ValueError: If the chain is not supported.
+
+    """
+    if chain in NETWORK_ID_TO_CHAIN:
+        return chain
+    if chain in CHAIN_ID_TO_NETWORK_ID:
+        return CHAIN_ID_TO_NETWORK_ID[chain]
+    raise ValueError(f"Unsupported chain {chain}. Must be one of: {', '.join(NETWORK_ID_TO_CHAIN)}")
+
+
+class MultiChainWalletProvider(EvmWalletProvider, track_methods=False):
+    """A wallet provider holding one wallet provider per chain for the same wallet.
+
+    Providers are built on first use of their chain and reused afterwards, together with
+    their RPC pool and HTTP sessions, so switching chains or working across chains costs
+    nothing after warm-up. Every wallet provider method is delegated to the provider of the
+    current chain, which is the default chain unless overridden with `on_network`.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], EvmWalletProvider],
+        default_network_id: str = "base-sepolia",
+        network_ids: list[str] | None = None,
+    ):
+        """Initialize the multi-chain wallet provider.
+
+        Args:
+            factory (Callable[[str], EvmWalletProvider]): Function building the wallet
+                provider of a network ID.
+            default_network_id (str): The chain used when no chain is selected, as network
+                ID or chain ID.
+            network_ids (list[str] | None): The chains the provider may use, as network IDs
+                or chain IDs. Defaults to every supported chain.
+
+        Raises:
+            ValueError: If a chain is not supported, or the default chain is not allowed.
+
+        """
+        self._factory = factory
+        self._network_ids = [
+            resolve_network_id(chain) for chain in network_ids or list(NETWORK_ID_TO_CHAIN)
+        ]
+        self._default_network_id = self._check_allowed(default_network_id)
+        self._current: ContextVar[str | None] = ContextVar(
+            f"multi_chain_network_{id(self)}", default=None
+        )
+        self._providers: dict[str, EvmWalletProvider] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_cdp_config(
+        cls,
+        config: "CdpWalletProviderConfig | None" = None,
+        network_ids: list[str] | None = None,
+        chain_wallet_data: dict[str, str] | None = None,
+        on_wallet_created: Callable[[str, str], None] | None = None,
+    ) -> "MultiChainWalletProvider":
+        """Create a multi-chain provider of a CDP wallet.
+
+        Every chain shares the API credentials and the wallet seed of the config, so the
+        wallet has the same address everywhere. The wallet of the default chain is imported
+        from `wallet_data` or the mnemonic phrase, or created. The wallet of each other chain
+        is imported from `chain_wallet_data`, or otherwise created from the seed on that chain.
+
+        Creating a wallet registers a new wallet with CDP. Persist the wallet data passed to
+        `on_wallet_created` and pass it back in `chain_wallet_data`, so that later runs import
+        the wallets instead of registering new ones.
+
+        Args:
+            config (CdpWalletProviderConfig | None): The CDP wallet provider config. Its network
+                ID, or the network ID of its wallet data, is the default chain.
+            network_ids (list[str] | None): The chains the provider may use.
+            chain_wallet_data (dict[str, str] | None): Exported wallet data of the other chains,
+                as JSON strings keyed by network ID or chain ID.
+            on_wallet_created (Callable[[str, str], None] | None): Called with the network ID
+                and the exported wallet data JSON of each wallet created for another chain.
+
+        Returns:
+            MultiChainWalletProvider: The provider.
+
+        """
+        from cdp import Wallet
+
+        from .cdp_wallet_provider import CdpWalletProvider, CdpWalletProviderConfig
+
+        config = config or CdpWalletProviderConfig()
+        wallet_data = json.loads(config.wallet_data) if config.wallet_data else None
+        default_network_id = resolve_network_id(
+            (wallet_data or {}).get("network_id") or config.network_id or "base-sepolia"
+        )
+        chain_wallet_data = {
+            resolve_network_id(chain): data for chain, data in (chain_wallet_data or {}).items()
+        }
+        default_provider: list[CdpWalletProvider] = []
+        lock = threading.Lock()
+
+        def get_default_provider() -> CdpWalletProvider:
+            # The default chain is built first, as it configures the SDK and holds the seed.
+            with lock:
+                if not default_provider:
+                    default_provider.append(
+                        CdpWalletProvider(
+                            config.model_copy(update={"network_id": default_network_id})
+                        )
+                    )
+                return default_provider[0]
+
+        def build(network_id: str) -> EvmWalletProvider:
+            if config.mnemonic_phrase and wallet_data is None:
+                provider = CdpWalletProvider(config.model_copy(update={"network_id": network_id}))
+            elif network_id == default_network_id:
+                provider = get_default_provider()
+            else:
+                chain_data = chain_wallet_data.get(network_id)
+                if chain_data is None:
+                    seed = get_default_provider().export_wallet().seed
+                    if not seed:
+                        raise ValueError("The CDP wallet has no seed to use it on other chains")
+                    wallet = Wallet.create_with_seed(seed=seed, network_id=network_id)
+                    chain_data = json.dumps(wallet.export_data().to_dict())
+                    if on_wallet_created is not None:
+                        on_wallet_created(network_id, chain_data)
+                provider = CdpWalletProvider(
+                    config.model_copy(update={"network_id": network_id, "wallet_data": chain_data})
+                )
+
+            actual_network_id = provider.get_network().network_id
+            if actual_network_id != network_id:
+                raise ValueError(
+                    f"The CDP wallet for {network_id} was loaded on {actual_network_id}"
+                )
+            return provider
+
+        return cls(build, default_network_id, network_ids)
+
+    @classmethod
+    def from_account(
+        cls,
+        account: "LocalAccount",
+        default_network_id: str = "base-sepolia",
+        network_ids: list[str] | None = None,
+        rpc_urls: dict[str, list[str]] | None = None,
+        gas: EvmGasConfig | None = None,
+        rpc_pool: RpcPoolConfig | None = None,
+    ) -> "MultiChainWalletProvider":
+        """Create a multi-chain provider of a local account.
+
+        Args:
+            account (LocalAccount): The account signing on every chain.
+            default_network_id (str): The chain used when no chain is selected.
+            network_ids (list[str] | None): The chains the provider may use.
+            rpc_urls (dict[str, list[str]] | None): Optional RPC URLs per network ID,
+                overriding the default chain RPC endpoints.
+            gas (EvmGasConfig | None): Gas configuration shared by every chain.
+            rpc_pool (RpcPoolConfig | None): RPC pool configuration shared by every chain.
+
+        Returns:
+            MultiChainWalletProvider: The provider.
+
+        """
+        from .eth_account_wallet_provider import (
+            EthAccountWalletProvider,
+            EthAccountWalletProviderConfig,
+        )
+
+        def build(network_id: str) -> EvmWalletProvider:
+            return EthAccountWalletProvider(
+                EthAccountWalletProviderConfig(
+                    account=account,
+                    chain_id=NETWORK_ID_TO_CHAIN[network_id].id,
+                    gas=gas,
+                    rpc_urls=(rpc_urls or {}).get(network_id),
+                    rpc_pool=rpc_pool,
+                )
+            )
+
+        return cls(build, default_network_id, network_ids)
+
+    @property
+    def network_ids(self) -> list[str]:
+        """Get the network IDs of the chains the provider may use."""
+        return list(self._network_ids)
+
+    @property
+    def current_network_id(self) -> str:
+        """Get the network ID of the chain calls are delegated to."""
+        return self._current.get() or self._default_network_id
+
+    def get_provider(self, chain: str | None = None) -> EvmWalletProvider:
+        """Get the wallet provider of a chain, building it on first use.
+
+        Args:
+            chain (str | None): The chain, as network ID or chain ID. Defaults to the
+                current chain.
+
+        Returns:
+            EvmWalletProvider: The wallet provider.
+
+        Raises:
+            ValueError: If the chain is not supported or not allowed.
+
+        """
+        network_id = self._check_allowed(chain) if chain else self.current_network_id
+        provider = self._providers.get(network_id)
+        if provider is not None:
+            return provider
+
+        with self._lock:
+            lock = self._locks.setdefault(network_id, threading.Lock())
+        with lock:
+            provider = self._providers.get(network_id)
+            if provider is None:
+                provider = self._factory(network_id)
+                self._providers[network_id] = provider
+        return provider
+
+    def switch_network(self, chain: str) -> EvmWalletProvider:
+        """Make a chain the default chain.
+
+        Args:
+            chain (str): The chain, as network ID or chain ID.
+
+        Returns:
+            EvmWalletProvider: The wallet provider of the chain.
+
+        """
+        network_id = self._check_allowed(chain)
+        provider = self.get_provider(network_id)
+        self._default_network_id = network_id
+        return provider
+
+    @contextmanager
+    def on_network(self, chain: str) -> Iterator[EvmWalletProvider]:
+        """Delegate calls to another chain within a block, without changing the default.
+
+        The override applies to the current thread or task only, so concurrent actions can
+        target different chains through the same provider.
+
+        Args:
+            chain (str): The chain, as network ID or chain ID.
+
+        Yields:
+            EvmWalletProvider: The wallet provider of the chain.
+
+        """
+        provider = self.get_provider(chain)
+        token = self._current.set(resolve_network_id(chain))
+        try:
+            yield provider
+        finally:
+            self._current.reset(token)
+
+    def get_address(self) -> str:
+        """Get the wallet address on the current chain."""
+        return self.get_provider().get_address()
+
+    def get_network(self) -> Network:
+        """Get the current chain."""
+        return self.get_provider().get_network()
+
+    def get_balance(self) -> Decimal:
+        """Get the native balance on the current chain."""
+        return self.get_provider().get_balance()
+
+    def get_name(self) -> str:
+        """Get the name of the wallet provider.
+
+        Returns:
+            str: The string 'multi_chain_wallet_provider'
+
+        """
+        return "multi_chain_wallet_provider"
+
+    def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the current chain."""
+        return self.get_provider().native_transfer(to, value)
+
+    def sign_message(self, message: str | bytes) -> HexStr:
+        """Sign a message with the wallet of the current chain."""
+        return self.get_provider().sign_message(message)
+
+    def sign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
+        """Sign typed data with the wallet of the current chain."""
+        return self.get_provider().sign_typed_data(typed_data)
+
+    def sign_transaction(self, transaction: TxParams) -> Any:
+        """Sign a transaction for the current chain."""
+        return self.get_provider().sign_transaction(transaction)
+
+    def send_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a transaction on the current chain."""
+        return self.get_provider().send_transaction(transaction)
+
+    def get_transaction_count(self, block_identifier: BlockIdentifier = "pending") -> int:
+        """Get the transaction count of the wallet on the current chain."""
+        return self.get_provider().get_transaction_count(block_identifier)
+
+    def wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+    ) -> dict[str, Any]:
+        """Wait for a transaction receipt on the current chain."""
+        return self.get_provider().wait_for_transaction_receipt(
+            tx_hash, timeout=timeout, poll_latency=poll_latency
+        )
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter on the current chain."""
+        return self.get_provider().get_logs(filter_params)
+
+    def read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read a contract on the current chain."""
+        return self.get_provider().read_contract(
+            contract_address, abi, function_name, args, block_identifier
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate provider-specific attributes to the provider of the current chain."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.get_provider(), name)
+
+    def _check_allowed(self, chain: str) -> str:
+        """Resolve a chain and check that the provider may use it."""
+        network_id = resolve_network_id(chain)
+        if network_id not in self._network_ids:
+            raise ValueError(
+                f"Chain {chain} is not enabled. Must be one of: {', '.join(self._network_ids)}"
+            )
+        return network_id
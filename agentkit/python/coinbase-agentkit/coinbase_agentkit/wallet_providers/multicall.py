@@ -0,0 +1,215 @@
+"""Batching of contract reads through Multicall3."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import eth_abi
+from eth_utils import (
+    function_abi_to_4byte_selector,
+    get_abi_input_types,
+    get_abi_output_types,
+    to_checksum_address,
+)
+from web3.types import BlockIdentifier
+
+from ..network import NETWORK_ID_TO_CHAIN
+from .evm_wallet_provider import EvmWalletProvider
+
+# Multicall3 is deployed at the same address on every chain it supports.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# The number of calls sent in a single aggregate3 call.
+DEFAULT_BATCH_SIZE = 200
+
+MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            },
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            },
+        ],
+    },
+    {
+        "type": "function",
+        "name": "getEthBalance",
+        "stateMutability": "view",
+        "inputs": [{"name": "addr", "type": "address"}],
+        "outputs": [{"name": "balance", "type": "uint256"}],
+    },
+    {
+        "type": "function",
+        "name": "getBlockNumber",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "blockNumber", "type": "uint256"}],
+    },
+]
+
+
+@dataclass(frozen=True)
+class ContractCall:
+    """A read of a contract function."""
+
+    address: str
+    abi: list[dict[str, Any]] = field(hash=False)
+    function_name: str
+    args: tuple[Any, ...] = ()
+
+    @property
+    def function_abi(self) -> dict[str, Any]:
+        """Get the ABI of the called function."""
+        for entry in self.abi:
+            if (
+                entry.get("type") == "function"
+                and entry.get("name") == self.function_name
+                and len(entry.get("inputs", [])) == len(self.args)
+            ):
+                return entry
+        raise ValueError(f"Function {self.function_name} not found in ABI")
+
+    def encode(self) -> bytes:
+        """Encode the calldata of the call."""
+        abi = self.function_abi
+        return function_abi_to_4byte_selector(abi) + eth_abi.encode(
+            get_abi_input_types(abi), list(self.args)
+        )
+
+    def decode(self, data: bytes) -> Any:
+        """Decode the return data of the call like `read_contract` would."""
+        abi = self.function_abi
+        types = get_abi_output_types(abi)
+        values = [
+            to_checksum_address(value) if abi_type == "address" else value
+            for abi_type, value in zip(types, eth_abi.decode(types, data), strict=True)
+        ]
+        return values[0] if len(values) == 1 else values
+
+
+@dataclass
+class CallResult:
+    """The outcome of a call made through `multicall`."""
+
+    success: bool
+    value: Any = None
+    error: str | None = None
+
+
+def get_multicall_address(network_id: str | None) -> str | None:
+    """Get the Multicall3 address of a network.
+
+    Args:
+        network_id (str | None): The network ID.
+
+    Returns:
+        str | None: The checksummed address, or None if Multicall3 is not known on the network.
+
+    """
+    chain = NETWORK_ID_TO_CHAIN.get(network_id or "")
+    contract = chain.contracts.get("multicall3") if chain else None
+    return to_checksum_address(contract.address) if contract else None
+
+
+def native_balance_call(address: str) -> ContractCall:
+    """Create a call reading the native balance of an address through Multicall3.
+
+    Args:
+        address (str): The address.
+
+    Returns:
+        ContractCall: The call, returning the balance in wei.
+
+    """
+    return ContractCall(
+        MULTICALL3_ADDRESS, MULTICALL3_ABI, "getEthBalance", (to_checksum_address(address),)
+    )
+
+
+def multicall(
+    wallet_provider: EvmWalletProvider,
+    calls: Sequence[ContractCall],
+    block_identifier: BlockIdentifier = "latest",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[CallResult]:
+    """Read several contract functions in as few RPC calls as possible.
+
+    The calls are sent through Multicall3's `aggregate3` in batches of `batch_size`, all
+    read at the same block. A failing call does not fail the others. On networks without
+    Multicall3 the calls are read one by one.
+
+    Args:
+        wallet_provider (EvmWalletProvider): The wallet provider of the network to read.
+        calls (Sequence[ContractCall]): The calls.
+        block_identifier (BlockIdentifier): The block to read at, defaults to 'latest'.
+        batch_size (int): The maximum number of calls per RPC call.
+
+    Returns:
+        list[CallResult]: The result of each call, in order.
+
+    """
+    if not calls:
+        return []
+
+    multicall_address = get_multicall_address(wallet_provider.get_network().network_id)
+    if multicall_address is None:
+        return [_read(wallet_provider, call, block_identifier) for call in calls]
+
+    results: list[CallResult] = []
+    for start in range(0, len(calls), batch_size):
+        batch = calls[start : start + batch_size]
+        responses = wallet_provider.read_contract(
+            contract_address=multicall_address,
+            abi=MULTICALL3_ABI,
+            function_name="aggregate3",
+            args=[[(to_checksum_address(c.address), True, c.encode()) for c in batch]],
+            block_identifier=block_identifier,
+        )
+        for call, (success, data) in zip(batch, responses, strict=True):
+            results.append(_decode(call, success, data))
+    return results
+
+
+def _decode(call: ContractCall, success: bool, data: bytes) -> CallResult:
+    """Decode the outcome of a call in an aggregate3 response."""
+    if not success:
+        return CallResult(False, error=f"{call.function_name} reverted")
+    try:
+        return CallResult(True, call.decode(data))
+    except Exception as e:
+        return CallResult(False, error=f"Could not decode {call.function_name}: {e!s}")
+
+
+def _read(
+    wallet_provider: EvmWalletProvider, call: ContractCall, block_identifier: BlockIdentifier
+) -> CallResult:
+    """Read a single call without Multicall3."""
+    try:
+        value = wallet_provider.read_contract(
+            contract_address=to_checksum_address(call.address),
+            abi=call.abi,
+            function_name=call.function_name,
+            args=list(call.args),
+            block_identifier=block_identifier,
+        )
+        return CallResult(True, value)
+    except Exception as e:
+        return CallResult(False, error=str(e))
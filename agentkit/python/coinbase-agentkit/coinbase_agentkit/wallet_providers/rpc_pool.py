@@ -0,0 +1,387 @@
+"""RPC endpoint pool with health-scored routing, failover and hedged reads."""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Any
+
+import requests
+from pydantic import BaseModel, Field
+from web3 import HTTPProvider
+from web3.providers import BaseProvider, JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from ..rate_limiting import rate_limiter
+
+# Methods that change chain state. These are never hedged, and they only fail over
+# when the request provably never reached the endpoint.
+WRITE_METHODS = frozenset({"eth_sendRawTransaction", "eth_sendTransaction"})
+
+# HTTP status codes that mean the endpoint rejected the request without processing it.
+REJECTED_STATUS_CODES = frozenset({429, 503})
+
+
+class RpcPoolConfig(BaseModel):
+    """Configuration for the RPC endpoint pool."""
+
+    hedge_delay: float | None = Field(
+        None,
+        description="Seconds to wait on a read before hedging it to a second endpoint. "
+        "Hedging is disabled when unset",
+    )
+    request_timeout: float = Field(10, description="Timeout in seconds for a single RPC request")
+    max_consecutive_failures: int = Field(
+        3, description="Consecutive failures after which an endpoint is ejected from the pool"
+    )
+    eject_cooldown: float = Field(
+        30, description="Seconds an ejected endpoint waits before it is re-admitted"
+    )
+    max_eject_cooldown: float = Field(
+        300, description="Upper bound in seconds for the backed-off ejection cooldown"
+    )
+    latency_decay: float = Field(
+        0.3, description="Smoothing factor of the moving averages used for health scoring"
+    )
+
+
+class RateLimitedHTTPProvider(HTTPProvider):
+    """An HTTP provider that sends requests under the shared rate limit of its endpoint.
+
+    Requests queue for a token of the endpoint's bucket before they are sent. When the
+    endpoint answers with a 429, the bucket is paused for the advertised `Retry-After` and the
+    request is queued again, up to `max_rate_limit_retries` times.
+    """
+
+    def __init__(self, *args: Any, max_rate_limit_retries: int = 2, **kwargs: Any):
+        """Initialize the provider.
+
+        Args:
+            *args: Positional arguments passed to `HTTPProvider`.
+            max_rate_limit_retries (int): How many times a rate limited request is retried.
+            **kwargs: Keyword arguments passed to `HTTPProvider`.
+
+        """
+        super().__init__(*args, **kwargs)
+        self.max_rate_limit_retries = max_rate_limit_retries
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a JSON-RPC request under the rate limit of the endpoint."""
+        return rate_limiter.call(
+            self.endpoint_uri,
+            lambda: super(RateLimitedHTTPProvider, self).make_request(method, params),
+            self.max_rate_limit_retries,
+            operation=method,
+        )
+
+    def make_batch_request(self, batch_requests: list[tuple[RPCEndpoint, Any]]) -> Any:
+        """Send a JSON-RPC batch request under the rate limit of the endpoint."""
+        return rate_limiter.call(
+            self.endpoint_uri,
+            lambda: super(RateLimitedHTTPProvider, self).make_batch_request(batch_requests),
+            self.max_rate_limit_retries,
+            operation="batch",
+        )
+
+
+class PooledEndpoint:
+    """Health statistics for a single endpoint in an RPC pool."""
+
+    def __init__(self, url: str, provider: RateLimitedHTTPProvider):
+        self.url = url
+        self.provider = provider
+        self.latency = 0.0
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+    def is_ejected(self, now: float) -> bool:
+        """Check whether the endpoint is currently ejected from the pool."""
+        return self.ejected_until > now
+
+    def score(self) -> float:
+        """Get the health score of the endpoint. Lower is healthier."""
+        return self.latency * (1 + 10 * self.error_rate)
+
+    def to_dict(self, now: float) -> dict[str, Any]:
+        """Get a snapshot of the endpoint statistics."""
+        return {
+            "url": self.url,
+            "latency": self.latency,
+            "error_rate": self.error_rate,
+            "requests": self.requests,
+            "failures": self.failures,
+            "ejected": self.is_ejected(now),
+        }
+
+
+class RpcPool(JSONBaseProvider):
+    """A web3 provider that spreads requests over several HTTP RPC endpoints.
+
+    Every endpoint is scored from a moving average of its latency and error rate. Requests
+    are routed to the healthiest endpoint and fail over to the next one on transport errors.
+    Endpoints that fail repeatedly are ejected for a backed-off cooldown and are re-admitted
+    on probation once it expires. Reads can optionally be hedged: when the first endpoint has
+    not answered within `hedge_delay`, the request is also sent to the runner-up and the
+    first successful response wins.
+    """
+
+    def __init__(self, urls: list[str], config: RpcPoolConfig | None = None, **kwargs: Any):
+        """Initialize the RPC pool.
+
+        Args:
+            urls (list[str]): The HTTP RPC endpoint URLs, in order of preference.
+            config (RpcPoolConfig | None): Optional pool configuration.
+            **kwargs: Additional keyword arguments passed to the base provider.
+
+        Raises:
+            ValueError: If no endpoint URLs are provided.
+
+        """
+        if not urls:
+            raise ValueError("RpcPool requires at least one endpoint URL")
+
+        super().__init__(**kwargs)
+
+        self.config = config or RpcPoolConfig()
+        self._endpoints = [
+            PooledEndpoint(
+                url,
+                # A rate limited endpoint is not retried in place, the pool fails over instead.
+                RateLimitedHTTPProvider(
+                    url,
+                    request_kwargs={"timeout": self.config.request_timeout},
+                    exception_retry_configuration=None,
+                    max_rate_limit_retries=0,
+                ),
+            )
+            for url in dict.fromkeys(urls)
+        ]
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __str__(self) -> str:
+        """Get a readable description of the pool."""
+        return f"RPC pool {[endpoint.url for endpoint in self._endpoints]}"
+
+    @property
+    def endpoint_urls(self) -> list[str]:
+        """Get the URLs of all endpoints in the pool."""
+        return [endpoint.url for endpoint in self._endpoints]
+
+    def get_endpoint_stats(self) -> list[dict[str, Any]]:
+        """Get the health statistics of every endpoint in the pool.
+
+        Returns:
+            list[dict[str, Any]]: One entry per endpoint, in order of preference.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            ranked = self._ranked(now)
+            ranked += [e for e in self._endpoints if e not in ranked]
+            return [endpoint.to_dict(now) for endpoint in ranked]
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a JSON-RPC request to the healthiest endpoint.
+
+        Args:
+            method (RPCEndpoint): The JSON-RPC method.
+            params (Any): The JSON-RPC params.
+
+        Returns:
+            RPCResponse: The JSON-RPC response.
+
+        Raises:
+            Exception: The last transport error if every eligible endpoint failed.
+
+        """
+        with self._lock:
+            ranked = self._ranked(time.monotonic())
+
+        if method in WRITE_METHODS:
+            return self._failover(
+                ranked, lambda p: p.make_request(method, params), self._is_rejected
+            )
+
+        if self.config.hedge_delay is not None and len(ranked) > 1:
+            return self._hedged(ranked, method, params)
+
+        return self._failover(ranked, lambda p: p.make_request(method, params))
+
+    def make_batch_request(self, batch_requests: list[tuple[RPCEndpoint, Any]]) -> Any:
+        """Send a JSON-RPC batch request to the healthiest endpoint.
+
+        Args:
+            batch_requests (list[tuple[RPCEndpoint, Any]]): The batched method and params pairs.
+
+        Returns:
+            Any: The batched JSON-RPC responses.
+
+        """
+        with self._lock:
+            ranked = self._ranked(time.monotonic())
+
+        if any(method in WRITE_METHODS for method, _ in batch_requests):
+            return self._failover(
+                ranked, lambda p: p.make_batch_request(batch_requests), self._is_rejected
+            )
+
+        return self._failover(ranked, lambda p: p.make_batch_request(batch_requests))
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        """Check whether any endpoint in the pool is reachable."""
+        return any(
+            endpoint.provider.is_connected(show_traceback=show_traceback)
+            for endpoint in self._endpoints
+        )
+
+    def _ranked(self, now: float) -> list[PooledEndpoint]:
+        """Rank the endpoints from healthiest to least healthy.
+
+        Endpoints paused by their rate limiter come after the others. Ejected endpoints are only
+        used once every other endpoint is ejected too, in which case the ones closest to
+        re-admission come first.
+        """
+        admitted = [e for e in self._endpoints if not e.is_ejected(now)]
+        if admitted:
+            return sorted(
+                admitted,
+                key=lambda e: (rate_limiter.bucket(e.url).is_paused(), e.score()),
+            )
+        return sorted(self._endpoints, key=lambda e: e.ejected_until)
+
+    def _call(self, endpoint: PooledEndpoint, send: Callable[[HTTPProvider], Any]) -> Any:
+        """Send a request to an endpoint and record its outcome."""
+        start = time.monotonic()
+        try:
+            response = send(endpoint.provider)
+        except Exception:
+            self._record(endpoint, time.monotonic() - start, failed=True)
+            raise
+        self._record(endpoint, time.monotonic() - start, failed=False)
+        return response
+
+    def _record(self, endpoint: PooledEndpoint, elapsed: float, failed: bool) -> None:
+        """Update the health statistics of an endpoint."""
+        decay = self.config.latency_decay
+        with self._lock:
+            endpoint.requests += 1
+            endpoint.error_rate = (1 - decay) * endpoint.error_rate + decay * float(failed)
+
+            # A failure counts as a request that took the full timeout, so an endpoint that
+            # fails fast does not look faster than a healthy one.
+            sample = self.config.request_timeout if failed else elapsed
+            endpoint.latency = (
+                sample
+                if endpoint.requests == 1
+                else (1 - decay) * endpoint.latency + decay * sample
+            )
+
+            if not failed:
+                endpoint.consecutive_failures = 0
+                endpoint.ejections = 0
+                return
+
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.config.max_consecutive_failures:
+                cooldown = min(
+                    self.config.eject_cooldown * 2**endpoint.ejections,
+                    self.config.max_eject_cooldown,
+                )
+                endpoint.ejections += 1
+                endpoint.consecutive_failures = 0
+                endpoint.ejected_until = time.monotonic() + cooldown
+
+    def _failover(
+        self,
+        ranked: list[PooledEndpoint],
+        send: Callable[[HTTPProvider], Any],
+        can_retry: Callable[[Exception], bool] | None = None,
+    ) -> Any:
+        """Try the ranked endpoints in order until one succeeds."""
+        last_error: Exception | None = None
+        for endpoint in ranked:
+            try:
+                return self._call(endpoint, send)
+            except Exception as e:
+                last_error = e
+                if can_retry is not None and not can_retry(e):
+                    raise
+        raise last_error
+
+    def _hedged(self, ranked: list[PooledEndpoint], method: RPCEndpoint, params: Any) -> Any:
+        """Send a read to the healthiest endpoint and hedge it to the runner-up when slow.
+
+        Requests run in the context of the caller, so they are attributed to its action.
+        """
+        executor = self._get_executor()
+
+        def send(p: HTTPProvider) -> RPCResponse:
+            return p.make_request(method, params)
+
+        pending: set[Future] = {executor.submit(copy_context().run, self._call, ranked[0], send)}
+        done, pending = wait(pending, timeout=self.config.hedge_delay)
+
+        if not done or next(iter(done)).exception() is not None:
+            pending.add(executor.submit(copy_context().run, self._call, ranked[1], send))
+
+        last_error: BaseException | None = None
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            last_error = future.exception()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                last_error = future.exception()
+
+        if len(ranked) > 2:
+            return self._failover(ranked[2:], send)
+
+        raise last_error
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the executor used for hedged requests, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2 * len(self._endpoints), thread_name_prefix="rpc-pool"
+                )
+            return self._executor
+
+    @staticmethod
+    def _is_rejected(error: Exception) -> bool:
+        """Check whether an error proves the request was never processed by the endpoint."""
+        if isinstance(error, requests.ConnectionError):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code in REJECTED_STATUS_CODES
+        return False
+
+
+def create_rpc_provider(urls: list[str], config: RpcPoolConfig | None = None) -> BaseProvider:
+    """Create a web3 provider for one or more RPC endpoints.
+
+    A single endpoint gets a `RateLimitedHTTPProvider`. Several endpoints are wrapped in an
+    `RpcPool`. Either way, requests are subject to the shared per-endpoint rate limits.
+
+    Args:
+        urls (list[str]): The HTTP RPC endpoint URLs, in order of preference.
+        config (RpcPoolConfig | None): Optional pool configuration.
+
+    Returns:
+        BaseProvider: The web3 provider.
+
+    """
+    if len(urls) == 1:
+        return RateLimitedHTTPProvider(urls[0])
+    return RpcPool(urls, config)
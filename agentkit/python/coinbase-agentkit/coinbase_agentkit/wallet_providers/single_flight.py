@@ -0,0 +1,147 @@
+"""In-flight request coalescing for contract reads."""
+
+import copy
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from eth_utils import get_abi_output_types
+from web3.contract import Contract
+from web3.types import BlockIdentifier
+
+from ..instrumentation import record_cache_lookup
+
+
+class _Call:
+    """A call that is currently in flight."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Collapses concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs the function. Callers that arrive with the same key
+    while it is still running wait for it and receive a copy of its result, or its error.
+    Nothing is cached once the call completes.
+    """
+
+    def __init__(self, name: str = "single_flight") -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._requests = 0
+        self._executions = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run a function, or join an identical call that is already in flight.
+
+        Args:
+            key (Hashable): The key identifying identical calls.
+            fn (Callable[[], Any]): The function to run.
+
+        Returns:
+            Any: The result of the function.
+
+        Raises:
+            BaseException: Any error raised by the function.
+
+        """
+        with self._lock:
+            self._requests += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executions += 1
+            else:
+                call.waiters += 1
+
+        record_cache_lookup(self.name, hit=not leader)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        # Waiters copy the shared result, so the leader must not hand out the original.
+        return copy.deepcopy(call.result) if call.waiters else call.result
+
+    def stats(self) -> dict[str, float]:
+        """Get the coalescing counters.
+
+        Returns:
+            dict[str, float]: The number of requests, executions and coalesced requests,
+                and the share of requests that were coalesced.
+
+        """
+        with self._lock:
+            requests, executions = self._requests, self._executions
+        coalesced = requests - executions
+        return {
+            "requests": requests,
+            "executions": executions,
+            "coalesced": coalesced,
+            "dedup_ratio": coalesced / requests if requests else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset the coalescing counters."""
+        with self._lock:
+            self._requests = 0
+            self._executions = 0
+
+
+# Shared by every wallet provider so that identical reads from concurrent agent sessions
+# collapse into one RPC.
+contract_reads = SingleFlight("contract_reads")
+
+
+def coalesced_read(
+    contract: Contract,
+    function_name: str,
+    args: list[Any],
+    chain_id: str | None,
+    block_identifier: BlockIdentifier,
+) -> Any:
+    """Call a read-only contract function, joining an identical read already in flight.
+
+    Reads are identical when they target the same chain, contract, calldata and block, and
+    decode the same output types.
+
+    Args:
+        contract (Contract): The contract to read from.
+        function_name (str): The name of the function to call.
+        args (list[Any]): Arguments to pass to the function call.
+        chain_id (str | None): The chain ID of the network the contract lives on.
+        block_identifier (BlockIdentifier): The block number to read from.
+
+    Returns:
+        Any: The result of the contract function call.
+
+    """
+    func = contract.functions[function_name](*args)
+    key = (
+        chain_id,
+        contract.address,
+        contract.encode_abi(function_name, args),
+        block_identifier,
+        tuple(get_abi_output_types(func.abi)),
+    )
+    return contract_reads.do(key, lambda: func.call(block_identifier=block_identifier))
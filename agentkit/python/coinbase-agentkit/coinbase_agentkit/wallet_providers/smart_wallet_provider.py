@@ -7,11 +7,21 @@ from eth_account.account import LocalAccount
 from eth_account.datastructures import SignedTransaction
 from pydantic import BaseModel, Field
 from web3 import Web3
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
 
 from ..__version__ import __version__
+from ..instrumentation import InstrumentationMiddleware
 from ..network import NETWORK_ID_TO_CHAIN, Network
 from .evm_wallet_provider import EvmWalletProvider
+from .rpc_pool import RpcPoolConfig, create_rpc_provider
+from .single_flight import coalesced_read
 
 
 class SmartWalletProviderConfig(BaseModel):
@@ -25,6 +35,10 @@ class SmartWalletProviderConfig(BaseModel):
     paymaster_url: str | None = Field(
         None, description="URL for the paymaster service to sponsor transactions"
     )
+    rpc_urls: list[str] | None = Field(
+        None, description="Optional RPC URLs to override the default chain RPC endpoints"
+    )
+    rpc_pool: RpcPoolConfig | None = Field(None, description="RPC pool configuration settings")
 
     class Config:
         """Configuration for SmartWalletProvider."""
@@ -43,8 +57,10 @@ class SmartWalletProvider(EvmWalletProvider):
             network_id=config.network_id,
             chain_id=NETWORK_ID_TO_CHAIN[config.network_id].id,
         )
-        self._web3 = Web3(
-            Web3.HTTPProvider(NETWORK_ID_TO_CHAIN[config.network_id].rpc_urls["default"].http[0])
+        rpc_urls = config.rpc_urls or NETWORK_ID_TO_CHAIN[config.network_id].get_rpc_urls()
+        self._web3 = Web3(create_rpc_provider(rpc_urls, config.rpc_pool))
+        self._web3.middleware_onion.inject(
+            InstrumentationMiddleware, name="instrumentation", layer=0
         )
 
         if config.cdp_api_key_name and config.cdp_api_key_private_key:
@@ -155,6 +171,10 @@ class SmartWalletProvider(EvmWalletProvider):
             tx_hash, timeout=timeout, poll_latency=poll_latency
         )
 
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter."""
+        return self._web3.eth.get_logs(filter_params)
+
     def read_contract(
         self,
         contract_address: ChecksumAddress,
@@ -165,8 +185,9 @@ class SmartWalletProvider(EvmWalletProvider):
     ) -> Any:
         """Read data from a smart contract."""
         contract = self._web3.eth.contract(address=contract_address, abi=abi)
-        func = contract.functions[function_name]
-        return func(*(args or [])).call(block_identifier=block_identifier)
+        return coalesced_read(
+            contract, function_name, args or [], self._network.chain_id, block_identifier
+        )
 
     def get_balance(self) -> Decimal:
         """Get the balance of the smart wallet."""
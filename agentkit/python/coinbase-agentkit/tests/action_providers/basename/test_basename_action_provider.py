@@ -1,12 +1,14 @@
 """Tests for Basename action provider."""
 
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 
 from web3 import Web3
 
 from coinbase_agentkit.action_providers.basename.constants import (
     BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET,
     BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET,
+    PRICE_CACHE_TTL,
+    REGISTRAR_ABI,
 )
 from coinbase_agentkit.network import Network
 
@@ -105,3 +107,80 @@ def test_supports_network(provider):
     for network_id, chain_id, expected in test_cases:
         network = Network(protocol_family="evm", chain_id=chain_id, network_id=network_id)
         assert provider.supports_network(network) is expected
+
+
+def respond_registrar(target, function_name, args):
+    """Answer registrar reads where only `taken` is registered and `broken` cannot be read."""
+    assert target == BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET
+    if args[0] == "broken":
+        raise ValueError("reverted")
+    if function_name == "available":
+        return args[0] != "taken"
+    return Web3.to_wei(len(args[0]) / 1000, "ether")
+
+
+def test_check_basenames(provider, mock_wallet_provider, multicall_reader):
+    """Test that availability and prices of all names are read in one multicall."""
+    mock_wallet_provider.read_contract.side_effect = multicall_reader(
+        [REGISTRAR_ABI], respond_registrar
+    )
+
+    response = provider.check_basenames(
+        mock_wallet_provider, {"basenames": ["agent", "taken.base.eth", "broken", "agent"]}
+    )
+
+    assert response == (
+        "Basename availability for one year of registration:\n"
+        "- agent.base.eth: available for 0.005 ETH\n"
+        "- taken.base.eth: taken\n"
+        "- broken.base.eth: error: available reverted"
+    )
+    mock_wallet_provider.read_contract.assert_called_once()
+
+
+def test_registration_reuses_checked_price(provider, mock_wallet_provider, multicall_reader):
+    """Test that registering a checked name pays the checked price without reading it again."""
+    mock_wallet_provider.read_contract.side_effect = multicall_reader(
+        [REGISTRAR_ABI], respond_registrar
+    )
+    provider.check_basenames(mock_wallet_provider, {"basenames": ["agent"]})
+    mock_wallet_provider.read_contract.reset_mock()
+
+    price = provider._get_price(
+        mock_wallet_provider, BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET, "agent"
+    )
+
+    assert price == Web3.to_wei("0.005", "ether")
+    mock_wallet_provider.read_contract.assert_not_called()
+
+
+def test_registration_reads_unchecked_or_stale_price(provider, mock_wallet_provider):
+    """Test that prices not checked recently are read from the registrar."""
+    provider._prices[("base-mainnet", "agent")] = (1, 0.0)
+    mock_wallet_provider.read_contract.side_effect = None
+    mock_wallet_provider.read_contract.return_value = 42
+
+    with patch(
+        "coinbase_agentkit.action_providers.basename.basename_action_provider.time.monotonic",
+        return_value=PRICE_CACHE_TTL + 1,
+    ):
+        price = provider._get_price(
+            mock_wallet_provider, BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET, "agent"
+        )
+
+    assert price == 42
+    mock_wallet_provider.read_contract.assert_called_once_with(
+        contract_address=BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET,
+        abi=REGISTRAR_ABI,
+        function_name="registerPrice",
+        args=["agent", 31557600],
+    )
+
+
+def test_check_basenames_error(provider, mock_wallet_provider):
+    """Test error handling when the registrar cannot be read."""
+    mock_wallet_provider.read_contract.side_effect = Exception("RPC unavailable")
+
+    response = provider.check_basenames(mock_wallet_provider, {"basenames": ["agent"]})
+
+    assert response == "Error checking basenames: RPC unavailable"
@@ -5,6 +5,33 @@ import pytest
 from coinbase_agentkit.action_providers.compound.compound_action_provider import (
     CompoundActionProvider,
 )
+from coinbase_agentkit.action_providers.compound.market import (
+    AssetConfig,
+    MarketConfig,
+    MarketPosition,
+)
+
+
+def market_config(token_symbol: str = "WETH", token_decimals: int = 18) -> MarketConfig:
+    """Create the configuration of a USDC market with "0xToken" as collateral."""
+    return MarketConfig(
+        comet_address="0xComet",
+        base_token=AssetConfig("0xBaseToken", "USDC", 6, "0xBaseFeed"),
+        collateral_assets=(
+            AssetConfig("0xToken", token_symbol, token_decimals, "0xTokenFeed", 8 * 10**17),
+        ),
+        block_number=100,
+    )
+
+
+def market_position(collateral_balance: int = 0, borrow_balance: int = 0) -> MarketPosition:
+    """Create a position in the market of `market_config`."""
+    return MarketPosition(
+        block_number=100,
+        borrow_balance=borrow_balance,
+        collateral_balances={"0xToken": collateral_balance},
+        prices={"0xBaseToken": 10**8, "0xToken": 2000 * 10**8},
+    )
 
 
 @pytest.fixture
@@ -13,6 +40,8 @@ def compound_provider():
     provider = CompoundActionProvider()
     provider._get_comet_address = lambda network: "0xComet"
     provider._get_asset_address = lambda network, asset_id: "0xToken"
+    provider._get_market_config = lambda wallet, comet_address: market_config()
+    provider._get_position = lambda wallet, config: market_position()
     return provider
 
 
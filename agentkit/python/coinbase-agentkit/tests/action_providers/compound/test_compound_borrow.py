@@ -8,10 +8,6 @@ def test_borrow_action_success(compound_wallet, compound_provider):
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_base_token_address",
-            return_value="0xBaseToken",
-        ),
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
@@ -0,0 +1,152 @@
+"""Tests for the cached Compound market configuration and batched position reads."""
+
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit.action_providers.compound.compound_action_provider import (
+    CompoundActionProvider,
+)
+from coinbase_agentkit.action_providers.compound.constants import (
+    COMET_ABI,
+    PRICE_FEED_ABI,
+    USDC_ADDRESS,
+    USDC_COMET_ADDRESS,
+    WETH_ADDRESS,
+)
+from coinbase_agentkit.action_providers.compound.market import (
+    MarketConfigCache,
+    get_market_position,
+    load_market_config,
+)
+from coinbase_agentkit.action_providers.compound.utils import (
+    get_health_ratio,
+    get_health_ratio_after_borrow,
+    get_health_ratio_after_withdraw,
+)
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmWalletProvider
+
+ACCOUNT = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+BASE_FEED = "0x7e860098F58bBFC8648a4311b374B1D669a2bc6B"
+WETH_FEED = "0x71041dddad3595F9CEd3DcCFBe3D1F4b0a16Bb70"
+
+
+class Market:
+    """A fake USDC Comet with WETH collateral, borrowing 1000 USDC against 1 WETH."""
+
+    def __init__(self):
+        self.block_number = 100
+        self.weth_price = 2000 * 10**8
+
+    def respond(self, target, function_name, args):
+        """Answer a call to the market, its tokens or its price feeds."""
+        target = target.lower()
+        if function_name == "symbol":
+            return "USDC" if target == USDC_ADDRESS.lower() else "WETH"
+        if function_name == "latestRoundData":
+            price = 10**8 if target == BASE_FEED.lower() else self.weth_price
+            return (1, price, 0, 0, 1)
+        return {
+            "getBlockNumber": self.block_number,
+            "baseToken": USDC_ADDRESS,
+            "baseTokenPriceFeed": BASE_FEED,
+            "numAssets": 1,
+            "decimals": 6,
+            "getAssetInfo": (0, WETH_ADDRESS, WETH_FEED, 10**18, 8 * 10**17, 0, 0, 0),
+            "borrowBalanceOf": 1000 * 10**6,
+            "collateralBalanceOf": 10**18,
+        }[function_name]
+
+
+@pytest.fixture
+def market():
+    """Create the fake market."""
+    return Market()
+
+
+@pytest.fixture
+def market_wallet(market, multicall_reader):
+    """Create a Base wallet provider mock reading the fake market through multicall."""
+    wallet = Mock(spec=EvmWalletProvider)
+    wallet.get_address.return_value = ACCOUNT
+    wallet.get_network.return_value = Network(protocol_family="evm", network_id="base-mainnet")
+    wallet.read_contract.side_effect = multicall_reader(
+        [COMET_ABI, PRICE_FEED_ABI, ERC20_ABI], market.respond
+    )
+    return wallet
+
+
+def test_load_market_config(market_wallet):
+    """Test that the market configuration is read in three multicalls."""
+    config = load_market_config(market_wallet, USDC_COMET_ADDRESS)
+
+    assert market_wallet.read_contract.call_count == 3
+    assert config.block_number == 100
+    assert config.base_token.address == USDC_ADDRESS
+    assert (config.base_token.symbol, config.base_token.decimals) == ("USDC", 6)
+    (weth,) = config.collateral_assets
+    assert (weth.address, weth.symbol, weth.decimals) == (WETH_ADDRESS, "WETH", 18)
+    assert (weth.price_feed, weth.borrow_collateral_factor) == (WETH_FEED, 8 * 10**17)
+    assert config.get_asset(WETH_ADDRESS.lower()) == weth
+    with pytest.raises(ValueError, match="is not an asset of the Compound market"):
+        config.get_asset(ACCOUNT)
+
+
+def test_position_reads_only_balances_and_prices(market_wallet):
+    """Test that a position is read in one multicall and health ratios follow from it."""
+    config = load_market_config(market_wallet, USDC_COMET_ADDRESS)
+    market_wallet.read_contract.reset_mock()
+
+    position = get_market_position(market_wallet, config)
+
+    assert market_wallet.read_contract.call_count == 1
+    (calls,) = market_wallet.read_contract.call_args.kwargs["args"]
+    assert len(calls) == 5
+    assert position.borrow_balance == 1000 * 10**6
+    assert position.collateral_balances == {WETH_ADDRESS: 10**18}
+    assert position.prices == {USDC_ADDRESS: 10**8, WETH_ADDRESS: 2000 * 10**8}
+    assert get_health_ratio(config, position) == Decimal("1.6")
+    assert get_health_ratio_after_borrow(config, position, 600 * 10**6) == Decimal("1")
+    assert get_health_ratio_after_withdraw(config, position, WETH_ADDRESS, 5 * 10**17) == Decimal(
+        "0.8"
+    )
+
+
+def test_market_config_cache_reloads_by_block_age_or_refresh(market, market_wallet):
+    """Test that the configuration is reused until outdated by block age or refreshed."""
+    cache = MarketConfigCache(max_age_blocks=10)
+    config = cache.get(market_wallet, USDC_COMET_ADDRESS)
+
+    assert cache.get(market_wallet, USDC_COMET_ADDRESS.lower()) is config
+    assert market_wallet.read_contract.call_count == 3
+
+    cache.observe(market_wallet, config, 110)
+    assert cache.get(market_wallet, USDC_COMET_ADDRESS) is config
+
+    market.block_number = 111
+    cache.observe(market_wallet, config, 111)
+    reloaded = cache.get(market_wallet, USDC_COMET_ADDRESS)
+    assert reloaded is not config and reloaded.block_number == 111
+    assert market_wallet.read_contract.call_count == 6
+
+    assert cache.refresh(market_wallet, USDC_COMET_ADDRESS) is not reloaded
+    assert market_wallet.read_contract.call_count == 9
+
+
+def test_get_portfolio_reuses_market_config(market, market_wallet):
+    """Test that repeated portfolio reads only read the position after the first one."""
+    provider = CompoundActionProvider()
+
+    first = provider.get_portfolio(market_wallet, {})
+    assert market_wallet.read_contract.call_count == 4
+
+    market.weth_price = 3000 * 10**8
+    second = provider.get_portfolio(market_wallet, {})
+
+    assert market_wallet.read_contract.call_count == 5
+    assert "### WETH\n- **Supply Amount:** 1.000000000000000000" in first
+    assert "- **Health Ratio:** 1.60" in first
+    assert "- **Health Ratio:** 2.40" in second
@@ -1,5 +1,7 @@
 from unittest.mock import patch
 
+from .conftest import market_config, market_position
+
 
 def test_get_portfolio_success(compound_wallet, compound_provider):
     """Test that the get_portfolio action returns the expected markdown details."""
@@ -16,7 +18,7 @@ def test_get_portfolio_success(compound_wallet, compound_provider):
 
         result = provider.get_portfolio(compound_wallet, input_args)
 
-        mock_get_portfolio_details.assert_called_once_with(compound_wallet, "0xComet")
+        mock_get_portfolio_details.assert_called_once_with(market_config(), market_position())
         assert result == "Portfolio Details Markdown"
 
 
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, call, patch
 
+from .conftest import market_config
+
 
 def test_repay_action_success(compound_wallet, compound_provider):
     """Test that the repay action in CompoundActionProvider successfully repays debt."""
@@ -10,9 +12,6 @@ def test_repay_action_success(compound_wallet, compound_provider):
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
         ) as mock_get_token_balance,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
@@ -22,9 +21,6 @@ def test_repay_action_success(compound_wallet, compound_provider):
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_symbol"
-        ) as mock_get_token_symbol,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
         ) as mock_web3,
@@ -32,11 +28,12 @@ def test_repay_action_success(compound_wallet, compound_provider):
         token_decimals = 6
         atomic_amount = 1000000000
         mock_get_token_balance.return_value = atomic_amount
-        mock_get_token_decimals.return_value = token_decimals
+        provider._get_market_config = lambda wallet, comet_address: market_config(
+            "USDC", token_decimals
+        )
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_format_amount_from_decimals.return_value = "1000"
         mock_get_health_ratio.side_effect = [1.5, 2.5]
-        mock_get_token_symbol.return_value = "USDC"
 
         fake_comet_contract = MagicMock()
         fake_comet_contract.encode_abi.return_value = "encoded_repay_data"
@@ -83,9 +80,6 @@ def test_repay_insufficient_balance(compound_wallet, compound_provider):
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
         ) as mock_get_token_balance,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
@@ -97,7 +91,9 @@ def test_repay_insufficient_balance(compound_wallet, compound_provider):
         repay_amount = 1000000000
         wallet_balance = 500000000
 
-        mock_get_token_decimals.return_value = token_decimals
+        provider._get_market_config = lambda wallet, comet_address: market_config(
+            "USDC", token_decimals
+        )
         mock_format_amount_with_decimals.return_value = repay_amount
         mock_get_token_balance.return_value = wallet_balance
         mock_format_amount_from_decimals.return_value = "500"
@@ -117,9 +113,6 @@ def test_repay_approval_failure(compound_wallet, compound_provider):
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
         ) as mock_get_token_balance,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
@@ -132,7 +125,9 @@ def test_repay_approval_failure(compound_wallet, compound_provider):
     ):
         token_decimals = 6
         atomic_amount = 1000000000
-        mock_get_token_decimals.return_value = token_decimals
+        provider._get_market_config = lambda wallet, comet_address: market_config(
+            "USDC", token_decimals
+        )
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_get_token_balance.return_value = atomic_amount * 2
         mock_get_health_ratio.return_value = 1.5
@@ -159,9 +154,6 @@ def test_repay_transaction_failure(compound_wallet, compound_provider):
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
         ) as mock_get_token_balance,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
@@ -174,7 +166,9 @@ def test_repay_transaction_failure(compound_wallet, compound_provider):
     ):
         token_decimals = 6
         atomic_amount = 1000000000
-        mock_get_token_decimals.return_value = token_decimals
+        provider._get_market_config = lambda wallet, comet_address: market_config(
+            "USDC", token_decimals
+        )
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_get_token_balance.return_value = atomic_amount * 2
         mock_get_health_ratio.return_value = 1.5
@@ -210,11 +204,10 @@ def test_repay_general_error(compound_wallet, compound_provider):
     provider = compound_provider
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
-    with patch(
-        "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-    ) as mock_get_token_decimals:
-        mock_get_token_decimals.side_effect = Exception("Unexpected error occurred")
+    def fail(wallet, comet_address):
+        raise Exception("Unexpected error occurred")
 
-        result = provider.repay(compound_wallet, input_args)
+    provider._get_market_config = fail
+    result = provider.repay(compound_wallet, input_args)
 
-        assert "Error repaying to Compound: Unexpected error occurred" in result
+    assert "Error repaying to Compound: Unexpected error occurred" in result
@@ -17,9 +17,6 @@ def test_supply_action_success(compound_wallet, compound_provider):
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_from_decimals"
         ) as mock_format_from_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_symbol"
-        ) as mock_get_token_symbol,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
         ) as mock_web3,
@@ -32,18 +29,13 @@ def test_supply_action_success(compound_wallet, compound_provider):
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
     ):
         # Setup mocks for utility functions
-        mock_get_token_decimals.return_value = 18
         atomic_amount = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_get_token_balance.return_value = atomic_amount
         # First call returns current health, second call returns new health
         mock_get_health_ratio.side_effect = [Decimal("2.0"), Decimal("3.0")]
-        mock_get_token_symbol.return_value = "WETH"
         mock_format_from_decimals.return_value = "1"
 
         fake_comet_contract = MagicMock()
@@ -90,9 +82,6 @@ def test_supply_insufficient_balance(compound_wallet, compound_provider):
     input_args = {"asset_id": "weth", "amount": "2"}
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
@@ -103,7 +92,6 @@ def test_supply_insufficient_balance(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_from_decimals"
         ) as mock_format_from_decimals,
     ):
-        mock_get_token_decimals.return_value = 18
         supply_amount = int(Decimal("2.0") * Decimal(10**18))
         wallet_balance = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = supply_amount
@@ -122,9 +110,6 @@ def test_supply_approval_failure(compound_wallet, compound_provider):
     input_args = {"asset_id": "weth", "amount": "1"}
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
@@ -138,7 +123,6 @@ def test_supply_approval_failure(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
         ) as mock_web3,
     ):
-        mock_get_token_decimals.return_value = 18
         atomic_amount = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_get_token_balance.return_value = atomic_amount * 2
@@ -162,9 +146,6 @@ def test_supply_transaction_failure(compound_wallet, compound_provider):
     input_args = {"asset_id": "weth", "amount": "1"}
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
@@ -178,7 +159,6 @@ def test_supply_transaction_failure(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
     ):
-        mock_get_token_decimals.return_value = 18
         atomic_amount = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_get_token_balance.return_value = atomic_amount * 2
@@ -214,11 +194,10 @@ def test_supply_general_error(compound_wallet, compound_provider):
     provider = compound_provider
     input_args = {"asset_id": "weth", "amount": "1"}
 
-    with patch(
-        "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-    ) as mock_get_token_decimals:
-        mock_get_token_decimals.side_effect = Exception("Unexpected error occurred")
+    def fail(wallet, comet_address):
+        raise Exception("Unexpected error occurred")
 
-        result = provider.supply(compound_wallet, input_args)
+    provider._get_market_config = fail
+    result = provider.supply(compound_wallet, input_args)
 
-        assert "Error supplying to Compound: Unexpected error occurred" in result
+    assert "Error supplying to Compound: Unexpected error occurred" in result
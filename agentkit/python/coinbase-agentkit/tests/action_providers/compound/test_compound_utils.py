@@ -3,18 +3,10 @@
 from decimal import Decimal
 from unittest.mock import MagicMock
 
-from coinbase_agentkit.action_providers.compound.constants import (
-    COMET_ABI,
-    PRICE_FEED_ABI,
-)
 from coinbase_agentkit.action_providers.compound.utils import (
     format_amount_from_decimals,
     format_amount_with_decimals,
-    get_collateral_balance,
-    get_price_feed_data,
     get_token_balance,
-    get_token_decimals,
-    get_token_symbol,
 )
 from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
 
@@ -39,76 +31,6 @@ def test_format_amount_from_decimals():
     assert format_amount_from_decimals(125, 2) == "1.25"
 
 
-def test_get_price_feed_data():
-    """Test that get_price_feed_data returns the values provided by the wallet.read_contract."""
-    # Create a mock wallet
-    mock_wallet = MagicMock()
-
-    # Set up the mock to return a tuple similar to latestRoundData
-    mock_wallet.read_contract.return_value = (0, 123456789, 0, 1617181920, 0)
-
-    price, updated_at = get_price_feed_data(mock_wallet, "0xDummyPriceFeed")
-
-    # Verify the correct method was called
-    mock_wallet.read_contract.assert_called_once_with(
-        "0xDummyPriceFeed", PRICE_FEED_ABI, "latestRoundData"
-    )
-
-    assert price == 123456789
-    assert updated_at == 1617181920
-
-
-def test_get_collateral_balance():
-    """Test that get_collateral_balance returns a dummy collateral balance."""
-    # Create a mock wallet with an address
-    mock_wallet = MagicMock()
-    mock_wallet.get_address.return_value = "0xDummyWallet"
-
-    # Set up the mock to return a balance
-    mock_wallet.read_contract.return_value = 5000
-
-    balance = get_collateral_balance(mock_wallet, "0xCompoundMarket", "0xAsset")
-
-    # Verify the correct method was called
-    mock_wallet.read_contract.assert_called_once_with(
-        "0xCompoundMarket", COMET_ABI, "collateralBalanceOf", args=["0xDummyWallet", "0xAsset"]
-    )
-
-    assert balance == 5000
-
-
-def test_get_token_decimals():
-    """Test that get_token_decimals returns a predetermined value."""
-    # Create a mock wallet
-    mock_wallet = MagicMock()
-
-    # Set up the mock to return decimals
-    mock_wallet.read_contract.return_value = 18
-
-    decimals = get_token_decimals(mock_wallet, "0xToken")
-
-    # Verify the correct method was called
-    mock_wallet.read_contract.assert_called_once_with("0xToken", ERC20_ABI, "decimals")
-
-    assert decimals == 18
-
-
-def test_get_token_symbol():
-    """Test that get_token_symbol returns a predetermined symbol."""
-    # Create a mock wallet
-    mock_wallet = MagicMock()
-
-    # Set up the mock to return a symbol
-    mock_wallet.read_contract.return_value = "WETH"
-
-    symbol = get_token_symbol(mock_wallet, "0xToken")
-
-    # Verify the correct method was called
-    mock_wallet.read_contract.assert_called_once_with("0xToken", ERC20_ABI, "symbol")
-
-    assert symbol == "WETH"
-
-
 def test_get_token_balance():
     """Test that get_token_balance returns a dummy balance."""
     # Create a mock wallet with a default address
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, patch
 
+from .conftest import market_config, market_position
+
 
 def test_withdraw_action_success(compound_wallet, compound_provider):
     """Test that the withdraw action in CompoundActionProvider successfully withdraws collateral."""
@@ -7,15 +9,9 @@ def test_withdraw_action_success(compound_wallet, compound_provider):
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_collateral_balance"
-        ) as mock_get_collateral_balance,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_from_decimals"
         ) as mock_format_amount_from_decimals,
@@ -25,22 +21,20 @@ def test_withdraw_action_success(compound_wallet, compound_provider):
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_symbol"
-        ) as mock_get_token_symbol,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
         ) as mock_web3,
     ):
         token_decimals = 6
         atomic_amount = 1000000000
-        mock_get_token_decimals.return_value = token_decimals
+        provider._get_market_config = lambda wallet, comet_address: market_config(
+            "USDC", token_decimals
+        )
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_collateral_balance.return_value = atomic_amount
+        provider._get_position = lambda wallet, config: market_position(atomic_amount)
         mock_format_amount_from_decimals.return_value = "1000"
         mock_get_health_ratio_after_withdraw.return_value = 1.5
         mock_get_health_ratio.side_effect = [2.0, 3.0]
-        mock_get_token_symbol.return_value = "USDC"
 
         fake_contract = MagicMock()
         fake_contract.encode_abi.return_value = "encoded_withdraw_data"
@@ -70,15 +64,9 @@ def test_withdraw_insufficient_collateral(compound_wallet, compound_provider):
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_collateral_balance"
-        ) as mock_get_collateral_balance,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_from_decimals"
         ) as mock_format_amount_from_decimals,
@@ -87,9 +75,11 @@ def test_withdraw_insufficient_collateral(compound_wallet, compound_provider):
         withdraw_amount = 1000000000  # 1000 USDC
         collateral_balance = 500000000  # Only 500 USDC supplied
 
-        mock_get_token_decimals.return_value = token_decimals
+        provider._get_market_config = lambda wallet, comet_address: market_config(
+            "USDC", token_decimals
+        )
         mock_format_amount_with_decimals.return_value = withdraw_amount
-        mock_get_collateral_balance.return_value = collateral_balance
+        provider._get_position = lambda wallet, config: market_position(collateral_balance)
         mock_format_amount_from_decimals.return_value = "500"
 
         result = provider.withdraw(compound_wallet, input_args)
@@ -104,24 +94,20 @@ def test_withdraw_unhealthy_position(compound_wallet, compound_provider):
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_collateral_balance"
-        ) as mock_get_collateral_balance,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_withdraw"
         ) as mock_get_health_ratio_after_withdraw,
     ):
         token_decimals = 6
         atomic_amount = 1000000000  # 1000 USDC
-        mock_get_token_decimals.return_value = token_decimals
+        provider._get_market_config = lambda wallet, comet_address: market_config(
+            "USDC", token_decimals
+        )
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_collateral_balance.return_value = atomic_amount * 2
+        provider._get_position = lambda wallet, config: market_position(atomic_amount * 2)
         mock_get_health_ratio_after_withdraw.return_value = 0.8
 
         result = provider.withdraw(compound_wallet, input_args)
@@ -136,15 +122,9 @@ def test_withdraw_transaction_failure(compound_wallet, compound_provider):
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_collateral_balance"
-        ) as mock_get_collateral_balance,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio_after_withdraw"
         ) as mock_get_health_ratio_after_withdraw,
@@ -157,9 +137,11 @@ def test_withdraw_transaction_failure(compound_wallet, compound_provider):
     ):
         token_decimals = 6
         atomic_amount = 1000000000
-        mock_get_token_decimals.return_value = token_decimals
+        provider._get_market_config = lambda wallet, comet_address: market_config(
+            "USDC", token_decimals
+        )
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_collateral_balance.return_value = atomic_amount * 2
+        provider._get_position = lambda wallet, config: market_position(atomic_amount * 2)
         mock_get_health_ratio_after_withdraw.return_value = 1.5
         mock_get_health_ratio.return_value = 2.0
 
@@ -180,11 +162,10 @@ def test_withdraw_general_error(compound_wallet, compound_provider):
     provider = compound_provider
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
-    with patch(
-        "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
-    ) as mock_get_token_decimals:
-        mock_get_token_decimals.side_effect = Exception("Unexpected error occurred")
+    def fail(wallet, comet_address):
+        raise Exception("Unexpected error occurred")
 
-        result = provider.withdraw(compound_wallet, input_args)
+    provider._get_market_config = fail
+    result = provider.withdraw(compound_wallet, input_args)
 
-        assert "Error withdrawing from Compound: Unexpected error occurred" in result
+    assert "Error withdrawing from Compound: Unexpected error occurred" in result
@@ -0,0 +1,65 @@
+"""Shared fixtures for action provider tests."""
+
+from collections.abc import Callable
+from typing import Any
+
+import eth_abi
+import pytest
+from eth_utils import function_abi_to_4byte_selector, get_abi_input_types, get_abi_output_types
+
+
+def make_aggregate3(
+    abis: list[list[dict[str, Any]]], respond: Callable[[str, str, tuple], Any]
+) -> Callable[[list[tuple[str, bool, bytes]]], list[tuple[bool, bytes]]]:
+    """Create a fake Multicall3 `aggregate3` answering each call with `respond`.
+
+    Args:
+        abis: The ABIs of the called contracts.
+        respond: Function returning the result of a call from its target, function name and
+            arguments. Raising makes the call fail.
+
+    Returns:
+        The fake, taking the calls and returning the `(success, returnData)` pairs.
+
+    """
+    functions = {
+        function_abi_to_4byte_selector(entry): entry
+        for abi in abis
+        for entry in abi
+        if entry.get("type") == "function"
+    }
+
+    def aggregate3(calls: list[tuple[str, bool, bytes]]) -> list[tuple[bool, bytes]]:
+        results = []
+        for target, _, data in calls:
+            entry = functions[data[:4]]
+            args = eth_abi.decode(get_abi_input_types(entry), data[4:])
+            try:
+                value = respond(target, entry["name"], args)
+            except Exception:
+                results.append((False, b""))
+                continue
+            output_types = get_abi_output_types(entry)
+            values = [value] if len(output_types) == 1 else list(value)
+            results.append((True, eth_abi.encode(output_types, values)))
+        return results
+
+    return aggregate3
+
+
+@pytest.fixture
+def multicall_reader():
+    """Create `read_contract` side effects serving multicalls through a fake `aggregate3`."""
+
+    def build(abis: list[list[dict[str, Any]]], respond: Callable[[str, str, tuple], Any]):
+        from coinbase_agentkit.wallet_providers.multicall import MULTICALL3_ABI
+
+        aggregate3 = make_aggregate3([MULTICALL3_ABI, *abis], respond)
+
+        def read_contract(contract_address, abi, function_name, args=None, block_identifier=None):
+            assert function_name == "aggregate3"
+            return aggregate3(args[0])
+
+        return read_contract
+
+    return build
@@ -1,6 +1,6 @@
 """Tests for the ERC20 action provider."""
 
-from unittest.mock import call
+from unittest.mock import Mock, call
 
 import pytest
 from web3 import Web3
@@ -9,10 +9,16 @@ from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
 from coinbase_agentkit.action_providers.erc20.erc20_action_provider import (
     erc20_action_provider,
 )
-from coinbase_agentkit.action_providers.erc20.schemas import GetBalanceSchema, TransferSchema
-from coinbase_agentkit.network import Network
+from coinbase_agentkit.action_providers.erc20.schemas import (
+    BatchTransferSchema,
+    GetBalanceSchema,
+    GetBalancesSchema,
+    TransferSchema,
+)
+from coinbase_agentkit.network import KNOWN_TOKENS, Network
 
 from .conftest import (
+    MOCK_ADDRESS,
     MOCK_AMOUNT,
     MOCK_CONTRACT_ADDRESS,
     MOCK_DECIMALS,
@@ -80,6 +86,73 @@ def test_get_balance_error(mock_wallet):
     assert f"Error getting balance: {error!s}" in response
 
 
+def test_get_balances_schema_valid():
+    """Test that the token list of GetBalancesSchema is optional."""
+    assert GetBalancesSchema().contract_addresses is None
+    schema = GetBalancesSchema(contract_addresses=[MOCK_CONTRACT_ADDRESS])
+    assert schema.contract_addresses == [MOCK_CONTRACT_ADDRESS]
+
+
+def respond_to_token_reads(target, function_name, args):
+    """Answer the reads of a USDC balance and a token whose balanceOf reverts."""
+    if target == MOCK_DESTINATION and function_name == "balanceOf":
+        raise Exception("execution reverted")
+    return {"balanceOf": 2_500_000, "decimals": MOCK_DECIMALS, "symbol": "USDC"}[function_name]
+
+
+def test_get_balances_success(mock_wallet, multicall_reader):
+    """Test that all token balances are read in a single multicall."""
+    mock_wallet.get_network.return_value = Network(protocol_family="evm", network_id="base-sepolia")
+    mock_wallet.read_contract.side_effect = multicall_reader([ERC20_ABI], respond_to_token_reads)
+    args = {"contract_addresses": [MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION.lower()]}
+
+    response = erc20_action_provider().get_balances(mock_wallet, args)
+
+    assert mock_wallet.read_contract.call_count == 1
+    assert response == (
+        f"Balances of {MOCK_ADDRESS} on base-sepolia:\n"
+        "| Token | Balance | Contract address |\n"
+        "| --- | --- | --- |\n"
+        f"| USDC | 2.5 | {MOCK_CONTRACT_ADDRESS} |\n"
+        f"| USDC | error: balanceOf reverted | {MOCK_DESTINATION} |"
+    )
+
+
+def test_get_balances_defaults_to_known_tokens(mock_wallet, multicall_reader):
+    """Test that the well-known tokens of the network are read when none are given."""
+    mock_wallet.get_network.return_value = Network(protocol_family="evm", network_id="base-mainnet")
+    mock_wallet.read_contract.side_effect = multicall_reader([ERC20_ABI], respond_to_token_reads)
+
+    response = erc20_action_provider().get_balances(mock_wallet, {})
+
+    (aggregate,) = mock_wallet.read_contract.call_args_list
+    targets = {target for target, _, _ in aggregate.kwargs["args"][0]}
+    assert targets == set(KNOWN_TOKENS["base-mainnet"].values())
+    assert response.count("| USDC | 2.5 |") == len(KNOWN_TOKENS["base-mainnet"])
+
+
+def test_get_balances_without_known_tokens(mock_wallet):
+    """Test that a network without known tokens needs a token list."""
+    mock_wallet.get_network.return_value = Network(protocol_family="evm", network_id="unknown")
+
+    response = erc20_action_provider().get_balances(mock_wallet, {})
+
+    assert response == "No contract addresses given and no known tokens on unknown"
+    mock_wallet.read_contract.assert_not_called()
+
+
+def test_get_balances_error(mock_wallet):
+    """Test that a failing multicall is reported."""
+    mock_wallet.get_network.return_value = Network(protocol_family="evm", network_id="base-sepolia")
+    mock_wallet.read_contract.side_effect = Exception("RPC unavailable")
+
+    response = erc20_action_provider().get_balances(
+        mock_wallet, {"contract_addresses": [MOCK_CONTRACT_ADDRESS]}
+    )
+
+    assert response == "Error getting balances: RPC unavailable"
+
+
 def test_transfer_schema_valid():
     """Test that the TransferSchema validates correctly."""
     valid_input = {
@@ -152,6 +225,118 @@ def test_transfer_error(mock_wallet):
     assert f"Error transferring the asset: {error!s}" in response
 
 
+RECIPIENTS = [
+    "0x1111111111111111111111111111111111111111",
+    "0x2222222222222222222222222222222222222222",
+    "0x3333333333333333333333333333333333333333",
+]
+
+
+def batch_args() -> dict:
+    """Create batch transfer arguments paying 100, 200 and 300 wei."""
+    return {
+        "contract_address": MOCK_CONTRACT_ADDRESS,
+        "transfers": [
+            {"destination": recipient, "amount": str(100 * (i + 1))}
+            for i, recipient in enumerate(RECIPIENTS)
+        ],
+    }
+
+
+def test_batch_transfer_schema():
+    """Test that batch transfers need at least one valid transfer."""
+    assert len(BatchTransferSchema(**batch_args()).transfers) == 3
+    with pytest.raises(ValueError):
+        BatchTransferSchema(contract_address=MOCK_CONTRACT_ADDRESS, transfers=[])
+    with pytest.raises(ValueError):
+        BatchTransferSchema(
+            contract_address=MOCK_CONTRACT_ADDRESS,
+            transfers=[{"destination": MOCK_DESTINATION, "amount": "1.5"}],
+        )
+
+
+def test_batch_transfer_submits_all_before_waiting(mock_wallet):
+    """Test that transfers are submitted with consecutive nonces before receipts are awaited."""
+    mock_wallet.get_transaction_count.return_value = 7
+    mock_wallet.send_transaction.side_effect = ["0xa", "0xb", "0xc"]
+    mock_wallet.wait_for_transaction_receipt.side_effect = [
+        {"status": 1},
+        {"status": 0},
+        {"status": 1},
+    ]
+
+    response = erc20_action_provider().batch_transfer(mock_wallet, batch_args())
+
+    submission = [
+        c[0]
+        for c in mock_wallet.mock_calls
+        if c[0] in ("get_transaction_count", "send_transaction", "wait_for_transaction_receipt")
+    ]
+    assert (
+        submission
+        == ["get_transaction_count"]
+        + ["send_transaction"] * 3
+        + ["wait_for_transaction_receipt"] * 3
+    )
+    assert [c.args[0]["nonce"] for c in mock_wallet.send_transaction.call_args_list] == [7, 8, 9]
+    contract = Web3().eth.contract(address=MOCK_CONTRACT_ADDRESS, abi=ERC20_ABI)
+    assert mock_wallet.send_transaction.call_args_list[1].args[0]["data"] == contract.encode_abi(
+        "transfer", [RECIPIENTS[1], 200]
+    )
+    assert response == (
+        f"Batch transfer of {MOCK_CONTRACT_ADDRESS}: 2 of 3 transfers confirmed.\n"
+        f"- 100 to {RECIPIENTS[0]}: confirmed (tx 0xa)\n"
+        f"- 200 to {RECIPIENTS[1]}: reverted (tx 0xb)\n"
+        f"- 300 to {RECIPIENTS[2]}: confirmed (tx 0xc)"
+    )
+
+
+def test_batch_transfer_stops_after_failed_submission(mock_wallet):
+    """Test that transfers after a failed submission are not sent, leaving no nonce gap."""
+    mock_wallet.get_transaction_count.return_value = 7
+    mock_wallet.send_transaction.side_effect = ["0xa", Exception("insufficient funds")]
+    mock_wallet.wait_for_transaction_receipt.return_value = {"status": 1}
+
+    response = erc20_action_provider().batch_transfer(mock_wallet, batch_args())
+
+    assert mock_wallet.send_transaction.call_count == 2
+    assert response.splitlines()[1:] == [
+        f"- 100 to {RECIPIENTS[0]}: confirmed (tx 0xa)",
+        f"- 200 to {RECIPIENTS[1]}: failed (insufficient funds)",
+        f"- 300 to {RECIPIENTS[2]}: not sent",
+    ]
+
+
+def test_batch_transfer_without_nonce_support(mock_wallet):
+    """Test that wallets without caller-managed nonces confirm each transfer in turn."""
+    mock_wallet.get_transaction_count.side_effect = NotImplementedError
+    mock_wallet.send_transaction.side_effect = ["0xa", "0xb", "0xc"]
+    mock_wallet.wait_for_transaction_receipt.return_value = {"status": 1}
+
+    response = erc20_action_provider().batch_transfer(mock_wallet, batch_args())
+
+    sends_and_waits = [
+        c[0]
+        for c in mock_wallet.mock_calls
+        if c[0] in ("send_transaction", "wait_for_transaction_receipt")
+    ]
+    assert sends_and_waits == ["send_transaction", "wait_for_transaction_receipt"] * 3
+    assert "nonce" not in mock_wallet.send_transaction.call_args.args[0]
+    assert response.startswith(f"Batch transfer of {MOCK_CONTRACT_ADDRESS}: 3 of 3")
+
+
+def test_batch_transfer_smart_wallet_uses_one_user_operation(mock_wallet):
+    """Test that smart wallets send every transfer in a single user operation."""
+    mock_wallet.send_user_operation = Mock(return_value="0xop")
+
+    response = erc20_action_provider().batch_transfer(mock_wallet, batch_args())
+
+    (calls,) = mock_wallet.send_user_operation.call_args.args
+    assert [c.to for c in calls] == [MOCK_CONTRACT_ADDRESS] * 3
+    mock_wallet.send_transaction.assert_not_called()
+    assert response.count("confirmed (tx 0xop)") == 3
+
+
 def test_supports_network():
     """Test network support based on protocol family."""
     test_cases = [
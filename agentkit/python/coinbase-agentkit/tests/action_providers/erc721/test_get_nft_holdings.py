@@ -0,0 +1,150 @@
+"""Tests for listing the NFTs held across collections."""
+
+from coinbase_agentkit.action_providers.erc721.constants import (
+    ERC721_ABI,
+    ERC721_ENUMERABLE_ABI,
+    TRANSFER_EVENT_TOPIC,
+)
+from coinbase_agentkit.action_providers.erc721.erc721_action_provider import Erc721ActionProvider
+from coinbase_agentkit.action_providers.erc721.schemas import GetNftHoldingsSchema
+
+from .conftest import MOCK_ADDRESS, MOCK_CONTRACT
+
+ENUMERABLE = MOCK_CONTRACT
+PLAIN = "0x2222222222222222222222222222222222222222"
+OWNER_TOPIC = "0x" + MOCK_ADDRESS[2:].rjust(64, "0")
+
+
+def transfer_log(token_id: int) -> dict:
+    """Create an ERC721 Transfer log of a token to the wallet."""
+    return {
+        "topics": [
+            TRANSFER_EVENT_TOPIC,
+            "0x" + "0" * 64,
+            OWNER_TOPIC,
+            "0x" + hex(token_id)[2:].rjust(64, "0"),
+        ]
+    }
+
+
+def respond(target, function_name, args):
+    """Answer for an enumerable collection holding tokens 7 and 9, and a plain one holding 3."""
+    if function_name == "getBlockNumber":
+        return 1_000
+    if function_name == "balanceOf":
+        return 2 if target == ENUMERABLE else 1
+    if function_name == "supportsInterface":
+        return target == ENUMERABLE
+    if function_name == "tokenOfOwnerByIndex":
+        return [7, 9][args[1]]
+    if function_name == "ownerOf":
+        if args[0] == 3:
+            return MOCK_ADDRESS
+        return "0x9876543210987654321098765432109876543210"
+    raise AssertionError(function_name)
+
+
+def test_get_nft_holdings_schema():
+    """Test that at least one collection is required."""
+    schema = GetNftHoldingsSchema(contract_addresses=[MOCK_CONTRACT])
+    assert schema.address is None
+    try:
+        GetNftHoldingsSchema(contract_addresses=[])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("empty contract_addresses accepted")
+
+
+def test_get_nft_holdings_enumerates_and_scans_logs(mock_wallet_provider, multicall_reader):
+    """Test that enumerable collections are batched and other ones are found from logs."""
+    mock_wallet_provider.read_contract.side_effect = multicall_reader(
+        [ERC721_ABI, ERC721_ENUMERABLE_ABI], respond
+    )
+    mock_wallet_provider.get_logs.side_effect = [
+        [{"topics": [TRANSFER_EVENT_TOPIC, "0x" + "0" * 64, OWNER_TOPIC]}],
+        [transfer_log(3), transfer_log(4), transfer_log(3)],
+    ]
+    provider = Erc721ActionProvider(log_chunk_size=100)
+
+    result = provider.get_nft_holdings(
+        mock_wallet_provider, {"contract_addresses": [ENUMERABLE, PLAIN]}
+    )
+
+    assert result == (
+        f"NFT holdings of {MOCK_ADDRESS} at block 1000:\n"
+        f"- {ENUMERABLE}: 2 tokens: 7, 9\n"
+        f"- {PLAIN}: 1 tokens: 3"
+    )
+    # Balances, ownerOf of the logged tokens and the enumeration; the empty chunk is not checked.
+    assert mock_wallet_provider.read_contract.call_count == 3
+    filters = [c.args[0] for c in mock_wallet_provider.get_logs.call_args_list]
+    assert [(f["fromBlock"], f["toBlock"]) for f in filters] == [(901, 1000), (801, 900)]
+    assert filters[0]["address"] == PLAIN
+    assert filters[0]["topics"] == [TRANSFER_EVENT_TOPIC, None, OWNER_TOPIC]
+    for c in mock_wallet_provider.read_contract.call_args_list[1:]:
+        assert c.kwargs["block_identifier"] == 1000
+
+
+def test_get_nft_holdings_stops_scanning_at_limit(mock_wallet_provider, multicall_reader):
+    """Test that the log scan reports how far back it looked when tokens are missing."""
+    mock_wallet_provider.read_contract.side_effect = multicall_reader([ERC721_ABI], respond)
+    mock_wallet_provider.get_logs.return_value = []
+    provider = Erc721ActionProvider(log_chunk_size=100, max_log_blocks=250)
+
+    result = provider.get_nft_holdings(mock_wallet_provider, {"contract_addresses": [PLAIN]})
+
+    assert result.endswith(f"- {PLAIN}: 1 tokens, 0 found in Transfer logs of the last 250 blocks")
+    filters = [c.args[0] for c in mock_wallet_provider.get_logs.call_args_list]
+    assert [(f["fromBlock"], f["toBlock"]) for f in filters] == [
+        (901, 1000),
+        (801, 900),
+        (751, 800),
+    ]
+
+
+def test_get_nft_holdings_caches_per_block(mock_wallet_provider, multicall_reader):
+    """Test that holdings read at the same block are not read again."""
+    mock_wallet_provider.read_contract.side_effect = multicall_reader(
+        [ERC721_ABI, ERC721_ENUMERABLE_ABI], respond
+    )
+    provider = Erc721ActionProvider()
+    args = {"contract_addresses": [ENUMERABLE]}
+
+    first = provider.get_nft_holdings(mock_wallet_provider, args)
+    second = provider.get_nft_holdings(mock_wallet_provider, args)
+
+    assert first == second
+    # The second read only fetches the block number and balances.
+    assert mock_wallet_provider.read_contract.call_count == 3
+
+
+def test_get_nft_holdings_reports_collection_errors(mock_wallet_provider, multicall_reader):
+    """Test that a failing collection does not fail the others."""
+
+    def failing(target, function_name, args):
+        if target == PLAIN and function_name == "balanceOf":
+            raise ValueError("not an ERC721")
+        return respond(target, function_name, args)
+
+    mock_wallet_provider.read_contract.side_effect = multicall_reader(
+        [ERC721_ABI, ERC721_ENUMERABLE_ABI], failing
+    )
+
+    result = Erc721ActionProvider().get_nft_holdings(
+        mock_wallet_provider, {"contract_addresses": [ENUMERABLE, PLAIN]}
+    )
+
+    assert f"- {ENUMERABLE}: 2 tokens: 7, 9" in result
+    assert f"- {PLAIN}: error: balanceOf reverted" in result
+
+
+def test_get_nft_holdings_error(mock_wallet_provider):
+    """Test that read failures are returned as an error message."""
+    mock_wallet_provider.read_contract.side_effect = Exception("RPC unavailable")
+
+    result = Erc721ActionProvider().get_nft_holdings(
+        mock_wallet_provider, {"contract_addresses": [ENUMERABLE]}
+    )
+
+    assert result == "Error getting NFT holdings: RPC unavailable"
@@ -0,0 +1,115 @@
+"""Tests for the Hyperbolic AI response cache."""
+
+from unittest.mock import patch
+
+from coinbase_agentkit.action_providers.hyperboliclabs.ai.action_provider import AIActionProvider
+from coinbase_agentkit.action_providers.hyperboliclabs.ai.cache import (
+    ResponseCache,
+    request_cache_key,
+)
+from coinbase_agentkit.action_providers.hyperboliclabs.ai.service import AIService
+from coinbase_agentkit.action_providers.hyperboliclabs.ai.types import (
+    ChatCompletionRequest,
+    ChatMessage,
+)
+
+MODEL = "meta-llama/Meta-Llama-3-70B-Instruct"
+
+RESPONSE = {
+    "id": "chat-12345",
+    "object": "chat.completion",
+    "created": 1677858242,
+    "model": MODEL,
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "4"},
+            "finish_reason": "stop",
+        }
+    ],
+}
+
+
+def chat_request(**kwargs):
+    """Create a chat completion request."""
+    return ChatCompletionRequest(
+        messages=[ChatMessage(role="user", content="What is 2+2?")], model=MODEL, **kwargs
+    )
+
+
+def test_request_cache_key_ignores_cache_ttl():
+    """Test that the content address only covers what is sent to the API."""
+    key = request_cache_key("chat", chat_request(temperature=0, cache_ttl=60))
+
+    assert key == request_cache_key("chat", chat_request(temperature=0, cache_ttl=5))
+    assert key != request_cache_key("chat", chat_request(temperature=0, seed=1, cache_ttl=60))
+    assert key != request_cache_key("image", chat_request(temperature=0, cache_ttl=60))
+    assert "cache_ttl" not in chat_request(cache_ttl=60).model_dump()
+
+
+def test_memory_tier_evicts_least_recently_used():
+    """Test that the memory tier is bounded by its number of entries."""
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", {"v": "a"}, ttl=60)
+    cache.set("b", {"v": "b"}, ttl=60)
+    cache.get("a")
+    cache.set("c", {"v": "c"}, ttl=60)
+
+    assert cache.get("a") == {"v": "a"}
+    assert cache.get("b") is None
+    assert cache.get("c") == {"v": "c"}
+
+
+def test_disk_tier_survives_memory(tmp_path):
+    """Test that entries are served from disk by a new cache and expire."""
+    ResponseCache(directory=str(tmp_path)).set("a", {"v": "a"}, ttl=60)
+    ResponseCache(directory=str(tmp_path)).set("b", {"v": "b"}, ttl=60)
+
+    with patch("time.time", return_value=0):
+        ResponseCache(directory=str(tmp_path)).set("expired", {"v": "x"}, ttl=1)
+
+    cache = ResponseCache(max_entries=1, directory=str(tmp_path))
+    assert cache.get("a") == {"v": "a"}
+    assert cache.get("b") == {"v": "b"}
+    assert cache.get("expired") is None
+    assert not (tmp_path / "expired.json").exists()
+
+
+def test_service_caches_deterministic_requests(mock_request, mock_api_key):
+    """Test that only deterministic requests with a TTL are served from the cache."""
+    service = AIService(mock_api_key, cache=ResponseCache())
+    mock_request.return_value.json.return_value = RESPONSE
+
+    first = service.generate_text(chat_request(temperature=0, cache_ttl=60))
+    second = service.generate_text(chat_request(temperature=0, cache_ttl=60))
+
+    assert first == second
+    assert mock_request.call_count == 1
+    assert "cache_ttl" not in mock_request.call_args.kwargs["json"]
+
+    service.generate_text(chat_request(temperature=0.7, cache_ttl=60))
+    service.generate_text(chat_request(temperature=0))
+    assert mock_request.call_count == 3
+
+
+def test_generate_text_action_uses_response_cache(mock_request, mock_api_key, tmp_path):
+    """Test that the generate_text action reaches the cache through its arguments."""
+    with patch(
+        "coinbase_agentkit.action_providers.hyperboliclabs.ai.action_provider.create_session",
+        return_value=None,
+    ):
+        provider = AIActionProvider(api_key=mock_api_key, response_cache=ResponseCache())
+    mock_request.return_value.json.return_value = RESPONSE
+    args = {"prompt": "What is 2+2?", "temperature": 0, "cache_ttl": 60}
+
+    with patch(
+        "coinbase_agentkit.action_providers.hyperboliclabs.ai.action_provider.save_text",
+        return_value=str(tmp_path / "text.txt"),
+    ):
+        first = provider.generate_text(args)
+        second = provider.generate_text(args)
+
+    assert "Text generation successful" in first
+    assert "Text generation successful" in second
+    assert mock_request.call_count == 1
+    assert mock_request.call_args.kwargs["json"]["temperature"] == 0
@@ -0,0 +1,120 @@
+"""Tests for the batch generation actions in HyperbolicAIActionProvider."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from coinbase_agentkit.action_providers.hyperboliclabs.ai.schemas import (
+    GenerateImagesSchema,
+    GenerateTextsSchema,
+)
+from coinbase_agentkit.action_providers.hyperboliclabs.ai.types import (
+    ChatCompletionResponse,
+    ChatCompletionResponseChoice,
+    ChatCompletionResponseMessage,
+    GeneratedImage,
+    ImageGenerationResponse,
+)
+
+
+def text_response(content):
+    """Create a chat completion response with the given content."""
+    return ChatCompletionResponse(
+        id="chat-12345",
+        object="chat.completion",
+        created=1677858242,
+        model="meta-llama/Meta-Llama-3-70B-Instruct",
+        choices=[
+            ChatCompletionResponseChoice(
+                index=0,
+                message=ChatCompletionResponseMessage(role="assistant", content=content),
+                finish_reason="stop",
+            )
+        ],
+    )
+
+
+def test_generate_texts_in_order_with_errors(provider, mock_ai_service):
+    """Test that batch text results keep prompt order and report per-item errors."""
+
+    def generate_text(request):
+        prompt = request.messages[-1].content
+        if prompt == "bad":
+            raise Exception("API error")
+        return text_response(f"answer to {prompt}")
+
+    mock_ai_service.generate_text.side_effect = generate_text
+
+    with patch(
+        "coinbase_agentkit.action_providers.hyperboliclabs.ai.action_provider.save_text",
+        side_effect=lambda text, path: f"/tmp/{text}.txt",
+    ):
+        result = provider.generate_texts(
+            {"prompts": ["one", "bad", "three"], "system_prompt": "Be brief."}
+        )
+
+    lines = result.splitlines()
+    assert lines[0] == "Batch text generation: 2/3 succeeded"
+    assert lines[1].startswith("Latency: total ")
+    assert "1. Saved to: /tmp/answer to one.txt" in lines
+    assert "   Preview: answer to one" in lines
+    assert "2. Error: API error" in lines
+    assert "3. Saved to: /tmp/answer to three.txt" in lines
+
+    requests = [call.args[0] for call in mock_ai_service.generate_text.call_args_list]
+    assert all(request.messages[0].content == "Be brief." for request in requests)
+
+
+def test_generate_texts_leaves_no_threads(provider, mock_ai_service):
+    """Test that the threads of a batch are shut down once it completes."""
+    mock_ai_service.generate_text.return_value = text_response("answer")
+
+    with patch(
+        "coinbase_agentkit.action_providers.hyperboliclabs.ai.action_provider.save_text",
+        return_value="/tmp/answer.txt",
+    ):
+        provider.generate_texts({"prompts": ["one", "two"]})
+
+    assert not [t for t in threading.enumerate() if t.name.startswith("hyperbolic-")]
+
+
+def test_generate_images_in_order(provider, mock_ai_service):
+    """Test that batch image results keep prompt order."""
+    mock_ai_service.generate_image.side_effect = lambda request: ImageGenerationResponse(
+        images=[GeneratedImage(image=request.prompt, random_seed=1, index=0)]
+    )
+
+    with patch(
+        "coinbase_agentkit.action_providers.hyperboliclabs.ai.action_provider.save_base64_data",
+        side_effect=lambda data, path: f"/tmp/{data}.png",
+    ):
+        result = provider.generate_images({"prompts": ["cat", "dog"], "steps": 20})
+
+    lines = result.splitlines()
+    assert lines[0] == "Batch image generation: 2/2 succeeded"
+    assert lines[-2:] == ["1. Saved to: /tmp/cat.png", "2. Saved to: /tmp/dog.png"]
+    assert all(call.args[0].steps == 20 for call in mock_ai_service.generate_image.call_args_list)
+
+
+def test_generate_images_empty_response(provider, mock_ai_service):
+    """Test that a prompt without images is reported as an error."""
+    mock_ai_service.generate_image.return_value = ImageGenerationResponse(images=[])
+
+    result = provider.generate_images({"prompts": ["cat"]})
+
+    assert "Batch image generation: 0/1 succeeded" in result
+    assert "1. Error: Generation failed: No images were generated." in result
+
+
+def test_batch_schema_validation():
+    """Test schema validation for the batch actions."""
+    assert GenerateTextsSchema(prompts=["a"]).model == "meta-llama/Meta-Llama-3-70B-Instruct"
+    assert GenerateImagesSchema(prompts=["a"]).num_images == 1
+
+    with pytest.raises(ValidationError):
+        GenerateTextsSchema(prompts=[])
+
+    with pytest.raises(ValidationError):
+        GenerateImagesSchema(prompts=["a"] * 9)
@@ -1,5 +1,7 @@
 """Unit tests for Hyperbolic AI service."""
 
+import json
+
 import pytest
 import requests
 
@@ -14,6 +16,8 @@ from coinbase_agentkit.action_providers.hyperboliclabs.constants import (
     AI_SERVICES_BASE_URL,
     SUPPORTED_IMAGE_MODELS,
 )
+from coinbase_agentkit.instrumentation import action_trace
+from coinbase_agentkit.instrumentation.tracing import TIME_TO_FIRST_TOKEN
 
 
 def test_ai_service_init(mock_api_key):
@@ -212,3 +216,97 @@ def test_ai_image_generation_invalid_model(mock_api_key):
 
     with pytest.raises(ValueError, match="Model InvalidModel not supported"):
         service.generate_image(request)
+
+
+def sse_lines(*payloads):
+    """Encode chat completion chunks as server-sent event lines."""
+    lines = [": keep-alive", ""]
+    for payload in payloads:
+        lines += [f"data: {json.dumps(payload)}", ""]
+    return [*lines, "data: [DONE]", ""]
+
+
+def chunk(content=None, role=None, finish_reason=None, usage=None):
+    """Create a streamed chat completion chunk."""
+    delta = {k: v for k, v in {"role": role, "content": content}.items() if v is not None}
+    payload = {
+        "id": "chat-12345",
+        "object": "chat.completion.chunk",
+        "created": 1677858242,
+        "model": "meta-llama/Meta-Llama-3-70B-Instruct",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    if usage:
+        payload["usage"] = usage
+    return payload
+
+
+STREAM = sse_lines(
+    chunk(role="assistant"),
+    chunk("Hello"),
+    chunk(", world"),
+    chunk(
+        finish_reason="stop", usage={"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}
+    ),
+)
+
+
+def test_ai_text_streaming(mock_request, mock_api_key):
+    """Test that streamed completions yield token deltas and aggregate a response."""
+    service = AIService(mock_api_key)
+    mock_request.return_value.iter_lines.return_value = iter(STREAM)
+
+    request = ChatCompletionRequest(
+        messages=[ChatMessage(role="user", content="Test prompt")],
+        model="meta-llama/Meta-Llama-3-70B-Instruct",
+    )
+    with action_trace("test") as trace:
+        stream = service.stream_text(request)
+        tokens = list(stream)
+
+    assert tokens == ["Hello", ", world"]
+    assert mock_request.call_args.kwargs["stream"] is True
+    assert mock_request.call_args.kwargs["json"]["stream"] is True
+
+    response = stream.response
+    assert response.choices[0].message.role == "assistant"
+    assert response.choices[0].message.content == "Hello, world"
+    assert response.choices[0].finish_reason == "stop"
+    assert response.usage.total_tokens == 5
+
+    assert stream.time_to_first_token is not None
+    assert trace.count(TIME_TO_FIRST_TOKEN) == 1
+    mock_request.return_value.close.assert_called()
+
+
+def test_ai_text_generation_with_stream_flag(mock_request, mock_api_key):
+    """Test that generate_text aggregates the stream when streaming is requested."""
+    service = AIService(mock_api_key)
+    mock_request.return_value.iter_lines.return_value = iter(STREAM)
+
+    request = ChatCompletionRequest(
+        messages=[ChatMessage(role="user", content="Test prompt")],
+        model="meta-llama/Meta-Llama-3-70B-Instruct",
+        stream=True,
+    )
+    response = service.generate_text(request)
+
+    assert response.choices[0].message.content == "Hello, world"
+    mock_request.return_value.json.assert_not_called()
+
+
+def test_ai_text_streaming_error_event(mock_request, mock_api_key):
+    """Test that errors reported mid-stream are raised."""
+    service = AIService(mock_api_key)
+    mock_request.return_value.iter_lines.return_value = iter(
+        [*sse_lines(chunk("Hel"))[:-2], 'data: {"error": {"message": "overloaded"}}', ""]
+    )
+
+    request = ChatCompletionRequest(
+        messages=[ChatMessage(role="user", content="Test prompt")],
+        model="meta-llama/Meta-Llama-3-70B-Instruct",
+    )
+    stream = service.stream_text(request)
+
+    with pytest.raises(ValueError, match="Stream error: overloaded"):
+        list(stream)
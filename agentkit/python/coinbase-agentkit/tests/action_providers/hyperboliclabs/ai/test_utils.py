@@ -0,0 +1,44 @@
+"""Tests for Hyperbolic AI utility functions."""
+
+import base64
+import os
+
+import pytest
+
+from coinbase_agentkit.action_providers.hyperboliclabs.ai.utils import (
+    iter_base64_decode,
+    save_base64_data,
+)
+
+DATA = os.urandom(10_003)
+ENCODED = base64.b64encode(DATA).decode()
+
+
+@pytest.mark.parametrize("chunk_size", [4, 7, 1024, 1 << 20])
+def test_iter_base64_decode_chunks(chunk_size):
+    """Test that chunked decoding matches decoding the whole payload."""
+    wrapped = "\n".join(ENCODED[i : i + 76] for i in range(0, len(ENCODED), 76))
+
+    assert b"".join(iter_base64_decode(ENCODED, chunk_size)) == DATA
+    assert b"".join(iter_base64_decode(wrapped, chunk_size)) == DATA
+    assert b"".join(iter_base64_decode(f"data:image/png;base64,{ENCODED}", chunk_size)) == DATA
+
+
+def test_save_base64_data(tmp_path):
+    """Test that base64 data is decoded into the output file."""
+    output_path = tmp_path / "nested" / "image.png"
+
+    result = save_base64_data(ENCODED, str(output_path))
+
+    assert result == str(output_path.resolve())
+    assert output_path.read_bytes() == DATA
+
+
+def test_save_base64_data_invalid(tmp_path):
+    """Test that invalid base64 data raises and leaves no partial file behind."""
+    output_path = tmp_path / "image.png"
+
+    with pytest.raises(ValueError, match="Invalid base64 data"):
+        save_base64_data(ENCODED[:-1], str(output_path))
+
+    assert not output_path.exists()
@@ -0,0 +1,103 @@
+"""Tests for the incremental Hyperbolic spend rollup."""
+
+from unittest.mock import Mock
+
+from coinbase_agentkit.action_providers.hyperboliclabs.billing.action_provider import (
+    BillingActionProvider,
+)
+from coinbase_agentkit.action_providers.hyperboliclabs.billing.rollup import (
+    SpendRollup,
+    load_rollup,
+    save_rollup,
+)
+from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.types import (
+    GpuHardware,
+    HardwareInfo,
+    InstanceHistoryEntry,
+    InstanceHistoryResponse,
+    Price,
+)
+
+
+def rental(name, model, started_at, terminated_at, amount=100.0, gpu_count=1):
+    """Create a rental history entry."""
+    return InstanceHistoryEntry(
+        instance_name=name,
+        started_at=started_at,
+        terminated_at=terminated_at,
+        gpu_count=gpu_count,
+        hardware=HardwareInfo(gpus=[GpuHardware(hardware_type="gpu", model=model)]),
+        price=Price(amount=amount, period="hourly"),
+    )
+
+
+JAN = rental("a", "NVIDIA-H100", "2025-01-31T22:00:00Z", "2025-01-31T23:00:00Z")
+FEB = rental("b", "NVIDIA-A100", "2025-02-01T10:00:00Z", "2025-02-01T12:00:00Z", amount=50.0)
+RUNNING = rental("c", "NVIDIA-H100", "2025-02-02T10:00:00Z", None)
+
+
+def test_rollup_folds_each_rental_once():
+    """Test that only rentals completed after the watermark are folded in."""
+    rollup = SpendRollup()
+
+    assert rollup.update([JAN, RUNNING]) == 1
+    assert rollup.update([FEB, JAN, RUNNING]) == 1
+    assert rollup.update([FEB, JAN]) == 0
+
+    assert rollup.rental_count == 2
+    assert rollup.total_cost == 2.0
+    assert rollup.watermark == "2025-02-01T12:00:00+00:00"
+
+
+def test_rollup_keeps_rentals_terminated_at_the_watermark():
+    """Test that a rental sharing the watermark timestamp is still folded in once."""
+    twin = rental("twin", "NVIDIA-A100", "2025-02-01T11:00:00Z", FEB.terminated_at)
+    rollup = SpendRollup()
+
+    rollup.update([FEB])
+    assert rollup.update([twin, FEB]) == 1
+    assert rollup.update([twin, FEB]) == 0
+
+
+def test_rollup_queries():
+    """Test spend by model and by period."""
+    rollup = SpendRollup()
+    rollup.update([FEB, JAN])
+
+    assert [model for model, _ in rollup.spend_by_model()] == ["NVIDIA-A100", "NVIDIA-H100"]
+    assert rollup.spend_by_period("month") == {"2025-01": 1.0, "2025-02": 1.0}
+    assert rollup.spend_by_period("year") == {"2025": 2.0}
+
+
+def test_rollup_persistence(tmp_path):
+    """Test that a persisted rollup is reloaded only for the same account."""
+    path = str(tmp_path / "spend.json")
+    rollup = SpendRollup(account="acct")
+    rollup.update([JAN])
+    save_rollup(rollup, path)
+
+    assert load_rollup(path, "acct") == rollup
+    assert load_rollup(path, "other").rental_count == 0
+
+
+def test_get_spend_breakdown(mock_api_key, tmp_path):
+    """Test the spend breakdown action and its persisted rollup."""
+    path = str(tmp_path / "spend.json")
+    provider = BillingActionProvider(api_key=mock_api_key, spend_rollup_path=path)
+    provider.marketplace.get_instance_history = Mock(
+        return_value=InstanceHistoryResponse(instance_history=[FEB, JAN, RUNNING])
+    )
+
+    result = provider.get_spend_breakdown({"group_by": "month"})
+
+    assert "Spend by month:" in result
+    assert "- 2025-01: $1.00" in result
+    assert "- 2025-02: $1.00" in result
+    assert "Total Spending: $2.00 over 2 rentals" in result
+
+    restarted = BillingActionProvider(api_key=mock_api_key, spend_rollup_path=path)
+    restarted.marketplace.get_instance_history = provider.marketplace.get_instance_history
+    result = restarted.get_spend_breakdown({"group_by": "model"})
+
+    assert "- NVIDIA-A100: $1.00 (7200 seconds, 1 GPUs)" in result
+    assert "Total Spending: $2.00 over 2 rentals" in result
@@ -0,0 +1,201 @@
+"""Tests for the Hyperbolic marketplace GPU inventory cache."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.action_provider import (
+    MarketplaceActionProvider,
+)
+from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.inventory import (
+    UNKNOWN_MODEL,
+    GpuInventory,
+    GpuInventoryCache,
+    get_price_band,
+)
+from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.types import (
+    AvailableInstance,
+    AvailableInstancesResponse,
+    CpuHardware,
+    GpuHardware,
+    HardwareInfo,
+    Location,
+    Price,
+    PricingInfo,
+    RamHardware,
+    StorageHardware,
+)
+
+
+def make_instance(
+    node_id: str,
+    gpu_model: str,
+    price_cents: int,
+    gpus_total: int = 1,
+    gpus_reserved: int = 0,
+    cluster_name: str = "cluster-a",
+    reserved: bool = False,
+) -> AvailableInstance:
+    """Create a marketplace node for testing."""
+    gpu = GpuHardware(
+        hardware_type="gpu",
+        model=gpu_model,
+        clock_speed=1000,
+        compute_power=1000,
+        ram=8192,
+        interface="PCIeX16",
+    )
+    hardware = HardwareInfo(
+        cpus=[CpuHardware(hardware_type="cpu", model="AMD-23-49", virtual_cores=32)],
+        gpus=[gpu],
+        storage=[StorageHardware(hardware_type="storage", capacity=80)],
+        ram=[RamHardware(hardware_type="ram", capacity=1070)],
+    )
+    return AvailableInstance(
+        id=node_id,
+        status="node_ready",
+        hardware=hardware,
+        location=Location(region="region-1"),
+        gpus_total=gpus_total,
+        gpus_reserved=gpus_reserved,
+        has_persistent_storage=True,
+        pricing=PricingInfo(price=Price(amount=price_cents, period="hourly", agent="platform")),
+        reserved=reserved,
+        cluster_name=cluster_name,
+    )
+
+
+INSTANCES = [
+    make_instance("h100-a", "NVIDIA-H100", 250, gpus_total=8, gpus_reserved=6),
+    make_instance("h100-b", "NVIDIA-H100", 199, gpus_total=8, cluster_name="cluster-b"),
+    make_instance("h100-full", "NVIDIA-H100", 100, gpus_total=4, gpus_reserved=4),
+    make_instance("h100-reserved", "NVIDIA-H100", 90, gpus_total=8, reserved=True),
+    make_instance("rtx-a", "NVIDIA-GeForce-RTX-4090", 35, gpus_total=2),
+]
+
+
+def test_inventory_indexes_available_offers():
+    """Test that only nodes with free GPUs are indexed, cheapest first."""
+    inventory = GpuInventory(INSTANCES)
+
+    assert [offer.node_id for offer in inventory.offers] == ["rtx-a", "h100-b", "h100-a"]
+    assert inventory.models == ["NVIDIA-GeForce-RTX-4090", "NVIDIA-H100"]
+    assert [offer.node_id for offer in inventory.by_cluster["cluster-b"]] == ["h100-b"]
+    assert [offer.node_id for offer in inventory.by_price_band[get_price_band(0.35)]] == ["rtx-a"]
+    assert inventory.by_model["NVIDIA-H100"][0].gpus_available == 8
+
+
+def test_inventory_models_skip_nodes_without_gpus():
+    """Test that nodes listing no GPU hardware are not reported as a GPU model."""
+    instance = make_instance("no-gpus", "NVIDIA-H100", 100)
+    instance.hardware.gpus = []
+
+    inventory = GpuInventory([*INSTANCES, instance])
+
+    assert inventory.models == ["NVIDIA-GeForce-RTX-4090", "NVIDIA-H100"]
+    assert inventory.by_model[UNKNOWN_MODEL][0].node_id == "no-gpus"
+
+
+def test_inventory_find_and_cheapest():
+    """Test filtering offers by model, GPU count, price and cluster."""
+    inventory = GpuInventory(INSTANCES)
+
+    assert [o.node_id for o in inventory.find(gpu_model="NVIDIA-H100")] == ["h100-b", "h100-a"]
+    assert [o.node_id for o in inventory.find(gpu_model="NVIDIA-H100", min_gpus=4)] == ["h100-b"]
+    assert [o.node_id for o in inventory.find(max_price=2.0)] == ["rtx-a", "h100-b"]
+    assert [o.node_id for o in inventory.find(cluster_name="cluster-a")] == ["rtx-a", "h100-a"]
+    assert inventory.find(gpu_model="NVIDIA-A100") == []
+
+    assert inventory.cheapest("NVIDIA-H100").node_id == "h100-b"
+    assert inventory.cheapest("NVIDIA-H100", min_gpus=16) is None
+
+
+def test_cache_reuses_fresh_snapshot():
+    """Test that back-to-back lookups within the TTL fetch the marketplace once."""
+    fetch = Mock(return_value=INSTANCES)
+    cache = GpuInventoryCache(fetch, ttl=60)
+
+    first = cache.get()
+    second = cache.get()
+
+    assert first is second
+    fetch.assert_called_once()
+
+
+def test_cache_serves_stale_snapshot_while_refreshing():
+    """Test that a stale snapshot is served while a background refresh runs."""
+    fetch = Mock(side_effect=[INSTANCES, INSTANCES[:1]])
+    cache = GpuInventoryCache(fetch, ttl=0, max_stale=60)
+
+    stale = cache.get()
+    assert cache.get() is stale
+
+    deadline = time.monotonic() + 5
+    while cache._snapshot is stale and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert fetch.call_count == 2
+    assert [offer.node_id for offer in cache._snapshot.offers] == ["h100-a"]
+
+
+def test_cache_fetches_synchronously_after_invalidate():
+    """Test that invalidating the cache forces the next lookup to fetch."""
+    fetch = Mock(return_value=INSTANCES)
+    cache = GpuInventoryCache(fetch, ttl=60)
+
+    first = cache.get()
+    cache.invalidate()
+
+    assert cache.get() is not first
+    assert fetch.call_count == 2
+
+
+def test_cache_discards_refresh_started_before_invalidate():
+    """Test that a background refresh in flight when the cache is invalidated is not stored."""
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(None)
+        if len(calls) == 2:
+            started.set()
+            release.wait(5)
+        return INSTANCES[: len(calls)]
+
+    cache = GpuInventoryCache(fetch, ttl=0, max_stale=60)
+
+    stale = cache.get()
+    assert cache.get() is stale
+    assert started.wait(5)
+    cache.invalidate()
+    release.set()
+
+    deadline = time.monotonic() + 5
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert cache._snapshot is None
+    assert len(cache.get().instances) == 3
+
+
+def test_actions_share_inventory(mock_api_key):
+    """Test that the GPU listing actions share a single marketplace fetch."""
+    provider = MarketplaceActionProvider(api_key=mock_api_key)
+    response = AvailableInstancesResponse(instances=INSTANCES)
+
+    with (
+        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
+        patch.object(
+            provider.marketplace, "get_available_instances", return_value=response
+        ) as mock_get,
+    ):
+        provider.get_available_gpus({})
+        provider.get_available_gpus_types({})
+        result = provider.get_available_gpus_by_type(
+            {"gpu_model": "NVIDIA-H100", "min_gpus": 4, "max_price": 3.0}
+        )
+
+    mock_get.assert_called_once()
+    assert "h100-b" in result
+    assert "h100-a" not in result
@@ -0,0 +1,308 @@
+"""Tests for the rent_and_connect action and its readiness polling."""
+
+import itertools
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.action_provider import (
+    MarketplaceActionProvider,
+)
+from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.readiness import (
+    SSHTarget,
+    backoff_delays,
+    connect_with_retries,
+    get_ssh_target,
+    parse_ssh_command,
+    wait_until_ready,
+)
+from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.types import (
+    HardwareInfo,
+    NodeInstance,
+    NodeRental,
+    RentedInstancesResponse,
+    RentInstanceResponse,
+    SSHAccess,
+)
+from coinbase_agentkit.action_providers.ssh.connection import (
+    SSHConnectionError,
+    SSHConnectionParams,
+    UnknownHostKeyError,
+)
+
+INSTANCE_NAME = "test-instance-123"
+RENT_ARGS = {"cluster_name": "us-east-1", "node_name": "node-789", "gpu_count": "2"}
+
+
+def make_rental(status: str, ssh_command: str | None = None) -> NodeRental:
+    """Create a rented node with the given status."""
+    return NodeRental(
+        id=INSTANCE_NAME,
+        instance=NodeInstance(id="node-789", status=status, hardware=HardwareInfo(gpus=[])),
+        ssh_command=ssh_command,
+    )
+
+
+def test_parse_ssh_command():
+    """Test parsing the host, user, port and key of ssh commands."""
+    assert parse_ssh_command("ssh ubuntu@1.2.3.4 -p 31234 -i ~/.ssh/key") == SSHTarget(
+        host="1.2.3.4", username="ubuntu", port=31234, key_path="~/.ssh/key"
+    )
+    assert parse_ssh_command("ssh -l root example.com") == SSHTarget(
+        host="example.com", username="root"
+    )
+    assert parse_ssh_command("ssh example.com") is None
+    assert parse_ssh_command('ssh "unterminated') is None
+
+
+def test_ssh_target_command():
+    """Test that the ssh command only includes non-default ports."""
+    assert SSHTarget(host="h", username="u").command == "ssh u@h"
+    assert SSHTarget(host="h", username="u", port=2222).command == "ssh u@h -p 2222"
+
+
+def test_get_ssh_target_from_ssh_access():
+    """Test falling back to the structured SSH access details."""
+    rental = make_rental("running")
+    rental.ssh_access = SSHAccess(host="10.0.0.1", username="admin", key_path="~/.ssh/id")
+
+    assert get_ssh_target(rental) == SSHTarget(
+        host="10.0.0.1", username="admin", key_path="~/.ssh/id"
+    )
+    assert get_ssh_target(make_rental("running")) is None
+
+
+def test_backoff_delays_grow_to_maximum():
+    """Test that delays grow exponentially up to the maximum without jitter."""
+    delays = list(itertools.islice(backoff_delays(1.0, 5.0, 2.0, jitter=0.0), 5))
+    assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_backoff_delays_jitter_stays_in_range():
+    """Test that jittered delays never exceed their base delay."""
+    for delay in itertools.islice(backoff_delays(4.0, 4.0, jitter=0.5), 50):
+        assert 2.0 <= delay <= 4.0
+
+
+def test_wait_until_ready_polls_until_running():
+    """Test that polling continues until the node runs and has SSH details."""
+    responses = iter(
+        [
+            [],
+            [make_rental("starting")],
+            [make_rental("running")],
+            [make_rental("running", "ssh ubuntu@1.2.3.4 -p 2222")],
+        ]
+    )
+    sleeps = []
+
+    rental, target, polls = wait_until_ready(
+        lambda: next(responses),
+        INSTANCE_NAME,
+        timeout=60,
+        delays=itertools.repeat(1.0),
+        sleep=sleeps.append,
+    )
+
+    assert rental.id == INSTANCE_NAME
+    assert target == SSHTarget(host="1.2.3.4", username="ubuntu", port=2222)
+    assert polls == 4
+    assert sleeps == [1.0, 1.0, 1.0]
+
+
+def test_wait_until_ready_fails_on_terminated_node():
+    """Test that a node stopping while starting ends the wait."""
+    with pytest.raises(RuntimeError, match="stopped while starting"):
+        wait_until_ready(
+            lambda: [make_rental("terminated")], INSTANCE_NAME, timeout=60, sleep=lambda _: None
+        )
+
+
+def test_wait_until_ready_times_out():
+    """Test that the wait gives up at the timeout with the last status."""
+    with pytest.raises(TimeoutError, match="last status: starting"):
+        wait_until_ready(
+            lambda: [make_rental("starting")], INSTANCE_NAME, timeout=0, sleep=lambda _: None
+        )
+
+
+def test_wait_until_ready_polls_through_request_errors():
+    """Test that failed polls are retried instead of ending the wait."""
+    responses = iter(
+        [
+            requests.ConnectionError("connection reset"),
+            requests.HTTPError("502 Server Error"),
+            [make_rental("running", "ssh ubuntu@1.2.3.4")],
+        ]
+    )
+
+    def fetch():
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    rental, _, polls = wait_until_ready(
+        fetch, INSTANCE_NAME, timeout=60, delays=itertools.repeat(1.0), sleep=lambda _: None
+    )
+
+    assert rental.id == INSTANCE_NAME
+    assert polls == 3
+
+
+def test_wait_until_ready_times_out_on_request_errors():
+    """Test that request errors until the timeout are reported as the last status."""
+
+    def fetch():
+        raise requests.ConnectionError("connection reset")
+
+    with pytest.raises(TimeoutError, match="request failed: connection reset"):
+        wait_until_ready(fetch, INSTANCE_NAME, timeout=0, sleep=lambda _: None)
+
+
+def make_params() -> SSHConnectionParams:
+    """Create connection parameters for the test instance."""
+    return SSHConnectionParams(
+        connection_id=INSTANCE_NAME,
+        host="1.2.3.4",
+        username="ubuntu",
+        private_key_path="~/.ssh/id_rsa",
+    )
+
+
+def test_connect_with_retries_retries_refused_connections():
+    """Test that connection errors are retried until the node accepts."""
+    pool = MagicMock()
+    pool.has_connection.return_value = False
+    connection = pool.create_connection.return_value
+    connection.connect.side_effect = [SSHConnectionError("refused"), None]
+    sleeps = []
+
+    result, attempts = connect_with_retries(
+        pool, make_params(), timeout=60, delays=itertools.repeat(2.0), sleep=sleeps.append
+    )
+
+    assert result is connection
+    assert attempts == 2
+    assert sleeps == [2.0]
+
+
+def test_connect_with_retries_does_not_retry_unknown_host_key():
+    """Test that unknown host keys are raised immediately and the connection removed."""
+    pool = MagicMock()
+    pool.has_connection.return_value = False
+    pool.create_connection.return_value.connect.side_effect = UnknownHostKeyError("unknown")
+
+    with pytest.raises(UnknownHostKeyError):
+        connect_with_retries(pool, make_params(), timeout=60, sleep=lambda _: None)
+
+    pool.close_and_remove_connection.assert_called_once_with(INSTANCE_NAME)
+    assert pool.create_connection.return_value.connect.call_count == 1
+
+
+def test_connect_with_retries_removes_connection_after_timeout():
+    """Test that a connection that never succeeds is removed from the pool."""
+    pool = MagicMock()
+    pool.has_connection.return_value = False
+    pool.create_connection.return_value.connect.side_effect = SSHConnectionError("refused")
+
+    with pytest.raises(SSHConnectionError, match="after 1 attempts"):
+        connect_with_retries(pool, make_params(), timeout=0, sleep=lambda _: None)
+
+    pool.close_and_remove_connection.assert_called_once_with(INSTANCE_NAME)
+
+
+@pytest.fixture
+def provider(mock_api_key):
+    """Create a provider with a mocked SSH connection pool."""
+    pool = MagicMock()
+    pool.has_connection.return_value = False
+    return MarketplaceActionProvider(api_key=mock_api_key, ssh_pool=pool)
+
+
+def test_rent_and_connect_success(provider):
+    """Test renting, waiting and connecting in one action."""
+    rented = RentedInstancesResponse(
+        instances=[make_rental("running", "ssh ubuntu@1.2.3.4 -p 2222")]
+    )
+
+    with (
+        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
+        patch.object(
+            provider.marketplace,
+            "rent_instance",
+            return_value=RentInstanceResponse(status="success", instance_name=INSTANCE_NAME),
+        ) as mock_rent,
+        patch.object(provider.marketplace, "get_rented_instances", return_value=rented),
+    ):
+        result = provider.rent_and_connect({**RENT_ARGS, "private_key_path": "~/.ssh/hyperbolic"})
+
+    assert mock_rent.call_args[0][0].model_dump() == RENT_ARGS
+    params = provider.ssh_pool.create_connection.call_args[0][0]
+    assert params.connection_id == INSTANCE_NAME
+    assert (params.host, params.port) == ("1.2.3.4", 2222)
+    assert params.private_key_path == "~/.ssh/hyperbolic"
+
+    assert f"Instance {INSTANCE_NAME} is ready and connected." in result
+    assert "SSH command: ssh ubuntu@1.2.3.4 -p 2222" in result
+    assert "- Provisioning:" in result
+    assert "(1 status checks)" in result
+    assert "(1 attempts)" in result
+
+
+def test_rent_and_connect_unknown_host_key(provider):
+    """Test that an unknown host key is reported with the node still ready."""
+    provider.ssh_pool.create_connection.return_value.connect.side_effect = UnknownHostKeyError(
+        "Host key not recognized, use ssh_add_host_key"
+    )
+    rented = RentedInstancesResponse(instances=[make_rental("running", "ssh root@1.2.3.4")])
+
+    with (
+        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
+        patch.object(
+            provider.marketplace,
+            "rent_instance",
+            return_value=RentInstanceResponse(status="success", instance_name=INSTANCE_NAME),
+        ),
+        patch.object(provider.marketplace, "get_rented_instances", return_value=rented),
+    ):
+        result = provider.rent_and_connect(RENT_ARGS)
+
+    assert "is ready, but the SSH connection was not established" in result
+    assert "ssh_add_host_key" in result
+
+
+def test_rent_and_connect_rental_error(provider):
+    """Test that rental errors are reported without polling."""
+    with (
+        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
+        patch.object(provider.marketplace, "rent_instance", side_effect=Exception("API Error")),
+        patch.object(provider.marketplace, "get_rented_instances") as mock_rented,
+    ):
+        result = provider.rent_and_connect(RENT_ARGS)
+
+    assert result == "Error: Compute rental: API Error"
+    mock_rented.assert_not_called()
+
+
+def test_rent_and_connect_readiness_error(provider):
+    """Test that readiness failures point at the still rented instance."""
+    with (
+        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
+        patch.object(
+            provider.marketplace,
+            "rent_instance",
+            return_value=RentInstanceResponse(status="success", instance_name=INSTANCE_NAME),
+        ),
+        patch.object(
+            provider.marketplace,
+            "get_rented_instances",
+            return_value=RentedInstancesResponse(instances=[make_rental("failed")]),
+        ),
+    ):
+        result = provider.rent_and_connect(RENT_ARGS)
+
+    assert result.startswith("Error: Instance readiness:")
+    assert "terminate_compute" in result
+    provider.ssh_pool.create_connection.assert_not_called()
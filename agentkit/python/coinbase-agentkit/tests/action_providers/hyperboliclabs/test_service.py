@@ -6,6 +6,7 @@ import pytest
 import requests
 
 from coinbase_agentkit.action_providers.hyperboliclabs.service import Base
+from coinbase_agentkit.rate_limiting import RateLimiter
 
 
 @pytest.fixture
@@ -95,3 +96,27 @@ def test_service_make_request_invalid_method(mock_request, mock_api_key):
 
     with pytest.raises(ValueError, match="Invalid HTTP method"):
         service.make_request("/test", method="INVALID")
+
+
+def test_make_request_honors_retry_after(mock_api_key):
+    """Test that a rate limited request is retried after the advertised delay."""
+    base = Base(mock_api_key, "https://api.example.com")
+    rate_limited = requests.Response()
+    rate_limited.status_code = 429
+    rate_limited.headers["Retry-After"] = "0"
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.hyperboliclabs.service.rate_limiter",
+            RateLimiter(),
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.hyperboliclabs.service.requests.request"
+        ) as mock_request,
+    ):
+        ok = requests.Response()
+        ok.status_code = 200
+        mock_request.side_effect = [rate_limited, ok]
+
+        assert base.make_request("/test") is ok
+        assert mock_request.call_count == 2
@@ -0,0 +1,76 @@
+"""Fixtures for Morpho action provider tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.action_providers.morpho.constants import (
+    IRM_ABI,
+    METAMORPHO_ABI,
+    MORPHO_BLUE_ABI,
+)
+from coinbase_agentkit.network import Network
+
+MOCK_VAULT_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_TOKEN_ADDRESS = "0x0987654321098765432109876543210987654321"
+MOCK_MORPHO_ADDRESS = "0xBBBBBbbBBb9cC5e90e3b3Af64bdAF62C37EEFFCb"
+MOCK_IRM_ADDRESS = "0x46415998764C29aB2a25CbeA6254146D50D22687"
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+IDLE_MARKET_ID = b"\x01" * 32
+LENDING_MARKET_ID = b"\x02" * 32
+
+# About 5% a year, per second, scaled by 1e18
+BORROW_RATE = 1_585_489_599
+
+
+def vault_state(asset_decimals: int) -> dict:
+    """Create the state of a vault with 2000 assets, a 10% fee and all of them lent out."""
+    unit = 10**asset_decimals
+    return {
+        "asset": MOCK_TOKEN_ADDRESS,
+        "decimals": 18,
+        "totalAssets": 2_000 * unit,
+        "totalSupply": 1_900 * 10**18,
+        "lastTotalAssets": 2_000 * unit,
+        "fee": 10**17,
+        "MORPHO": MOCK_MORPHO_ADDRESS,
+        "withdrawQueueLength": 2,
+        "symbol": "USDC",
+        # Markets with 1000 assets supplied, 80% borrowed and a 10% fee
+        "market": (1_000 * unit, 1_000 * unit * 10**6, 800 * unit, 800 * unit * 10**6, 0, 10**17),
+        "borrowRateView": BORROW_RATE,
+    }
+
+
+@pytest.fixture
+def vault_wallet(multicall_reader):
+    """Create a factory of wallet mocks serving the reads of a Morpho Vault."""
+
+    def build(asset_decimals: int = 18) -> MagicMock:
+        state = vault_state(asset_decimals)
+
+        def respond(target, function_name, args):
+            if function_name == "decimals":
+                return 18 if target == MOCK_VAULT_ADDRESS else asset_decimals
+            if function_name == "withdrawQueue":
+                return [IDLE_MARKET_ID, LENDING_MARKET_ID][args[0]]
+            if function_name == "idToMarketParams":
+                irm = ZERO_ADDRESS if args[0] == IDLE_MARKET_ID else MOCK_IRM_ADDRESS
+                return (MOCK_TOKEN_ADDRESS, ZERO_ADDRESS, ZERO_ADDRESS, irm, 0)
+            if function_name == "position":
+                if args[0] == IDLE_MARKET_ID:
+                    return (0, 0, 0)
+                return (state["totalAssets"] * 10**6, 0, 0)
+            return state[function_name]
+
+        wallet = MagicMock()
+        wallet.get_network.return_value = Network(
+            protocol_family="evm", chain_id="8453", network_id="base-mainnet"
+        )
+        wallet.read_contract.side_effect = multicall_reader(
+            [METAMORPHO_ABI, ERC20_ABI, MORPHO_BLUE_ABI, IRM_ABI], respond
+        )
+        return wallet
+
+    return build
@@ -2,23 +2,25 @@ import decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
+from web3 import Web3
 
+from coinbase_agentkit.action_providers.morpho.constants import METAMORPHO_ABI
 from coinbase_agentkit.action_providers.morpho.morpho_action_provider import morpho_action_provider
+from coinbase_agentkit.action_providers.morpho.vaults import VaultState
 from coinbase_agentkit.network import Network
 
-MOCK_VAULT_ADDRESS = "0x1234567890123456789012345678901234567890"
-MOCK_TOKEN_ADDRESS = "0x0987654321098765432109876543210987654321"
+from .conftest import MOCK_TOKEN_ADDRESS, MOCK_VAULT_ADDRESS
+
 MOCK_RECEIVER = "0x5555555555555555555555555555555555555555"
 MOCK_TX_HASH = "0xabcdef1234567890"
 MOCK_DECIMALS = 18
 
 
 # Deposit Tests
-def test_morpho_deposit_success():
+def test_morpho_deposit_success(vault_wallet):
     """Test successful morpho deposit with valid parameters."""
-    mock_wallet = MagicMock()
+    mock_wallet = vault_wallet(MOCK_DECIMALS)
     mock_wallet.send_transaction.return_value = MOCK_TX_HASH
-    mock_wallet.read_contract.return_value = MOCK_DECIMALS
 
     with patch(
         "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
@@ -96,9 +98,9 @@ def test_morpho_deposit_invalid_amount():
         )
 
 
-def test_morpho_deposit_approval_error():
+def test_morpho_deposit_approval_error(vault_wallet):
     """Test morpho deposit with approval error."""
-    mock_wallet = MagicMock()
+    mock_wallet = vault_wallet()
 
     with patch(
         "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
@@ -120,9 +122,9 @@ def test_morpho_deposit_approval_error():
 
 
 # Withdraw Tests
-def test_morpho_withdraw_success():
+def test_morpho_withdraw_success(vault_wallet):
     """Test successful morpho withdraw with valid parameters."""
-    mock_wallet = MagicMock()
+    mock_wallet = vault_wallet()
     mock_wallet.send_transaction.return_value = MOCK_TX_HASH
 
     with patch("web3.eth.Contract") as mock_contract:
@@ -179,9 +181,9 @@ def test_morpho_withdraw_invalid_amount():
         )
 
 
-def test_morpho_withdraw_transaction_error():
+def test_morpho_withdraw_transaction_error(vault_wallet):
     """Test morpho withdraw with transaction error."""
-    mock_wallet = MagicMock()
+    mock_wallet = vault_wallet()
     mock_wallet.send_transaction.side_effect = Exception("Transaction failed")
 
     with patch("web3.eth.Contract") as mock_contract:
@@ -195,6 +197,158 @@ def test_morpho_withdraw_transaction_error():
         assert "Error withdrawing from Morpho Vault" in result
 
 
+def test_morpho_deposit_reuses_vault_state(vault_wallet):
+    """Test that the vault asset and decimals are read once across deposits."""
+    mock_wallet = vault_wallet(6)
+    mock_wallet.send_transaction.return_value = MOCK_TX_HASH
+    provider = morpho_action_provider()
+    args = {
+        "vault_address": MOCK_VAULT_ADDRESS,
+        "token_address": MOCK_TOKEN_ADDRESS,
+        "assets": "1.5",
+        "receiver": MOCK_RECEIVER,
+    }
+
+    with patch(
+        "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
+    ) as mock_approve:
+        provider.deposit(mock_wallet, args)
+        result = provider.deposit(mock_wallet, args)
+
+    assert "Deposited 1.5" in result
+    # Only the vault asset and the asset decimals are read, once.
+    assert mock_wallet.read_contract.call_count == 2
+    mock_approve.assert_called_with(mock_wallet, MOCK_TOKEN_ADDRESS, MOCK_VAULT_ADDRESS, 1_500_000)
+
+
+def test_morpho_withdraw_invalidates_vault_state_after_receipt(vault_wallet):
+    """Test that the vault state is reloaded only once the withdrawal is mined."""
+    mock_wallet = vault_wallet()
+    mock_wallet.send_transaction.return_value = MOCK_TX_HASH
+    provider = morpho_action_provider()
+    provider.get_vault_state(mock_wallet, {"vault_addresses": [MOCK_VAULT_ADDRESS]})
+    reads = mock_wallet.read_contract.call_count
+
+    def wait_for_transaction_receipt(tx_hash):
+        # A read racing the receipt still gets the cached state.
+        provider.get_vault_state(mock_wallet, {"vault_addresses": [MOCK_VAULT_ADDRESS]})
+        assert mock_wallet.read_contract.call_count == reads
+        raise TimeoutError("receipt timed out")
+
+    mock_wallet.wait_for_transaction_receipt.side_effect = wait_for_transaction_receipt
+    result = provider.withdraw(
+        mock_wallet,
+        {"vault_address": MOCK_VAULT_ADDRESS, "assets": "1.0", "receiver": MOCK_RECEIVER},
+    )
+    provider.get_vault_state(mock_wallet, {"vault_addresses": [MOCK_VAULT_ADDRESS]})
+
+    assert result == "Error withdrawing from Morpho Vault: receipt timed out"
+    assert mock_wallet.read_contract.call_count > reads
+
+
+def test_morpho_deposit_wrong_token(vault_wallet):
+    """Test that depositing a token other than the vault asset is refused."""
+    mock_wallet = vault_wallet()
+
+    result = morpho_action_provider().deposit(
+        mock_wallet,
+        {
+            "vault_address": MOCK_VAULT_ADDRESS,
+            "token_address": MOCK_RECEIVER,
+            "assets": "1.0",
+            "receiver": MOCK_RECEIVER,
+        },
+    )
+
+    assert result == (
+        f"Error depositing to Morpho Vault: Token {MOCK_RECEIVER} is not the asset of the vault, "
+        f"{MOCK_TOKEN_ADDRESS}"
+    )
+    mock_wallet.send_transaction.assert_not_called()
+
+
+def test_morpho_withdraw_uses_asset_decimals(vault_wallet):
+    """Test that withdrawn amounts are converted with the decimals of the vault asset."""
+    mock_wallet = vault_wallet(6)
+    mock_wallet.send_transaction.return_value = MOCK_TX_HASH
+
+    morpho_action_provider().withdraw(
+        mock_wallet,
+        {"vault_address": MOCK_VAULT_ADDRESS, "assets": "2.5", "receiver": MOCK_RECEIVER},
+    )
+
+    data = mock_wallet.send_transaction.call_args[0][0]["data"]
+    _, params = Web3().eth.contract(abi=METAMORPHO_ABI).decode_function_input(data)
+    assert params["assets"] == 2_500_000
+
+
+# Vault State Tests
+def test_vault_state_conversions_include_accrued_fee():
+    """Test that previews add the fee shares not minted yet, like the vault contract."""
+    state = VaultState(
+        MOCK_VAULT_ADDRESS,
+        decimals=18,
+        asset_decimals=18,
+        total_assets=1_100,
+        total_supply=1_000,
+        last_total_assets=1_000,
+        fee=2 * 10**17,
+    )
+
+    # 100 assets of interest, 20 of fee, minted as 20 * 1001 // 1081 = 18 shares
+    assert state.to_shares(110) == 110 * 1_019 // 1_101
+    assert state.to_shares(110, round_up=True) == 110 * 1_019 // 1_101 + 1
+    assert state.to_assets(100) == 100 * 1_101 // 1_019
+
+
+def test_morpho_get_vault_state(vault_wallet):
+    """Test that vault state, APY and deposit previews are computed from cached reads."""
+    mock_wallet = vault_wallet(6)
+    provider = morpho_action_provider()
+    args = {"vault_addresses": [MOCK_VAULT_ADDRESS], "assets": "1"}
+
+    result = provider.get_vault_state(mock_wallet, args)
+
+    assert result == (
+        "Morpho Vault state:\n"
+        f"- {MOCK_VAULT_ADDRESS}: 2000 USDC total, 1 share = 1.052631 USDC, fee 10.00%, "
+        "APY 3.30% (before fee 3.67%), depositing 1 USDC mints 0.950000000024999999 shares"
+    )
+    # Vaults, queues, markets and rates
+    assert mock_wallet.read_contract.call_count == 4
+
+    provider.get_vault_state(mock_wallet, {**args, "assets": "2"})
+    assert mock_wallet.read_contract.call_count == 4
+
+
+def test_morpho_get_vault_state_errors(vault_wallet):
+    """Test that a vault that cannot be read does not fail the others."""
+    mock_wallet = vault_wallet()
+    not_a_vault = "0x5555555555555555555555555555555555555555"
+    aggregate3 = mock_wallet.read_contract.side_effect
+
+    def read_contract(contract_address, abi, function_name, args=None, block_identifier=None):
+        calls = args[0]
+        results = aggregate3(
+            contract_address,
+            abi,
+            function_name,
+            [[call for call in calls if call[0] != not_a_vault]],
+            block_identifier,
+        )
+        results = iter(results)
+        return [(False, b"") if call[0] == not_a_vault else next(results) for call in calls]
+
+    mock_wallet.read_contract.side_effect = read_contract
+
+    result = morpho_action_provider().get_vault_state(
+        mock_wallet, {"vault_addresses": [MOCK_VAULT_ADDRESS, not_a_vault]}
+    )
+
+    assert f"- {MOCK_VAULT_ADDRESS}: 2000 USDC total" in result
+    assert f"- {not_a_vault}: error: Not an ERC4626 vault: asset reverted" in result
+
+
 # Network Support Tests
 def test_supports_network():
     """Test network support checking."""
@@ -0,0 +1,150 @@
+"""Tests for client-side Superfluid streaming balances."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from coinbase_agentkit.action_providers.superfluid.constants import CFA_ABI, SUPER_TOKEN_ABI
+from coinbase_agentkit.action_providers.superfluid.streams import StreamSnapshot
+from coinbase_agentkit.action_providers.superfluid.superfluid_action_provider import (
+    SuperfluidActionProvider,
+)
+from coinbase_agentkit.network import Network
+
+ACCOUNT = "0x5555555555555555555555555555555555555555"
+TOKEN = "0x1234567890123456789012345678901234567890"
+HOST = "0x4C073B3baB6d8826b8C5b229f3cfdC1eC6E47E74"
+CFA = "0x19ba78B9cDB05A877718841c574325fdB53601bb"
+RECIPIENT = "0x9876543210987654321098765432109876543210"
+MOCK_TX_HASH = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
+
+SNAPSHOT_TIME = 1_700_000_000
+
+
+@pytest.fixture
+def stream_wallet(multicall_reader):
+    """Create a wallet streaming out 10 wei per second from a balance of 1000 wei."""
+
+    def respond(target, function_name, args):
+        return {
+            "realtimeBalanceOfNow": (1_000, 50, 0, SNAPSHOT_TIME),
+            "getNetFlow": -10,
+        }[function_name]
+
+    aggregate3 = multicall_reader([SUPER_TOKEN_ABI, CFA_ABI], respond)
+
+    def read_contract(contract_address, abi, function_name, args=None, block_identifier=None):
+        if function_name == "getHost":
+            return HOST
+        if function_name == "getAgreementClass":
+            return CFA
+        return aggregate3(contract_address, abi, function_name, args, block_identifier)
+
+    wallet = MagicMock()
+    wallet.get_address.return_value = ACCOUNT
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", chain_id="8453", network_id="base-mainnet"
+    )
+    wallet.read_contract.side_effect = read_contract
+    wallet.send_transaction.return_value = MOCK_TX_HASH
+    return wallet
+
+
+def aggregate3_calls(wallet):
+    """Count the multicalls sent by a wallet mock."""
+    return sum(
+        c.kwargs["function_name"] == "aggregate3" for c in wallet.read_contract.call_args_list
+    )
+
+
+def test_snapshot_extrapolates_balance():
+    """Test that balances and the depletion time are computed from the snapshot."""
+    snapshot = StreamSnapshot(TOKEN, ACCOUNT, 100, 1_000, 50, -10)
+
+    assert snapshot.balance_at(100) == 1_000
+    assert snapshot.balance_at(150) == 500
+    assert snapshot.balance_at(250) == -500
+    assert snapshot.depleted_at() == 200
+    assert StreamSnapshot(TOKEN, ACCOUNT, 100, 1_000, 50, 5).depleted_at() is None
+    assert StreamSnapshot(TOKEN, ACCOUNT, 100, -20, 50, -10).depleted_at() == 100
+
+
+def test_get_stream_balance_reads_once(stream_wallet):
+    """Test that balances at other times are computed without reading again."""
+    provider = SuperfluidActionProvider()
+
+    response = provider.get_stream_balance(
+        stream_wallet, {"token_address": TOKEN, "timestamp": SNAPSHOT_TIME + 40}
+    )
+
+    assert response == (
+        f"Balance of {ACCOUNT} in {TOKEN} at 2023-11-14T22:14:00+00:00: 600 wei\n"
+        "Net flow rate: -10 wei per second\n"
+        "The balance runs dry at 2023-11-14T22:15:00+00:00, in 0:01:00."
+    )
+
+    with patch(
+        "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.time.time",
+        return_value=SNAPSHOT_TIME + 500,
+    ):
+        response = provider.get_stream_balance(stream_wallet, {"token_address": TOKEN})
+
+    assert "-4000 wei" in response
+    assert "The balance ran dry at 2023-11-14T22:15:00+00:00." in response
+    assert aggregate3_calls(stream_wallet) == 1
+
+
+def test_flow_changes_refresh_the_snapshot(stream_wallet):
+    """Test that a flow change sent by the provider drops the cached snapshots."""
+    provider = SuperfluidActionProvider()
+    args = {"token_address": TOKEN, "timestamp": SNAPSHOT_TIME}
+
+    provider.get_stream_balance(stream_wallet, args)
+    provider.get_stream_balance(stream_wallet, {**args, "address": RECIPIENT})
+    assert aggregate3_calls(stream_wallet) == 2
+
+    provider.delete_flow(stream_wallet, {"recipient": RECIPIENT, "token_address": TOKEN})
+    provider.get_stream_balance(stream_wallet, args)
+    provider.get_stream_balance(stream_wallet, {**args, "address": RECIPIENT})
+
+    assert aggregate3_calls(stream_wallet) == 4
+
+
+def test_reads_while_a_flow_change_is_pending_are_dropped(stream_wallet):
+    """Test that a snapshot read before the flow change is mined is not kept."""
+    provider = SuperfluidActionProvider()
+    args = {"token_address": TOKEN, "timestamp": SNAPSHOT_TIME}
+
+    def read_while_pending(tx_hash):
+        provider.get_stream_balance(stream_wallet, args)
+
+    stream_wallet.wait_for_transaction_receipt.side_effect = read_while_pending
+    provider.delete_flow(stream_wallet, {"recipient": RECIPIENT, "token_address": TOKEN})
+    provider.get_stream_balance(stream_wallet, args)
+
+    assert aggregate3_calls(stream_wallet) == 2
+
+
+def test_snapshot_cache_is_bounded(stream_wallet):
+    """Test that only the most recently used snapshots are kept."""
+    provider = SuperfluidActionProvider()
+    provider.streams.max_cached = 1
+    args = {"token_address": TOKEN, "timestamp": SNAPSHOT_TIME}
+
+    provider.get_stream_balance(stream_wallet, args)
+    provider.get_stream_balance(stream_wallet, {**args, "address": RECIPIENT})
+    provider.get_stream_balance(stream_wallet, args)
+
+    assert len(provider.streams._snapshots) == 1
+    assert aggregate3_calls(stream_wallet) == 3
+
+
+def test_get_stream_balance_error(stream_wallet):
+    """Test that read failures are returned as an error message."""
+    stream_wallet.read_contract.side_effect = Exception("RPC unavailable")
+
+    response = SuperfluidActionProvider().get_stream_balance(
+        stream_wallet, {"token_address": TOKEN}
+    )
+
+    assert response == "Error getting stream balance: RPC unavailable"
@@ -2,16 +2,22 @@
 
 from unittest.mock import MagicMock, patch
 
+import eth_abi
 import pytest
 from pydantic import ValidationError
+from web3 import Web3
 
 from coinbase_agentkit.action_providers.superfluid.constants import (
+    CFA_ABI,
+    CFA_AGREEMENT_TYPE,
     CREATE_ABI,
     DELETE_ABI,
+    HOST_ABI,
     SUPERFLUID_HOST_ADDRESS,
     UPDATE_ABI,
 )
 from coinbase_agentkit.action_providers.superfluid.schemas import (
+    BatchFlowsSchema,
     CreateFlowSchema,
     DeleteFlowSchema,
     UpdateFlowSchema,
@@ -346,6 +352,140 @@ def test_delete_flow_error():
         assert tx["data"] == "0xencoded"
 
 
+BATCH_SENDER = "0x5555555555555555555555555555555555555555"
+BATCH_TOKEN = "0x1234567890123456789012345678901234567890"
+BATCH_HOST = "0x4C073B3baB6d8826b8C5b229f3cfdC1eC6E47E74"
+BATCH_CFA = "0x19ba78B9cDB05A877718841c574325fdB53601bb"
+RECIPIENT_A = "0x9876543210987654321098765432109876543210"
+RECIPIENT_B = "0x1111111111111111111111111111111111111111"
+
+
+def batch_wallet():
+    """Create a wallet whose Super token is managed by BATCH_HOST and BATCH_CFA."""
+
+    def read_contract(contract_address, abi, function_name, args=None, block_identifier=None):
+        return {"getHost": BATCH_HOST, "getAgreementClass": BATCH_CFA}[function_name]
+
+    wallet = MagicMock()
+    wallet.get_address.return_value = BATCH_SENDER
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", chain_id="8453", network_id="base-mainnet"
+    )
+    wallet.read_contract.side_effect = read_contract
+    wallet.send_transaction.return_value = MOCK_TX_HASH
+    wallet.wait_for_transaction_receipt.return_value = MOCK_RECEIPT
+    return wallet
+
+
+def decode_batch_call(data):
+    """Decode the operations of a host batchCall into (type, target, function, args)."""
+    host = Web3().eth.contract(abi=HOST_ABI)
+    cfa = Web3().eth.contract(abi=CFA_ABI)
+    function, params = host.decode_function_input(data)
+    assert function.fn_name == "batchCall"
+
+    operations = []
+    for operation in params["operations"]:
+        call_data, user_data = eth_abi.decode(["bytes", "bytes"], operation["data"])
+        assert user_data == b""
+        cfa_function, cfa_args = cfa.decode_function_input(call_data)
+        assert cfa_args["ctx"] == b""
+        operations.append(
+            (operation["operationType"], operation["target"], cfa_function.fn_name, cfa_args)
+        )
+    return operations
+
+
+def test_batch_flows_input_model():
+    """Test that flow rates are required to create or update flows only."""
+    operations = [
+        {
+            "operation": "create",
+            "recipient": RECIPIENT_A,
+            "token_address": BATCH_TOKEN,
+            "flow_rate": "1",
+        },
+        {"operation": "delete", "recipient": RECIPIENT_B, "token_address": BATCH_TOKEN},
+    ]
+    assert len(BatchFlowsSchema(operations=operations).operations) == 2
+
+    with pytest.raises(ValidationError, match="A flow rate is required to update a flow"):
+        BatchFlowsSchema(
+            operations=[
+                {"operation": "update", "recipient": RECIPIENT_A, "token_address": BATCH_TOKEN}
+            ]
+        )
+    with pytest.raises(ValidationError):
+        BatchFlowsSchema(operations=[])
+
+
+def test_batch_flows_success():
+    """Test that flow operations are sent as a single host batchCall."""
+    wallet = batch_wallet()
+    provider = SuperfluidActionProvider()
+    args = {
+        "operations": [
+            {
+                "operation": "create",
+                "recipient": RECIPIENT_A,
+                "token_address": BATCH_TOKEN,
+                "flow_rate": "1000",
+            },
+            {
+                "operation": "update",
+                "recipient": RECIPIENT_B,
+                "token_address": BATCH_TOKEN,
+                "flow_rate": "2000",
+            },
+            {"operation": "delete", "recipient": RECIPIENT_A, "token_address": BATCH_TOKEN},
+        ]
+    }
+
+    response = provider.batch_flows(wallet, args)
+
+    assert response == (
+        f"3 flow operations completed in one transaction. Transaction hash: {MOCK_TX_HASH}"
+    )
+    wallet.send_transaction.assert_called_once()
+    tx = wallet.send_transaction.call_args[0][0]
+    assert tx["to"] == BATCH_HOST
+    operations = decode_batch_call(tx["data"])
+    assert [op[:3] for op in operations] == [
+        (201, BATCH_CFA, "createFlow"),
+        (201, BATCH_CFA, "updateFlow"),
+        (201, BATCH_CFA, "deleteFlow"),
+    ]
+    assert operations[0][3]["receiver"] == RECIPIENT_A
+    assert operations[0][3]["flowRate"] == 1000
+    assert operations[1][3]["flowRate"] == 2000
+    assert operations[2][3]["sender"] == BATCH_SENDER
+    assert operations[2][3]["receiver"] == RECIPIENT_A
+    wallet.wait_for_transaction_receipt.assert_called_once_with(MOCK_TX_HASH)
+
+    # The host and agreement of the token are only read once.
+    assert [c.kwargs["function_name"] for c in wallet.read_contract.call_args_list] == [
+        "getHost",
+        "getAgreementClass",
+    ]
+    assert wallet.read_contract.call_args_list[1].kwargs["args"] == [CFA_AGREEMENT_TYPE]
+
+
+def test_batch_flows_error():
+    """Test batch flow operations when the transaction fails."""
+    wallet = batch_wallet()
+    wallet.send_transaction.side_effect = Exception("Transaction failed")
+    args = {
+        "operations": [
+            {"operation": "delete", "recipient": RECIPIENT_A, "token_address": BATCH_TOKEN}
+        ]
+    }
+
+    response = SuperfluidActionProvider().batch_flows(wallet, args)
+
+    assert response == "Error running batch flow operations: Transaction failed"
+    wallet.wait_for_transaction_receipt.assert_not_called()
+
+
 def test_supports_network():
     """Test network support validation."""
     provider = SuperfluidActionProvider()
@@ -0,0 +1,157 @@
+"""Tests for incremental fetching of Twitter account mentions."""
+
+from json import loads
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from coinbase_agentkit.action_providers.twitter.mentions import MentionsCursor, merge_pages
+from coinbase_agentkit.action_providers.twitter.twitter_action_provider import (
+    twitter_action_provider,
+)
+
+MOCK_USER_ID = "1234"
+
+
+def mention(tweet_id: str) -> dict:
+    """Create a mention with the given id."""
+    return {"id": tweet_id, "text": f"@testaccount {tweet_id}"}
+
+
+def test_first_fetch_returns_latest_page():
+    """Test that the first fetch for a user is a plain request."""
+    cursor = MentionsCursor()
+    page = {"data": [mention("20"), mention("10")], "meta": {"result_count": 2}}
+    fetch_page = Mock(return_value=page)
+
+    assert cursor.fetch(MOCK_USER_ID, fetch_page) == page
+    fetch_page.assert_called_once_with(MOCK_USER_ID)
+    assert cursor.since_id(MOCK_USER_ID) == "20"
+
+
+def test_later_fetches_use_since_id():
+    """Test that later fetches only ask for mentions newer than the cursor."""
+    cursor = MentionsCursor()
+    cursor.fetch(MOCK_USER_ID, Mock(return_value={"data": [mention("20")]}))
+
+    fetch_page = Mock(return_value={"meta": {"result_count": 0}})
+    assert cursor.fetch(MOCK_USER_ID, fetch_page) == {"meta": {"result_count": 0}}
+    fetch_page.assert_called_once_with(MOCK_USER_ID, since_id="20", max_results=100)
+    assert cursor.since_id(MOCK_USER_ID) == "20"
+
+
+def test_backlog_is_paginated_and_merged():
+    """Test that a backlog is followed through its pages and merged."""
+    cursor = MentionsCursor()
+    cursor.fetch(MOCK_USER_ID, Mock(return_value={"data": [mention("10")]}))
+
+    fetch_page = Mock(
+        side_effect=[
+            {"data": [mention("40"), mention("30")], "meta": {"next_token": "page2"}},
+            {"data": [mention("20")], "includes": {"users": [{"id": "u1"}]}, "meta": {}},
+        ]
+    )
+    response = cursor.fetch(MOCK_USER_ID, fetch_page)
+
+    assert fetch_page.call_args_list == [
+        call(MOCK_USER_ID, since_id="10", max_results=100),
+        call(MOCK_USER_ID, since_id="10", max_results=100, pagination_token="page2"),
+    ]
+    assert [m["id"] for m in response["data"]] == ["40", "30", "20"]
+    assert response["includes"] == {"users": [{"id": "u1"}]}
+    assert response["meta"] == {"result_count": 3, "newest_id": "40", "oldest_id": "20"}
+    assert cursor.since_id(MOCK_USER_ID) == "40"
+
+
+def test_backlog_is_truncated_at_max_pages():
+    """Test that pagination stops at max_pages and flags the response."""
+    cursor = MentionsCursor(max_pages=2)
+    cursor.fetch(MOCK_USER_ID, Mock(return_value={"data": [mention("10")]}))
+
+    fetch_page = Mock(
+        side_effect=[
+            {"data": [mention("40")], "meta": {"next_token": "page2"}},
+            {"data": [mention("30")], "meta": {"next_token": "page3"}},
+        ]
+    )
+    response = cursor.fetch(MOCK_USER_ID, fetch_page)
+
+    assert fetch_page.call_count == 2
+    assert response["meta"]["truncated"] is True
+    assert cursor.since_id(MOCK_USER_ID) == "10"
+
+
+def test_truncated_backlog_resumes_from_next_page():
+    """Test that a truncated backlog is resumed without skipping older mentions."""
+    cursor = MentionsCursor(max_pages=1)
+    cursor.fetch(MOCK_USER_ID, Mock(return_value={"data": [mention("10")]}))
+    cursor.fetch(
+        MOCK_USER_ID,
+        Mock(return_value={"data": [mention("40")], "meta": {"next_token": "page2"}}),
+    )
+
+    fetch_page = Mock(return_value={"data": [mention("30"), mention("20")], "meta": {}})
+    response = cursor.fetch(MOCK_USER_ID, fetch_page)
+
+    fetch_page.assert_called_once_with(
+        MOCK_USER_ID, since_id="10", max_results=100, pagination_token="page2"
+    )
+    assert [m["id"] for m in response["data"]] == ["30", "20"]
+    assert "truncated" not in response["meta"]
+    assert cursor.since_id(MOCK_USER_ID) == "40"
+
+    fetch_page = Mock(return_value={"meta": {"result_count": 0}})
+    cursor.fetch(MOCK_USER_ID, fetch_page)
+    fetch_page.assert_called_once_with(MOCK_USER_ID, since_id="40", max_results=100)
+
+
+def test_failed_fetch_does_not_advance_cursor():
+    """Test that an error on a later page leaves the cursor in place."""
+    cursor = MentionsCursor()
+    cursor.fetch(MOCK_USER_ID, Mock(return_value={"data": [mention("10")]}))
+
+    fetch_page = Mock(
+        side_effect=[
+            {"data": [mention("40")], "meta": {"next_token": "page2"}},
+            RuntimeError("rate limited"),
+        ]
+    )
+    with pytest.raises(RuntimeError):
+        cursor.fetch(MOCK_USER_ID, fetch_page)
+
+    assert cursor.since_id(MOCK_USER_ID) == "10"
+
+
+def test_cache_is_bounded_and_newest_first():
+    """Test that the cache keeps only the most recent mentions."""
+    cursor = MentionsCursor(max_cached=2)
+    cursor.fetch(
+        MOCK_USER_ID, Mock(return_value={"data": [mention("30"), mention("20"), mention("10")]})
+    )
+
+    assert [m["id"] for m in cursor.recent(MOCK_USER_ID)] == ["30", "20"]
+    assert cursor.recent("other") == []
+
+
+def test_merge_pages_without_data():
+    """Test merging pages that contain no mentions."""
+    assert merge_pages([{"meta": {"result_count": 0}}, {}]) == {"meta": {"result_count": 0}}
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_account_mentions_polls_incrementally():
+    """Test that repeated account_mentions calls only fetch new mentions."""
+    provider = twitter_action_provider()
+
+    with patch.object(
+        provider.client,
+        "get_users_mentions",
+        side_effect=[{"data": [mention("20")]}, {"data": [mention("30")]}],
+    ) as mock_get_mentions:
+        provider.account_mentions({"user_id": MOCK_USER_ID})
+        response = provider.account_mentions({"user_id": MOCK_USER_ID, "include_cached": True})
+
+    mock_get_mentions.assert_called_with(MOCK_USER_ID, since_id="20", max_results=100)
+    payload = loads(response.split("\n", 1)[1])
+    assert [m["id"] for m in payload["data"]] == ["30"]
+    assert [m["id"] for m in payload["cached"]] == ["30", "20"]
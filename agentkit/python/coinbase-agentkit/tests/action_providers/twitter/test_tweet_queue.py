@@ -0,0 +1,200 @@
+"""Tests for the rate-limit-aware outbound tweet queue."""
+
+import threading
+import time
+from json import dumps, loads
+from unittest.mock import Mock, patch
+
+import pytest
+
+from coinbase_agentkit.action_providers.twitter.tweet_queue import (
+    FAILED,
+    POSTED,
+    POSTING,
+    QUEUED,
+    TweetQueue,
+)
+from coinbase_agentkit.action_providers.twitter.twitter_action_provider import (
+    twitter_action_provider,
+)
+from coinbase_agentkit.rate_limiting import rate_limiter
+
+MOCK_TWEET_TEXT = "Hello, world!"
+MOCK_TWEET_ID = "1234"
+
+
+def tweet_response(tweet_id: str = MOCK_TWEET_ID) -> dict:
+    """Create a create_tweet response."""
+    return {"data": {"id": tweet_id, "text": MOCK_TWEET_TEXT}}
+
+
+def test_submit_posts_in_background():
+    """Test that queued tweets are posted and their handles resolved."""
+    post = Mock(return_value=tweet_response())
+    queue = TweetQueue(post, "test:tweets:background")
+
+    tweet = queue.submit(MOCK_TWEET_TEXT, "42")
+
+    assert tweet.wait(5)
+    assert tweet.status == POSTED
+    assert tweet.tweet_id == MOCK_TWEET_ID
+    assert queue.get(tweet.handle) is tweet
+    assert tweet.to_dict() == {
+        "handle": tweet.handle,
+        "status": POSTED,
+        "in_reply_to_tweet_id": "42",
+        "tweet_id": MOCK_TWEET_ID,
+    }
+    post.assert_called_once_with(tweet)
+
+
+def test_duplicate_posts_are_coalesced():
+    """Test that posting the same text twice returns the pending handle."""
+    release = threading.Event()
+    post = Mock(side_effect=lambda tweet: release.wait(5) and tweet_response())
+    queue = TweetQueue(post, "test:tweets:coalesce")
+
+    first = queue.submit(MOCK_TWEET_TEXT)
+    second = queue.submit(f"  {MOCK_TWEET_TEXT} ")
+    reply = queue.submit(MOCK_TWEET_TEXT, "42")
+    release.set()
+
+    assert second is first
+    assert reply is not first
+    assert first.wait(5) and reply.wait(5)
+    assert post.call_count == 2
+
+
+def test_posted_tweets_are_resubmitted():
+    """Test that the same text is posted again once the earlier post completed."""
+    post = Mock(side_effect=[tweet_response("1"), tweet_response("2")])
+    queue = TweetQueue(post, "test:tweets:resubmit")
+
+    first = queue.submit(MOCK_TWEET_TEXT)
+    assert first.wait(5)
+
+    second = queue.submit(MOCK_TWEET_TEXT)
+    assert second is not first
+    assert second.wait(5)
+    assert (first.tweet_id, second.tweet_id) == ("1", "2")
+    assert post.call_count == 2
+
+
+def test_posted_tweets_are_coalesced_within_window():
+    """Test that a posted tweet is only coalesced within the coalesce window."""
+    post = Mock(side_effect=[tweet_response("1"), tweet_response("2")])
+    queue = TweetQueue(post, "test:tweets:window", coalesce_window=60)
+
+    first = queue.submit(MOCK_TWEET_TEXT)
+    assert first.wait(5)
+    assert queue.submit(MOCK_TWEET_TEXT) is first
+
+    first.posted_at -= 61
+    second = queue.submit(MOCK_TWEET_TEXT)
+    assert second is not first
+    assert second.wait(5)
+    assert post.call_count == 2
+
+
+def test_failed_posts_are_not_coalesced():
+    """Test that a failed tweet can be posted again."""
+    post = Mock(side_effect=[ValueError("duplicate content"), tweet_response()])
+    queue = TweetQueue(post, "test:tweets:failed")
+
+    first = queue.submit(MOCK_TWEET_TEXT)
+    assert first.wait(5)
+    assert first.status == FAILED
+    assert first.to_dict()["error"] == "duplicate content"
+
+    second = queue.submit(MOCK_TWEET_TEXT)
+    assert second is not first
+    assert second.wait(5)
+    assert second.status == POSTED
+
+
+def test_rate_limited_posts_are_retried_after_reset():
+    """Test that a 429 keeps the tweet queued until the window resets."""
+    rate_limited = RuntimeError("429 Too Many Requests")
+    rate_limited.response = Mock(
+        headers={"x-rate-limit-remaining": "0", "x-rate-limit-reset": str(time.time())}
+    )
+    post = Mock(side_effect=[rate_limited, tweet_response()])
+    queue = TweetQueue(post, "test:tweets:retry", is_rate_limited=lambda e: e is rate_limited)
+
+    with patch("coinbase_agentkit.action_providers.twitter.tweet_queue.time.sleep") as sleep:
+        tweet = queue.submit(MOCK_TWEET_TEXT)
+        assert tweet.wait(5)
+
+    assert tweet.status == POSTED
+    assert post.call_count == 2
+    sleep.assert_called_once_with(1.0)
+    assert queue.remaining == 0
+
+
+def test_exhausted_window_pauses_the_route():
+    """Test that the rate limit headers pause the bucket until the reset."""
+    key = "test:tweets:window"
+    queue = TweetQueue(Mock(), key)
+
+    queue.update_rate_limit({"x-rate-limit-remaining": "3", "x-rate-limit-reset": "0"})
+    assert not rate_limiter.bucket(key).is_paused()
+
+    queue.update_rate_limit(
+        {"x-rate-limit-remaining": "0", "x-rate-limit-reset": str(time.time() + 60)}
+    )
+    assert queue.remaining == 0
+    assert rate_limiter.bucket(key).is_paused()
+
+
+def test_record_response_ignores_other_routes():
+    """Test that the response hook only reads responses of the tweets route."""
+    queue = TweetQueue(Mock(), "test:tweets:hook")
+    headers = {"x-rate-limit-remaining": "7", "x-rate-limit-reset": "0"}
+
+    queue.record_response(
+        Mock(request=Mock(method="GET"), url="https://api.twitter.com/2/users/me", headers=headers)
+    )
+    assert queue.remaining is None
+
+    queue.record_response(
+        Mock(request=Mock(method="POST"), url="https://api.twitter.com/2/tweets", headers=headers)
+    )
+    assert queue.remaining == 7
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_post_tweet_returns_handle_when_not_posted_in_time():
+    """Test that post_tweet returns a queued handle that resolves to the tweet ID."""
+    provider = twitter_action_provider()
+    provider.post_wait = 0
+    release = threading.Event()
+
+    with patch.object(
+        provider.client,
+        "create_tweet",
+        side_effect=lambda **kwargs: release.wait(5) and tweet_response(),
+    ):
+        response = provider.post_tweet({"tweet": MOCK_TWEET_TEXT})
+        assert response.startswith("Queued tweet for posting:\n")
+        payload = loads(response.split("\n", 1)[1])
+        handle = provider.outbound.get(payload["handle"])
+
+        assert payload["status"] in (QUEUED, POSTING)
+        assert not handle.done
+
+        release.set()
+        assert handle.wait(5)
+
+    response = provider.get_queued_tweet({"handle": handle.handle})
+    assert response == f"Successfully retrieved queued tweet:\n{dumps(handle.to_dict())}"
+    assert f'"tweet_id": "{MOCK_TWEET_ID}"' in response
+
+
+@pytest.mark.usefixtures("mock_env")
+def test_get_queued_tweet_unknown_handle():
+    """Test that unknown handles are reported."""
+    provider = twitter_action_provider()
+
+    assert provider.get_queued_tweet({"handle": "missing"}) == (
+        "Error retrieving queued tweet: Unknown handle missing"
+    )
@@ -0,0 +1,158 @@
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from coinbase_agentkit.action_providers.wallet.constants import ERC20_BALANCE_ABI
+from coinbase_agentkit.action_providers.wallet.schemas import GetBalancesAllChainsSchema
+from coinbase_agentkit.action_providers.wallet.wallet_action_provider import (
+    WalletActionProvider,
+)
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmWalletProvider
+from coinbase_agentkit.wallet_providers.multi_chain_wallet_provider import (
+    MultiChainWalletProvider,
+)
+
+from .conftest import MOCK_ADDRESS
+
+USDC = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+
+
+@pytest.fixture(autouse=True)
+def no_analytics():
+    """Keep wallet provider initialization from sending analytics events."""
+    with patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"):
+        yield
+
+
+def respond(target, function_name, args):
+    """Answer the balance reads of a wallet holding 1.5 ETH and 2.5 USDC."""
+    return {
+        "getEthBalance": 1_500_000_000_000_000_000,
+        "getBlockNumber": 123,
+        "balanceOf": 2_500_000,
+        "decimals": 6,
+        "symbol": "USDC",
+    }[function_name]
+
+
+@pytest.fixture
+def chain_wallet(multicall_reader):
+    """Create a factory of EVM wallet provider mocks serving reads through multicall."""
+
+    def build(network_id: str) -> Mock:
+        wallet = Mock(spec=EvmWalletProvider)
+        wallet.get_address.return_value = MOCK_ADDRESS
+        wallet.get_network.return_value = Network(protocol_family="evm", network_id=network_id)
+        wallet.read_contract.side_effect = multicall_reader([ERC20_BALANCE_ABI], respond)
+        return wallet
+
+    return build
+
+
+def test_get_balances_all_chains_schema():
+    """Test that the chains to query are optional."""
+    assert GetBalancesAllChainsSchema().network_ids is None
+    assert GetBalancesAllChainsSchema(network_ids=["8453"]).network_ids == ["8453"]
+
+
+def test_get_balances_all_chains_reads_each_chain_in_one_call(chain_wallet):
+    """Test that every chain is read with a single multicall."""
+    provider = MultiChainWalletProvider(chain_wallet, "base-sepolia", ["84532", "8453"])
+    action_provider = WalletActionProvider(tokens={"base-sepolia": [USDC]})
+
+    result = action_provider.get_balances_all_chains(provider, {})
+
+    assert result == (
+        f"Balances of {MOCK_ADDRESS} across 2 chains:\n"
+        "- base-sepolia (chain 84532, block 123): 1.5 ETH, 2.5 USDC\n"
+        "- base-mainnet (chain 8453, block 123): 1.5 ETH"
+    )
+    for network_id in ("base-sepolia", "base-mainnet"):
+        assert provider.get_provider(network_id).read_contract.call_count == 1
+
+
+def test_get_balances_all_chains_returns_partial_results_on_timeout(chain_wallet):
+    """Test that a slow chain is reported as timed out without delaying the others."""
+    release = threading.Event()
+
+    def build(network_id):
+        wallet = chain_wallet(network_id)
+        if network_id == "base-mainnet":
+            read = wallet.read_contract.side_effect
+            wallet.read_contract.side_effect = lambda **kwargs: release.wait(5) and read(**kwargs)
+        return wallet
+
+    provider = MultiChainWalletProvider(build, "base-sepolia", ["84532", "8453"])
+    action_provider = WalletActionProvider(tokens={}, chain_timeout=0.2)
+
+    try:
+        result = action_provider.get_balances_all_chains(provider, {})
+    finally:
+        release.set()
+
+    assert "- base-sepolia (chain 84532, block 123): 1.5 ETH" in result
+    assert "- base-mainnet: timed out after 0.2s" in result
+
+
+def test_get_balances_all_chains_does_not_queue_behind_hung_reads(chain_wallet):
+    """Test that a read still hanging from an earlier query does not delay later ones."""
+    release = threading.Event()
+    hung = threading.Event()
+
+    def build(network_id):
+        wallet = chain_wallet(network_id)
+        read = wallet.read_contract.side_effect
+
+        def read_contract(**kwargs):
+            if not hung.is_set():
+                hung.set()
+                release.wait(5)
+            return read(**kwargs)
+
+        wallet.read_contract.side_effect = read_contract
+        return wallet
+
+    provider = MultiChainWalletProvider(build, "base-sepolia", ["84532"])
+    action_provider = WalletActionProvider(tokens={}, chain_timeout=0.5)
+
+    try:
+        first = action_provider.get_balances_all_chains(provider, {})
+        second = action_provider.get_balances_all_chains(provider, {})
+    finally:
+        release.set()
+
+    assert "- base-sepolia: timed out after 0.5s" in first
+    assert "- base-sepolia (chain 84532, block 123): 1.5 ETH" in second
+
+
+def test_get_balances_all_chains_reports_chain_errors(chain_wallet):
+    """Test that a failing chain does not fail the others."""
+
+    def build(network_id):
+        if network_id == "base-mainnet":
+            raise ConnectionError("RPC unavailable")
+        return chain_wallet(network_id)
+
+    provider = MultiChainWalletProvider(build, "base-sepolia", ["84532", "8453"])
+
+    result = WalletActionProvider(tokens={}).get_balances_all_chains(provider, {})
+
+    assert "- base-sepolia (chain 84532, block 123): 1.5 ETH" in result
+    assert "- base-mainnet: error: RPC unavailable" in result
+
+
+def test_get_balances_all_chains_single_chain_wallet(chain_wallet):
+    """Test that a single-chain wallet is queried on its own network only."""
+    wallet = chain_wallet("base-sepolia")
+    action_provider = WalletActionProvider(tokens={"base-sepolia": [USDC]})
+
+    result = action_provider.get_balances_all_chains(wallet, {"network_ids": ["84532"]})
+    assert result.endswith("- base-sepolia (chain 84532, block 123): 1.5 ETH, 2.5 USDC")
+
+    result = action_provider.get_balances_all_chains(wallet, {"network_ids": ["8453"]})
+    assert result == (
+        "Error getting balances across chains: The wallet is only available on base-sepolia. "
+        "Use a MultiChainWalletProvider to query other chains"
+    )
@@ -0,0 +1,57 @@
+"""Tests for the lazy imports of action and wallet providers."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import coinbase_agentkit
+from coinbase_agentkit import action_providers, wallet_providers
+
+HEAVY_MODULES = ["allora_sdk", "cdp", "eth_account", "paramiko", "tweepy", "web3"]
+
+
+def run_python(code: str) -> dict:
+    """Run code in a fresh interpreter and parse the JSON it prints."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=120
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def loaded_after(statement: str) -> list[str]:
+    """Get the heavy modules loaded by a statement in a fresh interpreter."""
+    return run_python(
+        f"import json, sys\n{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+
+
+def test_import_does_not_load_heavy_sdks():
+    """Test that importing the package loads none of the provider SDKs."""
+    assert loaded_after("import coinbase_agentkit") == []
+
+
+def test_wallet_action_provider_does_not_load_heavy_sdks():
+    """Test that the wallet action provider can be used without the other providers."""
+    assert loaded_after("from coinbase_agentkit import AgentKit, wallet_action_provider") == []
+
+
+def test_provider_is_imported_on_first_access():
+    """Test that accessing a provider imports only its SDK."""
+    assert loaded_after("from coinbase_agentkit import ssh_action_provider") == ["paramiko"]
+
+
+@pytest.mark.parametrize("module", [coinbase_agentkit, action_providers, wallet_providers])
+def test_every_exported_name_resolves(module):
+    """Test that every name in __all__ resolves and is listed by dir()."""
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+
+def test_unknown_attribute_raises():
+    """Test that unknown attributes still raise AttributeError."""
+    with pytest.raises(AttributeError, match="no attribute 'missing_provider'"):
+        _ = action_providers.missing_provider
@@ -0,0 +1,139 @@
+"""Tests for per-action instrumentation."""
+
+from unittest.mock import patch
+
+import pytest
+from eth_account import Account
+from pydantic import BaseModel
+from web3 import Web3
+from web3.providers import BaseProvider
+
+from coinbase_agentkit.action_providers.action_decorator import create_action
+from coinbase_agentkit.instrumentation import (
+    InMemoryMetricsSink,
+    InstrumentationMiddleware,
+    MetricsSink,
+    action_trace,
+    add_metrics_sink,
+    current_trace,
+    remove_metrics_sink,
+    track,
+)
+from coinbase_agentkit.rate_limiting import RateLimiter
+from coinbase_agentkit.wallet_providers import (
+    EthAccountWalletProvider,
+    EthAccountWalletProviderConfig,
+)
+
+MOCK_RESULT = {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+
+
+class StubProvider(BaseProvider):
+    """A web3 provider that answers every request with the same result."""
+
+    def make_request(self, method, params):
+        """Answer a request."""
+        return MOCK_RESULT
+
+
+class EmptySchema(BaseModel):
+    """An empty action schema."""
+
+
+@pytest.fixture
+def sink():
+    """Register an in-memory metrics sink for the duration of a test."""
+    sink = InMemoryMetricsSink()
+    add_metrics_sink(sink)
+    yield sink
+    remove_metrics_sink(sink)
+
+
+@pytest.fixture
+def web3():
+    """Create a Web3 instance with the instrumentation middleware."""
+    w3 = Web3(StubProvider())
+    w3.middleware_onion.inject(InstrumentationMiddleware, name="instrumentation", layer=0)
+    return w3
+
+
+def test_action_attributes_rpc_calls(sink, web3):
+    """Test that JSON-RPC requests made by an action are attributed to it."""
+
+    class TestProvider:
+        @create_action(name="read_chain", description="Read the chain", schema=EmptySchema)
+        def read_chain(self, args):
+            web3.eth.block_number  # noqa: B018
+            web3.eth.block_number  # noqa: B018
+            web3.eth.chain_id  # noqa: B018
+            return "done"
+
+    with patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"):
+        assert TestProvider().read_chain({}) == "done"
+
+    (trace,) = sink.traces
+    assert trace.action_name.endswith("TestProvider_read_chain")
+    assert trace.count("rpc") == 3
+    assert trace.to_dict()["calls"]["rpc"]["eth_blockNumber"]["count"] == 2
+    assert trace.duration > 0
+    assert current_trace() is None
+
+
+def test_calls_outside_actions_reach_sinks(web3):
+    """Test that calls made outside an action are still reported to sinks."""
+    calls = []
+
+    class RecordingSink(MetricsSink):
+        def record_call(self, kind, name, elapsed, error, action_name, endpoint=None):
+            calls.append((kind, name, error, action_name))
+
+    sink = RecordingSink()
+    add_metrics_sink(sink)
+    try:
+        web3.eth.block_number  # noqa: B018
+        with pytest.raises(ValueError), track("sign", "sign_message"):
+            raise ValueError("failed")
+    finally:
+        remove_metrics_sink(sink)
+
+    assert calls == [("rpc", "eth_blockNumber", False, None), ("sign", "sign_message", True, None)]
+
+
+def test_failing_sink_does_not_break_calls(web3):
+    """Test that a failing sink does not affect the instrumented call."""
+
+    class FailingSink(MetricsSink):
+        def record_call(self, kind, name, elapsed, error, action_name, endpoint=None):
+            raise RuntimeError("sink down")
+
+    sink = FailingSink()
+    add_metrics_sink(sink)
+    try:
+        assert web3.eth.block_number == 1
+    finally:
+        remove_metrics_sink(sink)
+
+
+def test_wallet_provider_signing_is_tracked():
+    """Test that wallet provider signing methods are attributed to the running action."""
+    with patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"):
+        wallet_provider = EthAccountWalletProvider(
+            EthAccountWalletProviderConfig(
+                account=Account.create(), chain_id="84532", rpc_url="https://rpc.example.com"
+            )
+        )
+
+    with action_trace("sign") as trace:
+        wallet_provider.sign_message("hello")
+
+    assert trace.to_dict()["calls"]["sign"]["sign_message"]["count"] == 1
+
+
+def test_rate_limited_requests_are_tracked():
+    """Test that HTTP requests sent through the rate limiter are attributed to the action."""
+    limiter = RateLimiter()
+
+    with action_trace("fetch") as trace:
+        limiter.call("https://api.example.com/v1/prices", lambda: "ok")
+
+    assert trace.to_dict()["calls"]["http"]["https://api.example.com"]["count"] == 1
@@ -0,0 +1,170 @@
+"""Tests for the OpenMetrics exporter."""
+
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+from web3 import Web3
+from web3.providers import BaseProvider
+
+from coinbase_agentkit.action_providers.action_decorator import create_action
+from coinbase_agentkit.action_providers.ssh.connection_pool import SSHConnectionPool
+from coinbase_agentkit.instrumentation import InstrumentationMiddleware, track
+from coinbase_agentkit.metrics import (
+    CONTENT_TYPE,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    disable_metrics,
+    enable_metrics,
+    make_wsgi_app,
+    start_http_server,
+)
+from coinbase_agentkit.wallet_providers.single_flight import SingleFlight
+
+
+class StubProvider(BaseProvider):
+    """A web3 provider that answers every request with the same result."""
+
+    def make_request(self, method, params):
+        """Answer a request."""
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+
+
+class EmptySchema(BaseModel):
+    """An empty action schema."""
+
+
+@pytest.fixture
+def metrics_enabled():
+    """Collect AgentKit metrics for the duration of a test."""
+    enable_metrics()
+    yield
+    disable_metrics()
+
+
+def test_render_openmetrics():
+    """Test the OpenMetrics rendering of every metric type."""
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("test_requests", "Requests.", ("path",)))
+    gauge = registry.register(Gauge("test_open", "Open connections."))
+    histogram = registry.register(Histogram("test_latency_seconds", "Latency.", buckets=(0.1, 1)))
+
+    counter.inc(path='/a"b')
+    counter.inc(2, path='/a"b')
+    gauge.set(3)
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    assert registry.render() == (
+        "# TYPE test_requests counter\n"
+        "# HELP test_requests Requests.\n"
+        'test_requests_total{path="/a\\"b"} 3.0\n'
+        "# TYPE test_open gauge\n"
+        "# HELP test_open Open connections.\n"
+        "test_open 3.0\n"
+        "# TYPE test_latency_seconds histogram\n"
+        "# HELP test_latency_seconds Latency.\n"
+        'test_latency_seconds_bucket{le="0.1"} 1.0\n'
+        'test_latency_seconds_bucket{le="1.0"} 2.0\n'
+        'test_latency_seconds_bucket{le="+Inf"} 3.0\n'
+        "test_latency_seconds_count 3.0\n"
+        "test_latency_seconds_sum 5.55\n"
+        "# EOF\n"
+    )
+
+
+def test_labels_must_match():
+    """Test that observations with the wrong labels are rejected."""
+    counter = Counter("test_requests", "Requests.", ("path",))
+
+    with pytest.raises(ValueError):
+        counter.inc(method="GET")
+
+
+def test_actions_and_rpc_calls_are_exported(metrics_enabled):
+    """Test that action latency and RPC latency by method are collected."""
+    web3 = Web3(StubProvider())
+    web3.middleware_onion.inject(InstrumentationMiddleware, name="instrumentation", layer=0)
+
+    class MetricsTestProvider:
+        @create_action(name="read_chain", description="Read the chain", schema=EmptySchema)
+        def read_chain(self, args):
+            return web3.eth.block_number
+
+    with patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"):
+        MetricsTestProvider().read_chain({})
+    with track("receipt_wait", "wait_for_transaction_receipt"):
+        pass
+
+    exposition = REGISTRY.render()
+    assert 'agentkit_rpc_duration_seconds_count{method="eth_blockNumber"}' in exposition
+    assert "MetricsTestProvider_read_chain" in exposition
+    assert "agentkit_receipt_wait_seconds_count" in exposition
+
+
+def test_cache_lookups_are_exported(metrics_enabled):
+    """Test that cache hits and misses are counted."""
+    SingleFlight("metrics_test_cache").do("key", lambda: 1)
+
+    assert (
+        'agentkit_cache_lookups_total{cache="metrics_test_cache",result="miss"} 1.0'
+        in REGISTRY.render()
+    )
+
+
+def test_ssh_pool_occupancy_is_exported(metrics_enabled):
+    """Test that SSH pools report their occupancy until they are closed."""
+    pool = SSHConnectionPool(max_connections=4, name="metrics_test_pool")
+
+    exposition = REGISTRY.render()
+    assert 'agentkit_ssh_pool_connections{pool="metrics_test_pool"} 0.0' in exposition
+    assert 'agentkit_ssh_pool_capacity{pool="metrics_test_pool"} 4.0' in exposition
+
+    pool.clear_connection_pool()
+    assert 'pool="metrics_test_pool"' not in REGISTRY.render()
+
+
+def test_ssh_pools_sharing_a_name_are_summed(metrics_enabled):
+    """Test that pools with the same name report one series for all of them."""
+    first = SSHConnectionPool(max_connections=2, name="metrics_shared_pool")
+    second = SSHConnectionPool(max_connections=3, name="metrics_shared_pool")
+
+    assert 'agentkit_ssh_pool_capacity{pool="metrics_shared_pool"} 5.0' in REGISTRY.render()
+
+    second.clear_connection_pool()
+    assert 'agentkit_ssh_pool_capacity{pool="metrics_shared_pool"} 2.0' in REGISTRY.render()
+    first.clear_connection_pool()
+
+
+def test_ssh_pool_occupancy_is_not_recorded_when_disabled():
+    """Test that pools do not write metrics unless metrics are enabled."""
+    SSHConnectionPool(max_connections=4, name="metrics_disabled_pool")
+
+    assert 'pool="metrics_disabled_pool"' not in REGISTRY.render()
+
+
+def test_http_server_serves_metrics():
+    """Test that the embedded HTTP server serves the exposition."""
+    server = start_http_server(0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics") as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert response.read().decode().endswith("# EOF\n")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_wsgi_app_serves_metrics():
+    """Test that the WSGI app serves the exposition."""
+    responses = []
+    body = make_wsgi_app()({}, lambda status, headers: responses.append((status, headers)))
+
+    assert responses[0][0] == "200 OK"
+    assert ("Content-Type", CONTENT_TYPE) in responses[0][1]
+    assert b"".join(body).endswith(b"# EOF\n")
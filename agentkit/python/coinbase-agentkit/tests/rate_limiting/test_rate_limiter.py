@@ -0,0 +1,137 @@
+"""Tests for the client-side rate limiter."""
+
+import threading
+import time
+from email.utils import formatdate
+from unittest import mock
+
+import pytest
+import requests
+from web3 import HTTPProvider
+
+from coinbase_agentkit.rate_limiting import (
+    RateLimiter,
+    RateLimitTimeoutError,
+    TokenBucket,
+    endpoint_key,
+    get_retry_after,
+)
+from coinbase_agentkit.wallet_providers.rpc_pool import RateLimitedHTTPProvider
+
+MOCK_URL = "https://api.example.com/v1/resource?query=1"
+MOCK_RESPONSE = {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+
+
+def _rate_limited_response(headers: dict[str, str] | None = None) -> requests.Response:
+    """Create a 429 response."""
+    response = requests.Response()
+    response.status_code = 429
+    response.headers.update(headers or {})
+    return response
+
+
+def test_endpoint_key():
+    """Test that URLs are keyed on their origin and other keys are kept verbatim."""
+    assert endpoint_key(MOCK_URL) == "https://api.example.com"
+    assert endpoint_key("HTTPS://API.example.com:8545/rpc") == "https://api.example.com:8545"
+    assert endpoint_key("x-api:POST /2/tweets") == "x-api:POST /2/tweets"
+
+
+def test_bucket_allows_burst_then_throttles():
+    """Test that a bucket hands out its burst immediately and then refills at its rate."""
+    bucket = TokenBucket("test", rate=20, burst=2)
+
+    assert bucket.acquire() < 0.01
+    assert bucket.acquire() < 0.01
+    assert bucket.acquire() >= 0.03
+
+
+def test_bucket_serves_callers_in_order():
+    """Test that callers waiting on a bucket are served in arrival order."""
+    bucket = TokenBucket("test", rate=50, burst=1)
+    bucket.acquire()
+    order = []
+
+    def worker(index: int) -> None:
+        bucket.acquire()
+        order.append(index)
+
+    threads = []
+    for index in range(5):
+        thread = threading.Thread(target=worker, args=(index,))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.005)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_paused_bucket_times_out():
+    """Test that acquiring from a paused bucket fails fast when the pause outlasts the timeout."""
+    bucket = TokenBucket("test")
+    bucket.pause(60)
+
+    assert bucket.is_paused()
+    with pytest.raises(RateLimitTimeoutError):
+        bucket.acquire(timeout=0.01)
+
+
+def test_get_retry_after():
+    """Test parsing of the retry delay of rate limited responses."""
+    assert get_retry_after(None) is None
+    assert get_retry_after(mock.Mock(status_code=200, headers={})) is None
+    assert get_retry_after(_rate_limited_response({"Retry-After": "7"})) == 7
+
+    http_date = formatdate(time.time() + 30, usegmt=True)
+    assert 25 < get_retry_after(_rate_limited_response({"Retry-After": http_date})) <= 30
+
+    reset = str(int(time.time()) + 60)
+    assert 55 < get_retry_after(_rate_limited_response({"x-rate-limit-reset": reset})) <= 60
+
+    assert get_retry_after(_rate_limited_response()) == 1.0
+
+
+def test_call_retries_rate_limited_error():
+    """Test that a request rejected with a 429 is paused and queued again."""
+    limiter = RateLimiter()
+    error = requests.HTTPError(
+        "rate limited", response=_rate_limited_response({"Retry-After": "0.05"})
+    )
+    send = mock.Mock(side_effect=[error, "ok"])
+
+    start = time.monotonic()
+    assert limiter.call(MOCK_URL, send) == "ok"
+
+    assert send.call_count == 2
+    assert time.monotonic() - start >= 0.05
+
+
+def test_call_returns_rate_limited_response_when_out_of_retries():
+    """Test that the last rate limited response is returned to the caller."""
+    limiter = RateLimiter()
+    response = _rate_limited_response({"Retry-After": "5"})
+
+    assert limiter.call(MOCK_URL, lambda: response, max_retries=0) is response
+    assert limiter.bucket(MOCK_URL).is_paused()
+
+
+def test_rate_limited_http_provider_retries_after_429():
+    """Test that the web3 transport honors Retry-After before resending a request."""
+    error = requests.HTTPError(
+        "rate limited", response=_rate_limited_response({"Retry-After": "0"})
+    )
+    provider = RateLimitedHTTPProvider("https://rpc.example.com")
+
+    with (
+        mock.patch(
+            "coinbase_agentkit.wallet_providers.rpc_pool.rate_limiter", RateLimiter()
+        ) as limiter,
+        mock.patch.object(
+            HTTPProvider, "make_request", side_effect=[error, MOCK_RESPONSE]
+        ) as make_request,
+    ):
+        assert provider.make_request("eth_blockNumber", []) == MOCK_RESPONSE
+        assert make_request.call_count == 2
+        assert "https://rpc.example.com" in limiter._buckets
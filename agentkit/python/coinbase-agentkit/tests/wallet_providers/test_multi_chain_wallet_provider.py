@@ -0,0 +1,266 @@
+"""Tests for the multi-chain wallet provider."""
+
+import json
+import threading
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from cdp import Wallet, WalletData
+
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.cdp_wallet_provider import (
+    CdpWalletProvider,
+    CdpWalletProviderConfig,
+)
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmWalletProvider
+from coinbase_agentkit.wallet_providers.multi_chain_wallet_provider import (
+    MultiChainWalletProvider,
+    resolve_network_id,
+)
+
+MOCK_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+@pytest.fixture(autouse=True)
+def no_analytics():
+    """Keep wallet provider initialization from sending analytics events."""
+    with mock.patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"):
+        yield
+
+
+def fake_provider(network_id: str) -> mock.Mock:
+    """Create a wallet provider mock on a network."""
+    provider = mock.Mock(spec=EvmWalletProvider)
+    provider.get_address.return_value = MOCK_ADDRESS
+    provider.get_network.return_value = Network(protocol_family="evm", network_id=network_id)
+    provider.get_balance.return_value = Decimal(len(network_id))
+    return provider
+
+
+@pytest.fixture
+def factory():
+    """Create a factory building a wallet provider mock per network."""
+    return mock.Mock(side_effect=fake_provider)
+
+
+def test_resolve_network_id():
+    """Test that chains resolve from chain IDs and network IDs."""
+    assert resolve_network_id("8453") == "base-mainnet"
+    assert resolve_network_id("base-mainnet") == "base-mainnet"
+    with pytest.raises(ValueError, match="Unsupported chain 999"):
+        resolve_network_id("999")
+
+
+def test_providers_are_built_once_per_chain(factory):
+    """Test that each chain's provider is built on first use and then reused."""
+    provider = MultiChainWalletProvider(factory, "base-sepolia")
+
+    assert provider.get_network().network_id == "base-sepolia"
+    base = provider.get_provider("8453")
+    assert provider.get_provider("base-mainnet") is base
+    provider.get_balance()
+
+    assert [c.args[0] for c in factory.call_args_list] == ["base-sepolia", "base-mainnet"]
+
+
+def test_switch_network_changes_the_default(factory):
+    """Test that switching chains delegates later calls to the new chain."""
+    provider = MultiChainWalletProvider(factory, "base-sepolia")
+
+    provider.switch_network("84532")
+    provider.switch_network("ethereum-mainnet")
+
+    assert provider.current_network_id == "ethereum-mainnet"
+    assert provider.get_network().network_id == "ethereum-mainnet"
+    assert provider.get_balance() == Decimal(len("ethereum-mainnet"))
+
+
+def test_on_network_overrides_the_chain_per_call(factory):
+    """Test that on_network targets another chain only within the block and thread."""
+    provider = MultiChainWalletProvider(factory, "base-sepolia")
+    seen = []
+
+    with provider.on_network("8453") as base:
+        provider.send_transaction({"to": MOCK_ADDRESS})
+        thread = threading.Thread(target=lambda: seen.append(provider.current_network_id))
+        thread.start()
+        thread.join()
+
+    base.send_transaction.assert_called_once_with({"to": MOCK_ADDRESS})
+    assert seen == ["base-sepolia"]
+    assert provider.current_network_id == "base-sepolia"
+
+
+def test_delegates_every_wallet_method(factory):
+    """Test that wallet provider methods and extra attributes reach the current provider."""
+    provider = MultiChainWalletProvider(factory, "base-sepolia")
+    inner = provider.get_provider()
+    inner.export_wallet = mock.Mock(return_value="exported")
+
+    provider.read_contract(MOCK_ADDRESS, [], "balanceOf", [MOCK_ADDRESS])
+    provider.wait_for_transaction_receipt("0xabc", timeout=5)
+    provider.native_transfer(MOCK_ADDRESS, Decimal("1"))
+    provider.sign_message("hello")
+
+    inner.read_contract.assert_called_once_with(
+        MOCK_ADDRESS, [], "balanceOf", [MOCK_ADDRESS], "latest"
+    )
+    inner.wait_for_transaction_receipt.assert_called_once_with("0xabc", timeout=5, poll_latency=0.1)
+    inner.native_transfer.assert_called_once_with(MOCK_ADDRESS, Decimal("1"))
+    inner.sign_message.assert_called_once_with("hello")
+    assert provider.export_wallet() == "exported"
+    assert provider.get_name() == "multi_chain_wallet_provider"
+
+
+def test_disallowed_chains_are_rejected(factory):
+    """Test that only the configured chains can be used."""
+    provider = MultiChainWalletProvider(factory, "8453", network_ids=["8453", "1"])
+
+    assert provider.network_ids == ["base-mainnet", "ethereum-mainnet"]
+    with pytest.raises(ValueError, match="Chain base-sepolia is not enabled"):
+        provider.switch_network("base-sepolia")
+    with pytest.raises(ValueError, match="not enabled"):
+        MultiChainWalletProvider(factory, "base-sepolia", network_ids=["8453"])
+
+
+def test_concurrent_first_use_builds_one_provider(factory):
+    """Test that concurrent first use of a chain builds its provider once."""
+    release = threading.Event()
+
+    def slow_factory(network_id):
+        release.wait(5)
+        return fake_provider(network_id)
+
+    factory.side_effect = slow_factory
+    provider = MultiChainWalletProvider(factory, "base-sepolia")
+    factory.reset_mock()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(provider.get_provider("optimism-mainnet")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert factory.call_count == 1
+    assert all(result is results[0] for result in results)
+
+
+def fake_cdp_provider(config) -> mock.Mock:
+    """Create a CDP wallet provider mock on the network of its wallet, like the SDK."""
+    data = json.loads(config.wallet_data) if config.wallet_data else {}
+    network_id = data.get("network_id") or config.network_id
+    provider = mock.Mock(spec=CdpWalletProvider)
+    provider.get_network.return_value = Network(protocol_family="evm", network_id=network_id)
+    provider.export_wallet.return_value = WalletData(
+        data.get("wallet_id", "created"), data.get("seed", "created-seed"), network_id
+    )
+    return provider
+
+
+def created_wallet(seed: str, network_id: str) -> mock.Mock:
+    """Create a mock of a CDP wallet created from a seed."""
+    wallet = mock.Mock()
+    wallet.export_data.return_value = WalletData(f"{network_id}-wallet", seed, network_id)
+    return wallet
+
+
+def test_from_cdp_config_creates_each_chain_from_the_wallet_seed():
+    """Test that other chains get a wallet created from the seed of the imported wallet."""
+    wallet_data = json.dumps({"wallet_id": "w1", "seed": "s", "network_id": "base-sepolia"})
+    config = CdpWalletProviderConfig(api_key_name="name", wallet_data=wallet_data)
+
+    with (
+        mock.patch(
+            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.CdpWalletProvider",
+            side_effect=fake_cdp_provider,
+        ) as cdp_provider,
+        mock.patch.object(Wallet, "create_with_seed", side_effect=created_wallet) as create,
+    ):
+        provider = MultiChainWalletProvider.from_cdp_config(config)
+        mainnet = provider.get_provider("base-mainnet")
+
+    create.assert_called_once_with(seed="s", network_id="base-mainnet")
+    default, built = (c.args[0] for c in cdp_provider.call_args_list)
+    assert json.loads(default.wallet_data)["wallet_id"] == "w1"
+    assert built.api_key_name == "name"
+    assert json.loads(built.wallet_data) == {
+        "wallet_id": "base-mainnet-wallet",
+        "seed": "s",
+        "network_id": "base-mainnet",
+    }
+    assert mainnet.get_network().network_id == "base-mainnet"
+    assert provider.current_network_id == "base-sepolia"
+
+
+def test_from_cdp_config_reuses_persisted_chain_wallets():
+    """Test that chain wallets are imported when persisted and reported when created."""
+    wallet_data = json.dumps({"wallet_id": "w1", "seed": "s", "network_id": "base-sepolia"})
+    mainnet_data = json.dumps({"wallet_id": "w2", "seed": "s", "network_id": "base-mainnet"})
+    created = []
+
+    with (
+        mock.patch(
+            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.CdpWalletProvider",
+            side_effect=fake_cdp_provider,
+        ) as cdp_provider,
+        mock.patch.object(Wallet, "create_with_seed", side_effect=created_wallet) as create,
+    ):
+        provider = MultiChainWalletProvider.from_cdp_config(
+            CdpWalletProviderConfig(wallet_data=wallet_data),
+            chain_wallet_data={"8453": mainnet_data},
+            on_wallet_created=lambda network_id, data: created.append(network_id),
+        )
+        provider.get_provider("base-mainnet")
+        provider.get_provider("optimism-mainnet")
+
+    create.assert_called_once_with(seed="s", network_id="optimism-mainnet")
+    assert created == ["optimism-mainnet"]
+    built = {c.args[0].network_id: c.args[0] for c in cdp_provider.call_args_list}
+    assert built["base-mainnet"].wallet_data == mainnet_data
+
+
+def test_from_cdp_config_creates_one_wallet_without_wallet_data():
+    """Test that a new wallet is created once and its seed is reused on other chains."""
+    with (
+        mock.patch(
+            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.CdpWalletProvider",
+            side_effect=fake_cdp_provider,
+        ) as cdp_provider,
+        mock.patch.object(Wallet, "create_with_seed", side_effect=created_wallet) as create,
+    ):
+        provider = MultiChainWalletProvider.from_cdp_config(
+            CdpWalletProviderConfig(network_id="base-mainnet")
+        )
+        provider.get_provider("base-sepolia")
+        provider.get_provider("base-mainnet")
+
+    assert [c.args[0].network_id for c in cdp_provider.call_args_list] == [
+        "base-mainnet",
+        "base-sepolia",
+    ]
+    create.assert_called_once_with(seed="created-seed", network_id="base-sepolia")
+
+
+def test_from_cdp_config_rejects_a_wallet_on_another_chain():
+    """Test that a provider loaded on another network than requested is not used."""
+    wallet_data = json.dumps({"wallet_id": "w1", "seed": "s", "network_id": "base-sepolia"})
+    with (
+        mock.patch(
+            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.CdpWalletProvider",
+            # The SDK takes the network of imported wallets from the server record.
+            side_effect=lambda config: fake_cdp_provider(
+                config.model_copy(update={"wallet_data": wallet_data})
+            ),
+        ),
+        mock.patch.object(Wallet, "create_with_seed", side_effect=created_wallet),
+    ):
+        provider = MultiChainWalletProvider.from_cdp_config(
+            CdpWalletProviderConfig(wallet_data=wallet_data)
+        )
+        with pytest.raises(ValueError, match="for base-mainnet was loaded on base-sepolia"):
+            provider.get_provider("base-mainnet")
@@ -0,0 +1,120 @@
+"""Tests for batching contract reads through Multicall3."""
+
+from unittest import mock
+
+import eth_abi
+import pytest
+
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmWalletProvider
+from coinbase_agentkit.wallet_providers.multicall import (
+    MULTICALL3_ADDRESS,
+    ContractCall,
+    get_multicall_address,
+    multicall,
+    native_balance_call,
+)
+
+TOKEN = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+OWNER = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+
+ABI = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "inputs": [{"name": "account", "type": "address"}],
+        "outputs": [{"type": "uint256"}],
+    },
+    {
+        "type": "function",
+        "name": "ownerOf",
+        "inputs": [{"name": "tokenId", "type": "uint256"}],
+        "outputs": [{"type": "address"}],
+    },
+    {
+        "type": "function",
+        "name": "reserves",
+        "inputs": [],
+        "outputs": [{"type": "uint112"}, {"type": "uint112"}],
+    },
+]
+
+
+def wallet_on(network_id: str) -> mock.Mock:
+    """Create a wallet provider mock on a network."""
+    provider = mock.Mock(spec=EvmWalletProvider)
+    provider.get_network.return_value = Network(protocol_family="evm", network_id=network_id)
+    return provider
+
+
+def test_calls_round_trip():
+    """Test that calls encode their calldata and decode results like read_contract."""
+    balance = ContractCall(TOKEN, ABI, "balanceOf", (OWNER,))
+    owner = ContractCall(TOKEN, ABI, "ownerOf", (1,))
+    reserves = ContractCall(TOKEN, ABI, "reserves")
+
+    assert balance.encode()[:4].hex() == "70a08231"
+    assert balance.decode(eth_abi.encode(["uint256"], [7])) == 7
+    assert owner.decode(eth_abi.encode(["address"], [OWNER.lower()])) == OWNER
+    assert reserves.decode(eth_abi.encode(["uint112", "uint112"], [1, 2])) == [1, 2]
+    with pytest.raises(ValueError, match="Function missing not found"):
+        ContractCall(TOKEN, ABI, "missing").encode()
+
+
+def test_multicall_address_of_supported_chains():
+    """Test that Multicall3 is looked up in the chain definitions."""
+    assert get_multicall_address("base-mainnet") == MULTICALL3_ADDRESS
+    assert get_multicall_address("unknown") is None
+    assert get_multicall_address(None) is None
+
+
+def test_multicall_batches_calls_and_isolates_failures():
+    """Test that calls are sent in aggregate3 batches and failures stay per call."""
+    wallet = wallet_on("base-sepolia")
+    wallet.read_contract.side_effect = [
+        [(True, eth_abi.encode(["uint256"], [5])), (False, b"")],
+        [(True, b"")],
+    ]
+    calls = [
+        ContractCall(TOKEN, ABI, "balanceOf", (OWNER,)),
+        ContractCall(TOKEN, ABI, "ownerOf", (1,)),
+        native_balance_call(OWNER),
+    ]
+
+    results = multicall(wallet, calls, block_identifier=12, batch_size=2)
+
+    assert wallet.read_contract.call_count == 2
+    first = wallet.read_contract.call_args_list[0].kwargs
+    assert first["contract_address"] == MULTICALL3_ADDRESS
+    assert first["function_name"] == "aggregate3"
+    assert first["block_identifier"] == 12
+    assert [target for target, _, _ in first["args"][0]] == [TOKEN, TOKEN]
+    assert results[0].success and results[0].value == 5
+    assert not results[1].success and results[1].error == "ownerOf reverted"
+    assert not results[2].success and results[2].error.startswith("Could not decode")
+
+
+def test_multicall_without_multicall3_reads_one_by_one():
+    """Test that networks without Multicall3 fall back to single reads."""
+    wallet = wallet_on("unknown")
+    wallet.read_contract.side_effect = [5, Exception("execution reverted")]
+
+    results = multicall(
+        wallet,
+        [
+            ContractCall(TOKEN, ABI, "balanceOf", (OWNER,)),
+            ContractCall(TOKEN, ABI, "ownerOf", (1,)),
+        ],
+    )
+
+    assert [r.value for r in results] == [5, None]
+    assert results[1].error == "execution reverted"
+    assert wallet.read_contract.call_args_list[0].kwargs["function_name"] == "balanceOf"
+
+
+def test_multicall_without_calls_makes_no_request():
+    """Test that an empty multicall does not call the network."""
+    wallet = wallet_on("base-sepolia")
+
+    assert multicall(wallet, []) == []
+    wallet.read_contract.assert_not_called()
@@ -0,0 +1,201 @@
+"""Tests for the RPC endpoint pool."""
+
+import threading
+from unittest import mock
+
+import pytest
+import requests
+from web3 import HTTPProvider
+
+from coinbase_agentkit.network.chain_definitions import Chain, base_sepolia
+from coinbase_agentkit.wallet_providers.rpc_pool import (
+    RpcPool,
+    RpcPoolConfig,
+    create_rpc_provider,
+)
+
+MOCK_URL_1 = "https://rpc-1.example.com"
+MOCK_URL_2 = "https://rpc-2.example.com"
+MOCK_URL_3 = "https://rpc-3.example.com"
+MOCK_RESPONSE = {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+
+
+def _stub(pool: RpcPool, url: str, side_effect) -> mock.Mock:
+    """Replace the make_request method of a pooled endpoint."""
+    endpoint = next(e for e in pool._endpoints if e.url == url)
+    stub = mock.Mock(side_effect=side_effect)
+    endpoint.provider.make_request = stub
+    return stub
+
+
+def test_create_rpc_provider_single_url():
+    """Test that a single endpoint gets a plain HTTP provider."""
+    provider = create_rpc_provider([MOCK_URL_1])
+
+    assert isinstance(provider, HTTPProvider)
+    assert provider.endpoint_uri == MOCK_URL_1
+
+
+def test_create_rpc_provider_multiple_urls():
+    """Test that several endpoints are wrapped in a pool."""
+    provider = create_rpc_provider([MOCK_URL_1, MOCK_URL_2, MOCK_URL_1])
+
+    assert isinstance(provider, RpcPool)
+    assert provider.endpoint_urls == [MOCK_URL_1, MOCK_URL_2]
+
+
+def test_pool_requires_urls():
+    """Test that a pool cannot be created without endpoints."""
+    with pytest.raises(ValueError, match="at least one endpoint"):
+        RpcPool([])
+
+
+def test_chain_get_rpc_urls_default_first():
+    """Test that chain RPC URLs list the default endpoints first."""
+    chain = Chain(
+        **{
+            **base_sepolia.model_dump(),
+            "rpc_urls": {
+                "fallback": {"http": [MOCK_URL_2, MOCK_URL_1]},
+                "default": {"http": [MOCK_URL_1]},
+            },
+        }
+    )
+
+    assert chain.get_rpc_urls() == [MOCK_URL_1, MOCK_URL_2]
+
+
+def test_read_fails_over_to_next_endpoint():
+    """Test that a read falls back to the next endpoint on transport errors."""
+    pool = RpcPool([MOCK_URL_1, MOCK_URL_2])
+    first = _stub(pool, MOCK_URL_1, requests.ConnectionError("down"))
+    second = _stub(pool, MOCK_URL_2, lambda method, params: MOCK_RESPONSE)
+
+    assert pool.make_request("eth_blockNumber", []) == MOCK_RESPONSE
+    first.assert_called_once_with("eth_blockNumber", [])
+    second.assert_called_once_with("eth_blockNumber", [])
+
+
+def test_all_endpoints_failing_raises_last_error():
+    """Test that the last error is raised when every endpoint fails."""
+    pool = RpcPool([MOCK_URL_1, MOCK_URL_2])
+    _stub(pool, MOCK_URL_1, requests.ConnectionError("first"))
+    _stub(pool, MOCK_URL_2, requests.Timeout("second"))
+
+    with pytest.raises(requests.Timeout, match="second"):
+        pool.make_request("eth_blockNumber", [])
+
+
+def test_routes_to_fastest_endpoint():
+    """Test that reads are routed to the endpoint with the best health score."""
+    pool = RpcPool([MOCK_URL_1, MOCK_URL_2])
+    slow = _stub(pool, MOCK_URL_1, lambda method, params: MOCK_RESPONSE)
+    fast = _stub(pool, MOCK_URL_2, lambda method, params: MOCK_RESPONSE)
+    pool._endpoints[0].latency = 1.0
+    pool._endpoints[1].latency = 0.1
+
+    pool.make_request("eth_chainId", [])
+
+    slow.assert_not_called()
+    fast.assert_called_once()
+
+
+def test_failing_endpoint_ranks_after_healthy_one():
+    """Test that an endpoint that has only failed is not preferred over a healthy one."""
+    pool = RpcPool([MOCK_URL_1, MOCK_URL_2])
+    dead = _stub(pool, MOCK_URL_1, requests.ConnectionError("down"))
+    healthy = _stub(pool, MOCK_URL_2, lambda method, params: MOCK_RESPONSE)
+
+    pool.make_request("eth_chainId", [])
+    pool.make_request("eth_chainId", [])
+
+    assert dead.call_count == 1
+    assert healthy.call_count == 2
+    assert [entry["url"] for entry in pool.get_endpoint_stats()] == [MOCK_URL_2, MOCK_URL_1]
+
+
+def test_endpoint_ejected_and_readmitted():
+    """Test that failing endpoints are ejected and re-admitted after the cooldown."""
+    pool = RpcPool(
+        [MOCK_URL_1, MOCK_URL_2],
+        RpcPoolConfig(max_consecutive_failures=2, eject_cooldown=30),
+    )
+    flaky = _stub(pool, MOCK_URL_1, requests.ConnectionError("down"))
+    other = _stub(pool, MOCK_URL_2, lambda method, params: MOCK_RESPONSE)
+
+    with mock.patch("coinbase_agentkit.wallet_providers.rpc_pool.time.monotonic") as now:
+        now.return_value = 100.0
+        pool.make_request("eth_chainId", [])
+        other.side_effect = requests.ConnectionError("down")
+        with pytest.raises(requests.ConnectionError):
+            pool.make_request("eth_chainId", [])
+
+        stats = {entry["url"]: entry for entry in pool.get_endpoint_stats()}
+        assert stats[MOCK_URL_1]["ejected"] is True
+        assert flaky.call_count == 2
+
+        other.side_effect = lambda method, params: MOCK_RESPONSE
+        pool.make_request("eth_chainId", [])
+        assert flaky.call_count == 2
+
+        now.return_value = 131.0
+        flaky.side_effect = lambda method, params: MOCK_RESPONSE
+        other.side_effect = requests.ConnectionError("down")
+        assert pool.make_request("eth_chainId", []) == MOCK_RESPONSE
+
+        assert flaky.call_count == 3
+        stats = {entry["url"]: entry for entry in pool.get_endpoint_stats()}
+        assert stats[MOCK_URL_1]["ejected"] is False
+
+
+def test_write_does_not_fail_over_on_read_timeout():
+    """Test that transactions are not resent when the first endpoint may have received them."""
+    pool = RpcPool([MOCK_URL_1, MOCK_URL_2])
+    _stub(pool, MOCK_URL_1, requests.ReadTimeout("timed out"))
+    second = _stub(pool, MOCK_URL_2, lambda method, params: MOCK_RESPONSE)
+
+    with pytest.raises(requests.ReadTimeout):
+        pool.make_request("eth_sendRawTransaction", ["0x01"])
+    second.assert_not_called()
+
+
+def test_write_fails_over_when_rate_limited():
+    """Test that transactions fail over when the endpoint rejected them."""
+    pool = RpcPool([MOCK_URL_1, MOCK_URL_2])
+    response = requests.Response()
+    response.status_code = 429
+    _stub(pool, MOCK_URL_1, requests.HTTPError("rate limited", response=response))
+    _stub(pool, MOCK_URL_2, lambda method, params: MOCK_RESPONSE)
+
+    assert pool.make_request("eth_sendRawTransaction", ["0x01"]) == MOCK_RESPONSE
+
+
+def test_slow_read_is_hedged():
+    """Test that a slow read is hedged to the runner-up endpoint."""
+    pool = RpcPool([MOCK_URL_1, MOCK_URL_2], RpcPoolConfig(hedge_delay=0.01))
+    release = threading.Event()
+
+    def slow(method, params):
+        release.wait(timeout=5)
+        return {"jsonrpc": "2.0", "id": 1, "result": "0xslow"}
+
+    _stub(pool, MOCK_URL_1, slow)
+    hedge = _stub(pool, MOCK_URL_2, lambda method, params: MOCK_RESPONSE)
+
+    try:
+        assert pool.make_request("eth_call", [{}, "latest"]) == MOCK_RESPONSE
+        hedge.assert_called_once()
+    finally:
+        release.set()
+
+
+def test_writes_are_never_hedged():
+    """Test that hedging does not apply to transactions."""
+    pool = RpcPool([MOCK_URL_1, MOCK_URL_2], RpcPoolConfig(hedge_delay=0))
+    first = _stub(pool, MOCK_URL_1, lambda method, params: MOCK_RESPONSE)
+    second = _stub(pool, MOCK_URL_2, lambda method, params: MOCK_RESPONSE)
+
+    pool.make_request("eth_sendRawTransaction", ["0x01"])
+
+    first.assert_called_once()
+    second.assert_not_called()
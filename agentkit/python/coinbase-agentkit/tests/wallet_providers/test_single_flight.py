@@ -0,0 +1,124 @@
+"""Tests for in-flight contract read coalescing."""
+
+import threading
+from unittest import mock
+
+import pytest
+from web3 import Web3
+from web3.contract.contract import ContractFunction
+
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.wallet_providers.single_flight import (
+    SingleFlight,
+    coalesced_read,
+    contract_reads,
+)
+
+MOCK_CONTRACT_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_OWNER = "0x9876543210987654321098765432109876543210"
+
+
+def _run_concurrently(flight: SingleFlight, key, fn, count: int) -> tuple[list, list]:
+    """Run the same call from several threads and collect their results."""
+    results = [None] * count
+    threads = [
+        threading.Thread(target=lambda i=i: results.__setitem__(i, flight.do(key, fn)))
+        for i in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_calls_are_coalesced():
+    """Test that identical in-flight calls share one execution."""
+    flight = SingleFlight()
+    release = threading.Event()
+    executions = []
+
+    def fn():
+        executions.append(1)
+        release.wait(timeout=5)
+        return [42]
+
+    threads, results = _run_concurrently(flight, "key", fn, 5)
+    while flight.stats()["requests"] < 5:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(executions) == 1
+    assert results == [[42]] * 5
+    assert len({id(result) for result in results}) == 5
+    assert flight.stats() == {
+        "requests": 5,
+        "executions": 1,
+        "coalesced": 4,
+        "dedup_ratio": 0.8,
+    }
+
+
+def test_sequential_calls_are_not_cached():
+    """Test that completed calls are not reused."""
+    flight = SingleFlight()
+    fn = mock.Mock(side_effect=[1, 2])
+
+    assert flight.do("key", fn) == 1
+    assert flight.do("key", fn) == 2
+    assert flight.stats()["coalesced"] == 0
+
+
+def test_error_is_shared_with_waiters():
+    """Test that waiters receive the error of the call they joined."""
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(timeout=5)
+        raise ValueError("execution reverted")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("key", fn)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while flight.stats()["requests"] < 3:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3
+    with pytest.raises(KeyError):
+        flight._calls["key"]
+
+
+def test_coalesced_read_key_includes_calldata():
+    """Test that reads with different calldata are not coalesced."""
+    contract = Web3().eth.contract(
+        address=Web3.to_checksum_address(MOCK_CONTRACT_ADDRESS), abi=ERC20_ABI
+    )
+    contract_reads.reset_stats()
+
+    with (
+        mock.patch.object(ContractFunction, "call", return_value=100) as call,
+        mock.patch.object(contract_reads, "do", wraps=contract_reads.do) as do,
+    ):
+        assert coalesced_read(contract, "balanceOf", [MOCK_OWNER], "8453", "latest") == 100
+        assert coalesced_read(contract, "decimals", [], "8453", "latest") == 100
+
+    first_key, second_key = (c.args[0] for c in do.call_args_list)
+    assert first_key[0] == "8453"
+    assert first_key[1] == Web3.to_checksum_address(MOCK_CONTRACT_ADDRESS)
+    assert first_key[3] == "latest"
+    assert first_key[4] == ("uint256",)
+    assert first_key[2] != second_key[2]
+    assert call.call_count == 2
+    call.assert_called_with(block_identifier="latest")
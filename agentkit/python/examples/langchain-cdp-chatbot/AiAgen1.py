@@ -10,6 +10,7 @@ from coinbase_agentkit import (
     AgentKitConfig,
     CdpWalletProvider,
     CdpWalletProviderConfig,
+    MultiChainWalletProvider,
     allora_action_provider,
     cdp_api_action_provider,
     cdp_wallet_action_provider,
@@ -34,6 +35,7 @@ from langgraph.prebuilt import create_react_agent
 load_dotenv()
 
 wallet_data_file = "wallet_data.txt"
+chain_wallet_data_file = "chain_wallet_data.json"
 
 ###############################################################################
 #                SUPPORTED CHAINS & DEFAULT CHAIN
@@ -296,9 +298,8 @@ CROSSCHAIN_CONTRACT_ABI = [
 ###############################################################################
 
 
-wallet_provider = None
+wallet_provider: MultiChainWalletProvider | None = None
 current_chain_id = DEFAULT_CHAIN_ID
-wallet_providers_cache = {}
 agentkit = None
 
 ###############################################################################
@@ -332,10 +333,11 @@ def switch_network(new_chain_id: str) -> str:
     """
     switch_network(new_chain_id: str) -> str
 
-    Switch the global chain to new_chain_id, re-initializing the wallet provider
-    from wallet_data. Return a success or error string.
+    Switch the global chain to new_chain_id. The multi-chain wallet provider keeps
+    one provider per chain, so the wallet is only imported the first time a chain
+    is used and the AgentKit instance is reused. Return a success or error string.
     """
-    global current_chain_id, wallet_provider, agentkit, wallet_providers_cache
+    global current_chain_id
 
     if new_chain_id not in SUPPORTED_CHAINS:
         return f"Error: Chain ID {new_chain_id} not supported. Must be one of: {', '.join(SUPPORTED_CHAINS.keys())}"
@@ -344,14 +346,7 @@ def switch_network(new_chain_id: str) -> str:
         return f"Already on {get_chain_name()} (Chain ID: {current_chain_id})"
 
     try:
-        # Clear cached provider if we had one
-        if new_chain_id in wallet_providers_cache:
-            del wallet_providers_cache[new_chain_id]
-
-        # Build a fresh CdpWalletProvider for new_chain_id:
         new_provider = get_cdp_wallet_provider_for_chain(new_chain_id)
-        if not new_provider:
-            return f"Error: Could not create a wallet provider for chain {new_chain_id}"
 
         # Check if the chain_id from new_provider matches:
         net = new_provider.get_network()
@@ -366,27 +361,10 @@ def switch_network(new_chain_id: str) -> str:
             print(f"ERROR: Could not get balance for chain {new_chain_id}: {str(e)}")
             return f"Error connecting to {SUPPORTED_CHAINS[new_chain_id]['name']}: {str(e)}"
 
-        # Switch globally:
+        # Switch globally; the agentkit delegates to the new chain from now on:
+        wallet_provider.switch_network(new_chain_id)
         current_chain_id = new_chain_id
-        wallet_provider = new_provider
-
-        # Recreate agentkit with new provider:
-        agentkit = AgentKit(
-            AgentKitConfig(
-                wallet_provider=wallet_provider,
-                action_providers=[
-                    cdp_api_action_provider(),
-                    cdp_wallet_action_provider(),
-                    erc20_action_provider(),
-                    skywire_action_provider(),  # add skywire bridging
-                    pyth_action_provider(),
-                    wallet_action_provider(),
-                    weth_action_provider(),
-                    allora_action_provider(),
-                ],
-            )
-        )
-        # final check:
+
         actual_net = wallet_provider.get_network()
         print(f"DEBUG: switched to network with chain_id={actual_net.chain_id}")
 
@@ -399,56 +377,10 @@ def get_cdp_wallet_provider_for_chain(chain_id: str) -> CdpWalletProvider:
     """
     get_cdp_wallet_provider_for_chain(chain_id: str) -> CdpWalletProvider
 
-    Creates or retrieves from cache a CdpWalletProvider that is on the requested chain.
-    We rely on wallet_data from wallet_data.txt and pass it into CdpWalletProviderConfig.
-    If the chain ID doesn't match, we attempt to switch the provider's internal chain.
-
-    This is the code path used by switch_network. If the user tries to do an operation
-    on a chain we are not connected to, we can call switch_network first or
-    the agent can do it automatically if it's in skywire_action_provider.
+    Return the CdpWalletProvider of the wallet on the requested chain. It is built
+    from wallet_data.txt the first time the chain is used and reused afterwards.
     """
-    global wallet_providers_cache
-
-    if chain_id in wallet_providers_cache:
-        print(f"DEBUG: reusing cached wallet provider for chain_id={chain_id}")
-        return wallet_providers_cache[chain_id]
-
-    # Otherwise, load from wallet_data.txt:
-    wallet_data = None
-    if os.path.exists(wallet_data_file):
-        with open(wallet_data_file, "r") as f:
-            wallet_data = f.read()
-
-    cdp_config = None
-    if wallet_data is not None:
-        cdp_config = CdpWalletProviderConfig(wallet_data=wallet_data)
-    else:
-        print("WARNING: No existing wallet_data.txt found; will start from empty config.")
-        cdp_config = CdpWalletProviderConfig()
-
-    # We set chain_id explicitly. The underlying code may need to confirm.
-    cdp_config.default_chain_id = chain_id
-
-    provider = CdpWalletProvider(cdp_config)
-
-    # Let the provider do its network detection:
-    net = provider.get_network()
-    print(f"DEBUG: new CdpWalletProvider => chain_id={net.chain_id}, network_id={net.network_id or 'N/A'}")
-
-    if net.chain_id != chain_id:
-        
-        print("WARNING: The CdpWalletProvider's chain_id doesn't match the requested chain.")
-        
-
-    # Store to cache
-    wallet_providers_cache[chain_id] = provider
-
-    # Also persist any updated wallet data so that if the provider was changed, we keep it.
-    updated_data = provider.export_wallet().to_dict()
-    with open(wallet_data_file, "w") as f:
-        f.write(json.dumps(updated_data))
-
-    return provider
+    return wallet_provider.get_provider(chain_id)
 
 
 ###############################################################################
@@ -687,23 +619,17 @@ def parse_get_current_network(input_str: str) -> str:
 
 def verify_all_chains() -> str:
     """
-    Attempt connecting to each chain in SUPPORTED_CHAINS with a fresh
-    CdpWalletProvider, check the wallet's native balance, then show success/failure.
+    Check the wallet's balances on every chain in SUPPORTED_CHAINS. The chains are
+    queried concurrently, so a slow chain is reported as timed out instead of
+    delaying the others.
     """
     lines = []
     lines.append(f"Current chain in global state: {get_chain_name()} (ID={current_chain_id})")
-
-    for chain_id, info in SUPPORTED_CHAINS.items():
-        try:
-            # create new provider
-            prov = get_cdp_wallet_provider_for_chain(chain_id)
-            net = prov.get_network()
-            # check balance
-            bal = prov.get_balance()
-            lines.append(f"✅ {info['name']} (Chain {chain_id}): got balance {bal} wei")
-        except Exception as e:
-            lines.append(f"❌ {info['name']} (Chain {chain_id}): {str(e)}")
-
+    lines.append(
+        wallet_action_provider().get_balances_all_chains(
+            wallet_provider, {"network_ids": list(SUPPORTED_CHAINS)}
+        )
+    )
     return "\n".join(lines)
 
 def parse_verify_chains(input_str: str) -> str:
@@ -731,10 +657,26 @@ def initialize_agent():
         print("No existing wallet_data.txt found. We'll create new wallet data.")
         cdp_config = CdpWalletProviderConfig()
 
-    # Build provider
+    # Wallets created for the other chains are persisted so later runs import them
+    chain_wallet_data = {}
+    if os.path.exists(chain_wallet_data_file):
+        with open(chain_wallet_data_file) as f:
+            chain_wallet_data = json.load(f)
+
+    def save_chain_wallet(network_id: str, data: str) -> None:
+        chain_wallet_data[network_id] = data
+        with open(chain_wallet_data_file, "w") as f:
+            json.dump(chain_wallet_data, f)
+
+    # Build provider: one CdpWalletProvider per supported chain, built on first use
     global wallet_provider
-    wallet_provider = CdpWalletProvider(cdp_config)
-    
+    wallet_provider = MultiChainWalletProvider.from_cdp_config(
+        cdp_config,
+        network_ids=list(SUPPORTED_CHAINS),
+        chain_wallet_data=chain_wallet_data,
+        on_wallet_created=save_chain_wallet,
+    )
+
     # Immediately persist updated data
     with open(wallet_data_file, "w") as f:
         new_data = wallet_provider.export_wallet().to_dict()